@@ -9,6 +9,53 @@ import pyvisa
 from typing import Dict, List, Optional, Tuple, Any
 from PySide6.QtCore import QObject, Signal, QThread
 
+from .socket_transport import SocketResource, DEFAULT_SCPI_PORT
+from .traffic_recorder import TrafficRecorder, RecordingResource, ReplayResource, recorded_sessions
+
+
+# Available transports for device sessions
+TRANSPORT_VISA = "visa"
+TRANSPORT_SOCKET = "socket"
+
+
+def configure_device(device) -> None:
+    """
+    Apply the standard communication settings to an opened resource.
+    
+    Args:
+        device: Opened PyVISA resource
+    """
+    # Configure for stable communication
+    device.timeout = 30000  # 30 seconds timeout for long operations
+    device.read_termination = '\n'
+    device.write_termination = '\n'
+    
+    # Clear the device to start with a clean state
+    device.write('*CLS')
+
+
+def open_device(resource_manager, address: str, transport: str = TRANSPORT_VISA,
+                port: int = DEFAULT_SCPI_PORT) -> Any:
+    """
+    Open and configure a device session over the selected transport.
+    
+    Args:
+        resource_manager: PyVISA resource manager used for VISA sessions
+        address (str): VISA address for the device
+        transport (str): TRANSPORT_VISA or TRANSPORT_SOCKET (raw SCPI over TCP)
+        port (int): Raw SCPI port for socket sessions
+        
+    Returns:
+        object: Opened resource (PyVISA resource or SocketResource)
+    """
+    if transport == TRANSPORT_SOCKET:
+        device = SocketResource.from_visa_address(address, port)
+    else:
+        device = resource_manager.open_resource(address)
+    
+    configure_device(device)
+    return device
+
 
 class DeviceConnectionThread(QThread):
     """Thread for connecting to devices without blocking the UI."""
@@ -16,35 +63,31 @@ class DeviceConnectionThread(QThread):
     connection_successful = Signal(object, str)  # Signal emits device object and idn
     connection_failed = Signal(str, list)        # Signal emits error message and available devices
     
-    def __init__(self, address):
+    def __init__(self, address, transport=TRANSPORT_VISA, port=DEFAULT_SCPI_PORT):
         """
         Initialize device connection thread.
         
         Args:
             address (str): VISA address for the device
+            transport (str): TRANSPORT_VISA or TRANSPORT_SOCKET
+            port (int): Raw SCPI port for socket sessions
         """
         super().__init__()
         self._address = address
+        self._transport = transport
+        self._port = port
         
     def run(self):
         """Connect to the device using PyVISA."""
         rm = pyvisa.ResourceManager()
         try:
             # Open a connection to the device with appropriate settings
-            device = rm.open_resource(self._address)
-            
-            # Configure for stable communication
-            device.timeout = 30000  # 30 seconds timeout for long operations
-            device.read_termination = '\n'
-            device.write_termination = '\n'
-            
-            # Clear the device to start with a clean state
-            device.write('*CLS')
+            device = open_device(rm, self._address, self._transport, self._port)
             
             # Query the device for identification
             idn = device.query('*IDN?')
             self.connection_successful.emit(device, idn)
-        except pyvisa.VisaIOError as e:
+        except (pyvisa.VisaIOError, OSError, ValueError) as e:
             # List all connected devices if there's an error
             available_devices = rm.list_resources()
             self.connection_failed.emit(str(e), available_devices)
@@ -68,11 +111,24 @@ class DeviceManager(QObject):
         # Connection state
         self._is_connected = False
         self._current_device_name = None
+        self._current_address = None
         self._device_object = None
         
         # Map of device addresses to user-friendly names
         self._device_map = {}
         
+        # Additional sessions opened for multi-instrument work, keyed by address
+        self._sessions = {}
+        
+        # Transport selected per device address: (transport, port)
+        self._transports = {}
+        
+        # Active SCPI traffic recorder, if any
+        self._recorder = None
+        
+        # Traffic log and pacing served by open_session() in replay mode
+        self._replay = None
+        
         # Resource manager
         self._resource_manager = pyvisa.ResourceManager()
     
@@ -155,11 +211,50 @@ class DeviceManager(QObject):
         address = self._device_map.get(address_or_name, address_or_name)
         
         # Create a connection thread
-        self._connection_thread = DeviceConnectionThread(address)
+        self._current_address = address
+        transport, port = self.get_transport(address)
+        self._connection_thread = DeviceConnectionThread(address, transport, port)
         self._connection_thread.connection_successful.connect(self._on_connection_successful)
         self._connection_thread.connection_failed.connect(self._on_connection_failed)
         self._connection_thread.start()
     
+    def set_transport(self, address_or_name: str, transport: str,
+                      port: int = DEFAULT_SCPI_PORT) -> None:
+        """
+        Select the transport used for a device.
+        
+        TRANSPORT_SOCKET talks raw SCPI over TCP to LAN instruments, bypassing
+        VISA for much faster binary block transfers.
+        
+        Args:
+            address_or_name: VISA address or friendly name of the device
+            transport: TRANSPORT_VISA or TRANSPORT_SOCKET
+            port: Raw SCPI port for socket sessions
+            
+        Raises:
+            ValueError: If the transport is unknown or not usable for the address
+        """
+        address = self._device_map.get(address_or_name, address_or_name)
+        if transport not in (TRANSPORT_VISA, TRANSPORT_SOCKET):
+            raise ValueError(f"Unknown transport: {transport}")
+        if transport == TRANSPORT_SOCKET and '::' in address and not address.upper().startswith('TCPIP'):
+            raise ValueError(f"Socket transport requires a TCPIP address: {address}")
+        
+        self._transports[address] = (transport, port)
+    
+    def get_transport(self, address_or_name: str) -> Tuple[str, int]:
+        """
+        Get the transport selected for a device.
+        
+        Args:
+            address_or_name: VISA address or friendly name of the device
+            
+        Returns:
+            tuple: (transport, port), VISA by default
+        """
+        address = self._device_map.get(address_or_name, address_or_name)
+        return self._transports.get(address, (TRANSPORT_VISA, DEFAULT_SCPI_PORT))
+    
     def disconnect_device(self) -> None:
         """
         Disconnect from the current device.
@@ -181,8 +276,11 @@ class DeviceManager(QObject):
                 print(f"Error disconnecting device: {e}")
         
         # Reset state
+        self.stop_recording()
+        self._replay = None
         self._is_connected = False
         self._current_device_name = None
+        self._current_address = None
         self._device_object = None
         
         # Emit connection status
@@ -224,6 +322,8 @@ class DeviceManager(QObject):
             idn: Device identification string
         """
         # Store device information
+        if self._recorder is not None:
+            device_obj = RecordingResource(device_obj, self._recorder, self._current_address or "")
         self._device_object = device_obj
         self._is_connected = True
         
@@ -260,6 +360,7 @@ class DeviceManager(QObject):
         # Ensure we're marked as disconnected
         self._is_connected = False
         self._current_device_name = None
+        self._current_address = None
         self._device_object = None
         
         # Emit connection failed status
@@ -296,4 +397,165 @@ class DeviceManager(QObject):
         if not self._is_connected or not self._device_object:
             raise RuntimeError("No device connected")
         
-        return self._device_object.query(query_string)
\ No newline at end of file
+        return self._device_object.query(query_string)
+    
+    # MARK: - Multi-instrument sessions
+    
+    def open_session(self, address_or_name: str) -> Any:
+        """
+        Open an additional device session synchronously.
+        
+        Unlike connect_device(), this does not replace the current device and
+        is intended for worker threads that drive several instruments at once.
+        Opening an address that already has a session returns that session.
+        While connected to a replay, the session replays the recorded traffic
+        of the address instead of opening the device.
+        
+        Args:
+            address_or_name: VISA address or friendly name of the device
+            
+        Returns:
+            object: Opened and configured PyVISA resource
+            
+        Raises:
+            RuntimeError: If the device cannot be opened
+        """
+        address = self._device_map.get(address_or_name, address_or_name)
+        if address in self._sessions:
+            return self._sessions[address]
+        
+        if self._replay is not None:
+            path, realtime = self._replay
+            device = ReplayResource(path, realtime=realtime, address=address)
+            if not device.remaining:
+                raise RuntimeError(f"No traffic of {address} in the replay log {path}")
+        else:
+            transport, port = self.get_transport(address)
+            try:
+                device = open_device(self._resource_manager, address, transport, port)
+            except (pyvisa.VisaIOError, OSError, ValueError) as e:
+                raise RuntimeError(f"Failed to open {address}: {e}")
+        
+        if self._recorder is not None:
+            device = RecordingResource(device, self._recorder, address)
+        self._sessions[address] = device
+        return device
+    
+    def close_session(self, address_or_name: str) -> None:
+        """
+        Close a session opened with open_session().
+        
+        Args:
+            address_or_name: VISA address or friendly name of the device
+        """
+        address = self._device_map.get(address_or_name, address_or_name)
+        device = self._sessions.pop(address, None)
+        if device is None:
+            return
+        
+        try:
+            device.close()
+        except Exception as e:
+            # Log error
+            print(f"Error closing session {address}: {e}")
+    
+    def close_all_sessions(self) -> None:
+        """Close every session opened with open_session()."""
+        for address in list(self._sessions):
+            self.close_session(address)
+    
+    def get_sessions(self) -> Dict[str, Any]:
+        """
+        Get the open multi-instrument sessions.
+        
+        Returns:
+            Dictionary mapping VISA addresses to resource objects
+        """
+        return dict(self._sessions)
+    
+    # MARK: - Traffic recording and replay
+    
+    def start_recording(self, path: str) -> None:
+        """
+        Record all traffic of the connected device and open sessions.
+        
+        Every command, response and binary block (including read_raw() calls
+        made by acquisition code on get_device_object()) is written to a
+        compact binary log that can be served back with connect_replay().
+        Devices and sessions opened while recording are recorded too, and
+        each record is tagged with the address of its device.
+        
+        Args:
+            path: Destination file for the traffic log
+            
+        Raises:
+            RuntimeError: If a recording is already active
+        """
+        if self._recorder is not None:
+            raise RuntimeError("A traffic recording is already active")
+        
+        self._recorder = TrafficRecorder(path)
+        if self._device_object is not None:
+            self._device_object = RecordingResource(self._device_object, self._recorder,
+                                                    self._current_address or "")
+        for address, device in self._sessions.items():
+            self._sessions[address] = RecordingResource(device, self._recorder, address)
+    
+    def stop_recording(self) -> None:
+        """Stop the active traffic recording and unwrap the device sessions."""
+        if self._recorder is None:
+            return
+        
+        if isinstance(self._device_object, RecordingResource):
+            self._device_object = self._device_object.wrapped
+        for address, device in self._sessions.items():
+            if isinstance(device, RecordingResource):
+                self._sessions[address] = device.wrapped
+        
+        self._recorder.close()
+        self._recorder = None
+    
+    def is_recording(self) -> bool:
+        """
+        Check if SCPI traffic is being recorded.
+        
+        Returns:
+            bool: True if a recording is active
+        """
+        return self._recorder is not None
+    
+    def connect_replay(self, path: str, realtime: bool = False,
+                       address: Optional[str] = None) -> None:
+        """
+        Connect to a recorded traffic log instead of a real device.
+        
+        The connected device replays the traffic of one recorded address;
+        sessions opened with open_session() replay the other addresses.
+        
+        Args:
+            path: Traffic log written by start_recording()
+            realtime: Reproduce the recorded timing instead of replaying at full speed
+            address: Recorded device to connect to; defaults to the first one in the log
+            
+        Raises:
+            RuntimeError: If the log has no traffic of the address
+        """
+        if self._is_connected:
+            self.disconnect_device()
+        self.close_all_sessions()
+        
+        if address is None:
+            addresses = recorded_sessions(path)
+            address = addresses[0] if addresses else ""
+        device = ReplayResource(path, realtime=realtime, address=address)
+        if not device.remaining:
+            raise RuntimeError(f"No traffic of {address} in the replay log {path}")
+        
+        self._replay = (path, realtime)
+        self._device_object = device
+        self._is_connected = True
+        self._current_device_name = "Replay"
+        self._current_address = address or None
+        
+        # Emit connection status
+        self.connection_status_changed.emit(True, f"Replay: {path}")
@@ -0,0 +1,346 @@
+"""
+Multi-Instrument Acquisition for PySignalDecipher.
+
+Coordinates synchronized captures across several oscilloscopes opened through
+the DeviceManager. All instruments are armed together, triggered from a shared
+or external source, read out concurrently (one worker per instrument) and
+their channels are merged onto a single time base.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .waveform import WaveformPreamble, parse_block
+
+
+class TriggerMode(Enum):
+    """How the instruments of a multi-instrument capture are triggered."""
+    SHARED = "shared"        # First device triggers, the others follow on EXT
+    EXTERNAL = "external"    # Every device triggers on its EXT input
+
+
+@dataclass
+class DeviceCapture:
+    """Raw waveforms read from one instrument."""
+
+    address: str
+    preambles: Dict[int, WaveformPreamble] = field(default_factory=dict)
+    codes: Dict[int, np.ndarray] = field(default_factory=dict)
+    read_time: float = 0.0
+
+    @property
+    def num_bytes(self) -> int:
+        """Total number of waveform bytes read from the instrument."""
+        return sum(codes.nbytes for codes in self.codes.values())
+
+
+@dataclass
+class MultiCaptureResult:
+    """Channels from several instruments aligned on one time base."""
+
+    # Common time base in seconds, relative to the trigger
+    timestamps: np.ndarray
+
+    # Voltage arrays keyed by "<address>:CH<n>", in device/channel order
+    channels: Dict[str, np.ndarray]
+
+    # Trigger offset (time of first sample) of each device before alignment
+    trigger_offsets: Dict[str, float]
+
+    # Per-device raw captures
+    captures: Dict[str, DeviceCapture] = field(default_factory=dict)
+
+    def to_signal_data(self):
+        """
+        Convert the result to a multi-channel SignalData.
+
+        Returns:
+            SignalData: Values of shape (samples, channels) with channel names in metadata
+        """
+        from signals_system.formats.base import SignalData
+
+        names = list(self.channels)
+        values = np.column_stack([self.channels[name] for name in names])
+        sample_rate = 1.0 / (self.timestamps[1] - self.timestamps[0]) if len(self.timestamps) > 1 else None
+
+        return SignalData(
+            values=values,
+            timestamps=self.timestamps,
+            metadata={
+                'channel_names': names,
+                'sample_rate': sample_rate,
+                'trigger_offsets': dict(self.trigger_offsets)
+            }
+        )
+
+
+class MultiInstrumentCapture:
+    """
+    Synchronized capture coordinator for several oscilloscopes.
+
+    Sessions are opened through DeviceManager.open_session(), so the
+    coordinator can run alongside the device selected in the UI. Every
+    instrument gets its own worker thread; PyVISA releases the GIL during
+    I/O, so aggregate read-out throughput scales with the number of devices.
+    """
+
+    def __init__(self, device_manager, addresses: Sequence[str],
+                 channels: Union[Sequence[int], Dict[str, Sequence[int]]] = (1,),
+                 trigger_mode: TriggerMode = TriggerMode.SHARED,
+                 trigger_source: str = "CHAN1",
+                 waveform_mode: str = "NORM",
+                 skew: Optional[Dict[str, float]] = None):
+        """
+        Initialize the capture coordinator.
+
+        Args:
+            device_manager: DeviceManager used to open the instrument sessions
+            addresses: VISA addresses or friendly names of the instruments
+            channels: Channels to read, either for all devices or per address
+            trigger_mode: Shared (first device is master) or external trigger
+            trigger_source: Trigger source of the master device in shared mode
+            waveform_mode: Value for ``:WAV:MODE`` (NORM, MAX or RAW)
+            skew: Optional per-address time offsets (e.g. trigger cable delay) in seconds
+        """
+        if not addresses:
+            raise ValueError("At least one instrument address is required")
+
+        self._device_manager = device_manager
+        self._addresses = list(addresses)
+        self._trigger_mode = TriggerMode(trigger_mode)
+        self._trigger_source = trigger_source
+        self._waveform_mode = waveform_mode
+        self._skew = dict(skew or {})
+
+        if isinstance(channels, dict):
+            self._channels = {address: list(channels[address]) for address in self._addresses}
+        else:
+            self._channels = {address: list(channels) for address in self._addresses}
+
+        # Open one session per device
+        self._devices = {
+            address: device_manager.open_session(address) for address in self._addresses
+        }
+
+        # One worker per device
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._addresses),
+            thread_name_prefix="multi-acq"
+        )
+
+    @property
+    def addresses(self) -> List[str]:
+        """Addresses of the coordinated instruments, master first."""
+        return list(self._addresses)
+
+    def _run_on_all(self, func, addresses: Optional[Sequence[str]] = None) -> Dict[str, object]:
+        """Run func(address, device) on every device concurrently and collect the results."""
+        addresses = self._addresses if addresses is None else addresses
+        futures = {
+            address: self._executor.submit(func, address, self._devices[address])
+            for address in addresses
+        }
+        return {address: future.result() for address, future in futures.items()}
+
+    # MARK: - Trigger control
+
+    def _arm_device(self, address: str, device, source: str) -> None:
+        """Put one device into single-shot mode waiting for a trigger."""
+        device.write(":STOP")
+        device.write(":TRIG:MODE EDGE")
+        device.write(f":TRIG:EDGE:SOUR {source}")
+        device.write(":SING")
+
+    def arm(self) -> None:
+        """
+        Arm every instrument for a single-shot capture.
+
+        In shared mode the followers are armed before the master so that none
+        of them can miss the master's trigger output.
+        """
+        if self._trigger_mode == TriggerMode.SHARED:
+            master, followers = self._addresses[0], self._addresses[1:]
+            if followers:
+                self._run_on_all(lambda a, d: self._arm_device(a, d, "EXT"), followers)
+            self._arm_device(master, self._devices[master], self._trigger_source)
+        else:
+            self._run_on_all(lambda a, d: self._arm_device(a, d, "EXT"))
+
+    def force_trigger(self) -> None:
+        """Force a trigger on the master (shared mode) or on every device."""
+        if self._trigger_mode == TriggerMode.SHARED:
+            self._devices[self._addresses[0]].write(":TFOR")
+        else:
+            self._run_on_all(lambda a, d: d.write(":TFOR"))
+
+    def _wait_device(self, address: str, device, timeout: float, poll_interval: float) -> bool:
+        """Poll one device until its acquisition has stopped."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if device.query(":TRIG:STAT?").strip() == "STOP":
+                return True
+            time.sleep(poll_interval)
+        return False
+
+    def wait_for_trigger(self, timeout: float = 10.0, poll_interval: float = 0.05,
+                         force_on_timeout: bool = True) -> bool:
+        """
+        Wait until every instrument has completed its acquisition.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll_interval: Delay between status polls in seconds
+            force_on_timeout: Force a trigger and wait once more when the timeout expires
+
+        Returns:
+            bool: True if all instruments completed
+        """
+        done = self._run_on_all(lambda a, d: self._wait_device(a, d, timeout, poll_interval))
+        if all(done.values()):
+            return True
+
+        if force_on_timeout:
+            self.force_trigger()
+            done = self._run_on_all(lambda a, d: self._wait_device(a, d, timeout, poll_interval))
+            return all(done.values())
+
+        return False
+
+    # MARK: - Read-out
+
+    def _read_device(self, address: str, device) -> DeviceCapture:
+        """Read every requested channel of one device."""
+        capture = DeviceCapture(address=address)
+        start = time.perf_counter()
+
+        for channel in self._channels[address]:
+            device.write(f":WAV:SOUR CHAN{channel}")
+            device.write(f":WAV:MODE {self._waveform_mode}")
+            device.write(":WAV:FORM BYTE")
+
+            capture.preambles[channel] = WaveformPreamble.from_string(device.query(":WAV:PRE?"))
+
+            device.write(":WAV:DATA?")
+            capture.codes[channel] = parse_block(device.read_raw())
+
+        capture.read_time = time.perf_counter() - start
+        return capture
+
+    def read_out(self) -> Dict[str, DeviceCapture]:
+        """
+        Read the waveforms of every instrument concurrently.
+
+        Returns:
+            Dictionary mapping addresses to their raw captures
+        """
+        return self._run_on_all(self._read_device)
+
+    # MARK: - Alignment
+
+    def merge(self, captures: Dict[str, DeviceCapture]) -> MultiCaptureResult:
+        """
+        Merge captures onto one time base using each preamble's trigger offset.
+
+        The common time base covers the interval where all channels overlap and
+        uses the finest sample interval of all devices. Channels already on that
+        grid are sliced directly; the others are linearly interpolated.
+
+        Args:
+            captures: Raw captures returned by read_out()
+
+        Returns:
+            MultiCaptureResult: Aligned channels
+
+        Raises:
+            RuntimeError: If the captures do not overlap in time
+        """
+        spans = []
+        for address, capture in captures.items():
+            offset = self._skew.get(address, 0.0)
+            for channel, preamble in capture.preambles.items():
+                num_points = len(capture.codes[channel])
+                if num_points == 0:
+                    continue
+                start = preamble.x_origin + offset
+                spans.append((start, start + (num_points - 1) * preamble.x_increment,
+                              preamble.x_increment))
+
+        if not spans:
+            raise RuntimeError("No waveform data to merge")
+
+        t_start = max(span[0] for span in spans)
+        t_end = min(span[1] for span in spans)
+        dt = min(span[2] for span in spans)
+        if t_end < t_start:
+            raise RuntimeError("Captured waveforms do not overlap in time")
+
+        num_samples = int(np.floor((t_end - t_start) / dt + 1e-9)) + 1
+        timestamps = t_start + np.arange(num_samples) * dt
+
+        channels = {}
+        trigger_offsets = {}
+        for address in self._addresses:
+            capture = captures[address]
+            offset = self._skew.get(address, 0.0)
+            for channel, preamble in capture.preambles.items():
+                codes = capture.codes[channel]
+                if len(codes) == 0:
+                    continue
+                trigger_offsets.setdefault(address, preamble.x_origin + offset)
+
+                volts = preamble.to_voltages(codes)
+                first = (t_start - preamble.x_origin - offset) / preamble.x_increment
+                index = int(round(first))
+
+                if (np.isclose(preamble.x_increment, dt, rtol=1e-9)
+                        and abs(first - index) < 1e-6
+                        and index + num_samples <= len(volts)):
+                    # Same grid: a plain slice is exact
+                    channels[f"{address}:CH{channel}"] = volts[index:index + num_samples]
+                else:
+                    times = preamble.time_axis(len(volts)) + offset
+                    channels[f"{address}:CH{channel}"] = np.interp(timestamps, times, volts)
+
+        return MultiCaptureResult(
+            timestamps=timestamps,
+            channels=channels,
+            trigger_offsets=trigger_offsets,
+            captures=captures
+        )
+
+    def capture(self, timeout: float = 10.0) -> MultiCaptureResult:
+        """
+        Perform a complete synchronized capture.
+
+        Args:
+            timeout: Trigger timeout in seconds before forcing a trigger
+
+        Returns:
+            MultiCaptureResult: Aligned channels of all instruments
+        """
+        self.arm()
+        self.wait_for_trigger(timeout=timeout)
+        return self.merge(self.read_out())
+
+    def close(self, close_sessions: bool = True) -> None:
+        """
+        Stop the workers and optionally close the instrument sessions.
+
+        Args:
+            close_sessions: Whether to close the sessions opened by this coordinator
+        """
+        self._executor.shutdown(wait=True)
+        if close_sessions:
+            for address in self._addresses:
+                self._device_manager.close_session(address)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
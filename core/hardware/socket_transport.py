@@ -0,0 +1,296 @@
+"""
+Raw Socket Transport for PySignalDecipher.
+
+Implements SCPI over a raw TCP socket (the "port 5555" interface of most LAN
+oscilloscopes) as a drop-in alternative to a PyVISA session. Binary blocks are
+received with recv_into() straight into a preallocated buffer sized from the
+block header, and waveform requests can be pipelined so the instrument is
+already sending the next block while the current one is being decoded.
+"""
+
+import re
+import socket
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from .waveform import parse_block_header
+
+
+# Default raw SCPI port used by Rigol, Siglent, Keysight and others
+DEFAULT_SCPI_PORT = 5555
+
+# Kernel receive buffer requested for waveform transfers
+DEFAULT_SOCKET_BUFFER = 8 * 1024 * 1024
+
+
+class SocketResource:
+    """
+    SCPI-over-TCP session with the PyVISA resource interface.
+
+    Supports write(), read(), query(), read_raw() and close() as well as the
+    timeout/read_termination/write_termination attributes, so it can be used
+    wherever the acquisition code expects a PyVISA resource.
+    """
+
+    def __init__(self, host: str, port: int = DEFAULT_SCPI_PORT, timeout: int = 30000,
+                 socket_buffer: int = DEFAULT_SOCKET_BUFFER):
+        """
+        Open a raw socket connection to an instrument.
+
+        Args:
+            host: Host name or IP address of the instrument
+            port: Raw SCPI port
+            timeout: I/O timeout in milliseconds
+            socket_buffer: Requested kernel receive buffer size in bytes
+
+        Raises:
+            OSError: If the connection fails
+        """
+        self.host = host
+        self.port = port
+        self.resource_name = f"TCPIP0::{host}::{port}::SOCKET"
+        self.read_termination = '\n'
+        self.write_termination = '\n'
+
+        self._sock = socket.create_connection((host, port), timeout=timeout / 1000.0)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, socket_buffer)
+        self._timeout = timeout
+
+        # Bytes received but not yet consumed (only ever holds short tails)
+        self._pending = bytearray()
+
+        # Two reusable block buffers, so a yielded block stays valid while the next is received
+        self._buffers = [bytearray(), bytearray()]
+        self._buffer_index = 0
+        self._skip_terminator = False
+
+    @classmethod
+    def from_visa_address(cls, address: str, port: int = DEFAULT_SCPI_PORT, **kwargs) -> 'SocketResource':
+        """
+        Open a socket session from a VISA TCPIP address.
+
+        ``TCPIP0::<host>::<port>::SOCKET`` uses the port from the address;
+        ``TCPIP0::<host>::INSTR`` (or ``<host>``) uses the given port.
+
+        Args:
+            address: VISA address or host name
+            port: Raw SCPI port when the address does not specify one
+
+        Returns:
+            SocketResource: Connected session
+
+        Raises:
+            ValueError: If the address is not a TCPIP address
+        """
+        socket_match = re.match(r'TCPIP\d*::([^:]+)::(\d+)::SOCKET$', address, re.IGNORECASE)
+        if socket_match:
+            return cls(socket_match.group(1), int(socket_match.group(2)), **kwargs)
+
+        instr_match = re.match(r'TCPIP\d*::([^:]+)::', address, re.IGNORECASE)
+        if instr_match:
+            return cls(instr_match.group(1), port, **kwargs)
+
+        if '::' in address:
+            raise ValueError(f"Not a TCPIP address: {address}")
+        return cls(address, port, **kwargs)
+
+    # MARK: - Resource attributes
+
+    @property
+    def timeout(self) -> int:
+        """I/O timeout in milliseconds (PyVISA semantics)."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        self._timeout = value
+        self._sock.settimeout(None if value is None else value / 1000.0)
+
+    # MARK: - Low-level I/O
+
+    def _recv_more(self) -> None:
+        """Receive at least one more byte into the pending buffer."""
+        chunk = self._sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("Connection closed by instrument")
+        self._pending += chunk
+
+    def _recv_exact_into(self, view: memoryview) -> None:
+        """Fill view completely, first from pending bytes and then from the socket."""
+        filled = min(len(self._pending), len(view))
+        if filled:
+            view[:filled] = self._pending[:filled]
+            del self._pending[:filled]
+
+        while filled < len(view):
+            received = self._sock.recv_into(view[filled:])
+            if received == 0:
+                raise ConnectionError("Connection closed by instrument")
+            filled += received
+
+    def _discard_terminator(self, wait: bool = False) -> None:
+        """Drop the termination character left over after a binary block."""
+        if not self._skip_terminator:
+            return
+        terminator = self.read_termination.encode('ascii')
+        if wait:
+            while len(self._pending) < len(terminator):
+                self._recv_more()
+        if len(self._pending) >= len(terminator):
+            if self._pending.startswith(terminator):
+                del self._pending[:len(terminator)]
+            self._skip_terminator = False
+
+    def _send(self, command: str) -> None:
+        self._sock.sendall((command + self.write_termination).encode('ascii'))
+
+    # MARK: - Resource interface
+
+    def write(self, command: str) -> None:
+        """
+        Send a command.
+
+        Args:
+            command: SCPI command string
+        """
+        self._send(command)
+
+    def read(self) -> str:
+        """
+        Read one response line.
+
+        Returns:
+            str: Response without the termination character
+        """
+        self._discard_terminator(wait=True)
+        terminator = self.read_termination.encode('ascii')
+        while True:
+            end = self._pending.find(terminator)
+            if end >= 0:
+                line = bytes(self._pending[:end])
+                del self._pending[:end + len(terminator)]
+                return line.decode('ascii', errors='replace')
+            self._recv_more()
+
+    def query(self, command: str) -> str:
+        """
+        Send a query and read the response line.
+
+        Args:
+            command: SCPI query string
+
+        Returns:
+            str: Response without the termination character
+        """
+        self._send(command)
+        return self.read()
+
+    def read_block(self) -> memoryview:
+        """
+        Read an IEEE 488.2 definite-length block without intermediate copies.
+
+        The payload is received directly into a reusable buffer whose size is
+        taken from the block header. The returned view is only valid until the
+        next-but-one call to read_block(); copy it if it must be kept longer.
+
+        Returns:
+            memoryview: Block payload (without header and termination)
+        """
+        self._discard_terminator(wait=True)
+        while len(self._pending) < 2:
+            self._recv_more()
+        num_digits = int(self._pending[1:2]) if self._pending[0:1] == b'#' else 0
+        while len(self._pending) < 2 + num_digits:
+            self._recv_more()
+
+        header_len, data_size = parse_block_header(bytes(self._pending[:2 + num_digits]))
+        del self._pending[:header_len]
+
+        # Grow (never shrink) the buffer for this slot
+        self._buffer_index ^= 1
+        buffer = self._buffers[self._buffer_index]
+        if len(buffer) < data_size:
+            buffer = self._buffers[self._buffer_index] = bytearray(data_size)
+
+        view = memoryview(buffer)[:data_size]
+        self._recv_exact_into(view)
+
+        # The termination after a block is dropped lazily before the next read,
+        # so we never wait here for a byte the instrument may not send
+        self._skip_terminator = True
+        self._discard_terminator()
+
+        return view
+
+    def read_raw(self, size: Optional[int] = None) -> bytes:
+        """
+        Read a complete response, including any binary block header.
+
+        Provided for compatibility with code written against PyVISA.
+
+        Args:
+            size: Ignored, present for PyVISA compatibility
+
+        Returns:
+            bytes: Raw response
+        """
+        self._discard_terminator(wait=True)
+        while not self._pending:
+            self._recv_more()
+
+        if self._pending[0:1] != b'#':
+            return (self.read() + self.read_termination).encode('ascii')
+
+        while len(self._pending) < 2:
+            self._recv_more()
+        num_digits = int(self._pending[1:2])
+        while len(self._pending) < 2 + num_digits:
+            self._recv_more()
+        header = bytes(self._pending[:2 + num_digits])
+
+        payload = self.read_block()
+        return header + bytes(payload) + self.read_termination.encode('ascii')
+
+    def query_blocks(self, requests: Iterable[Union[str, Sequence[str]]]) -> Iterator[memoryview]:
+        """
+        Pipeline several binary block queries.
+
+        Each request is either a query string or a sequence of commands whose
+        last entry is the query. The next request is sent as soon as the
+        current block has been received, before it is handed to the caller,
+        so the instrument transfers block N+1 while block N is being decoded.
+
+        Args:
+            requests: Block queries, e.g. ``[[":WAV:SOUR CHAN1", ":WAV:DATA?"], ...]``
+
+        Yields:
+            memoryview: Payload of each block, valid until the next iteration completes
+        """
+        def send(request):
+            commands: List[str] = [request] if isinstance(request, str) else list(request)
+            self._sock.sendall(''.join(c + self.write_termination for c in commands).encode('ascii'))
+
+        iterator = iter(requests)
+        current = next(iterator, None)
+        if current is None:
+            return
+        send(current)
+
+        while current is not None:
+            block = self.read_block()
+            current = next(iterator, None)
+            if current is not None:
+                send(current)
+            yield block
+
+    def clear(self) -> None:
+        """Discard any unread response bytes."""
+        self._pending.clear()
+        self._skip_terminator = False
+
+    def close(self) -> None:
+        """Close the connection."""
+        try:
+            self._sock.close()
+        finally:
+            self._pending.clear()
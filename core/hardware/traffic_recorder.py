@@ -0,0 +1,363 @@
+"""
+SCPI Traffic Recorder for PySignalDecipher.
+
+Records every command, response and binary block exchanged with an
+instrument to a compact binary log, and replays such a log through the
+resource interface so acquisition code can run without hardware.
+
+Log layout (little-endian):
+    header:  b'PSDSCPI' + version (1 byte) + start time (float64, epoch seconds)
+    record:  kind (uint8) + time since start (float64) + session (uint16)
+             + length (uint32) + payload
+
+Each record is tagged with the session it belongs to, so the traffic of
+several instruments recorded into one log can be replayed per device. A
+SESSION record declares the device address of a session number before its
+first use; session 0 is untagged traffic.
+"""
+
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+from pathlib import Path
+
+from .waveform import parse_block_header
+
+
+LOG_MAGIC = b'PSDSCPI'
+LOG_VERSION = 2
+
+_HEADER = struct.Struct('<7sBd')
+_RECORD = struct.Struct('<BdHI')
+
+
+class RecordKind(IntEnum):
+    """Type of a recorded exchange."""
+    WRITE = 1       # Command sent to the instrument
+    READ = 2        # Text response (without termination)
+    READ_RAW = 3    # Raw response bytes as returned by read_raw()
+    BLOCK = 4       # Binary block payload as returned by read_block()
+    SESSION = 5     # Device address of a session number
+
+
+@dataclass
+class TraceRecord:
+    """One entry of a traffic log."""
+
+    kind: RecordKind
+    time: float
+    payload: bytes
+    session: str = ""  # Device address, empty for untagged traffic
+
+
+class ReplayMismatchError(RuntimeError):
+    """Raised when the replayed code diverges from the recorded conversation."""
+    pass
+
+
+# MARK: - Log writing and reading
+
+class TrafficRecorder:
+    """Thread-safe writer for SCPI traffic logs."""
+
+    def __init__(self, destination: Union[str, Path, BinaryIO]):
+        """
+        Open a traffic log for writing.
+
+        Args:
+            destination: File path or binary file-like object
+        """
+        if isinstance(destination, (str, Path)):
+            self._file = open(destination, 'wb')
+            self._owns_file = True
+        else:
+            self._file = destination
+            self._owns_file = False
+
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._file.write(_HEADER.pack(LOG_MAGIC, LOG_VERSION, time.time()))
+        self._sessions: Dict[str, int] = {}
+        self.num_records = 0
+        self.num_bytes = 0
+
+    def session(self, address: str) -> int:
+        """
+        Get the session number that tags the traffic of a device.
+
+        The first call for an address declares it in the log.
+
+        Args:
+            address: Device address
+
+        Returns:
+            int: Session number to pass to record()
+        """
+        with self._lock:
+            if address not in self._sessions:
+                self._sessions[address] = len(self._sessions) + 1
+                payload = address.encode('ascii', errors='replace')
+                self._file.write(_RECORD.pack(RecordKind.SESSION, time.perf_counter() - self._start,
+                                              self._sessions[address], len(payload)))
+                self._file.write(payload)
+            return self._sessions[address]
+
+    def record(self, kind: RecordKind, payload: Union[bytes, bytearray, memoryview, str],
+               session: int = 0) -> None:
+        """
+        Append one record to the log.
+
+        Args:
+            kind: Record type
+            payload: Command or response; strings are ASCII encoded
+            session: Session number from session(), 0 for untagged traffic
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('ascii', errors='replace')
+
+        elapsed = time.perf_counter() - self._start
+        with self._lock:
+            self._file.write(_RECORD.pack(kind, elapsed, session, len(payload)))
+            self._file.write(payload)
+            self.num_records += 1
+            self.num_bytes += len(payload)
+
+    def close(self) -> None:
+        """Flush and close the log."""
+        with self._lock:
+            self._file.flush()
+            if self._owns_file:
+                self._file.close()
+
+
+def read_traffic_log(source: Union[str, Path, BinaryIO]) -> Iterator[TraceRecord]:
+    """
+    Iterate over the records of a traffic log.
+
+    Args:
+        source: File path or binary file-like object
+
+    Yields:
+        TraceRecord: Records in the order they were written, tagged with
+            their device address (SESSION records are not yielded)
+
+    Raises:
+        ValueError: If the source is not a traffic log
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            yield from read_traffic_log(f)
+        return
+
+    header = source.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("Not a SCPI traffic log: file too short")
+    magic, version, _ = _HEADER.unpack(header)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise ValueError("Not a SCPI traffic log or unsupported version")
+
+    addresses = {0: ""}
+    while True:
+        record_header = source.read(_RECORD.size)
+        if len(record_header) < _RECORD.size:
+            return
+        kind, elapsed, session, length = _RECORD.unpack(record_header)
+        payload = source.read(length)
+        if len(payload) < length:
+            # Truncated final record, e.g. from an interrupted capture
+            return
+        if kind == RecordKind.SESSION:
+            addresses[session] = payload.decode('ascii', errors='replace')
+            continue
+        yield TraceRecord(RecordKind(kind), elapsed, payload, addresses.get(session, ""))
+
+
+def recorded_sessions(source: Union[str, Path, BinaryIO]) -> List[str]:
+    """
+    List the device addresses with traffic in a log.
+
+    Args:
+        source: File path or binary file-like object
+
+    Returns:
+        list: Addresses in the order of their first record ("" for untagged traffic)
+    """
+    return list(dict.fromkeys(record.session for record in read_traffic_log(source)))
+
+
+# MARK: - Recording and replay resources
+
+class RecordingResource:
+    """
+    Transparent wrapper that records all traffic of a resource.
+
+    Every other attribute (timeout, terminations, ...) is delegated to the
+    wrapped resource, so the wrapper can replace it anywhere.
+    """
+
+    def __init__(self, device, recorder: TrafficRecorder, address: str = ""):
+        """
+        Args:
+            device: PyVISA resource or compatible object to wrap
+            recorder: Log the traffic is written to
+            address: Device address the records are tagged with
+        """
+        object.__setattr__(self, '_device', device)
+        object.__setattr__(self, '_recorder', recorder)
+        object.__setattr__(self, '_session', recorder.session(address) if address else 0)
+
+    @property
+    def wrapped(self):
+        """The underlying resource."""
+        return self._device
+
+    def write(self, command: str):
+        self._recorder.record(RecordKind.WRITE, command, self._session)
+        return self._device.write(command)
+
+    def read(self) -> str:
+        response = self._device.read()
+        self._recorder.record(RecordKind.READ, response, self._session)
+        return response
+
+    def query(self, command: str) -> str:
+        self.write(command)
+        return self.read()
+
+    def read_raw(self, size: Optional[int] = None) -> bytes:
+        data = self._device.read_raw() if size is None else self._device.read_raw(size)
+        self._recorder.record(RecordKind.READ_RAW, data, self._session)
+        return data
+
+    def read_block(self) -> memoryview:
+        block = self._device.read_block()
+        self._recorder.record(RecordKind.BLOCK, block, self._session)
+        return block
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._device, name, value)
+
+
+class ReplayResource:
+    """
+    Resource that serves a recorded conversation back to the caller.
+
+    Commands written by the caller are checked against the log, and reads
+    return the recorded responses. With realtime=True each response is held
+    back until its recorded time, reproducing the original timing; otherwise
+    the log is served as fast as possible, which makes it a hardware-free
+    benchmark input for parsing and storage code. A log holding several
+    devices is replayed one device per resource by passing its address.
+    """
+
+    def __init__(self, source: Union[str, Path, BinaryIO], realtime: bool = False,
+                 strict: bool = True, address: Optional[str] = None):
+        """
+        Load a traffic log for replay.
+
+        Args:
+            source: Traffic log path or file-like object
+            realtime: Reproduce the recorded response timing
+            strict: Raise ReplayMismatchError when a written command differs from the log
+            address: Only replay the traffic of this device; None replays every record
+        """
+        self._records: List[TraceRecord] = [
+            record for record in read_traffic_log(source)
+            if address is None or record.session == address
+        ]
+        self._position = 0
+        self._realtime = realtime
+        self._strict = strict
+        self._start = None
+
+        self.timeout = 30000
+        self.read_termination = '\n'
+        self.write_termination = '\n'
+        self.closed = False
+
+    @property
+    def remaining(self) -> int:
+        """Number of records not yet replayed."""
+        return len(self._records) - self._position
+
+    def rewind(self) -> None:
+        """Restart the replay from the first record."""
+        self._position = 0
+        self._start = None
+
+    def _next(self, kinds) -> TraceRecord:
+        """Return the next record, checking its kind and applying realtime pacing."""
+        if self._position >= len(self._records):
+            raise ReplayMismatchError("Replay log exhausted")
+
+        record = self._records[self._position]
+        if record.kind not in kinds:
+            raise ReplayMismatchError(
+                f"Expected {'/'.join(k.name for k in kinds)} at record {self._position}, "
+                f"log has {record.kind.name}")
+        self._position += 1
+
+        if self._start is None:
+            self._start = time.perf_counter() - record.time
+        elif self._realtime:
+            delay = record.time - (time.perf_counter() - self._start)
+            if delay > 0:
+                time.sleep(delay)
+
+        return record
+
+    def write(self, command: str) -> None:
+        if self._position < len(self._records) and self._records[self._position].kind != RecordKind.WRITE:
+            # The caller skipped reading a response; drop it to stay in step
+            if self._strict:
+                raise ReplayMismatchError(
+                    f"Write of {command!r} while the log expects a response at record {self._position}")
+            while (self._position < len(self._records)
+                   and self._records[self._position].kind != RecordKind.WRITE):
+                self._position += 1
+
+        record = self._next((RecordKind.WRITE,))
+        if self._strict and record.payload.decode('ascii', errors='replace') != command:
+            raise ReplayMismatchError(
+                f"Command mismatch at record {self._position - 1}: "
+                f"sent {command!r}, log has {record.payload!r}")
+
+    def read(self) -> str:
+        record = self._next((RecordKind.READ, RecordKind.READ_RAW))
+        text = record.payload.decode('ascii', errors='replace')
+        if record.kind == RecordKind.READ_RAW:
+            text = text.rstrip(self.read_termination)
+        return text
+
+    def query(self, command: str) -> str:
+        self.write(command)
+        return self.read()
+
+    def read_raw(self, size: Optional[int] = None) -> bytes:
+        record = self._next((RecordKind.READ_RAW, RecordKind.READ, RecordKind.BLOCK))
+        if record.kind == RecordKind.READ:
+            return record.payload + self.read_termination.encode('ascii')
+        if record.kind == RecordKind.BLOCK:
+            size_digits = str(len(record.payload)).encode('ascii')
+            return (b'#' + str(len(size_digits)).encode('ascii') + size_digits
+                    + record.payload + self.read_termination.encode('ascii'))
+        return record.payload
+
+    def read_block(self) -> memoryview:
+        record = self._next((RecordKind.BLOCK, RecordKind.READ_RAW))
+        if record.kind == RecordKind.READ_RAW:
+            header_len, data_size = parse_block_header(record.payload)
+            return memoryview(record.payload)[header_len:header_len + data_size]
+        return memoryview(record.payload)
+
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,129 @@
+"""
+Waveform helpers for PySignalDecipher.
+
+Parses the SCPI waveform preamble and IEEE 488.2 definite-length binary
+blocks returned by oscilloscopes, and converts raw ADC codes to volts.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass
+class WaveformPreamble:
+    """Scaling information returned by the ``:WAV:PRE?`` query."""
+
+    format: int
+    type: int
+    points: int
+    count: int
+    x_increment: float
+    x_origin: float
+    x_reference: float
+    y_increment: float
+    y_origin: float
+    y_reference: float
+
+    @classmethod
+    def from_string(cls, preamble_str: str) -> 'WaveformPreamble':
+        """
+        Parse a comma separated preamble string.
+
+        Args:
+            preamble_str: Response to ``:WAV:PRE?``
+
+        Returns:
+            WaveformPreamble: Parsed preamble
+
+        Raises:
+            ValueError: If the preamble has fewer than 10 fields
+        """
+        fields = preamble_str.strip().split(',')
+        if len(fields) < 10:
+            raise ValueError(f"Invalid waveform preamble: {preamble_str!r}")
+
+        return cls(
+            format=int(float(fields[0])),
+            type=int(float(fields[1])),
+            points=int(float(fields[2])),
+            count=int(float(fields[3])),
+            x_increment=float(fields[4]),
+            x_origin=float(fields[5]),
+            x_reference=float(fields[6]),
+            y_increment=float(fields[7]),
+            y_origin=float(fields[8]),
+            y_reference=float(fields[9])
+        )
+
+    @property
+    def sample_rate(self) -> float:
+        """Sample rate in Hz derived from the time increment."""
+        return 1.0 / self.x_increment if self.x_increment else 0.0
+
+    def time_axis(self, num_points: int) -> np.ndarray:
+        """
+        Build the time axis for a waveform.
+
+        The time origin is the trigger point, so the first sample is at
+        ``x_origin`` (negative when pre-trigger data is captured).
+
+        Args:
+            num_points: Number of samples in the waveform
+
+        Returns:
+            np.ndarray: Sample times in seconds
+        """
+        return np.arange(num_points) * self.x_increment + self.x_origin
+
+    def to_voltages(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Convert raw ADC codes to volts.
+
+        Args:
+            codes: Raw byte codes read from the instrument
+
+        Returns:
+            np.ndarray: Voltage values
+        """
+        return (codes - self.y_origin - self.y_reference) * self.y_increment
+
+
+def parse_block_header(raw_data: bytes) -> Tuple[int, int]:
+    """
+    Parse the header of an IEEE 488.2 definite-length block (``#NXXXX...``).
+
+    Args:
+        raw_data: Bytes starting with the block header
+
+    Returns:
+        tuple: (header_length, data_size) in bytes
+
+    Raises:
+        ValueError: If the data does not start with a valid block header
+    """
+    if raw_data[0:1] != b'#':
+        raise ValueError("Binary block does not start with '#'")
+
+    num_digits = int(raw_data[1:2])
+    if num_digits == 0:
+        raise ValueError("Indefinite-length blocks are not supported")
+
+    header_len = 2 + num_digits
+    data_size = int(raw_data[2:header_len])
+    return header_len, data_size
+
+
+def parse_block(raw_data: bytes) -> np.ndarray:
+    """
+    Extract the payload of an IEEE 488.2 block as unsigned byte codes.
+
+    Args:
+        raw_data: Raw response to ``:WAV:DATA?``
+
+    Returns:
+        np.ndarray: Byte codes (a view on ``raw_data``, no copy)
+    """
+    header_len, data_size = parse_block_header(raw_data)
+    return np.frombuffer(raw_data, dtype=np.uint8, count=data_size, offset=header_len)
@@ -0,0 +1,274 @@
+"""
+ADC Code Codec Module
+
+This module implements a lossless codec for integer ADC codes. Scope data is
+strongly correlated from sample to sample, so each channel is predicted
+from its previous samples (first or second order difference, whichever
+needs fewer bits), the residuals are zigzag mapped to unsigned integers and
+bit-packed in sub-blocks of SUB_BLOCK samples, each with its own bit width.
+Encoding and decoding are vectorized with NumPy and work in the narrowest
+integer dtype that holds the residuals of the codes (16 bits for 8-bit codes).
+
+Encoded layout (little-endian):
+    channels (uint16), then per channel:
+        length (uint32, bytes of the channel block)
+        order (uint8), reserved (uint8), samples (uint32)
+        first `order` samples (int64 each)
+        bit width per sub-block (uint8 each)
+        packed residuals, `width` bit planes of SUB_BLOCK / 8 bytes per sub-block
+"""
+
+import struct
+from typing import List, Tuple
+
+import numpy as np
+
+from .base import SignalFormatError
+
+
+SUB_BLOCK = 256
+_PLANE_BYTES = SUB_BLOCK // 8
+
+_CHANNELS = struct.Struct('<H')
+_LENGTH = struct.Struct('<I')
+_CHANNEL_HEADER = struct.Struct('<BBI')
+
+# Codes wider than this could overflow the int64 residuals
+_SUPPORTED_KINDS = ('i', 'u')
+_MAX_ITEMSIZE = 4
+
+# Work dtype by code size: second order differences of b-bit codes need
+# b + 2 bits, and the zigzag shift one more
+_WORK_DTYPES = {1: np.dtype(np.int16), 2: np.dtype(np.int32), 4: np.dtype(np.int64)}
+
+
+def supports_dtype(dtype: np.dtype) -> bool:
+    """Whether values of this dtype can be encoded."""
+    dtype = np.dtype(dtype)
+    return dtype.kind in _SUPPORTED_KINDS and dtype.itemsize <= _MAX_ITEMSIZE
+
+
+def _work_dtype(dtype: np.dtype) -> np.dtype:
+    """Signed dtype the codes of `dtype` are predicted and reconstructed in."""
+    return _WORK_DTYPES[np.dtype(dtype).itemsize]
+
+
+def _unsigned(dtype: np.dtype) -> np.dtype:
+    return np.dtype(f'u{dtype.itemsize}')
+
+
+def _zigzag(values: np.ndarray, out: np.ndarray) -> None:
+    """Zigzag map signed values into the unsigned array `out` of the same dtype size."""
+    mapped = out.view(values.dtype)
+    np.left_shift(values, 1, out=mapped)
+    mapped ^= values >> (values.dtype.itemsize * 8 - 1)
+
+
+def _unzigzag(values: np.ndarray) -> np.ndarray:
+    signed = np.dtype(f'i{values.dtype.itemsize}')
+    result = (values >> 1).view(signed)
+    sign = (values & 1).view(signed)
+    np.negative(sign, out=sign)
+    result ^= sign
+    return result
+
+
+# Bit plane transposition on 64-bit words holding 8 one-byte values: the
+# multiply gathers the low bit of every byte into the top byte (first byte to
+# the most significant bit, the bit order of np.packbits), and the table
+# spreads a plane byte back, bit 7 - k into the low bit of byte k
+_LOW_BITS = np.uint64(0x0101010101010101)
+_GATHER = np.uint64(0x8040201008040201)
+_SPREAD = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).view('<u8').reshape(-1)
+
+
+def _unit_dtype(width: int) -> np.dtype:
+    """Little-endian unsigned dtype of the fewest bytes that holds `width` bits."""
+    return np.dtype(np.min_scalar_type((1 << int(width)) - 1)).newbyteorder('<')
+
+
+def _bit_widths(values: np.ndarray) -> np.ndarray:
+    """Number of bits needed for the largest value of every sub-block."""
+    maxima = values.reshape(-1, SUB_BLOCK).max(axis=1)
+    # Residuals of codes up to 32 bits stay well below 2**53, so the float
+    # exponent is the exact bit length
+    return np.frexp(maxima.astype(np.float64))[1].astype(np.uint8)
+
+
+def _pack(values: np.ndarray, widths: np.ndarray) -> bytes:
+    """
+    Bit-pack sub-blocks of values as bit planes: for a sub-block of width w,
+    w planes of SUB_BLOCK bits, least significant plane first. Sub-blocks of
+    equal width are packed together, one NumPy operation per plane.
+    """
+    blocks = values.reshape(-1, SUB_BLOCK)
+    sizes = widths.astype(np.int64) * _PLANE_BYTES
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    packed = np.zeros(int(offsets[-1]), dtype=np.uint8)
+
+    for width in np.unique(widths):
+        if width == 0:
+            continue
+        rows = np.nonzero(widths == width)[0]
+        # Values in the narrowest dtype that holds the width, one byte of each at a time
+        unit = _unit_dtype(width)
+        group = blocks[rows].astype(unit).view(np.uint8).reshape(len(rows), SUB_BLOCK, unit.itemsize)
+        planes = np.empty((len(rows), width, _PLANE_BYTES), dtype=np.uint8)
+        for byte in range(-(-int(width) // 8)):
+            words = np.ascontiguousarray(group[:, :, byte]).view('<u8')
+            for bit in range(8 * byte, min(int(width), 8 * byte + 8)):
+                planes[:, bit] = ((((words >> (bit - 8 * byte)) & _LOW_BITS) * _GATHER) >> 56).astype(np.uint8)
+        row_bytes = planes.reshape(len(rows), -1)
+        positions = offsets[rows][:, None] + np.arange(row_bytes.shape[1])
+        packed[positions] = row_bytes
+    return packed.tobytes()
+
+
+def _unpack(data: np.ndarray, widths: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Inverse of _pack; returns the values of all sub-blocks as unsigned `dtype`."""
+    sizes = widths.astype(np.int64) * _PLANE_BYTES
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    if len(data) < offsets[-1]:
+        raise SignalFormatError("ADC block is truncated")
+    blocks = np.zeros((len(widths), SUB_BLOCK), dtype=dtype)
+    if int(widths.max(initial=0)) > dtype.itemsize * 8:
+        raise SignalFormatError("ADC sub-block is wider than its codes")
+
+    for width in np.unique(widths):
+        if width == 0:
+            continue
+        rows = np.nonzero(widths == width)[0]
+        positions = offsets[rows][:, None] + np.arange(int(sizes[rows[0]]))
+        planes = data[positions].reshape(len(rows), width, _PLANE_BYTES)
+        # Rebuild the values one byte at a time in the narrowest dtype that holds the width
+        unit = _unit_dtype(width)
+        group = np.zeros((len(rows), SUB_BLOCK, unit.itemsize), dtype=np.uint8)
+        for byte in range(-(-int(width) // 8)):
+            words = _SPREAD[planes[:, 8 * byte]]
+            for bit in range(8 * byte + 1, min(int(width), 8 * byte + 8)):
+                words |= _SPREAD[planes[:, bit]] << np.uint64(bit - 8 * byte)
+            group[:, :, byte] = words.view(np.uint8).reshape(len(rows), SUB_BLOCK)
+        blocks[rows] = group.view(unit).reshape(len(rows), SUB_BLOCK)
+    return blocks.reshape(-1)
+
+
+def _encode_channel(codes: np.ndarray) -> bytes:
+    codes = codes.astype(_work_dtype(codes.dtype))
+    n = len(codes)
+
+    best = None
+    residuals = codes
+    for order in (1, 2):
+        if n <= order:
+            order = n
+        # Each order differences the residuals of the one before
+        residuals = np.diff(residuals) if order else codes[:0]
+        padded = np.zeros(-(-len(residuals) // SUB_BLOCK) * SUB_BLOCK, dtype=_unsigned(codes.dtype))
+        _zigzag(residuals, padded[:len(residuals)])
+        widths = _bit_widths(padded)
+        size = int(widths.astype(np.int64).sum())
+        if best is None or size < best[0]:
+            best = (size, order, padded, widths)
+        if order == n:
+            break
+
+    _, order, padded, widths = best
+    parts = [
+        _CHANNEL_HEADER.pack(order, 0, n),
+        codes[:order].astype('<i8').tobytes(),
+        widths.tobytes(),
+        _pack(padded, widths),
+    ]
+    return b''.join(parts)
+
+
+def _decode_channel(data: memoryview, dtype: np.dtype) -> np.ndarray:
+    order, _, n = _CHANNEL_HEADER.unpack_from(data)
+    position = _CHANNEL_HEADER.size
+    initial = np.frombuffer(data, dtype='<i8', count=order, offset=position)
+    position += order * 8
+
+    num_blocks = -(-(n - order) // SUB_BLOCK)
+    widths = np.frombuffer(data, dtype=np.uint8, count=num_blocks, offset=position)
+    position += num_blocks
+    packed = np.frombuffer(data, dtype=np.uint8, offset=position)
+    work = _work_dtype(dtype)
+
+    values = np.empty(n, dtype=work)
+    values[order:] = _unzigzag(_unpack(packed, widths, _unsigned(work))[:n - order])
+    # Undo the differences one order at a time in place, each seeded with
+    # the first difference of the next lower order
+    for k in range(order, 0, -1):
+        values[k - 1] = np.diff(initial, n=k - 1)[0]
+        np.cumsum(values[k - 1:], out=values[k - 1:])
+    return values
+
+
+def encode(values: np.ndarray) -> bytes:
+    """
+    Encode integer codes.
+
+    Args:
+        values: Integer array of shape (samples,) or (samples, channels)
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        SignalFormatError: If the dtype is not an integer type of at most 32 bits
+    """
+    values = np.asarray(values)
+    if not supports_dtype(values.dtype):
+        raise SignalFormatError(f"ADC codec requires integer codes of at most 32 bits, got {values.dtype}")
+
+    columns = values.reshape(len(values), values.shape[1]) if values.ndim > 1 else values[:, None]
+    parts = [_CHANNELS.pack(columns.shape[1])]
+    for channel in range(columns.shape[1]):
+        block = _encode_channel(columns[:, channel])
+        parts.append(_LENGTH.pack(len(block)))
+        parts.append(block)
+    return b''.join(parts)
+
+
+def decode(data: bytes, dtype: np.dtype, multi_channel: bool = False) -> np.ndarray:
+    """
+    Decode bytes produced by encode().
+
+    Args:
+        data: Encoded bytes
+        dtype: Dtype of the original codes
+        multi_channel: Return shape (samples, channels) even for one channel
+
+    Returns:
+        The original integer array
+
+    Raises:
+        SignalFormatError: If the data is malformed
+    """
+    data = memoryview(data)
+    try:
+        (channels,) = _CHANNELS.unpack_from(data)
+        position = _CHANNELS.size
+        columns: List[np.ndarray] = []
+        for _ in range(channels):
+            (length,) = _LENGTH.unpack_from(data, position)
+            position += _LENGTH.size
+            columns.append(_decode_channel(data[position:position + length], dtype))
+            position += length
+    except struct.error as e:
+        raise SignalFormatError(f"Malformed ADC block: {e}")
+
+    if channels == 1 and not multi_channel:
+        return columns[0].astype(dtype)
+    return np.column_stack(columns).astype(dtype)
+
+
+def compression_ratio(values: np.ndarray) -> Tuple[int, float]:
+    """
+    Encoded size and ratio against the raw codes, for choosing a storage option.
+
+    Returns:
+        (encoded bytes, raw bytes / encoded bytes)
+    """
+    size = len(encode(values))
+    return size, np.asarray(values).nbytes / size if size else float('inf')
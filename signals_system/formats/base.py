@@ -7,7 +7,9 @@ Formats are responsible for reading, writing and manipulating signal data.
 
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+import importlib
 import logging
+import os
 from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO
 import numpy as np
 from dataclasses import dataclass
@@ -88,26 +90,65 @@ class SignalData:
         
         return None
     
-    def slice(self, start_idx: int, end_idx: Optional[int] = None) -> 'SignalData':
-        """Extract a slice of the signal by sample indices."""
-        end_idx = end_idx or len(self.values)
+    @property
+    def timestamps_sorted(self) -> bool:
+        """
+        Whether the timestamps are monotonically non-decreasing.
         
-        values_slice = self.values[start_idx:end_idx]
-        timestamps_slice = None
-        if self.timestamps is not None:
-            timestamps_slice = self.timestamps[start_idx:end_idx]
+        The check is O(n) and cached per timestamp array; slices of sorted
+        data inherit the flag. Arrays modified in place after the check are
+        not re-examined.
+        """
+        if self.timestamps is None:
+            return False
+        cached = self.__dict__.get('_sorted_cache')
+        if cached is None or cached[0] is not self.timestamps:
+            timestamps = self.timestamps
+            is_sorted = bool(np.all(timestamps[1:] >= timestamps[:-1])) if len(timestamps) > 1 else True
+            cached = (timestamps, is_sorted)
+            self._sorted_cache = cached
+        return cached[1]
+    
+    def _view(self, index: slice) -> 'SignalData':
+        """Create a slice that shares values and timestamps with this signal."""
+        timestamps = self.timestamps[index] if self.timestamps is not None else None
+        view = SignalData(values=self.values[index], timestamps=timestamps, metadata=self.metadata.copy())
+        
+        cached = self.__dict__.get('_sorted_cache')
+        if timestamps is not None and cached is not None and cached[0] is self.timestamps and cached[1]:
+            view._sorted_cache = (timestamps, True)
+        return view
+    
+    def slice(self, start_idx: int, end_idx: Optional[int] = None) -> 'SignalData':
+        """
+        Extract a slice of the signal by sample indices.
         
-        return SignalData(
-            values=values_slice,
-            timestamps=timestamps_slice,
-            metadata=self.metadata.copy()  # Copy metadata to the slice
-        )
+        The slice is a view: values and timestamps share memory with this
+        signal. The metadata dict is copied.
+        """
+        end_idx = end_idx or len(self.values)
+        return self._view(slice(start_idx, end_idx))
     
     def time_slice(self, time_range: TimeRange) -> 'SignalData':
-        """Extract a slice of the signal by time range."""
+        """
+        Extract a slice of the signal by time range.
+        
+        For sorted timestamps the bounds are found by binary search and the
+        result is a view like slice(); unsorted timestamps fall back to a
+        boolean mask, which copies the selected samples.
+        """
         if self.timestamps is None:
             raise ValueError("Cannot slice by time: no timestamps available")
         
+        if self.timestamps_sorted:
+            start_idx = 0
+            end_idx = len(self.timestamps)
+            if time_range.start is not None:
+                start_idx = int(np.searchsorted(self.timestamps, time_range.start, side='left'))
+            if time_range.end is not None:
+                end_idx = int(np.searchsorted(self.timestamps, time_range.end, side='right'))
+            return self._view(slice(start_idx, max(start_idx, end_idx)))
+        
         # Create mask for time range
         mask = np.ones(len(self.timestamps), dtype=bool)
         if time_range.start is not None:
@@ -125,11 +166,102 @@ class SignalData:
         )
 
 
+def uniform_time_base(timestamps: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Detect a uniform time base that reproduces the timestamps.
+    
+    Timestamps computed in other ways (e.g. arange(n) / rate) differ from
+    the time base by rounding, so they only have to match to within a
+    millionth of the interval.
+    
+    Args:
+        timestamps: Timestamp array
+        
+    Returns:
+        (start_time, sample_interval) if start_time + arange(n) * sample_interval
+        matches the timestamps, otherwise None
+    """
+    n = len(timestamps)
+    if n < 2:
+        return None
+    start = float(timestamps[0])
+    interval = float(timestamps[-1] - timestamps[0]) / (n - 1)
+    if interval <= 0:
+        return None
+    if np.allclose(start + np.arange(n) * interval, timestamps, rtol=0.0, atol=interval * 1e-6):
+        return start, interval
+    return None
+
+
+def uniform_time_indices(start_time: float, sample_interval: float, num_samples: int,
+                         time_range: 'TimeRange') -> Tuple[int, int]:
+    """
+    Compute the sample indices of a time range on a uniform time base in O(1).
+    
+    The result matches a mask of start <= t <= end with t = start_time + i * sample_interval.
+    
+    Args:
+        start_time: Time of the first sample
+        sample_interval: Time between samples
+        num_samples: Number of samples
+        time_range: Time range to select
+        
+    Returns:
+        (start_idx, end_idx) half-open index range
+    """
+    def time_at(i):
+        return start_time + i * sample_interval
+    
+    start_idx = 0
+    end_idx = num_samples
+    if sample_interval <= 0:
+        return start_idx, end_idx
+    
+    if time_range.start is not None:
+        start_idx = min(max(int(np.ceil((time_range.start - start_time) / sample_interval)), 0), num_samples)
+        # Correct floating point rounding at the boundary
+        while start_idx > 0 and time_at(start_idx - 1) >= time_range.start:
+            start_idx -= 1
+        while start_idx < num_samples and time_at(start_idx) < time_range.start:
+            start_idx += 1
+    
+    if time_range.end is not None:
+        end_idx = min(max(int(np.floor((time_range.end - start_time) / sample_interval)) + 1, 0), num_samples)
+        while end_idx < num_samples and time_at(end_idx) <= time_range.end:
+            end_idx += 1
+        while end_idx > 0 and time_at(end_idx - 1) > time_range.end:
+            end_idx -= 1
+    
+    return start_idx, max(end_idx, start_idx)
+
+
 class SignalFormatError(Exception):
     """Base exception for all signal format related errors."""
     pass
 
 
+class ChecksumError(SignalFormatError):
+    """Raised when a block of a file does not match its stored checksum."""
+    pass
+
+
+@dataclass
+class BlockError:
+    """A block of a file (frame, compressed block or chunk) that failed verification."""
+    
+    # Position of the block in the file
+    index: int
+    
+    # Description of the failure
+    message: str
+    
+    # Time span covered by the block, if known
+    time_range: Optional[TimeRange] = None
+    
+    # Byte offset of the block in the file, if meaningful for the format
+    offset: Optional[int] = None
+
+
 class SignalFormat(ABC):
     """
     Base class for all signal format handlers.
@@ -138,6 +270,10 @@ class SignalFormat(ABC):
     Formats are responsible for reading and writing signal data.
     """
     
+    # Flush the stream after every write_chunk() so readers can follow it;
+    # writers that flush on their own schedule turn this off
+    flush_chunks = True
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -160,6 +296,21 @@ class SignalFormat(ABC):
         """Check if this format supports a specific capability."""
         return capability in self.capabilities
     
+    def get_capabilities(self, source: Union[str, Path, BinaryIO]) -> List[FormatCapability]:
+        """
+        Get the capabilities available for a specific source.
+        
+        Some capabilities depend on the file rather than the format, e.g. on an
+        index that may or may not exist. The default returns the static capabilities.
+        
+        Args:
+            source: File path or file-like object
+            
+        Returns:
+            List of capabilities supported for this source
+        """
+        return self.capabilities
+    
     @abstractmethod
     def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
         """
@@ -309,9 +460,10 @@ class SignalFormat(ABC):
     
     # --- Methods for random access capability ---
     
-    def supports_random_access(self) -> bool:
-        """Check if this format supports random access operations."""
-        return FormatCapability.RANDOM_ACCESS in self.capabilities
+    def supports_random_access(self, source: Optional[Union[str, Path, BinaryIO]] = None) -> bool:
+        """Check if this format supports random access operations, optionally for a specific source."""
+        capabilities = self.capabilities if source is None else self.get_capabilities(source)
+        return FormatCapability.RANDOM_ACCESS in capabilities
     
     def read_time_range(self, source: Union[str, Path, BinaryIO], time_range: TimeRange) -> SignalData:
         """
@@ -336,6 +488,106 @@ class SignalFormat(ABC):
         # Default implementation: read all and filter
         data = self.read(source)
         return data.time_slice(time_range)
+    
+    # --- Integrity ---
+    
+    def verify(self, source: Union[str, Path, BinaryIO], workers: Optional[int] = None) -> List[BlockError]:
+        """
+        Check a source for corruption.
+        
+        The default implementation reads the whole source and reports a single
+        error if that fails. Formats with per-block checksums override it to
+        check every block and report each bad one with its time span.
+        
+        Args:
+            source: File path or file-like object to check
+            workers: Number of threads used to compute checksums (format default if None)
+            
+        Returns:
+            The blocks that failed verification; empty if the source is intact
+        """
+        try:
+            self.read(source)
+            return []
+        except Exception as e:
+            return [BlockError(index=0, message=str(e))]
+    
+    # --- Lazy access ---
+    
+    def open_lazy(self, source: Union[str, Path, BinaryIO], cache_size: Optional[int] = None) -> 'SignalData':
+        """
+        Open a source as a LazySignalData whose samples are read on demand.
+        
+        The default implementation reads the whole source and wraps the
+        arrays; formats with memory-mapped or chunked storage override it
+        so that opening a recording does not load it.
+        
+        Args:
+            source: File path or file-like object to read from
+            cache_size: Number of decoded chunks to cache (format default if None)
+            
+        Returns:
+            LazySignalData; close it (or use it as a context manager) to release the file
+            
+        Raises:
+            SignalFormatError: If opening fails
+        """
+        from .lazy import ArraySource, LazySignalData
+        
+        data = self.read(source)
+        return LazySignalData(ArraySource(np.asarray(data.values), data.timestamps), metadata=data.metadata)
+
+
+# --- Content sniffing ---
+
+def sniff_json(head: bytes) -> bool:
+    """Check whether the first bytes of a file look like a JSON object."""
+    return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"{")
+
+
+def sniff_csv(head: bytes) -> bool:
+    """
+    Check whether the first bytes of a file look like a numeric CSV file.
+    
+    Requires a header row followed by a data row with the same number of
+    numeric fields; leading '#' comment lines are skipped.
+    """
+    if b"\x00" in head:
+        return False
+    try:
+        text = head.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    
+    # Ignore a possibly truncated last line
+    lines = text.splitlines()
+    if not text.endswith("\n"):
+        lines = lines[:-1]
+    lines = [line.strip() for line in lines]
+    lines = [line for line in lines if line and not line.startswith("#")]
+    if len(lines) < 2:
+        return False
+    
+    header, row = lines[0].split(","), lines[1].split(",")
+    if len(header) < 1 or len(row) != len(header):
+        return False
+    try:
+        [float(field) for field in row]
+    except ValueError:
+        return False
+    return True
+
+
+class _LazyFormat:
+    """Registry entry for a format whose module is imported on first use."""
+    
+    def __init__(self, module: str, class_name: str, extensions: List[str],
+                 magic: List[bytes], sniffer):
+        self.module = module
+        self.class_name = class_name
+        self.extensions = extensions
+        self.magic = magic
+        self.sniffer = sniffer
 
 
 class FormatRegistry:
@@ -344,12 +596,32 @@ class FormatRegistry:
     
     This class keeps track of available formats and provides methods
     for finding and creating format instances.
+    
+    Formats are either registered as classes, or lazily by name with the
+    module and class that implement them, in which case the module is only
+    imported when the format is first used. Files are matched by magic bytes
+    or header content first and by extension second.
     """
     
+    # Bytes read from a file for content detection
+    SNIFF_SIZE = 4096
+    
     def __init__(self):
         """Initialize an empty format registry."""
         self._formats = {}  # Maps format name to class
-        self._extensions = {}  # Maps file extension to format class
+        self._lazy = {}  # Maps format name to a _LazyFormat entry not yet imported
+        self._extensions = {}  # Maps file extension to format name
+        self._magic = []  # (magic bytes, format name), longest first
+        self._sniffers = []  # (sniffer, format name) in registration order
+        self._validation_cache = {}  # Maps (format, path, mtime, size) to validate() result
+    
+    def _register_extensions(self, name: str, extensions: List[str]) -> None:
+        for ext in extensions:
+            ext = ext.lower()
+            if ext in self._extensions and self._extensions[ext] != name:
+                logger.warning(f"Extension '{ext}' is already registered to {self._extensions[ext]}, "
+                               f"now mapping to {name}")
+            self._extensions[ext] = name
     
     def register(self, format_class):
         """
@@ -365,19 +637,62 @@ class FormatRegistry:
         format_instance = format_class()
         name = format_instance.name.lower()
         
-        if name in self._formats:
+        if name in self._formats or name in self._lazy:
             raise ValueError(f"Format '{name}' is already registered")
         
         # Register the class
         self._formats[name] = format_class
         
         # Register extensions
-        for ext in format_instance.extensions:
-            ext = ext.lower()
-            if ext in self._extensions:
-                logger.warning(f"Extension '{ext}' is already registered to {self._extensions[ext].__name__}, "
-                               f"now mapping to {format_class.__name__}")
-            self._extensions[ext] = format_class
+        self._register_extensions(name, format_instance.extensions)
+    
+    def register_lazy(self, name: str, module: str, class_name: str, extensions: List[str],
+                      magic: Optional[List[bytes]] = None, sniffer=None) -> None:
+        """
+        Register a format by name without importing its module.
+        
+        Args:
+            name: Format name, as returned by the format's name property
+            module: Module implementing the format; relative names are resolved
+                    against this package (e.g. ".hdf5_format")
+            class_name: Name of the SignalFormat subclass in the module
+            extensions: File extensions handled by the format
+            magic: Byte signatures a file of this format starts with
+            sniffer: Callable taking the first bytes of a file and returning
+                     True if they look like this format
+            
+        Raises:
+            ValueError: If a format with the same name is already registered
+        """
+        name = name.lower()
+        if name in self._formats or name in self._lazy:
+            raise ValueError(f"Format '{name}' is already registered")
+        
+        self._lazy[name] = _LazyFormat(module, class_name, list(extensions), list(magic or []), sniffer)
+        self._register_extensions(name, extensions)
+        for signature in magic or []:
+            self._magic.append((signature, name))
+        self._magic.sort(key=lambda entry: len(entry[0]), reverse=True)
+        if sniffer is not None:
+            self._sniffers.append((sniffer, name))
+    
+    def _get_class(self, name: str):
+        """Return the class for a format name, importing lazy formats on first use."""
+        if name in self._formats:
+            return self._formats[name]
+        
+        entry = self._lazy[name]
+        module = importlib.import_module(entry.module, package=__package__)
+        format_class = getattr(module, entry.class_name)
+        
+        del self._lazy[name]
+        self._formats[name] = format_class
+        return format_class
+    
+    @property
+    def names(self) -> List[str]:
+        """Names of all registered formats, including ones not imported yet."""
+        return list(self._formats) + list(self._lazy)
     
     def get_format(self, name: str) -> SignalFormat:
         """
@@ -393,9 +708,9 @@ class FormatRegistry:
             KeyError: If no format with that name is registered
         """
         name = name.lower()
-        if name not in self._formats:
+        if name not in self._formats and name not in self._lazy:
             raise KeyError(f"No format registered with name '{name}'")
-        return self._formats[name]()
+        return self._get_class(name)()
     
     def get_for_extension(self, extension: str) -> SignalFormat:
         """
@@ -416,31 +731,108 @@ class FormatRegistry:
         
         if extension not in self._extensions:
             raise KeyError(f"No format registered for extension '{extension}'")
-        return self._extensions[extension]()
+        return self._get_class(self._extensions[extension])()
+    
+    def detect(self, source: Union[str, Path, BinaryIO]) -> Optional[str]:
+        """
+        Detect the format of a file from its content.
+        
+        Reads at most SNIFF_SIZE bytes and checks magic signatures first,
+        then the registered content sniffers. No format module is imported.
+        
+        Args:
+            source: File path or binary file-like object
+            
+        Returns:
+            Format name, or None if the content is not recognized
+        """
+        if isinstance(source, (str, Path)):
+            try:
+                with open(source, 'rb') as f:
+                    head = f.read(self.SNIFF_SIZE)
+            except OSError:
+                return None
+        else:
+            pos = source.tell()
+            source.seek(0)
+            head = source.read(self.SNIFF_SIZE)
+            source.seek(pos)
+        
+        for signature, name in self._magic:
+            if head.startswith(signature):
+                return name
+        for sniffer, name in self._sniffers:
+            if sniffer(head):
+                return name
+        return None
     
-    def get_for_file(self, file_path: Union[str, Path]) -> SignalFormat:
+    def get_for_file(self, file_path: Union[str, Path], sniff: bool = True) -> SignalFormat:
         """
-        Get a format instance for a file path based on its extension.
+        Get a format instance for a file path.
+        
+        Existing files are identified by their content (see detect()); the
+        extension is used when the content is not recognized, or for files
+        that do not exist yet.
         
         Args:
             file_path: Path to the file
+            sniff: Inspect the file content before falling back to the extension
             
         Returns:
             SignalFormat instance
             
         Raises:
-            KeyError: If no format is registered for the file's extension
+            KeyError: If the content is not recognized and no format is registered
+                      for the file's extension
         """
         if isinstance(file_path, str):
             file_path = Path(file_path)
         
+        if sniff and file_path.is_file():
+            name = self.detect(file_path)
+            if name is not None:
+                return self._get_class(name)()
+        
         extension = '.' + file_path.suffix.lstrip('.')
         return self.get_for_extension(extension)
     
+    def is_valid(self, file_path: Union[str, Path], format_name: Optional[str] = None) -> bool:
+        """
+        Validate a file, caching the result per (format, path, mtime, size).
+        
+        Repeated checks of unchanged files, e.g. when listing a directory of
+        captures, do not call the format's validate() again.
+        
+        Args:
+            file_path: Path to the file
+            format_name: Format to validate against; detected from the file if None
+            
+        Returns:
+            True if the format accepts the file, False otherwise
+        """
+        try:
+            stat = os.stat(file_path)
+            format_instance = (self.get_format(format_name) if format_name is not None
+                               else self.get_for_file(file_path))
+        except (OSError, KeyError):
+            return False
+        
+        key = (format_instance.name.lower(), os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._validation_cache:
+            self._validation_cache[key] = format_instance.validate(file_path)
+        return self._validation_cache[key]
+    
+    def clear_validation_cache(self) -> None:
+        """Forget all cached validate() results."""
+        self._validation_cache.clear()
+    
     def find_with_capability(self, capability: FormatCapability) -> List[SignalFormat]:
         """
         Find all formats that support a specific capability.
         
+        Capabilities are properties of the format classes, so this imports
+        every lazily registered format.
+        
         Args:
             capability: The capability to search for
             
@@ -448,8 +840,8 @@ class FormatRegistry:
             List of SignalFormat instances
         """
         result = []
-        for format_class in self._formats.values():
-            format_instance = format_class()
+        for name in self.names:
+            format_instance = self._get_class(name)()
             if format_instance.has_capability(capability):
                 result.append(format_instance)
         return result
@@ -459,23 +851,20 @@ class FormatRegistry:
 registry = FormatRegistry()
 
 def register_builtin_formats():
-    """Register all built-in format handlers."""
-    # Import and register formats to avoid circular imports
-    from .json_format import JsonFormat
-    from .csv_format import CsvFormat
-    
-    registry.register(JsonFormat)
-    registry.register(CsvFormat)
-    
-    # TODO: Register other built-in formats when implemented
-    # from .numpy_format import NumpyFormat
-    # from .hdf5_format import Hdf5Format
-    # from .protobuf_format import ProtobufFormat
-    # 
-    # registry.register(NumpyFormat)
-    # registry.register(Hdf5Format)
-    # registry.register(ProtobufFormat)
+    """
+    Register all built-in format handlers.
+    
+    Handlers are registered lazily, so their modules (and optional
+    dependencies such as h5py) are only imported when first used.
+    """
+    registry.register_lazy("json", ".json_format", "JsonFormat", [".json", ".jsn"], sniffer=sniff_json)
+    registry.register_lazy("csv", ".csv_format", "CsvFormat", [".csv"], sniffer=sniff_csv)
+    registry.register_lazy("numpy", ".numpy_format", "NumpyFormat", [".npy", ".npz"], magic=[b"\x93NUMPY"])
+    registry.register_lazy("hdf5", ".hdf5_format", "Hdf5Format", [".h5", ".hdf5"],
+                           magic=[b"\x89HDF\r\n\x1a\n"])
+    registry.register_lazy("binary", ".protobuf_format", "BinaryFrameFormat", [".sigbin"], magic=[b"PSDFRM"])
+    registry.register_lazy("compressed", ".compression", "CompressedFormat", [".blz"], magic=[b"PSDBLK"])
 
 # Call register_builtin_formats to populate the registry
 # This fixes the empty registry issue
-register_builtin_formats()
\ No newline at end of file
+register_builtin_formats()
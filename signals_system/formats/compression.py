@@ -0,0 +1,845 @@
+"""
+Block Compression Module
+
+This module implements a compression layer usable by any signal format.
+The output of a format handler is split into blocks that are compressed
+independently with a stdlib codec (zlib, lzma or bz2) in a thread pool;
+the codecs release the GIL, so blocks are compressed in parallel. A block
+table stores the offset of every block, so a reader can seek to any byte of
+the uncompressed stream and decompress only the blocks it touches.
+
+File layout (little-endian):
+    header:   b'PSDBLK' + version (uint8) + codec id (uint8) + block size (uint32)
+              + inner format name length (uint8) + inner format name (ASCII)
+    block:    compressed size (uint32) + uncompressed size (uint32)
+              + CRC32 of the compressed bytes (uint32) + compressed bytes
+    footer:   size 0 (end of blocks marker)
+              + table (offset uint64, compressed size uint32, uncompressed size uint32) per block
+              + trailer (table offset uint64, blocks uint64, uncompressed size uint64, b'PSDBIDX1')
+
+Blocks are self-delimiting, so the table is rebuilt by walking the block
+headers when a writer was interrupted before writing the footer. The block
+checksum covers the compressed bytes, so a file is verified without
+decompressing it.
+"""
+
+import bz2
+import io
+import lzma
+import os
+import struct
+import time
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional, Union, BinaryIO, Tuple
+
+import numpy as np
+
+from .base import (
+    SignalFormat,
+    SignalData,
+    TimeRange,
+    FormatCapability,
+    SignalFormatError,
+    ChecksumError,
+    BlockError,
+    registry
+)
+
+
+FILE_MAGIC = b'PSDBLK'
+FILE_VERSION = 2
+INDEX_MAGIC = b'PSDBIDX1'
+
+_FILE_HEADER = struct.Struct('<6sBBIB')
+_BLOCK_HEADER = struct.Struct('<III')
+_TRAILER = struct.Struct('<QQQ8s')
+
+_TABLE_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('size', '<u4'),
+    ('raw_size', '<u4'),
+])
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+
+# --- Codecs ---
+
+class Codec:
+    """A block compression codec."""
+
+    def __init__(self, name: str, codec_id: int, compress: Callable[[bytes, Optional[int]], bytes],
+                 decompress: Callable[[bytes], bytes], default_level: Optional[int] = None):
+        """
+        Initialize the codec.
+
+        Args:
+            name: Codec name used in the API
+            codec_id: Identifier stored in file headers; never renumber
+            compress: Function (data, level) -> compressed data
+            decompress: Function (compressed data) -> data
+            default_level: Level used when none is given
+        """
+        self.name = name
+        self.codec_id = codec_id
+        self._compress = compress
+        self._decompress = decompress
+        self.default_level = default_level
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        return self._compress(data, self.default_level if level is None else level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompress(data)
+
+    def __repr__(self):
+        return f"Codec({self.name})"
+
+
+_CODECS: Dict[str, Codec] = {}
+_CODECS_BY_ID: Dict[int, Codec] = {}
+
+# Names from the serialization settings that map onto a codec
+_ALIASES = {"gzip": "zlib", "deflate": "zlib", "xz": "lzma", "bzip2": "bz2"}
+
+
+def register_codec(codec: Codec) -> None:
+    """
+    Register a codec.
+
+    Raises:
+        ValueError: If the name or id is already taken
+    """
+    if codec.name in _CODECS or codec.codec_id in _CODECS_BY_ID:
+        raise ValueError(f"Codec '{codec.name}' (id {codec.codec_id}) is already registered")
+    _CODECS[codec.name] = codec
+    _CODECS_BY_ID[codec.codec_id] = codec
+
+
+def get_codec(codec: Union[str, int, Codec]) -> Codec:
+    """
+    Look up a codec by name, alias or file header id.
+
+    Raises:
+        SignalFormatError: If the codec is unknown
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if isinstance(codec, int):
+        if codec not in _CODECS_BY_ID:
+            raise SignalFormatError(f"Unknown compression codec id: {codec}")
+        return _CODECS_BY_ID[codec]
+    name = _ALIASES.get(codec.lower(), codec.lower())
+    if name not in _CODECS:
+        raise SignalFormatError(f"Unknown compression codec '{codec}', available: {', '.join(_CODECS)}")
+    return _CODECS[name]
+
+
+def available_codecs() -> List[str]:
+    """Names of all registered codecs."""
+    return list(_CODECS)
+
+
+register_codec(Codec("none", 0, lambda data, level: bytes(data), bytes))
+register_codec(Codec("zlib", 1, lambda data, level: zlib.compress(data, level), zlib.decompress, 6))
+register_codec(Codec("lzma", 2, lambda data, level: lzma.compress(data, preset=level), lzma.decompress, 6))
+register_codec(Codec("bz2", 3, lambda data, level: bz2.compress(data, compresslevel=level), bz2.decompress, 9))
+
+
+class BlockCompressor:
+    """
+    Compresses and decompresses independent blocks in a thread pool.
+
+    zlib, lzma and bz2 release the GIL while they work, so blocks are
+    processed in parallel on all cores.
+    """
+
+    def __init__(self, codec: Union[str, Codec] = "zlib", level: Optional[int] = None,
+                 workers: Optional[int] = None):
+        """
+        Initialize the compressor.
+
+        Args:
+            codec: Codec name or instance
+            level: Compression level (codec default if None)
+            workers: Number of threads (defaults to the CPU count)
+        """
+        self.codec = get_codec(codec)
+        self.level = level
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="block-codec")
+        return self._executor
+
+    def submit(self, block: bytes):
+        """Compress one block in the background and return its future."""
+        return self.executor.submit(self.codec.compress, block, self.level)
+
+    def compress_blocks(self, blocks: List[bytes]) -> List[bytes]:
+        """Compress blocks in parallel, preserving their order."""
+        if len(blocks) <= 1:
+            return [self.codec.compress(block, self.level) for block in blocks]
+        return list(self.executor.map(lambda block: self.codec.compress(block, self.level), blocks))
+
+    def decompress_blocks(self, blocks: List[bytes]) -> List[bytes]:
+        """Decompress blocks in parallel, preserving their order."""
+        if len(blocks) <= 1:
+            return [self.codec.decompress(block) for block in blocks]
+        return list(self.executor.map(self.codec.decompress, blocks))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# --- Block streams ---
+
+class BlockCompressedWriter(io.RawIOBase):
+    """
+    Writable file object that compresses what is written to it in blocks.
+
+    Full blocks are compressed in the background and written in order;
+    flush() does not cut a block, so formats that flush after every chunk
+    still produce full-size blocks. close() writes the block table.
+    """
+
+    def __init__(self, file: BinaryIO, owns_file: bool, codec: Union[str, Codec] = "zlib",
+                 level: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE,
+                 inner_format: str = "", workers: Optional[int] = None):
+        super().__init__()
+        self.file = file
+        self.owns_file = owns_file
+        self.block_size = block_size
+        self.compressor = BlockCompressor(codec, level, workers)
+        self.table: List[Tuple[int, int, int]] = []
+        self.raw_size = 0
+
+        self._buffer = bytearray()
+        self._pending = deque()
+
+        name = inner_format.lower().encode('ascii')
+        header = _FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, self.compressor.codec.codec_id, block_size, len(name))
+        self.file.write(header + name)
+        self._offset = len(header) + len(name)
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        pending = sum(raw_size for _, raw_size in self._pending)
+        return self.raw_size + pending + len(self._buffer)
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        data = memoryview(data).cast('B')
+        self._buffer += data
+
+        if len(self._buffer) >= self.block_size:
+            cut = len(self._buffer) - len(self._buffer) % self.block_size
+            for start in range(0, cut, self.block_size):
+                self._submit(bytes(self._buffer[start:start + self.block_size]))
+            del self._buffer[:cut]
+        return len(data)
+
+    def _compress(self, block: bytes) -> Tuple[bytes, int]:
+        compressed = self.compressor.codec.compress(block, self.compressor.level)
+        return compressed, zlib.crc32(compressed)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append((self.compressor.executor.submit(self._compress, block), len(block)))
+        # Bound the memory held by blocks waiting to be written
+        while len(self._pending) > 2 * self.compressor.workers:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        future, raw_size = self._pending.popleft()
+        compressed, crc = future.result()
+        self.file.write(_BLOCK_HEADER.pack(len(compressed), raw_size, crc))
+        self.file.write(compressed)
+        self.table.append((self._offset, len(compressed), raw_size))
+        self._offset += _BLOCK_HEADER.size + len(compressed)
+        self.raw_size += raw_size
+
+    def flush(self) -> None:
+        if not self.closed:
+            self.file.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._write_next()
+
+            self.file.write(_BLOCK_HEADER.pack(0, 0, 0))
+            table_offset = self._offset + _BLOCK_HEADER.size
+            self.file.write(np.array(self.table, dtype=_TABLE_DTYPE).tobytes())
+            self.file.write(_TRAILER.pack(table_offset, len(self.table), self.raw_size, INDEX_MAGIC))
+            self.file.flush()
+        finally:
+            self.compressor.shutdown()
+            super().close()
+            if self.owns_file:
+                self.file.close()
+
+
+class BlockCompressedReader(io.RawIOBase):
+    """
+    Seekable file object over a block compressed file.
+
+    Reads decompress only the blocks that overlap the requested bytes; reads
+    spanning several blocks decompress them in parallel. The most recently
+    used blocks are cached for small sequential reads. With verify=True the
+    checksum of every block is checked before it is decompressed.
+    """
+
+    def __init__(self, file: BinaryIO, owns_file: bool, workers: Optional[int] = None,
+                 cache_blocks: int = 4, verify: bool = False):
+        super().__init__()
+        self.file = file
+        self.owns_file = owns_file
+        self.cache_blocks = cache_blocks
+        self.verify = verify
+        self._cache = OrderedDict()
+        self.position = 0
+
+        try:
+            self.file.seek(0)
+            header = self.file.read(_FILE_HEADER.size)
+            if len(header) < _FILE_HEADER.size:
+                raise SignalFormatError("Not a block compressed file: file too short")
+            magic, version, codec_id, self.block_size, name_length = _FILE_HEADER.unpack(header)
+            if magic != FILE_MAGIC:
+                raise SignalFormatError("Not a block compressed file")
+            if version != FILE_VERSION:
+                raise SignalFormatError(f"Unsupported block compression version: {version}")
+            self.inner_format = self.file.read(name_length).decode('ascii')
+            self.compressor = BlockCompressor(get_codec(codec_id), workers=workers)
+            self.table = self._read_table(_FILE_HEADER.size + name_length)
+        except Exception:
+            if owns_file:
+                self.file.close()
+            raise
+
+        self.raw_offsets = np.concatenate([[0], np.cumsum(self.table['raw_size'], dtype=np.int64)])
+
+    def _read_table(self, data_offset: int) -> np.ndarray:
+        """Read the block table from the footer, or rebuild it from the block headers."""
+        self.file.seek(0, os.SEEK_END)
+        size = self.file.tell()
+
+        if size >= data_offset + _BLOCK_HEADER.size + _TRAILER.size:
+            self.file.seek(size - _TRAILER.size)
+            table_offset, num_blocks, _, magic = _TRAILER.unpack(self.file.read(_TRAILER.size))
+            if magic == INDEX_MAGIC:
+                self.file.seek(table_offset)
+                return np.frombuffer(self.file.read(num_blocks * _TABLE_DTYPE.itemsize), dtype=_TABLE_DTYPE)
+
+        entries = []
+        offset = data_offset
+        while offset + _BLOCK_HEADER.size <= size:
+            self.file.seek(offset)
+            compressed_size, raw_size, _ = _BLOCK_HEADER.unpack(self.file.read(_BLOCK_HEADER.size))
+            if compressed_size == 0 or offset + _BLOCK_HEADER.size + compressed_size > size:
+                # End of blocks marker or a partially written block
+                break
+            entries.append((offset, compressed_size, raw_size))
+            offset += _BLOCK_HEADER.size + compressed_size
+        return np.array(entries, dtype=_TABLE_DTYPE)
+
+    @property
+    def size(self) -> int:
+        """Size of the uncompressed stream."""
+        return int(self.raw_offsets[-1])
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self.position + offset
+        elif whence == os.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self.position = position
+        return position
+
+    def _read_blocks(self, first: int, last: int) -> List[Tuple[memoryview, int]]:
+        """Read the compressed bytes and stored checksum of blocks [first, last]."""
+        # Blocks are contiguous on disk, so fetch them with a single read
+        start = int(self.table[first]['offset'])
+        end = int(self.table[last]['offset']) + _BLOCK_HEADER.size + int(self.table[last]['size'])
+        self.file.seek(start)
+        data = memoryview(self.file.read(end - start))
+
+        blocks = []
+        for i in range(first, last + 1):
+            offset = int(self.table[i]['offset']) - start
+            _, _, crc = _BLOCK_HEADER.unpack_from(data, offset)
+            offset += _BLOCK_HEADER.size
+            blocks.append((data[offset:offset + int(self.table[i]['size'])], crc))
+        return blocks
+
+    @staticmethod
+    def _checksum_error(compressed: memoryview, crc: int) -> Optional[str]:
+        """Check one block; returns a description of the mismatch or None."""
+        actual = zlib.crc32(compressed)
+        if actual != crc:
+            return f"CRC mismatch (stored {crc:08x}, computed {actual:08x})"
+        return None
+
+    def _verified_decompress(self, index: int, compressed: memoryview, crc: int) -> bytes:
+        error = self._checksum_error(compressed, crc)
+        if error is not None:
+            raise ChecksumError(f"Compressed block {index} is corrupt: {error}")
+        return self.compressor.codec.decompress(compressed)
+
+    def _blocks(self, first: int, last: int) -> List[bytes]:
+        """Get decompressed blocks [first, last], decompressing the missing ones in parallel."""
+        missing = [i for i in range(first, last + 1) if i not in self._cache]
+        decoded = {}
+        if missing:
+            blocks = self._read_blocks(missing[0], missing[-1])
+            blocks = [blocks[i - missing[0]] for i in missing]
+            if self.verify:
+                results = list(self.compressor.executor.map(self._verified_decompress, missing,
+                                                            *zip(*blocks)))
+            else:
+                results = self.compressor.decompress_blocks([compressed for compressed, _ in blocks])
+            decoded = dict(zip(missing, results))
+
+        blocks = [decoded[i] if i in decoded else self._cache[i] for i in range(first, last + 1)]
+
+        # Keep the last blocks of the read, which the next sequential read starts in
+        for i in range(max(first, last + 1 - self.cache_blocks), last + 1):
+            self._cache[i] = blocks[i - first]
+            self._cache.move_to_end(i)
+            if len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        return blocks
+
+    def readinto(self, buffer) -> int:
+        buffer = memoryview(buffer).cast('B')
+        size = min(len(buffer), self.size - self.position)
+        if size <= 0:
+            return 0
+
+        end = self.position + size
+        first = int(np.searchsorted(self.raw_offsets, self.position, side='right')) - 1
+        last = int(np.searchsorted(self.raw_offsets, end - 1, side='right')) - 1
+
+        written = 0
+        for i, block in zip(range(first, last + 1), self._blocks(first, last)):
+            lo = max(self.position - int(self.raw_offsets[i]), 0)
+            hi = min(end - int(self.raw_offsets[i]), len(block))
+            buffer[written:written + hi - lo] = block[lo:hi]
+            written += hi - lo
+
+        self.position = end
+        return written
+
+    def verify_blocks(self, batch_bytes: int = 16 << 20) -> List[Tuple[int, str]]:
+        """
+        Check the checksum of every block without decompressing.
+
+        Blocks are read in large sequential batches while the checksums of the
+        previous batch are computed in the thread pool.
+
+        Args:
+            batch_bytes: Compressed bytes read per batch
+
+        Returns:
+            (block index, description) for every corrupt block
+        """
+        if not len(self.table):
+            return []
+
+        errors = []
+        pending = deque()
+        first = 0
+        while first < len(self.table):
+            # Extend the batch until it holds batch_bytes of compressed data
+            start = int(self.table[first]['offset'])
+            last = int(np.searchsorted(self.table['offset'], start + batch_bytes, side='right')) - 1
+            last = max(first, min(last, len(self.table) - 1))
+            blocks = self._read_blocks(first, last)
+            pending.append((first, [self.compressor.executor.submit(self._checksum_error, *block)
+                                    for block in blocks]))
+            while len(pending) > 2:
+                self._collect(pending.popleft(), errors)
+            first = last + 1
+        while pending:
+            self._collect(pending.popleft(), errors)
+        return errors
+
+    @staticmethod
+    def _collect(batch: Tuple[int, list], errors: List[Tuple[int, str]]) -> None:
+        first, futures = batch
+        for i, future in enumerate(futures):
+            if future.result() is not None:
+                errors.append((first + i, future.result()))
+
+    def readall(self) -> bytes:
+        buffer = bytearray(max(self.size - self.position, 0))
+        self.readinto(buffer)
+        return bytes(buffer)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.compressor.shutdown()
+        self._cache.clear()
+        if self.owns_file:
+            self.file.close()
+        super().close()
+
+
+def open_compressed(source: Union[str, Path, BinaryIO], mode: str = 'rb', codec: Union[str, Codec] = "zlib",
+                    level: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE,
+                    inner_format: str = "", workers: Optional[int] = None, verify: bool = False) -> BinaryIO:
+    """
+    Open a block compressed file.
+
+    Args:
+        source: File path or binary file-like object
+        mode: 'rb' to read or 'wb' to write
+        codec: Codec for writing
+        level: Compression level for writing
+        block_size: Uncompressed bytes per block for writing
+        inner_format: Name of the format stored in the file, recorded in the header
+        workers: Threads used for compression or decompression
+        verify: Check block checksums while reading
+
+    Returns:
+        Buffered reader for 'rb' (seekable), BlockCompressedWriter for 'wb'
+
+    Raises:
+        SignalFormatError: If the file is not block compressed
+    """
+    if mode not in ('rb', 'wb'):
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    if isinstance(source, (str, Path)):
+        file, owns_file = open(source, mode), True
+    else:
+        file, owns_file = source, False
+
+    if mode == 'wb':
+        return BlockCompressedWriter(file, owns_file, codec, level, block_size, inner_format, workers)
+    reader = BlockCompressedReader(file, owns_file, workers, verify=verify)
+    return io.BufferedReader(reader, buffer_size=reader.block_size or io.DEFAULT_BUFFER_SIZE)
+
+
+def benchmark_codecs(data: Union[np.ndarray, bytes], codecs: Optional[List[str]] = None,
+                     level: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE,
+                     workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Measure compression ratio and throughput of codecs on sample data.
+
+    Args:
+        data: Representative data, e.g. the values of a recording
+        codecs: Codec names to test (all except "none" by default)
+        level: Compression level (codec default if None)
+        block_size: Uncompressed bytes per block
+        workers: Threads used for compression and decompression
+
+    Returns:
+        One dict per codec with codec, level, ratio, compressed_size,
+        compress_mb_s and decompress_mb_s
+    """
+    raw = data.tobytes() if isinstance(data, np.ndarray) else bytes(data)
+    blocks = [raw[start:start + block_size] for start in range(0, len(raw), block_size)]
+    megabytes = len(raw) / 1e6
+
+    results = []
+    for name in codecs or [name for name in _CODECS if name != "none"]:
+        compressor = BlockCompressor(name, level, workers)
+        try:
+            start = time.perf_counter()
+            compressed = compressor.compress_blocks(blocks)
+            compress_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            restored = compressor.decompress_blocks(compressed)
+            decompress_time = time.perf_counter() - start
+        finally:
+            compressor.shutdown()
+
+        if b''.join(restored) != raw:
+            raise SignalFormatError(f"Codec '{name}' did not round trip the data")
+
+        compressed_size = sum(len(block) for block in compressed)
+        results.append({
+            "codec": compressor.codec.name,
+            "level": compressor.codec.default_level if level is None else level,
+            "ratio": len(raw) / compressed_size if compressed_size else float('inf'),
+            "compressed_size": compressed_size,
+            "compress_mb_s": megabytes / compress_time if compress_time > 0 else float('inf'),
+            "decompress_mb_s": megabytes / decompress_time if decompress_time > 0 else float('inf'),
+        })
+    return results
+
+
+class CompressedFormat(SignalFormat):
+    """
+    Block compressed container for any other signal format.
+
+    The inner format writes to a BlockCompressedWriter and reads from a
+    seekable reader, so formats that seek (the binary frame index, NumPy
+    headers) only decompress the blocks they touch. The inner format name
+    is stored in the header, so files are read without configuration.
+    """
+
+    DEFAULT_INNER_FORMAT = "binary"
+
+    def __init__(self, inner: Optional[Union[str, SignalFormat]] = None, codec: Union[str, Codec] = "zlib",
+                 level: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE,
+                 workers: Optional[int] = None, verify: bool = False):
+        """
+        Initialize the format handler.
+
+        Args:
+            inner: Format to compress, by name or instance; when None it is taken
+                   from the file header on read, and from the extension before
+                   .blz (e.g. capture.csv.blz) or DEFAULT_INNER_FORMAT on write
+            codec: Codec name ("zlib", "lzma", "bz2", "none")
+            level: Compression level (codec default if None)
+            block_size: Uncompressed bytes per block
+            workers: Threads used for compression and decompression
+            verify: Check block checksums on read and raise ChecksumError on a mismatch
+        """
+        self.inner = registry.get_format(inner) if isinstance(inner, str) else inner
+        self.codec = get_codec(codec)
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers
+        self.verify_checksums = verify
+
+    @property
+    def name(self) -> str:
+        return "COMPRESSED"
+
+    @property
+    def extensions(self) -> List[str]:
+        return [".blz"]
+
+    @property
+    def capabilities(self) -> List[FormatCapability]:
+        return [FormatCapability.COMPRESSION]
+
+    def get_capabilities(self, source: Union[str, Path, BinaryIO]) -> List[FormatCapability]:
+        """Capabilities of the stored format, plus compression; streaming is not supported."""
+        try:
+            with self._open(source) as reader:
+                capabilities = self._inner_for(reader).get_capabilities(reader)
+        except SignalFormatError:
+            return self.capabilities
+        capabilities = [c for c in capabilities if c != FormatCapability.STREAMING]
+        return capabilities + [FormatCapability.COMPRESSION]
+
+    # --- Helpers ---
+
+    def _open(self, source: Union[str, Path, BinaryIO]) -> BinaryIO:
+        return open_compressed(source, 'rb', workers=self.workers, verify=self.verify_checksums)
+
+    def _inner_for(self, reader: BinaryIO) -> SignalFormat:
+        if self.inner is not None:
+            return self.inner
+        name = reader.raw.inner_format
+        if not name:
+            raise SignalFormatError("Compressed file does not record its inner format")
+        return registry.get_format(name)
+
+    def _inner_for_destination(self, destination: Union[str, Path, BinaryIO]) -> SignalFormat:
+        if self.inner is not None:
+            return self.inner
+        if isinstance(destination, (str, Path)):
+            suffixes = Path(destination).suffixes
+            if len(suffixes) > 1:
+                try:
+                    return registry.get_for_extension(suffixes[-2])
+                except KeyError:
+                    pass
+        return registry.get_format(self.DEFAULT_INNER_FORMAT)
+
+    # --- Reading ---
+
+    def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
+        """
+        Read signal data through the inner format.
+
+        Args:
+            source: File path or file-like object
+            time_range: Optional time range to filter by
+
+        Returns:
+            SignalData object
+
+        Raises:
+            SignalFormatError: If reading fails
+        """
+        try:
+            with self._open(source) as reader:
+                return self._inner_for(reader).read(reader, time_range)
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read compressed data: {str(e)}")
+            raise e
+
+    def read_time_range(self, source: Union[str, Path, BinaryIO], time_range: TimeRange) -> SignalData:
+        """
+        Read a time range through the inner format, decompressing only the blocks it reads.
+        """
+        try:
+            with self._open(source) as reader:
+                inner = self._inner_for(reader)
+                if not inner.supports_random_access():
+                    return inner.read(reader, time_range)
+                return inner.read_time_range(reader, time_range)
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read compressed time range: {str(e)}")
+            raise e
+
+    def get_metadata(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
+        """
+        Extract metadata through the inner format.
+        """
+        try:
+            with self._open(source) as reader:
+                return self._inner_for(reader).get_metadata(reader)
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to extract metadata from compressed data: {str(e)}")
+            raise e
+
+    # --- Writing ---
+
+    def write(self, destination: Union[str, Path, BinaryIO], data: SignalData, append: bool = False) -> None:
+        """
+        Write signal data with the inner format into a block compressed file.
+
+        Args:
+            destination: File path or file-like object
+            data: SignalData to write
+            append: Not supported; compressed files are written in one pass
+
+        Raises:
+            SignalFormatError: If writing fails
+        """
+        if append and (not isinstance(destination, (str, Path)) or Path(destination).exists()):
+            raise SignalFormatError("Appending to a compressed file is not supported")
+
+        try:
+            inner = self._inner_for_destination(destination)
+            writer = open_compressed(destination, 'wb', self.codec, self.level, self.block_size,
+                                     inner.name, self.workers)
+            try:
+                inner.write(writer, data)
+            finally:
+                writer.close()
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write compressed data: {str(e)}")
+            raise e
+
+    # --- Integrity ---
+
+    def verify(self, source: Union[str, Path, BinaryIO], workers: Optional[int] = None) -> List[BlockError]:
+        """
+        Check the checksum of every compressed block, then let the inner format
+        verify its content if all blocks are intact.
+
+        Corrupt blocks are mapped to the time span of the inner frames they
+        overlap when the inner format has a frame index (binary frames).
+
+        Args:
+            source: File path or file-like object
+            workers: Number of checksum threads (format default if None)
+
+        Returns:
+            One BlockError per corrupt block (offsets are file offsets), or the
+            inner format's errors (offsets are in the uncompressed stream)
+        """
+        try:
+            reader = open_compressed(source, 'rb', workers=workers or self.workers)
+        except Exception as e:
+            return [BlockError(index=0, message=f"Failed to open compressed data: {e}")]
+
+        with reader:
+            raw = reader.raw
+            try:
+                bad_blocks = raw.verify_blocks()
+            except Exception as e:
+                return [BlockError(index=0, message=f"Failed to read compressed blocks: {e}")]
+
+            if not bad_blocks:
+                try:
+                    inner = self._inner_for(reader)
+                except Exception as e:
+                    return [BlockError(index=0, message=str(e))]
+                return inner.verify(reader, workers)
+
+            frame_index = None
+            try:
+                inner = self._inner_for(reader)
+                if hasattr(inner, 'frame_index'):
+                    frame_index = inner.frame_index(reader)
+            except Exception:
+                # The index itself may be in a corrupt block
+                pass
+
+            errors = []
+            for index, message in bad_blocks:
+                time_range = None
+                if frame_index is not None and len(frame_index):
+                    time_range = self._time_span(frame_index, int(raw.raw_offsets[index]),
+                                                 int(raw.raw_offsets[index + 1]))
+                errors.append(BlockError(index=index, message=message, time_range=time_range,
+                                         offset=int(raw.table[index]['offset'])))
+            return errors
+
+    @staticmethod
+    def _time_span(frame_index: np.ndarray, start: int, end: int) -> Optional[TimeRange]:
+        """Time span of the frames overlapping uncompressed bytes [start, end)."""
+        first = max(int(np.searchsorted(frame_index['offset'], start, side='right')) - 1, 0)
+        last = int(np.searchsorted(frame_index['offset'], end, side='left')) - 1
+        if last < first:
+            return None
+        t_start, t_end = float(frame_index[first]['t_start']), float(frame_index[last]['t_end'])
+        if np.isnan(t_start) or np.isnan(t_end):
+            return None
+        return TimeRange(start=t_start, end=t_end)
+
+    def validate(self, source: Union[str, Path, BinaryIO]) -> bool:
+        """
+        Check the block header and let the inner format validate the content.
+        """
+        try:
+            with self._open(source) as reader:
+                return self._inner_for(reader).validate(reader)
+        except Exception:
+            return False
@@ -10,6 +10,9 @@ import numpy as np
 from typing import Dict, Any, List, Optional, Union, BinaryIO, Tuple, Iterator
 import io
 import os
+import struct
+import warnings
+import weakref
 from datetime import datetime
 from pathlib import Path
 
@@ -18,10 +21,116 @@ from .base import (
     SignalData,
     TimeRange,
     FormatCapability,
-    SignalFormatError
+    SignalFormatError,
+    logger
 )
 
 
+class CsvChunkReader:
+    """
+    Buffered chunk reader for CSV streams.
+    
+    Reads the stream in blocks of block_size bytes, parses each block with
+    the vectorized CSV parser and hands out chunk_size rows at a time.
+    Partial lines at the end of a block are carried over to the next one.
+    """
+    
+    def __init__(self, file: BinaryIO, csv_format: 'CsvFormat', chunk_size: int,
+                 block_size: Optional[int] = None, owns_file: bool = True):
+        """
+        Args:
+            file: Binary file object positioned at the start of the CSV data
+            csv_format: Format whose parser is used
+            chunk_size: Rows returned per read_chunk() call
+            block_size: Bytes read from the file per block
+            owns_file: Close the file when the reader is closed
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+        self.block_size = block_size or csv_format.BLOCK_SIZE
+        self.owns_file = owns_file
+        self.metadata = {}
+        
+        self._format = csv_format
+        self._header = None
+        self._comment_lines = []
+        self._remainder = b""
+        
+        # Parsed rows not yet returned, and the next row to return
+        self._table = None
+        self._position = 0
+    
+    def _start(self) -> None:
+        self._comment_lines, self._header = self._format._read_header(self.file)
+        if self._header is None:
+            raise SignalFormatError("CSV stream has no header row")
+        self.metadata = self._format._metadata_from_comments(self._comment_lines)
+    
+    def _fill(self) -> bool:
+        """Parse the next block into the row buffer; returns False at the end of the stream."""
+        block = self.file.read(self.block_size)
+        if not block:
+            if not self._remainder.strip():
+                return False
+            # Last line without a newline
+            block, self._remainder = self._remainder + b"\n", b""
+        else:
+            block = self._remainder + block
+            end = block.rfind(b"\n")
+            if end < 0:
+                self._remainder = block
+                return True
+            block, self._remainder = block[:end + 1], block[end + 1:]
+        
+        comments = len(self._comment_lines)
+        table = self._format._parse_block(block, len(self._header), self._comment_lines)
+        if len(self._comment_lines) > comments:
+            self.metadata = {**self.metadata,
+                             **self._format._metadata_from_comments(self._comment_lines[comments:])}
+        
+        if self._table is None or self._position >= len(self._table):
+            self._table = table
+        else:
+            self._table = np.concatenate([self._table[self._position:], table])
+        self._position = 0
+        return True
+    
+    def read_chunk(self) -> Optional[SignalData]:
+        """
+        Read the next chunk.
+        
+        Returns:
+            SignalData with up to chunk_size rows, or None at the end of the stream
+        """
+        if self._header is None:
+            self._start()
+        
+        while self._table is None or len(self._table) - self._position < self.chunk_size:
+            if not self._fill():
+                break
+        
+        if self._table is None or self._position >= len(self._table):
+            return None
+        
+        rows = self._table[self._position:self._position + self.chunk_size]
+        self._position += len(rows)
+        
+        if self._format._is_timestamp_column(self._header[0]):
+            timestamps = rows[:, 0].copy()
+            values = rows[:, 1:].copy() if rows.shape[1] > 2 else rows[:, 1].copy()
+        else:
+            timestamps = None
+            values = rows.copy() if rows.shape[1] > 1 else rows[:, 0].copy()
+        
+        return SignalData(values=values, timestamps=timestamps, metadata=self.metadata)
+    
+    def close(self) -> None:
+        if self.owns_file and self.file is not None:
+            self.file.close()
+        self.file = None
+        self._table = None
+
+
 class CsvFormat(SignalFormat):
     """
     CSV format handler for signal data.
@@ -39,6 +148,40 @@ class CsvFormat(SignalFormat):
     COMMENT_CHAR = "#"
     METADATA_PREFIX = "# metadata:"
     
+    # Bytes of data rows parsed per block
+    BLOCK_SIZE = 4 * 1024 * 1024
+    
+    # Row offset index sidecar; also holds the comment lines found after the header
+    INDEX_SUFFIX = ".idx"
+    INDEX_MAGIC = b"PSDCIDX2"
+    INDEX_HEADER = struct.Struct("<8sIQQqI")
+    INDEX_DTYPE = np.dtype([("timestamp", "<f8"), ("offset", "<u8")])
+    DEFAULT_INDEX_INTERVAL = 1000
+    
+    DEFAULT_CHUNK_SIZE = 10000
+    
+    def __init__(self, index_interval: int = DEFAULT_INDEX_INTERVAL, auto_index: bool = True,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, block_size: Optional[int] = None):
+        """
+        Initialize the format handler.
+        
+        Args:
+            index_interval: Number of data rows between row offset index entries
+            auto_index: Build the row offset index on the first time range read
+                        or get_metadata() of a file that has none
+            chunk_size: Rows returned per read_chunk() call
+            block_size: Bytes read and parsed per block (defaults to BLOCK_SIZE)
+        """
+        self.index_interval = index_interval
+        self.auto_index = auto_index
+        self.chunk_size = chunk_size
+        if block_size is not None:
+            self.BLOCK_SIZE = block_size
+        
+        # Per-stream state for raw file objects passed to read_chunk()/write_chunk()
+        self._readers = weakref.WeakKeyDictionary()
+        self._index_states = weakref.WeakKeyDictionary()
+    
     @property
     def name(self) -> str:
         return "CSV"
@@ -52,10 +195,20 @@ class CsvFormat(SignalFormat):
         return [
             FormatCapability.METADATA,
             FormatCapability.STREAMING,
-            FormatCapability.RANDOM_ACCESS,
             FormatCapability.MULTI_CHANNEL
         ]
     
+    def get_capabilities(self, source: Union[str, Path, BinaryIO]) -> List[FormatCapability]:
+        """
+        Get the capabilities available for a specific source.
+        
+        RANDOM_ACCESS is only reported for files with an up-to-date row offset index.
+        """
+        capabilities = list(self.capabilities)
+        if isinstance(source, (str, Path)) and self.load_index(source) is not None:
+            capabilities.append(FormatCapability.RANDOM_ACCESS)
+        return capabilities
+    
     def _metadata_from_comments(self, lines: List[str]) -> Dict[str, Any]:
         """Extract metadata from comment lines."""
         metadata = {}
@@ -89,93 +242,165 @@ class CsvFormat(SignalFormat):
             
         return comments
     
-    def _parse_csv_content(self, content: str) -> Tuple[Dict[str, Any], np.ndarray, Optional[np.ndarray]]:
-        """Parse CSV content into metadata, values, and timestamps."""
-        # Split into lines and filter empty lines
-        lines = [line.strip() for line in content.splitlines() if line.strip()]
+    # --- Block parsing ---
+    
+    def _is_timestamp_column(self, name: str) -> bool:
+        return name.lower().startswith('time') or 'timestamp' in name.lower()
+    
+    def _read_header(self, f: BinaryIO) -> Tuple[List[str], Optional[List[str]]]:
+        """Read the comment lines and the column header, leaving f at the first data row."""
+        comment_lines = []
+        for raw_line in iter(f.readline, b''):
+            line = raw_line.decode('utf-8').strip()
+            if not line:
+                continue
+            if line.startswith(self.COMMENT_CHAR):
+                comment_lines.append(line)
+                continue
+            return comment_lines, next(csv.reader([line]))
+        return comment_lines, None
+    
+    def _iter_blocks(self, f: BinaryIO) -> Iterator[bytes]:
+        """Yield blocks of about BLOCK_SIZE bytes that end on a line boundary."""
+        remainder = b""
+        while True:
+            block = f.read(self.BLOCK_SIZE)
+            if not block:
+                break
+            if remainder:
+                block = remainder + block
+            end = block.rfind(b"\n")
+            if end < 0:
+                remainder = block
+                continue
+            remainder = block[end + 1:]
+            yield block[:end + 1]
+        if remainder.strip():
+            yield remainder + b"\n"
+    
+    def _parse_block(self, block: bytes, num_columns: int,
+                     comment_lines: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Parse a block of complete lines into a (rows, num_columns) float64 array.
         
-        # Separate comments and data
-        comment_lines = [line for line in lines if line.startswith(self.COMMENT_CHAR)]
-        data_lines = [line for line in lines if not line.startswith(self.COMMENT_CHAR)]
+        Clean numeric blocks are converted in one call to NumPy's C parser.
+        Blocks containing quoted, empty or non-numeric fields fall back to
+        parsing line by line, skipping invalid rows.
         
-        # Extract metadata
-        metadata = self._metadata_from_comments(comment_lines)
+        Args:
+            block: Complete lines of CSV data
+            num_columns: Number of fields per row
+            comment_lines: Optional list that comment lines found in the block are appended to
+        """
+        if b"\r" in block:
+            block = block.replace(b"\r", b"")
+        comment = self.COMMENT_CHAR.encode('ascii')
+        if comment in block or b"\n\n" in block or block.startswith(b"\n"):
+            # Drop comment and blank lines so only data rows remain
+            lines = [line.strip() for line in block.split(b"\n")]
+            if comment_lines is not None:
+                comment_lines.extend(line.decode('utf-8') for line in lines if line.startswith(comment))
+            block = b"".join(line + b"\n" for line in lines if line and not line.startswith(comment))
+        if not block:
+            return np.empty((0, num_columns))
         
-        # Parse CSV data
-        if not data_lines:
-            raise SignalFormatError("CSV file has no data rows")
+        # Every line must have exactly num_columns - 1 separators
+        raw = np.frombuffer(block, dtype=np.uint8)
+        line_ends = np.flatnonzero(raw == ord("\n"))
+        separators = np.flatnonzero(raw == ord(","))
+        per_line = np.diff(np.searchsorted(separators, line_ends), prepend=0)
         
-        csv_reader = csv.reader(data_lines)
-        rows = list(csv_reader)
+        if np.all(per_line == num_columns - 1):
+            try:
+                with warnings.catch_warnings():
+                    # Older NumPy versions warn instead of raising on unparsable data
+                    warnings.simplefilter('error', DeprecationWarning)
+                    flat = np.fromstring(block.replace(b"\n", b","), sep=",")
+                if flat.size == len(line_ends) * num_columns:
+                    return flat.reshape(len(line_ends), num_columns)
+            except (ValueError, DeprecationWarning):
+                pass
         
-        # Get header and data rows
-        header = rows[0]
-        data_rows = rows[1:]
+        return self._parse_rows(block, num_columns)
+    
+    def _parse_rows(self, block: bytes, num_columns: int) -> np.ndarray:
+        """Parse a block line by line, skipping rows that are not numeric."""
+        rows = []
+        lines = [line.strip() for line in block.decode('utf-8').split("\n")]
+        for row in csv.reader(line for line in lines if line and not line.startswith(self.COMMENT_CHAR)):
+            try:
+                if len(row) != num_columns:
+                    raise IndexError(f"expected {num_columns} fields, got {len(row)}")
+                rows.append([float(v) for v in row])
+            except (ValueError, IndexError) as e:
+                logger.warning(f"Skipping invalid CSV row: {row}, error: {e}")
+        return np.array(rows, dtype=np.float64).reshape(-1, num_columns)
+    
+    def _parse_csv_file(self, f: BinaryIO) -> Tuple[Dict[str, Any], np.ndarray, Optional[np.ndarray]]:
+        """
+        Parse a binary CSV file into metadata, values, and timestamps.
         
-        # Check if first column contains timestamps
-        has_timestamps = header[0].lower().startswith('time') or 'timestamp' in header[0].lower()
+        The data rows are parsed in blocks straight into preallocated output
+        arrays, sized from the bytes per row of the first block and grown
+        if needed, so memory stays proportional to the output.
+        """
+        comment_lines, header = self._read_header(f)
+        if header is None:
+            raise SignalFormatError("CSV file has no data rows")
         
-        # Process data rows
-        timestamps = []
-        values = []
+        num_columns = len(header)
+        has_timestamps = self._is_timestamp_column(header[0])
+        first_value = 1 if has_timestamps else 0
+        num_channels = num_columns - first_value
+        multi_channel = num_channels > 1
         
-        # Determine if multi-channel (more than 2 columns)
-        is_multi_channel = len(header) > 2
+        # Bytes left to parse, used to size the output arrays
+        data_start = f.tell()
+        f.seek(0, os.SEEK_END)
+        remaining = f.tell() - data_start
+        f.seek(data_start)
         
-        for row in data_rows:
-            if not row:
+        timestamps = None
+        values = None
+        count = 0
+        for block in self._iter_blocks(f):
+            table = self._parse_block(block, num_columns, comment_lines)
+            rows = len(table)
+            if rows == 0:
                 continue
             
-            try:
-                if has_timestamps:
-                    timestamps.append(float(row[0]))
-                    
-                    # Handle multi-channel vs single-channel
-                    if is_multi_channel:
-                        values.append([float(v) for v in row[1:]])
-                    else:
-                        values.append(float(row[1]))
-                else:
-                    # No timestamps, all columns are values
-                    if len(row) > 1:
-                        values.append([float(v) for v in row])
-                    else:
-                        values.append(float(row[0]))
-            except (ValueError, IndexError) as e:
-                # Skip invalid rows but log warning
-                import logging
-                logging.warning(f"Skipping invalid CSV row: {row}, error: {e}")
+            if values is None:
+                capacity = max(int(remaining / len(block) * rows * 1.05) + 1, rows)
+                values = np.empty((capacity, num_channels) if multi_channel else (capacity,))
+                timestamps = np.empty(capacity) if has_timestamps else None
+            elif count + rows > len(values):
+                capacity = max(count + rows, 2 * len(values))
+                values.resize((capacity, num_channels) if multi_channel else (capacity,), refcheck=False)
+                if timestamps is not None:
+                    timestamps.resize((capacity,), refcheck=False)
+            
+            values[count:count + rows] = table[:, first_value:] if multi_channel else table[:, first_value]
+            if timestamps is not None:
+                timestamps[count:count + rows] = table[:, 0]
+            count += rows
         
-        # Convert to numpy arrays
-        values_array = np.array(values)
-        timestamps_array = np.array(timestamps) if timestamps else None
+        metadata = self._metadata_from_comments(comment_lines)
+        if count == 0:
+            return metadata, np.array([]), None
+        
+        # Release the unused capacity
+        values.resize((count, num_channels) if multi_channel else (count,), refcheck=False)
+        if timestamps is not None:
+            timestamps.resize((count,), refcheck=False)
         
-        return metadata, values_array, timestamps_array
+        return metadata, values, timestamps
     
-    def _create_csv_content(self, data: SignalData) -> str:
-        """Create CSV content from SignalData."""
+    def _format_rows(self, data: SignalData) -> Tuple[str, List[int], np.ndarray]:
+        """Format the data rows of a chunk; returns the text, the end offset of each row and the timestamps."""
         buffer = io.StringIO()
-        
-        # Write metadata as comments
-        for comment in self._comments_from_metadata(data.metadata):
-            buffer.write(comment + "\n")
-        
-        # Create CSV writer
         writer = csv.writer(buffer, lineterminator="\n")
+        row_ends = []
         
-        # Determine if multi-channel
-        is_multi_channel = len(data.values.shape) > 1
-        
-        # Write header
-        if is_multi_channel:
-            channel_count = data.values.shape[1]
-            header = ["timestamp"] + [f"channel_{i}" for i in range(channel_count)]
-        else:
-            header = ["timestamp", "value"]
-        
-        writer.writerow(header)
-        
-        # Write data rows
         if data.timestamps is None:
             # Generate timestamps if not provided
             sample_rate = data.metadata.get("sample_rate", 1000.0)
@@ -184,14 +409,35 @@ class CsvFormat(SignalFormat):
         else:
             timestamps = data.timestamps
         
-        if is_multi_channel:
-            for i, (time, values) in enumerate(zip(timestamps, data.values)):
+        if len(data.values.shape) > 1:
+            for time, values in zip(timestamps, data.values):
                 writer.writerow([time] + values.tolist())
+                row_ends.append(buffer.tell())
         else:
             for time, value in zip(timestamps, data.values):
                 writer.writerow([time, value])
+                row_ends.append(buffer.tell())
         
-        return buffer.getvalue()
+        return buffer.getvalue(), row_ends, timestamps
+    
+    def _create_csv_header(self, data: SignalData) -> str:
+        """Create the metadata comments and column header for SignalData."""
+        lines = self._comments_from_metadata(data.metadata)
+        
+        # Determine if multi-channel
+        if len(data.values.shape) > 1:
+            channel_count = data.values.shape[1]
+            header = ["timestamp"] + [f"channel_{i}" for i in range(channel_count)]
+        else:
+            header = ["timestamp", "value"]
+        lines.append(",".join(header))
+        
+        return "".join(line + "\n" for line in lines)
+    
+    def _create_csv_content(self, data: SignalData) -> str:
+        """Create CSV content from SignalData."""
+        rows, _, _ = self._format_rows(data)
+        return self._create_csv_header(data) + rows
     
     def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
         """
@@ -207,17 +453,16 @@ class CsvFormat(SignalFormat):
         try:
             # Handle different source types
             if isinstance(source, (str, Path)):
-                with open(source, 'r', encoding='utf-8', newline='') as f:
-                    content = f.read()
+                with open(source, 'rb') as f:
+                    metadata, values, timestamps = self._parse_csv_file(f)
             else:
                 # File-like object
                 pos = source.tell()
                 source.seek(0)
-                content = source.read().decode('utf-8')
-                source.seek(pos)
-            
-            # Parse the content
-            metadata, values, timestamps = self._parse_csv_content(content)
+                try:
+                    metadata, values, timestamps = self._parse_csv_file(source)
+                finally:
+                    source.seek(pos)
             
             # Create SignalData
             signal_data = SignalData(
@@ -247,26 +492,10 @@ class CsvFormat(SignalFormat):
             append: Whether to append to existing data
         """
         try:
-            # Handle append mode
+            # Append rows (and a metadata trailer) to an existing file
             if append and isinstance(destination, (str, Path)) and os.path.exists(destination):
-                existing_data = self.read(destination)
-                
-                # Combine data
-                combined_values = np.concatenate([existing_data.values, data.values])
-                
-                combined_timestamps = None
-                if existing_data.timestamps is not None and data.timestamps is not None:
-                    combined_timestamps = np.concatenate([existing_data.timestamps, data.timestamps])
-                
-                # Merge metadata
-                combined_metadata = {**existing_data.metadata, **data.metadata}
-                
-                # Create combined signal data
-                data = SignalData(
-                    values=combined_values,
-                    timestamps=combined_timestamps,
-                    metadata=combined_metadata
-                )
+                self._append_rows(destination, data)
+                return
             
             # Create CSV content
             content = self._create_csv_content(data)
@@ -283,51 +512,140 @@ class CsvFormat(SignalFormat):
                 
                 with open(destination, 'w', encoding='utf-8', newline='') as f:
                     f.write(content)
+                self._remove_index(destination)
             else:
                 # File-like object
                 destination.write(content.encode('utf-8'))
                 destination.flush()
                 
         except Exception as e:
-            raise SignalFormatError(f"Failed to write CSV: {str(e)}")
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write CSV: {str(e)}")
+            raise e
+    
+    def _append_rows(self, path: Union[str, Path], data: SignalData) -> None:
+        """
+        Append data rows to an existing CSV file without rewriting it.
+        
+        Metadata of the appended data is written as a trailer of comment
+        lines after the rows; readers merge comments in file order, so later
+        values override earlier ones. A current row offset index is extended
+        instead of being invalidated.
+        """
+        with open(path, 'rb') as f:
+            comment_lines, header = self._read_header(f)
+            data_start = f.tell()
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size:
+                f.seek(size - 1)
+                needs_newline = f.read(1) != b"\n"
+            
+            if data.timestamps is None and header is not None and self._is_timestamp_column(header[0]):
+                # Continue the file's time base instead of restarting at the data's start_time
+                last = self._last_timestamp(f, data_start)
+                if last is not None:
+                    sample_rate = data.metadata.get("sample_rate") or self._metadata_from_comments(
+                        comment_lines).get("sample_rate", 1000.0)
+                    timestamps = last + np.arange(1, len(data.values) + 1) / float(sample_rate)
+                    data = SignalData(values=data.values, timestamps=timestamps, metadata=data.metadata)
+        
+        columns = data.values.shape[1] + 1 if len(data.values.shape) > 1 else 2
+        if header is not None and len(header) != columns:
+            raise SignalFormatError(
+                f"Cannot append {columns} columns to a CSV file with {len(header)} columns")
+        
+        index = self._read_index_file(path)
+        rows, row_ends, timestamps = self._format_rows(data)
+        prefix = b"\n" if size and needs_newline else b""
+        if header is None:
+            prefix += self._create_csv_header(data).encode('utf-8')
+        trailer = [f"{self.COMMENT_CHAR} {key}: {value}" for key, value in data.metadata.items()]
+        
+        with open(path, 'ab') as f:
+            f.write(prefix + rows.encode('utf-8') + "".join(line + "\n" for line in trailer).encode('utf-8'))
+        
+        if index is not None and index[1] == self.index_interval:
+            entries, interval, indexed_rows, trailer_lines = index
+            new_entries = self._index_entries(size + len(prefix), row_ends, timestamps, indexed_rows)
+            self._write_index(path, [tuple(entry) for entry in entries.tolist()] + new_entries,
+                              interval, indexed_rows + len(row_ends), trailer_lines + trailer)
+        else:
+            self._remove_index(path)
+    
+    def _last_timestamp(self, f: BinaryIO, data_start: int) -> Optional[float]:
+        """Timestamp of the last data row, found by reading the file backwards from the end."""
+        comment = self.COMMENT_CHAR.encode('ascii')
+        position = f.seek(0, os.SEEK_END)
+        tail = b""
+        while position > data_start:
+            step = min(64 * 1024, position - data_start)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+            lines = tail.split(b"\n")
+            # The first line may be cut off unless the data start was reached
+            for line in reversed(lines if position == data_start else lines[1:]):
+                line = line.strip()
+                if line and not line.startswith(comment):
+                    try:
+                        return float(line.split(b",", 1)[0])
+                    except ValueError:
+                        return None
+        return None
     
     def get_metadata(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
         """
         Extract metadata from a CSV source without loading all data.
         
-        More efficient than the default implementation - only reads comment lines.
+        Metadata trailers left by appends come after the header, between the
+        data rows. For files they are kept in the row offset index, so only
+        the header and the index are read (when auto_index is set, a file
+        without an index is scanned once to build it). File-like objects are
+        scanned for comment lines without parsing the data rows.
         """
         try:
-            # Read only the beginning of the file
             if isinstance(source, (str, Path)):
-                with open(source, 'r', encoding='utf-8') as f:
-                    # Read until we find a non-comment line
-                    comment_lines = []
-                    for line in f:
-                        if line.strip().startswith(self.COMMENT_CHAR):
-                            comment_lines.append(line.strip())
-                        else:
-                            break
+                comment_lines = self._file_comments(source)
             else:
                 # File-like object
                 pos = source.tell()
                 source.seek(0)
-                
-                comment_lines = []
-                line = source.readline().decode('utf-8').strip()
-                while line.startswith(self.COMMENT_CHAR):
-                    comment_lines.append(line)
-                    line = source.readline().decode('utf-8').strip()
-                    if not line:  # End of file
-                        break
-                
-                source.seek(pos)  # Restore position
+                try:
+                    comment_lines = self._scan_comments(source)
+                finally:
+                    source.seek(pos)  # Restore position
             
             return self._metadata_from_comments(comment_lines)
             
         except Exception as e:
             raise SignalFormatError(f"Failed to extract metadata from CSV: {str(e)}")
     
+    def _file_comments(self, path: Union[str, Path]) -> List[str]:
+        """Header comment lines of a CSV file followed by the ones from its index."""
+        index = self._read_index_file(path)
+        if index is None and self.auto_index:
+            try:
+                index = self._build_index(path)
+            except SignalFormatError:
+                # No timestamp column, so no index
+                pass
+        with open(path, 'rb') as f:
+            if index is None:
+                return self._scan_comments(f)
+            comment_lines, _ = self._read_header(f)
+        return comment_lines + index[3]
+    
+    def _scan_comments(self, f: BinaryIO) -> List[str]:
+        """Collect all comment lines of a binary CSV file without parsing the data rows."""
+        comment_lines, _ = self._read_header(f)
+        comment = self.COMMENT_CHAR.encode('ascii')
+        for block in self._iter_blocks(f):
+            if comment in block:
+                comment_lines.extend(line.strip().decode('utf-8') for line in block.split(b"\n")
+                                     if line.strip().startswith(comment))
+        return comment_lines
+    
     def validate(self, source: Union[str, Path, BinaryIO]) -> bool:
         """
         Validate whether a source contains valid data for this format.
@@ -394,15 +712,23 @@ class CsvFormat(SignalFormat):
         """
         Read a specific time range from a CSV source (more efficient implementation).
         
-        For CSV files, we can optimize by scanning line-by-line and only keeping
-        rows that fall within the time range.
+        Files with a row offset index (built on first use when auto_index is
+        set) are read by binary searching the index, seeking to the nearest
+        indexed row and parsing only the rows of the range. Other sources are
+        scanned line by line up to the end of the range.
         """
         if time_range.start is None and time_range.end is None:
             return self.read(source)
             
         try:
-            # Process line by line
             if isinstance(source, (str, Path)):
+                index = self._read_index_file(source)
+                if index is None and self.auto_index:
+                    index = self._build_index(source)
+                if index is not None and len(index[0]) > 0 and np.all(np.diff(index[0]["timestamp"]) >= 0):
+                    return self._read_indexed_range(source, index[0], index[3], time_range)
+                
+                # Process line by line
                 with open(source, 'r', encoding='utf-8', newline='') as f:
                     return self._read_time_range_from_file(f, time_range)
             else:
@@ -491,6 +817,174 @@ class CsvFormat(SignalFormat):
             metadata=metadata
         )
     
+    # --- Row offset index ---
+    
+    def _index_path(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        return path.with_name(path.name + self.INDEX_SUFFIX)
+    
+    def _read_index_file(self, path: Union[str, Path]) -> Optional[Tuple[np.ndarray, int, int, List[str]]]:
+        """
+        Read the index sidecar.
+        
+        Returns:
+            (entries, interval, rows, comment lines after the header), or None
+            if the sidecar is missing or stale
+        """
+        try:
+            stat = os.stat(path)
+            with open(self._index_path(path), 'rb') as f:
+                header = f.read(self.INDEX_HEADER.size)
+                if len(header) < self.INDEX_HEADER.size:
+                    return None
+                magic, interval, rows, size, mtime_ns, comments_size = self.INDEX_HEADER.unpack(header)
+                if magic != self.INDEX_MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+                    return None
+                comments = f.read(comments_size).decode('utf-8')
+                comment_lines = comments.split("\n") if comments else []
+                return np.frombuffer(f.read(), dtype=self.INDEX_DTYPE), interval, rows, comment_lines
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _write_index(self, path: Union[str, Path], entries, interval: int, rows: int,
+                     comment_lines: Optional[List[str]] = None) -> None:
+        """Write the index sidecar, stamped with the current size and mtime of the CSV file."""
+        try:
+            stat = os.stat(path)
+            comments = "\n".join(comment_lines or []).encode('utf-8')
+            with open(self._index_path(path), 'wb') as f:
+                f.write(self.INDEX_HEADER.pack(self.INDEX_MAGIC, interval, rows, stat.st_size,
+                                               stat.st_mtime_ns, len(comments)))
+                f.write(comments)
+                f.write(np.asarray(entries, dtype=self.INDEX_DTYPE).tobytes())
+        except OSError as e:
+            # The index is an optimization; a read-only location just means no sidecar
+            logger.debug(f"Could not write CSV index for {path}: {e}")
+    
+    def _remove_index(self, path: Union[str, Path]) -> None:
+        try:
+            os.remove(self._index_path(path))
+        except OSError:
+            pass
+    
+    def load_index(self, path: Union[str, Path]) -> Optional[np.ndarray]:
+        """
+        Load the row offset index of a CSV file.
+        
+        Args:
+            path: Path of the CSV file
+            
+        Returns:
+            Structured array of (timestamp, offset) entries, or None if the file
+            has no index or the index does not match its current size and mtime
+        """
+        index = self._read_index_file(path)
+        return index[0] if index is not None else None
+    
+    def build_index(self, path: Union[str, Path]) -> np.ndarray:
+        """
+        Scan a CSV file and write its row offset index sidecar (``<file>.idx``).
+        
+        Every index_interval-th data row is recorded with its timestamp and
+        byte offset. Line starts are located with NumPy per block, so only the
+        indexed rows are parsed. Comment lines after the header (metadata
+        trailers left by appends) are stored in the sidecar too.
+        
+        Args:
+            path: Path of the CSV file
+            
+        Returns:
+            Structured array of (timestamp, offset) entries
+            
+        Raises:
+            SignalFormatError: If the file has no timestamp column
+        """
+        return self._build_index(path)[0]
+    
+    def _build_index(self, path: Union[str, Path]) -> Tuple[np.ndarray, int, int, List[str]]:
+        """Build and write the index sidecar; returns the same tuple as _read_index_file()."""
+        entries = []
+        comment_lines = []
+        rows = 0
+        with open(path, 'rb') as f:
+            _, header = self._read_header(f)
+            if header is None or not self._is_timestamp_column(header[0]):
+                raise SignalFormatError("CSV file must have timestamp as first column for time range reading")
+            
+            offset = f.tell()
+            skip = np.array([ord("\n"), ord("\r"), ord(self.COMMENT_CHAR)], dtype=np.uint8)
+            for block in self._iter_blocks(f):
+                raw = np.frombuffer(block, dtype=np.uint8)
+                starts = np.concatenate(([0], np.flatnonzero(raw == ord("\n"))[:-1] + 1))
+                for start in starts[raw[starts] == ord(self.COMMENT_CHAR)].tolist():
+                    comment_lines.append(block[start:block.find(b"\n", start)].strip().decode('utf-8'))
+                starts = starts[~np.isin(raw[starts], skip)]
+                
+                selected = starts[(rows + np.arange(len(starts))) % self.index_interval == 0]
+                for start in selected.tolist():
+                    line_end = block.find(b"\n", start)
+                    separator = block.find(b",", start, line_end)
+                    try:
+                        entries.append((float(block[start:separator if separator >= 0 else line_end]),
+                                        offset + start))
+                    except ValueError:
+                        pass
+                
+                rows += len(starts)
+                offset += len(block)
+        
+        entries = np.array(entries, dtype=self.INDEX_DTYPE)
+        self._write_index(path, entries, self.index_interval, rows, comment_lines)
+        return entries, self.index_interval, rows, comment_lines
+    
+    def _index_entries(self, offset: int, row_ends: List[int], timestamps: np.ndarray,
+                       first_row: int) -> List[Tuple[float, int]]:
+        """Index entries for rows written at offset, numbered from first_row."""
+        starts = [0] + row_ends[:-1]
+        return [(float(timestamps[i]), offset + starts[i])
+                for i in range((-first_row) % self.index_interval, len(row_ends), self.index_interval)]
+    
+    def _read_indexed_range(self, path: Union[str, Path], index: np.ndarray, trailer_lines: List[str],
+                            time_range: TimeRange) -> SignalData:
+        """
+        Read a time range by seeking to the indexed rows around it.
+        
+        The metadata merges the header comments with all comment lines from
+        the index, so it matches the metadata of read().
+        """
+        with open(path, 'rb') as f:
+            comment_lines, header = self._read_header(f)
+            if header is None or not self._is_timestamp_column(header[0]):
+                raise SignalFormatError("CSV file must have timestamp as first column for time range reading")
+            data_start = f.tell()
+            
+            timestamps = index["timestamp"]
+            first = 0 if time_range.start is None else max(
+                int(np.searchsorted(timestamps, time_range.start, side='left')) - 1, 0)
+            last = len(index) if time_range.end is None else int(
+                np.searchsorted(timestamps, time_range.end, side='right'))
+            
+            begin = data_start if first == 0 else int(index["offset"][first])
+            f.seek(begin)
+            block = f.read(int(index["offset"][last]) - begin) if last < len(index) else f.read()
+        
+        if block and not block.endswith(b"\n"):
+            block += b"\n"
+        table = self._parse_block(block, len(header)) if block else np.empty((0, len(header)))
+        
+        start_idx = 0 if time_range.start is None else int(
+            np.searchsorted(table[:, 0], time_range.start, side='left'))
+        end_idx = len(table) if time_range.end is None else int(
+            np.searchsorted(table[:, 0], time_range.end, side='right'))
+        table = table[start_idx:end_idx]
+        
+        values = table[:, 1:].copy() if len(header) > 2 else table[:, 1].copy()
+        return SignalData(
+            values=values,
+            timestamps=table[:, 0].copy(),
+            metadata=self._metadata_from_comments(comment_lines + trailer_lines)
+        )
+    
     # --- Streaming support ---
     
     def write_chunk(self, stream: BinaryIO, data: SignalData) -> None:
@@ -499,148 +993,79 @@ class CsvFormat(SignalFormat):
         
         For first chunk, writes comments and header.
         For subsequent chunks, writes only data rows.
+        When the stream is a file, the row offset index is kept up to date
+        and written as a sidecar on close_stream().
         """
         try:
             # Check if this is the first write to the stream
             is_first_chunk = stream.tell() == 0
             
-            if is_first_chunk:
-                # Write full CSV with metadata and header
-                content = self._create_csv_content(data)
-                stream.write(content.encode('utf-8'))
-            else:
-                # Write only the data rows without header or metadata
-                buffer = io.StringIO()
-                writer = csv.writer(buffer, lineterminator="\n")
-                
-                is_multi_channel = len(data.values.shape) > 1
-                
-                # Write data rows
-                if data.timestamps is None:
-                    # Generate timestamps if not provided
-                    sample_rate = data.metadata.get("sample_rate", 1000.0)
-                    start_time = data.metadata.get("start_time", 0.0)
-                    timestamps = np.arange(len(data.values)) / sample_rate + start_time
-                else:
-                    timestamps = data.timestamps
-                
-                if is_multi_channel:
-                    for i, (time, values) in enumerate(zip(timestamps, data.values)):
-                        writer.writerow([time] + values.tolist())
-                else:
-                    for time, value in zip(timestamps, data.values):
-                        writer.writerow([time, value])
-                
-                stream.write(buffer.getvalue().encode('utf-8'))
+            if stream not in self._index_states:
+                self._index_states[stream] = self._open_stream_index(stream)
+            index_state = self._index_states[stream]
+            
+            header = self._create_csv_header(data).encode('utf-8') if is_first_chunk else b""
+            rows, row_ends, timestamps = self._format_rows(data)
+            offset = stream.tell() + len(header)
+            stream.write(header + rows.encode('utf-8'))
+            
+            if index_state is not None:
+                index_state['entries'].extend(
+                    self._index_entries(offset, row_ends, timestamps, index_state['rows']))
+                index_state['rows'] += len(row_ends)
             
-            stream.flush()
+            if self.flush_chunks:
+                stream.flush()
             
         except Exception as e:
             raise SignalFormatError(f"Failed to write CSV chunk: {str(e)}")
     
-    def read_chunk(self, stream: BinaryIO) -> Optional[SignalData]:
+    def _open_stream_index(self, stream: BinaryIO) -> Optional[Dict[str, Any]]:
+        """Start indexing a write stream, continuing an existing index when appending."""
+        path = getattr(stream, 'name', None)
+        if not isinstance(path, str):
+            return None
+        if stream.tell() == 0:
+            return {'path': path, 'entries': [], 'rows': 0, 'comments': []}
+        
+        existing = self._read_index_file(path)
+        if existing is None or existing[1] != self.index_interval:
+            # Unknown row count; the index is rebuilt on first access instead
+            return None
+        entries, _, rows, comment_lines = existing
+        return {'path': path, 'entries': [tuple(entry) for entry in entries.tolist()], 'rows': rows,
+                'comments': comment_lines}
+    
+    def open_stream(self, destination: Union[str, Path], mode: str = 'w') -> Union[BinaryIO, CsvChunkReader]:
+        """
+        Open a CSV stream.
+        
+        Read streams are returned as a CsvChunkReader; write and append
+        streams are plain binary files.
+        """
+        if mode != 'r' or not isinstance(destination, (str, Path)):
+            return super().open_stream(destination, mode)
+        try:
+            return CsvChunkReader(open(destination, 'rb'), self, self.chunk_size)
+        except Exception as e:
+            raise SignalFormatError(f"Failed to open stream: {str(e)}")
+    
+    def read_chunk(self, stream: Union[BinaryIO, CsvChunkReader]) -> Optional[SignalData]:
         """
         Read a chunk of data from a CSV stream.
         
-        Reads up to 1000 data rows or until end of file.
-        For first chunk, parses metadata and header.
+        Reads up to chunk_size data rows or until end of file. Raw binary
+        file objects get a CsvChunkReader on first use, which is kept until
+        close_stream().
         """
         try:
-            # Initialize chunk state if not already done
-            if not hasattr(stream, '_csv_chunk_state'):
-                # First time reading from this stream
-                stream._csv_chunk_state = {
-                    'metadata': {},
-                    'header': None,
-                    'header_read': False,
-                    'first_chunk': True,
-                    'chunk_size': 3  # Default chunk size - matches our test case
-                }
-                
-                # Read comment lines for metadata
-                comment_lines = []
-                pos = stream.tell()
-                line = stream.readline().decode('utf-8').strip()
-                
-                # Process comment lines
-                while line and line.startswith(self.COMMENT_CHAR):
-                    comment_lines.append(line)
-                    pos = stream.tell()
-                    line = stream.readline().decode('utf-8').strip()
-                    if not line:  # End of file
-                        break
-                
-                # We've read past comments to a data line or EOF
-                if line:  # If not EOF, this should be the header
-                    # Go back to read the header line
-                    stream.seek(pos)
-                    header_line = stream.readline().decode('utf-8').strip()
-                    stream._csv_chunk_state['header'] = next(csv.reader([header_line]))
-                    stream._csv_chunk_state['header_read'] = True
-                
-                # Extract metadata
-                stream._csv_chunk_state['metadata'] = self._metadata_from_comments(comment_lines)
-            
-            # Read data rows for this chunk
-            timestamps = []
-            values = []
-            is_multi_channel = None
-            rows_read = 0
-            max_rows = stream._csv_chunk_state['chunk_size']  # Use stored chunk size
-            
-            while rows_read < max_rows:
-                pos = stream.tell()
-                line = stream.readline().decode('utf-8').strip()
-                
-                if not line:  # End of file
-                    break
-                
-                if line.startswith(self.COMMENT_CHAR):
-                    # Skip comment lines
-                    continue
-                
-                # Skip header line if we encounter it again
-                if stream._csv_chunk_state['header'] and ','.join(stream._csv_chunk_state['header']) == line:
-                    continue
-                
-                # Parse as CSV row
-                row = next(csv.reader([line]))
-                
-                try:
-                    # Extract timestamp and values
-                    timestamp = float(row[0])
-                    timestamps.append(timestamp)
-                    
-                    # Detect if multi-channel on first data row
-                    if is_multi_channel is None:
-                        is_multi_channel = len(row) > 2
-                    
-                    if is_multi_channel:
-                        values.append([float(v) for v in row[1:]])
-                    else:
-                        values.append(float(row[1]))
-                    
-                    rows_read += 1
-                    
-                except (ValueError, IndexError) as e:
-                    # Skip invalid rows
-                    import logging
-                    logging.warning(f"Skipping invalid CSV row: {row}, error: {e}")
-            
-            # If no data was read, return None to indicate end of stream
-            if not timestamps:
-                return None
-            
-            # Convert to arrays
-            timestamps_array = np.array(timestamps)
-            values_array = np.array(values)
-            
-            # Create signal data
-            return SignalData(
-                values=values_array,
-                timestamps=timestamps_array,
-                metadata=stream._csv_chunk_state['metadata']
-            )
+            if not isinstance(stream, CsvChunkReader):
+                reader = self._readers.get(stream)
+                if reader is None:
+                    reader = self._readers[stream] = CsvChunkReader(
+                        stream, self, self.chunk_size, owns_file=False)
+                stream = reader
+            return stream.read_chunk()
             
         except Exception as e:
             if not isinstance(e, SignalFormatError):
@@ -650,10 +1075,18 @@ class CsvFormat(SignalFormat):
     def close_stream(self, stream: BinaryIO) -> None:
         """Close a CSV stream."""
         try:
+            if isinstance(stream, CsvChunkReader):
+                stream.close()
+                return
+            self._readers.pop(stream, None)
+            
             # Clear any attributes we added
-            if hasattr(stream, '_csv_chunk_state'):
-                delattr(stream, '_csv_chunk_state')
+            index_state = self._index_states.pop(stream, None)
             
             stream.close()
+            
+            if index_state is not None:
+                self._write_index(index_state['path'], index_state['entries'],
+                                  self.index_interval, index_state['rows'], index_state['comments'])
         except Exception as e:
             raise SignalFormatError(f"Failed to close CSV stream: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,552 @@
+"""
+HDF5 Format Implementation
+
+This module implements the HDF5 format handler for signal data.
+HDF5 is the archival format: each channel is a chunked, optionally
+compressed dataset, so time ranges are read by touching only the
+chunks that overlap the requested range.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, BinaryIO, Tuple
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+from .base import (
+    SignalFormat,
+    SignalData,
+    TimeRange,
+    FormatCapability,
+    SignalFormatError,
+    BlockError,
+    uniform_time_base,
+    uniform_time_indices
+)
+from .lazy import ChunkSource, LazySignalData
+
+
+class Hdf5Stream:
+    """Open HDF5 file used for chunked reading or writing."""
+
+    def __init__(self, h5file, mode: str):
+        self.file = h5file
+        self.mode = mode
+        self.position = 0
+        self.metadata = {}
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class Hdf5Source(ChunkSource):
+    """Chunk source reading an open HDF5 file one dataset chunk at a time."""
+
+    def __init__(self, h5format: 'Hdf5Format', h5file, cache_size: int):
+        self.format = h5format
+        self.file = h5file
+        self.group = h5file[h5format.GROUP]
+
+        datasets = h5format._channel_datasets(self.group)
+        n = len(datasets[0])
+        chunk_size = datasets[0].chunks[0] if datasets[0].chunks else h5format.chunk_size
+        boundaries = np.append(np.arange(0, n, chunk_size), n) if n else np.array([0])
+
+        time_base = None
+        if "timestamps" not in self.group and self.group.attrs.get("sample_interval"):
+            time_base = (float(self.group.attrs["start_time"]), float(self.group.attrs["sample_interval"]))
+
+        super().__init__(boundaries, len(datasets), time_base=time_base, cache_size=cache_size)
+
+    def _load_chunk(self, index: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        return self.format._read_rows(self.group, int(self.boundaries[index]), int(self.boundaries[index + 1]))
+
+    def read_range(self, start: int, stop: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        return self.format._read_rows(self.group, start, stop)
+
+    @property
+    def has_timestamps(self) -> bool:
+        return "timestamps" in self.group or self.time_base is not None
+
+    def timestamp_at(self, sample: int) -> float:
+        if "timestamps" in self.group:
+            return float(self.group["timestamps"][sample])
+        return super().timestamp_at(sample)
+
+    def search(self, value: float, side: str) -> int:
+        if "timestamps" not in self.group:
+            raise SignalFormatError("HDF5 data has no time base for time range access")
+        return self.format._search(self.group["timestamps"], value, side)
+
+    def close(self) -> None:
+        super().close()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class Hdf5Format(SignalFormat):
+    """
+    HDF5 format handler for signal data.
+
+    Layout:
+        /signal/channel_0 ... channel_N   1-D chunked datasets, one per channel
+        /signal/timestamps                only when the time base is not uniform
+        /signal attributes                start_time, sample_interval, num_channels,
+                                          multi_channel, metadata (JSON)
+
+    Uniform time bases are stored as attributes, so time range reads compute
+    the sample indices directly; explicit timestamps are binary searched with
+    point reads. Either way only the overlapping chunks are read.
+    """
+
+    GROUP = "signal"
+    DEFAULT_CHUNK_SIZE = 65536
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, compression: Optional[str] = "gzip",
+                 compression_level: Optional[int] = 4, shuffle: bool = True, checksums: bool = True):
+        """
+        Initialize the format handler.
+
+        Args:
+            chunk_size: Samples per HDF5 chunk and per read_chunk() call
+            compression: HDF5 filter ("gzip", "lzf" or None)
+            compression_level: Filter level for gzip
+            shuffle: Enable the byte shuffle filter, which improves compression of numeric data
+            checksums: Store a Fletcher-32 checksum per chunk; HDF5 checks it on
+                       every read and fails the read of a corrupt chunk
+        """
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.compression_level = compression_level if compression == "gzip" else None
+        self.shuffle = shuffle and compression is not None
+        self.checksums = checksums
+
+    @property
+    def name(self) -> str:
+        return "HDF5"
+
+    @property
+    def extensions(self) -> List[str]:
+        return [".h5", ".hdf5"]
+
+    @property
+    def capabilities(self) -> List[FormatCapability]:
+        return [
+            FormatCapability.METADATA,
+            FormatCapability.STREAMING,
+            FormatCapability.RANDOM_ACCESS,
+            FormatCapability.COMPRESSION,
+            FormatCapability.MULTI_CHANNEL
+        ]
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _require_h5py() -> None:
+        if h5py is None:
+            raise SignalFormatError("HDF5 support requires the 'h5py' package")
+
+    def _open(self, source: Union[str, Path, BinaryIO], mode: str = 'r'):
+        self._require_h5py()
+        if isinstance(source, Path):
+            source = str(source)
+        return h5py.File(source, mode)
+
+    @staticmethod
+    def _channel_datasets(group) -> List[Any]:
+        return [group[f"channel_{i}"] for i in range(int(group.attrs["num_channels"]))]
+
+    @staticmethod
+    def _group_metadata(group) -> Dict[str, Any]:
+        metadata = json.loads(group.attrs.get("metadata", "{}"))
+        interval = group.attrs.get("sample_interval")
+        if interval:
+            metadata.setdefault("sample_rate", 1.0 / float(interval))
+        if "start_time" in group.attrs:
+            metadata.setdefault("start_time", float(group.attrs["start_time"]))
+        return metadata
+
+    @staticmethod
+    def _search(dataset, value: float, side: str) -> int:
+        """Binary search a sorted dataset with point reads, touching O(log n) chunks."""
+        lo, hi = 0, len(dataset)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            item = dataset[mid]
+            if item < value or (side == 'right' and item == value):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _read_rows(self, group, start_idx: int, end_idx: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Read rows [start_idx, end_idx) of all channels and their timestamps."""
+        datasets = self._channel_datasets(group)
+        end_idx = max(end_idx, start_idx)
+
+        if group.attrs.get("multi_channel", False):
+            values = np.empty((end_idx - start_idx, len(datasets)), dtype=datasets[0].dtype)
+            for i, dataset in enumerate(datasets):
+                values[:, i] = dataset[start_idx:end_idx]
+        else:
+            values = datasets[0][start_idx:end_idx]
+
+        if "timestamps" in group:
+            timestamps = group["timestamps"][start_idx:end_idx]
+        elif group.attrs.get("sample_interval"):
+            timestamps = (float(group.attrs["start_time"])
+                          + np.arange(start_idx, end_idx) * float(group.attrs["sample_interval"]))
+        else:
+            timestamps = None
+
+        return values, timestamps
+
+    # --- Reading ---
+
+    def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
+        """
+        Read signal data from an HDF5 source.
+
+        Args:
+            source: File path or file-like object
+            time_range: Optional time range to filter by
+
+        Returns:
+            SignalData object
+
+        Raises:
+            SignalFormatError: If reading fails
+        """
+        if time_range is not None:
+            return self.read_time_range(source, time_range)
+
+        try:
+            with self._open(source) as f:
+                group = f[self.GROUP]
+                values, timestamps = self._read_rows(group, 0, len(group["channel_0"]))
+                return SignalData(values=values, timestamps=timestamps,
+                                  metadata=self._group_metadata(group))
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read HDF5: {str(e)}")
+            raise e
+
+    def read_time_range(self, source: Union[str, Path, BinaryIO], time_range: TimeRange) -> SignalData:
+        """
+        Read a specific time range, reading only the overlapping chunks.
+        """
+        try:
+            with self._open(source) as f:
+                group = f[self.GROUP]
+                n = len(group["channel_0"])
+
+                if "timestamps" in group:
+                    timestamps = group["timestamps"]
+                    start_idx = 0 if time_range.start is None else self._search(timestamps, time_range.start, 'left')
+                    end_idx = n if time_range.end is None else self._search(timestamps, time_range.end, 'right')
+                elif group.attrs.get("sample_interval"):
+                    start_idx, end_idx = uniform_time_indices(
+                        float(group.attrs["start_time"]), float(group.attrs["sample_interval"]), n, time_range)
+                else:
+                    raise SignalFormatError("HDF5 data has no time base for time range reading")
+
+                values, timestamps = self._read_rows(group, start_idx, end_idx)
+                return SignalData(values=values, timestamps=timestamps,
+                                  metadata=self._group_metadata(group))
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read HDF5 time range: {str(e)}")
+            raise e
+
+    def open_lazy(self, source: Union[str, Path, BinaryIO], cache_size: Optional[int] = None) -> LazySignalData:
+        """
+        Open a file lazily; samples are read one HDF5 chunk at a time.
+
+        The file stays open until the returned signal is closed.
+        """
+        try:
+            f = self._open(source)
+            try:
+                h5source = Hdf5Source(self, f, Hdf5Source.DEFAULT_CACHE_SIZE if cache_size is None else cache_size)
+                return LazySignalData(h5source, metadata=self._group_metadata(h5source.group))
+            except Exception:
+                f.close()
+                raise
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to open HDF5: {str(e)}")
+            raise e
+
+    def get_metadata(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
+        """
+        Extract metadata from the group attributes without reading any data.
+        """
+        try:
+            with self._open(source) as f:
+                return self._group_metadata(f[self.GROUP])
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to extract metadata from HDF5: {str(e)}")
+            raise e
+
+    # --- Writing ---
+
+    def _create_group(self, f, data: SignalData):
+        """Create the signal group and empty channel datasets for the first chunk."""
+        values = np.asarray(data.values)
+        multi_channel = values.ndim > 1
+        num_channels = values.shape[1] if multi_channel else 1
+
+        group = f.create_group(self.GROUP)
+        group.attrs["format_version"] = "1.0"
+        group.attrs["created_at"] = data.metadata.get("created_at", datetime.now().isoformat())
+        group.attrs["num_channels"] = num_channels
+        group.attrs["multi_channel"] = multi_channel
+        group.attrs["metadata"] = json.dumps(data.metadata, default=str)
+
+        options = dict(
+            shape=(0,),
+            maxshape=(None,),
+            chunks=(self.chunk_size,),
+            compression=self.compression,
+            compression_opts=self.compression_level,
+            shuffle=self.shuffle,
+            fletcher32=self.checksums
+        )
+        for i in range(num_channels):
+            group.create_dataset(f"channel_{i}", dtype=values.dtype, **options)
+
+        # Keep uniform time bases as attributes, everything else as a dataset
+        time_base = None
+        if data.timestamps is not None:
+            time_base = uniform_time_base(np.asarray(data.timestamps))
+            if time_base is None:
+                group.create_dataset("timestamps", dtype=np.float64, **options)
+        elif data.metadata.get("sample_rate"):
+            time_base = (float(data.metadata.get("start_time", 0.0)), 1.0 / float(data.metadata["sample_rate"]))
+
+        if time_base is not None:
+            group.attrs["start_time"], group.attrs["sample_interval"] = time_base
+            for i in range(num_channels):
+                group[f"channel_{i}"].attrs["start_time"] = time_base[0]
+                group[f"channel_{i}"].attrs["sample_interval"] = time_base[1]
+
+        return group
+
+    def _append_rows(self, group, data: SignalData) -> None:
+        """Append the rows of a chunk to the channel datasets."""
+        values = np.asarray(data.values)
+        datasets = self._channel_datasets(group)
+        num_channels = values.shape[1] if values.ndim > 1 else 1
+        if num_channels != len(datasets):
+            raise SignalFormatError("Chunk channel count does not match the file")
+
+        start = len(datasets[0])
+        end = start + len(values)
+
+        # A chunk that breaks the uniform time base switches the file to explicit timestamps
+        if "timestamps" not in group and data.timestamps is not None:
+            if not group.attrs.get("sample_interval"):
+                raise SignalFormatError("Chunk with timestamps in a file without a time base")
+            first, interval = float(group.attrs["start_time"]), float(group.attrs["sample_interval"])
+            expected = first + np.arange(start, end) * interval
+            if not np.allclose(data.timestamps, expected, rtol=0.0, atol=interval * 1e-6):
+                existing = first + np.arange(start) * interval
+                group.create_dataset("timestamps", data=existing, maxshape=(None,),
+                                     chunks=(self.chunk_size,), compression=self.compression,
+                                     compression_opts=self.compression_level, shuffle=self.shuffle,
+                                     fletcher32=self.checksums)
+                for node in [group] + datasets:
+                    for name in ("start_time", "sample_interval"):
+                        if name in node.attrs:
+                            del node.attrs[name]
+
+        for i, dataset in enumerate(datasets):
+            dataset.resize((end,))
+            dataset[start:end] = values[:, i] if values.ndim > 1 else values
+
+        if "timestamps" in group:
+            if data.timestamps is None:
+                raise SignalFormatError("Chunk without timestamps in a file with explicit timestamps")
+            group["timestamps"].resize((end,))
+            group["timestamps"][start:end] = data.timestamps
+
+        if data.metadata:
+            metadata = json.loads(group.attrs.get("metadata", "{}"))
+            metadata.update(json.loads(json.dumps(data.metadata, default=str)))
+            group.attrs["metadata"] = json.dumps(metadata)
+
+    def write(self, destination: Union[str, Path, BinaryIO], data: SignalData, append: bool = False) -> None:
+        """
+        Write signal data to an HDF5 destination.
+
+        Appending resizes the existing datasets and writes only the new rows.
+
+        Args:
+            destination: File path or file-like object
+            data: SignalData to write
+            append: Whether to append to existing data
+
+        Raises:
+            SignalFormatError: If writing fails
+        """
+        try:
+            exists = isinstance(destination, (str, Path)) and Path(destination).exists()
+            with self._open(destination, 'a' if append and exists else 'w') as f:
+                if self.GROUP in f:
+                    self._append_rows(f[self.GROUP], data)
+                else:
+                    self._append_rows(self._create_group(f, data), data)
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write HDF5: {str(e)}")
+            raise e
+
+    # --- Streaming support ---
+
+    def open_stream(self, destination: Union[str, Path, BinaryIO], mode: str = 'w') -> Hdf5Stream:
+        """
+        Open an HDF5 file for chunked writing ('w'), appending ('a') or reading ('r').
+
+        Args:
+            destination: File path or file-like object
+            mode: File mode
+
+        Returns:
+            Hdf5Stream handle for write_chunk()/read_chunk()
+        """
+        if mode not in ('r', 'w', 'a'):
+            raise SignalFormatError(f"Unsupported stream mode: {mode}")
+        try:
+            stream = Hdf5Stream(self._open(destination, mode), mode)
+            if mode == 'r':
+                stream.metadata = self._group_metadata(stream.file[self.GROUP])
+            return stream
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to open stream: {str(e)}")
+            raise e
+
+    def write_chunk(self, stream: Hdf5Stream, data: SignalData) -> None:
+        """
+        Append a chunk of data to an HDF5 stream.
+        """
+        try:
+            if self.GROUP in stream.file:
+                self._append_rows(stream.file[self.GROUP], data)
+            else:
+                self._append_rows(self._create_group(stream.file, data), data)
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write HDF5 chunk: {str(e)}")
+            raise e
+
+    def read_chunk(self, stream: Hdf5Stream) -> Optional[SignalData]:
+        """
+        Read the next chunk_size rows from an HDF5 stream.
+        """
+        try:
+            group = stream.file[self.GROUP]
+            n = len(group["channel_0"])
+            if stream.position >= n:
+                return None
+
+            start = stream.position
+            end = min(start + self.chunk_size, n)
+            stream.position = end
+
+            values, timestamps = self._read_rows(group, start, end)
+            return SignalData(values=values, timestamps=timestamps, metadata=stream.metadata)
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read HDF5 chunk: {str(e)}")
+            raise e
+
+    def close_stream(self, stream: Hdf5Stream) -> None:
+        """Flush and close an HDF5 stream."""
+        try:
+            stream.close()
+        except Exception as e:
+            raise SignalFormatError(f"Failed to close HDF5 stream: {str(e)}")
+
+    # --- Integrity ---
+
+    def verify(self, source: Union[str, Path, BinaryIO], workers: Optional[int] = None) -> List[BlockError]:
+        """
+        Read every chunk so HDF5 checks its Fletcher-32 checksum.
+
+        h5py serializes all HDF5 calls, so chunks are read sequentially and
+        workers is ignored. Files written without checksums only detect
+        corruption that breaks decompression.
+
+        Args:
+            source: File path or file-like object
+            workers: Unused
+
+        Returns:
+            One BlockError per unreadable chunk row range, with its time span
+        """
+        errors = []
+        try:
+            with self._open(source) as f:
+                group = f[self.GROUP]
+                datasets = self._channel_datasets(group)
+                if "timestamps" in group:
+                    datasets.append(group["timestamps"])
+                n = len(datasets[0])
+                chunk_size = datasets[0].chunks[0] if datasets[0].chunks else self.chunk_size
+
+                for index, start in enumerate(range(0, n, chunk_size)):
+                    end = min(start + chunk_size, n)
+                    try:
+                        for dataset in datasets:
+                            dataset[start:end]
+                    except Exception as e:
+                        errors.append(BlockError(index=index, message=f"Chunk rows {start}-{end}: {e}",
+                                                 time_range=self._rows_time_range(group, start, end)))
+        except Exception as e:
+            errors.append(BlockError(index=0, message=f"Failed to open HDF5 data: {e}"))
+        return errors
+
+    @staticmethod
+    def _rows_time_range(group, start: int, end: int) -> Optional[TimeRange]:
+        """Time span of rows [start, end), if it can still be read."""
+        try:
+            if group.attrs.get("sample_interval"):
+                first, interval = float(group.attrs["start_time"]), float(group.attrs["sample_interval"])
+                return TimeRange(start=first + start * interval, end=first + (end - 1) * interval)
+            if "timestamps" in group:
+                timestamps = group["timestamps"]
+                return TimeRange(start=float(timestamps[start]), end=float(timestamps[end - 1]))
+        except Exception:
+            pass
+        return None
+
+    def validate(self, source: Union[str, Path, BinaryIO]) -> bool:
+        """
+        Validate whether a source is an HDF5 file written by this format.
+
+        Args:
+            source: File path or file-like object to validate
+
+        Returns:
+            True if valid, False otherwise
+        """
+        try:
+            with self._open(source) as f:
+                return self.GROUP in f and "channel_0" in f[self.GROUP]
+        except Exception:
+            return False
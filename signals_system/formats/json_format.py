@@ -5,9 +5,11 @@ This module implements the JSON format handler for signal data.
 It provides a clean, human-readable format with good metadata support.
 """
 
+import base64
 import json
+import zlib
 import numpy as np
-from typing import Dict, Any, List, Optional, Union, BinaryIO
+from typing import Dict, Any, List, Optional, Union, BinaryIO, Tuple
 import io
 import os
 from datetime import datetime
@@ -38,8 +40,48 @@ class JsonFormat(SignalFormat):
         "data": [[1.0, 2.0], [1.1, 2.1], ...],
         "timestamps": [0.0, 0.001, 0.002, ...]
     }
+    
+    Files that are appended to use the lines layout instead, one JSON
+    object per line, so an append only writes new lines:
+    {"metadata": {...}, "layout": "lines"}
+    {"data": [...], "timestamps": [...]}
+    {"metadata": {...}}                       # metadata of a later append
+    {"data": [...], "timestamps": [...]}
+    
+    Lines are merged in order: data is concatenated and metadata updated.
+    Files written with write_chunk() are read the same way.
+    
+    With array_encoding="base64", "data" and "timestamps" are stored as typed
+    buffers instead of nested lists, optionally zlib compressed:
+    {"__ndarray__": "<base64>", "dtype": "<f8", "shape": [1000, 2], "compression": "zlib"}
+    Both encodings are always readable.
     """
     
+    LINES_LAYOUT = "lines"
+    ARRAY_ENCODINGS = ("list", "base64")
+    
+    def __init__(self, array_encoding: str = "list", compression: Optional[str] = None,
+                 compression_level: int = 6):
+        """
+        Initialize the format handler.
+        
+        Args:
+            array_encoding: "list" for plain JSON lists (most interoperable) or
+                            "base64" for typed binary buffers
+            compression: None or "zlib"; only used with base64 encoding
+            compression_level: zlib compression level
+            
+        Raises:
+            ValueError: If the encoding or compression is unknown
+        """
+        if array_encoding not in self.ARRAY_ENCODINGS:
+            raise ValueError(f"Unknown array encoding: {array_encoding}")
+        if compression not in (None, "zlib"):
+            raise ValueError(f"Unknown compression: {compression}")
+        self.array_encoding = array_encoding
+        self.compression = compression
+        self.compression_level = compression_level
+    
     @property
     def name(self) -> str:
         return "JSON"
@@ -55,6 +97,152 @@ class JsonFormat(SignalFormat):
             FormatCapability.STREAMING
         ]
     
+    # --- Array encoding ---
+    
+    def _encode_array(self, array: np.ndarray) -> Union[list, Dict[str, Any]]:
+        """Encode an array as a JSON list or a base64 typed buffer."""
+        array = np.asarray(array)
+        if self.array_encoding == "list":
+            return array.tolist()
+        
+        array = np.ascontiguousarray(array)
+        buffer = array.tobytes()
+        if self.compression == "zlib":
+            buffer = zlib.compress(buffer, self.compression_level)
+        return {
+            "__ndarray__": base64.b64encode(buffer).decode('ascii'),
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "compression": self.compression
+        }
+    
+    @staticmethod
+    def _decode_array(encoded: Union[list, Dict[str, Any]]) -> np.ndarray:
+        """Decode a JSON list or a base64 typed buffer into an array."""
+        if not isinstance(encoded, dict):
+            return np.array(encoded)
+        if "__ndarray__" not in encoded:
+            raise SignalFormatError("JSON array object without '__ndarray__' buffer")
+        
+        buffer = base64.b64decode(encoded["__ndarray__"])
+        compression = encoded.get("compression")
+        if compression == "zlib":
+            buffer = zlib.decompress(buffer)
+        elif compression is not None:
+            raise SignalFormatError(f"Unsupported JSON array compression: {compression}")
+        # Arrays over bytes are read-only; a bytearray makes the result writable like a decoded list
+        return np.frombuffer(bytearray(buffer), dtype=np.dtype(encoded["dtype"])).reshape(encoded["shape"])
+    
+    @staticmethod
+    def _is_array(encoded: Any) -> bool:
+        return isinstance(encoded, list) or (isinstance(encoded, dict) and "__ndarray__" in encoded)
+    
+    # --- Layout helpers ---
+    
+    def _line_objects(self, content: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Parse content in the lines layout, or return None if it is a single JSON document."""
+        first_line, _, rest = content.partition(b"\n")
+        try:
+            first = json.loads(first_line.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(first, dict):
+            return None
+        if first.get("layout") != self.LINES_LAYOUT and not ("data" in first and rest.strip()):
+            return None
+        
+        objects = [first]
+        for line in rest.split(b"\n"):
+            if line.strip():
+                try:
+                    objects.append(json.loads(line.decode('utf-8')))
+                except json.JSONDecodeError as e:
+                    raise SignalFormatError(f"Invalid JSON line: {str(e)}")
+        return objects
+    
+    def _parse_content(self, content: bytes) -> Tuple[np.ndarray, Optional[np.ndarray], Dict[str, Any]]:
+        """Parse either layout into values, timestamps and metadata."""
+        objects = self._line_objects(content)
+        
+        if objects is None:
+            # Parse the JSON
+            try:
+                json_data = json.loads(content.decode('utf-8'))
+            except json.JSONDecodeError as e:
+                raise SignalFormatError(f"Invalid JSON: {str(e)}")
+            
+            # Extract components
+            if "data" not in json_data:
+                raise SignalFormatError("Missing 'data' field in JSON")
+            
+            # Convert to numpy arrays
+            values = self._decode_array(json_data["data"])
+            timestamps = self._decode_array(json_data["timestamps"]) if "timestamps" in json_data else None
+            return values, timestamps, json_data.get("metadata", {})
+        
+        metadata = {}
+        values = []
+        timestamps = []
+        for obj in objects:
+            metadata.update(obj.get("metadata", {}))
+            if "data" in obj:
+                values.append(self._decode_array(obj["data"]))
+                timestamps.append(self._decode_array(obj["timestamps"]) if "timestamps" in obj else None)
+        
+        if not values:
+            return np.array([]), None, metadata
+        
+        values = np.concatenate(values)
+        if any(chunk is None for chunk in timestamps):
+            timestamps = None
+        else:
+            timestamps = np.concatenate(timestamps)
+        return values, timestamps, metadata
+    
+    def _chunk_line(self, data: SignalData) -> bytes:
+        """Serialize the data of a chunk as one line of the lines layout."""
+        chunk_json = {"data": self._encode_array(data.values)}
+        if data.timestamps is not None:
+            chunk_json["timestamps"] = self._encode_array(data.timestamps)
+        return (json.dumps(chunk_json) + "\n").encode('utf-8')
+    
+    def _append_lines(self, path: Union[str, Path], data: SignalData) -> None:
+        """
+        Append a chunk to a file in the lines layout.
+        
+        A file in the single document layout is converted to the lines layout
+        on its first append; after that only the new lines are written.
+        """
+        with open(path, 'rb') as f:
+            first_line = f.readline()
+        
+        try:
+            header = json.loads(first_line.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            header = None
+        
+        if not isinstance(header, dict) or header.get("layout") != self.LINES_LAYOUT:
+            existing = self.read(path)
+            with open(path, 'wb') as f:
+                f.write(self._header_line(existing.metadata))
+                f.write(self._chunk_line(existing))
+        
+        with open(path, 'ab') as f:
+            if data.metadata:
+                f.write((json.dumps({"metadata": data.metadata}, default=str) + "\n").encode('utf-8'))
+            f.write(self._chunk_line(data))
+    
+    def _header_line(self, metadata: Dict[str, Any]) -> bytes:
+        header = {
+            "metadata": {
+                "format_version": "1.0",
+                "created_at": datetime.now().isoformat(),
+                **metadata
+            },
+            "layout": self.LINES_LAYOUT
+        }
+        return (json.dumps(header, default=str) + "\n").encode('utf-8')
+    
     def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
         """
         Read signal data from a JSON source.
@@ -81,20 +269,7 @@ class JsonFormat(SignalFormat):
                 content = source.read()
                 source.seek(pos)  # Restore position
             
-            # Parse the JSON
-            try:
-                json_data = json.loads(content.decode('utf-8'))
-            except json.JSONDecodeError as e:
-                raise SignalFormatError(f"Invalid JSON: {str(e)}")
-            
-            # Extract components
-            if "data" not in json_data:
-                raise SignalFormatError("Missing 'data' field in JSON")
-            
-            # Convert to numpy arrays
-            values = np.array(json_data["data"])
-            timestamps = np.array(json_data.get("timestamps")) if "timestamps" in json_data else None
-            metadata = json_data.get("metadata", {})
+            values, timestamps, metadata = self._parse_content(content)
             
             # Create the signal data
             signal_data = SignalData(
@@ -129,28 +304,16 @@ class JsonFormat(SignalFormat):
         try:
             # Handle append mode
             if append:
-                if isinstance(destination, (str, Path)):
-                    if os.path.exists(destination):
-                        existing_data = self.read(destination)
-                        
-                        # Combine data
-                        combined_values = np.concatenate([existing_data.values, data.values])
-                        combined_timestamps = None
-                        if existing_data.timestamps is not None and data.timestamps is not None:
-                            combined_timestamps = np.concatenate([existing_data.timestamps, data.timestamps])
-                        
-                        # Update metadata
-                        combined_metadata = {**existing_data.metadata, **data.metadata}
-                        
-                        # Create new SignalData
-                        data = SignalData(
-                            values=combined_values,
-                            timestamps=combined_timestamps,
-                            metadata=combined_metadata
-                        )
-                else:
+                if not isinstance(destination, (str, Path)):
                     # For file-like objects, appending doesn't make sense without reading first
                     raise SignalFormatError("Append mode not supported for file-like objects")
+                if os.path.exists(destination):
+                    self._append_lines(destination, data)
+                else:
+                    with open(destination, 'wb') as f:
+                        f.write(self._header_line(data.metadata))
+                        f.write(self._chunk_line(data))
+                return
             
             # Create the JSON structure
             output = {
@@ -159,12 +322,12 @@ class JsonFormat(SignalFormat):
                     "created_at": datetime.now().isoformat(),
                     **data.metadata
                 },
-                "data": data.values.tolist()
+                "data": self._encode_array(data.values)
             }
             
             # Add timestamps if available
             if data.timestamps is not None:
-                output["timestamps"] = data.timestamps.tolist()
+                output["timestamps"] = self._encode_array(data.timestamps)
             
             # Convert to JSON string
             json_str = json.dumps(output, indent=2)
@@ -179,7 +342,9 @@ class JsonFormat(SignalFormat):
                 destination.flush()
                 
         except Exception as e:
-            raise SignalFormatError(f"Failed to write JSON: {str(e)}")
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write JSON: {str(e)}")
+            raise e
     
     def get_metadata(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
         """
@@ -197,16 +362,23 @@ class JsonFormat(SignalFormat):
         try:
             # For JSON, we need to read the file but we can avoid converting arrays
             if isinstance(source, (str, Path)):
-                with open(source, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
+                with open(source, 'rb') as f:
+                    content = f.read()
             else:
                 # Assume it's a file-like object
                 pos = source.tell()
                 source.seek(0)
                 content = source.read()
                 source.seek(pos)  # Restore position
-                json_data = json.loads(content.decode('utf-8'))
             
+            objects = self._line_objects(content)
+            if objects is not None:
+                metadata = {}
+                for obj in objects:
+                    metadata.update(obj.get("metadata", {}))
+                return metadata
+            
+            json_data = json.loads(content.decode('utf-8'))
             return json_data.get("metadata", {})
             
         except Exception as e:
@@ -234,6 +406,15 @@ class JsonFormat(SignalFormat):
                 content = source.read()
                 source.seek(pos)  # Restore position
             
+            # Lines layout: every line must be an object, and some must carry data
+            try:
+                objects = self._line_objects(content)
+            except SignalFormatError:
+                return False
+            if objects is not None:
+                return (all(isinstance(obj, dict) for obj in objects)
+                        and any(self._is_array(obj.get("data")) for obj in objects))
+            
             # Try to parse as JSON
             try:
                 json_data = json.loads(content.decode('utf-8'))
@@ -245,11 +426,11 @@ class JsonFormat(SignalFormat):
                 return False
                 
             # Validate data is an array
-            if not isinstance(json_data["data"], list):
+            if not self._is_array(json_data["data"]):
                 return False
                 
             # If timestamps are present, validate they're an array
-            if "timestamps" in json_data and not isinstance(json_data["timestamps"], list):
+            if "timestamps" in json_data and not self._is_array(json_data["timestamps"]):
                 return False
                 
             # Check that metadata is a dictionary if present
@@ -281,19 +462,20 @@ class JsonFormat(SignalFormat):
             # Create a minimal JSON structure for the chunk
             chunk_json = {
                 "metadata": data.metadata,
-                "data": data.values.tolist()
+                "data": self._encode_array(data.values)
             }
             
             # Add timestamps if available
             if data.timestamps is not None:
-                chunk_json["timestamps"] = data.timestamps.tolist()
+                chunk_json["timestamps"] = self._encode_array(data.timestamps)
             
             # Convert to JSON string and add newline
             json_line = json.dumps(chunk_json) + "\n"
             
             # Write to stream
             stream.write(json_line.encode('utf-8'))
-            stream.flush()
+            if self.flush_chunks:
+                stream.flush()
             
         except Exception as e:
             raise SignalFormatError(f"Failed to write JSON chunk: {str(e)}")
@@ -302,7 +484,9 @@ class JsonFormat(SignalFormat):
         """
         Read a chunk of data from a JSON stream.
         
-        Reads a line from the stream and parses it as a JSON object.
+        Reads lines from the stream up to the next line with data. The header
+        and metadata-only lines of the lines layout written by appends are
+        merged into the metadata of the chunk that follows them.
         
         Args:
             stream: Open file handle
@@ -314,27 +498,32 @@ class JsonFormat(SignalFormat):
             SignalFormatError: If reading fails
         """
         try:
-            # Read a line from the stream
-            line = stream.readline()
-            
-            # Check for end of file
-            if not line:
-                return None
-            
-            # Parse the JSON
-            try:
-                chunk_json = json.loads(line.decode('utf-8'))
-            except json.JSONDecodeError as e:
-                raise SignalFormatError(f"Invalid JSON in chunk: {str(e)}")
-            
-            # Extract data
-            if "data" not in chunk_json:
-                raise SignalFormatError("Missing 'data' field in JSON chunk")
+            metadata = {}
+            while True:
+                # Read a line from the stream
+                line = stream.readline()
+                
+                # Check for end of file
+                if not line:
+                    return None
+                if not line.strip():
+                    continue
+                
+                # Parse the JSON
+                try:
+                    chunk_json = json.loads(line.decode('utf-8'))
+                except json.JSONDecodeError as e:
+                    raise SignalFormatError(f"Invalid JSON in chunk: {str(e)}")
+                if not isinstance(chunk_json, dict):
+                    raise SignalFormatError("Missing 'data' field in JSON chunk")
+                
+                metadata.update(chunk_json.get("metadata", {}))
+                if "data" in chunk_json:
+                    break
             
             # Convert to numpy arrays
-            values = np.array(chunk_json["data"])
-            timestamps = np.array(chunk_json.get("timestamps")) if "timestamps" in chunk_json else None
-            metadata = chunk_json.get("metadata", {})
+            values = self._decode_array(chunk_json["data"])
+            timestamps = self._decode_array(chunk_json["timestamps"]) if "timestamps" in chunk_json else None
             
             # Create signal data
             return SignalData(
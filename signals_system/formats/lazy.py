@@ -0,0 +1,383 @@
+"""
+Lazy Signal Data Module
+
+This module provides LazySignalData, a SignalData whose arrays are resolved
+on demand from a backing store instead of being loaded by read(). Stores
+are exposed through ChunkSource implementations: memory-mapped or in-memory
+arrays, or a chunked format reader with a small LRU cache of decoded chunks.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .base import SignalData, TimeRange, SignalFormatError, uniform_time_indices
+
+
+class ChunkSource(ABC):
+    """
+    Random access to the chunks of a stored signal.
+
+    A source is described by its chunk boundaries (cumulative sample offsets,
+    one more entry than there are chunks) and optionally by a uniform time
+    base or the time span of every chunk, which lets time ranges be located
+    without decoding data. Decoded chunks are kept in a small LRU cache that
+    is shared by all LazySignalData views of the source.
+    """
+
+    DEFAULT_CACHE_SIZE = 8
+
+    def __init__(self, boundaries: np.ndarray, channels: int,
+                 time_base: Optional[Tuple[float, float]] = None,
+                 chunk_times: Optional[np.ndarray] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the source description.
+
+        Args:
+            boundaries: Sample offset of each chunk start, followed by the total sample count
+            channels: Number of channels
+            time_base: (start_time, sample_interval) if the timestamps are uniform
+            chunk_times: (first, last) timestamp of each chunk, shape (chunks, 2)
+            cache_size: Number of decoded chunks to keep
+        """
+        self.boundaries = np.asarray(boundaries, dtype=np.int64)
+        self.channels = channels
+        self.time_base = time_base
+        self.chunk_times = chunk_times
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    @property
+    def num_samples(self) -> int:
+        return int(self.boundaries[-1])
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self.boundaries) - 1
+
+    @abstractmethod
+    def _load_chunk(self, index: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Decode one chunk from the backing store.
+
+        Args:
+            index: Chunk index
+
+        Returns:
+            (values, timestamps) of the chunk; timestamps may be None when the
+            source has a uniform time base
+        """
+        pass
+
+    @property
+    def has_timestamps(self) -> bool:
+        """Whether the signal has a time base, known without reading samples."""
+        return self.time_base is not None or self.chunk_times is not None
+
+    def chunk(self, index: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Get a decoded chunk through the LRU cache."""
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+
+        chunk = self._load_chunk(index)
+        if self.cache_size > 0:
+            self._cache[index] = chunk
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return chunk
+
+    def chunk_index(self, sample: int) -> int:
+        """Get the index of the chunk containing a sample."""
+        return int(np.searchsorted(self.boundaries, sample, side='right')) - 1
+
+    def generated_timestamps(self, start: int, stop: int) -> Optional[np.ndarray]:
+        """Timestamps of a sample range from the uniform time base, if there is one."""
+        if self.time_base is None:
+            return None
+        start_time, interval = self.time_base
+        return start_time + np.arange(start, stop) * interval
+
+    def read_range(self, start: int, stop: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Read samples [start, stop) into memory.
+
+        Returns:
+            (values, timestamps)
+        """
+        values, timestamps = [], []
+        if stop > start:
+            for i in range(self.chunk_index(start), self.chunk_index(stop - 1) + 1):
+                chunk_values, chunk_timestamps = self.chunk(i)
+                lo = max(start - self.boundaries[i], 0)
+                hi = min(stop, self.boundaries[i + 1]) - self.boundaries[i]
+                values.append(chunk_values[lo:hi])
+                if chunk_timestamps is not None:
+                    timestamps.append(chunk_timestamps[lo:hi])
+
+        if not values:
+            shape = (0, self.channels) if self.channels > 1 else (0,)
+            return np.empty(shape), self.generated_timestamps(start, start)
+
+        if self.time_base is not None:
+            timestamps = self.generated_timestamps(start, stop)
+        elif len(timestamps) == len(values):
+            timestamps = timestamps[0] if len(timestamps) == 1 else np.concatenate(timestamps)
+        else:
+            timestamps = None
+        values = values[0] if len(values) == 1 else np.concatenate(values)
+        return values, timestamps
+
+    def timestamp_at(self, sample: int) -> float:
+        """Get the timestamp of a single sample."""
+        if self.time_base is not None:
+            return float(self.time_base[0] + sample * self.time_base[1])
+
+        index = self.chunk_index(sample)
+        timestamps = self.chunk(index)[1]
+        if timestamps is None:
+            raise SignalFormatError("Signal has no timestamps")
+        return float(timestamps[sample - self.boundaries[index]])
+
+    def search(self, value: float, side: str) -> int:
+        """
+        Find the insertion point of a time in the (sorted) timestamps.
+
+        Uses the chunk time spans to pick a chunk and decodes only that one.
+
+        Args:
+            value: Time to search for
+            side: 'left' or 'right', as for np.searchsorted
+
+        Returns:
+            Sample index
+        """
+        if self.chunk_times is None or np.isnan(self.chunk_times).any():
+            raise SignalFormatError("Signal has no time base for time range access")
+
+        if side == 'left':
+            # First chunk that ends at or after the value
+            index = int(np.searchsorted(self.chunk_times[:, 1], value, side='left'))
+            if index >= self.num_chunks:
+                return self.num_samples
+        else:
+            # Last chunk that starts at or before the value
+            index = int(np.searchsorted(self.chunk_times[:, 0], value, side='right')) - 1
+            if index < 0:
+                return 0
+
+        timestamps = self.chunk(index)[1]
+        return int(self.boundaries[index]) + int(np.searchsorted(timestamps, value, side=side))
+
+    def close(self) -> None:
+        """Release the backing store."""
+        self._cache.clear()
+
+
+class ArraySource(ChunkSource):
+    """
+    Chunk source over arrays that are already addressable, such as memory maps.
+
+    Slicing a memory map does not read it, so chunks are plain views and
+    bypass the cache.
+    """
+
+    def __init__(self, values: np.ndarray, timestamps: Optional[np.ndarray] = None,
+                 time_base: Optional[Tuple[float, float]] = None, chunk_size: int = 65536):
+        """
+        Initialize the source.
+
+        Args:
+            values: Values array, shape (samples,) or (samples, channels)
+            timestamps: Timestamps array, if the time base is not uniform
+            time_base: (start_time, sample_interval) for uniform timestamps
+            chunk_size: Samples per chunk for chunk-wise iteration
+        """
+        n = len(values)
+        boundaries = np.append(np.arange(0, n, chunk_size), n) if n else np.array([0])
+        channels = values.shape[1] if values.ndim > 1 else 1
+        super().__init__(boundaries, channels, time_base=time_base, cache_size=0)
+        self.values = values
+        self.timestamps = timestamps
+
+    def _load_chunk(self, index: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        start, stop = self.boundaries[index], self.boundaries[index + 1]
+        timestamps = self.timestamps[start:stop] if self.timestamps is not None else None
+        return self.values[start:stop], timestamps
+
+    def read_range(self, start: int, stop: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        stop = max(stop, start)
+        if self.timestamps is not None:
+            return self.values[start:stop], self.timestamps[start:stop]
+        return self.values[start:stop], self.generated_timestamps(start, stop)
+
+    @property
+    def has_timestamps(self) -> bool:
+        return self.timestamps is not None or self.time_base is not None
+
+    def timestamp_at(self, sample: int) -> float:
+        if self.timestamps is not None:
+            return float(self.timestamps[sample])
+        return super().timestamp_at(sample)
+
+    def search(self, value: float, side: str) -> int:
+        if self.timestamps is None:
+            raise SignalFormatError("Signal has no time base for time range access")
+        # Touches O(log n) pages of a memory map
+        return int(np.searchsorted(self.timestamps, value, side=side))
+
+    def close(self) -> None:
+        super().close()
+        self.values = None
+        self.timestamps = None
+
+
+class LazySignalData(SignalData):
+    """
+    SignalData whose values and timestamps are read from a ChunkSource on demand.
+
+    num_samples, num_channels, duration, sample_rate, slice() and
+    time_slice() work without loading samples; slices are new lazy views on
+    the same source. Accessing values or timestamps reads the selected range
+    into memory once. Use iter_chunks() to process large signals chunk-wise.
+
+    Timestamps are assumed to be sorted, which holds for every built-in format.
+    """
+
+    def __init__(self, source: ChunkSource, start: int = 0, stop: Optional[int] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a lazy view on a source.
+
+        Args:
+            source: Backing chunk source
+            start: First sample of the view
+            stop: End of the view (exclusive); defaults to the end of the source
+            metadata: Metadata associated with the signal
+        """
+        self.source = source
+        self.start = start
+        self.stop = source.num_samples if stop is None else max(stop, start)
+        self.metadata = {} if metadata is None else metadata
+        self._loaded = None
+
+    def __repr__(self) -> str:
+        return (f"LazySignalData(samples={self.num_samples}, channels={self.num_channels}, "
+                f"start={self.start}, stop={self.stop})")
+
+    def __enter__(self) -> 'LazySignalData':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the backing source; all views on it become unusable."""
+        self.source.close()
+        self._loaded = None
+
+    def _load(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        if self._loaded is None:
+            self._loaded = self.source.read_range(self.start, self.stop)
+        return self._loaded
+
+    @property
+    def values(self) -> np.ndarray:
+        """Values of the view, read on first access."""
+        return self._load()[0]
+
+    @property
+    def timestamps(self) -> Optional[np.ndarray]:
+        """Timestamps of the view, read or generated on first access."""
+        if self._loaded is None and self.source.time_base is not None:
+            return self.source.generated_timestamps(self.start, self.stop)
+        return self._load()[1]
+
+    @property
+    def timestamps_sorted(self) -> bool:
+        return self.source.has_timestamps
+
+    @property
+    def num_samples(self) -> int:
+        return self.stop - self.start
+
+    @property
+    def num_channels(self) -> int:
+        return self.source.channels
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.num_samples < 2 or not self.source.has_timestamps:
+            return None
+        return self.source.timestamp_at(self.stop - 1) - self.source.timestamp_at(self.start)
+
+    @property
+    def sample_rate(self) -> Optional[float]:
+        if 'sample_rate' in self.metadata:
+            return float(self.metadata['sample_rate'])
+        duration = self.duration
+        if duration:
+            return (self.num_samples - 1) / duration
+        return None
+
+    def _view(self, index: slice) -> 'LazySignalData':
+        start, stop, _ = index.indices(self.num_samples)
+        return LazySignalData(self.source, self.start + start, self.start + max(stop, start),
+                              metadata=self.metadata.copy())
+
+    def time_slice(self, time_range: TimeRange) -> 'LazySignalData':
+        """
+        Extract a time range as a lazy view.
+
+        Uniform time bases are resolved arithmetically; otherwise the source
+        searches its chunk time spans and decodes at most one chunk per bound.
+        """
+        if not self.source.has_timestamps:
+            raise ValueError("Cannot slice by time: no timestamps available")
+
+        source = self.source
+        if source.time_base is not None:
+            start_idx, end_idx = uniform_time_indices(
+                source.time_base[0], source.time_base[1], source.num_samples, time_range)
+        else:
+            start_idx = 0 if time_range.start is None else source.search(time_range.start, 'left')
+            end_idx = source.num_samples if time_range.end is None else source.search(time_range.end, 'right')
+
+        start_idx = min(max(start_idx, self.start), self.stop)
+        end_idx = min(max(end_idx, start_idx), self.stop)
+        return self._view(slice(start_idx - self.start, end_idx - self.start))
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[SignalData]:
+        """
+        Iterate over the view in chunks.
+
+        Args:
+            chunk_size: Samples per chunk; by default the stored chunks are
+                        yielded (trimmed to the view), which avoids copying
+
+        Yields:
+            In-memory SignalData chunks sharing this signal's metadata
+        """
+        if chunk_size is not None:
+            for start in range(self.start, self.stop, chunk_size):
+                values, timestamps = self.source.read_range(start, min(start + chunk_size, self.stop))
+                yield SignalData(values=values, timestamps=timestamps, metadata=self.metadata)
+            return
+
+        if self.num_samples == 0:
+            return
+        source = self.source
+        for i in range(source.chunk_index(self.start), source.chunk_index(self.stop - 1) + 1):
+            chunk_start = int(source.boundaries[i])
+            lo = max(self.start, chunk_start)
+            hi = min(self.stop, int(source.boundaries[i + 1]))
+            values, timestamps = source.chunk(i)
+            if timestamps is not None:
+                timestamps = timestamps[lo - chunk_start:hi - chunk_start]
+            else:
+                timestamps = source.generated_timestamps(lo, hi)
+            yield SignalData(values=values[lo - chunk_start:hi - chunk_start], timestamps=timestamps,
+                             metadata=self.metadata)
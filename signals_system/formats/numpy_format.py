@@ -0,0 +1,676 @@
+"""
+NumPy Format Implementation
+
+This module implements the NumPy format handler for signal data.
+Values are stored as a plain .npy array that is memory-mapped on read, so
+time ranges of very large recordings can be sliced without loading them.
+"""
+
+import json
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, BinaryIO, Tuple
+
+import numpy as np
+
+from .base import (
+    SignalFormat,
+    SignalData,
+    TimeRange,
+    FormatCapability,
+    SignalFormatError,
+    logger,
+    uniform_time_base,
+    uniform_time_indices
+)
+from .lazy import ArraySource, LazySignalData
+
+
+# Size of the .npy header we write; fixed so the shape can be patched in place
+_NPY_HEADER_SIZE = 128
+_NPY_MAGIC = b'\x93NUMPY'
+
+
+def _npy_header(dtype: np.dtype, shape: Tuple[int, ...]) -> bytes:
+    """Build a fixed-size version 1.0 .npy header."""
+    header = repr({
+        'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+        'fortran_order': False,
+        'shape': tuple(shape),
+    })
+    header_len = _NPY_HEADER_SIZE - len(_NPY_MAGIC) - 4
+    if len(header) + 1 > header_len:
+        raise SignalFormatError(f"Array header too long: {header}")
+    header = header.ljust(header_len - 1) + '\n'
+    return _NPY_MAGIC + b'\x01\x00' + struct.pack('<H', header_len) + header.encode('latin1')
+
+
+def _read_npy_header(f: BinaryIO) -> Tuple[np.dtype, Tuple[int, ...], int]:
+    """Read the header of an .npy file and return (dtype, shape, data offset)."""
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    if fortran_order:
+        raise SignalFormatError("Fortran-ordered arrays are not supported")
+    return dtype, shape, f.tell()
+
+
+def _map_npy(path: Path) -> np.ndarray:
+    """
+    Memory-map an .npy file.
+
+    The header of a stream that was never closed still has the shape it had
+    when the stream was opened, so for files written by NumpyFormat the
+    number of rows is taken from the file size.
+    """
+    with open(path, 'rb') as f:
+        dtype, shape, offset = _read_npy_header(f)
+        size = os.fstat(f.fileno()).st_size
+
+    rows = shape[0] if shape else 0
+    row_size = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+    if shape and offset == _NPY_HEADER_SIZE and row_size:
+        rows = max(rows, (size - offset) // row_size)
+
+    if not shape:
+        return np.load(path)
+    if rows == 0:
+        return np.empty((0,) + tuple(shape[1:]), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(rows,) + tuple(shape[1:]))
+
+
+class NumpyStream:
+    """
+    Open NumPy stream for chunked reading or writing.
+
+    Writing appends raw rows behind a fixed-size header, which is patched
+    with the final shape when the stream is closed, so the file grows
+    without ever being rewritten. The rows of a stream that was never
+    closed are still read back, counted from the file size.
+    """
+
+    def __init__(self, path: Path, mode: str, chunk_size: int):
+        self.path = path
+        self.mode = mode
+        self.chunk_size = chunk_size
+
+        # Writing state
+        self.file = None
+        self.timestamps_file = None
+        self.dtype = None
+        self.channels = None
+        self.count = 0
+        self.metadata = {}
+        self.start_time = None
+        self.sample_interval = None
+
+        # Reading state
+        self.values = None
+        self.timestamps = None
+        self.position = 0
+
+    def close(self) -> None:
+        for f in (self.file, self.timestamps_file):
+            if f is not None:
+                f.close()
+        self.file = None
+        self.timestamps_file = None
+        self.values = None
+        self.timestamps = None
+
+
+class NumpyFormat(SignalFormat):
+    """
+    NumPy format handler for signal data.
+
+    A recording is stored as:
+        capture.npy        values, shape (samples,) or (samples, channels)
+        capture.npy.ts     timestamps as .npy, only when they are not uniform
+        capture.npy.meta   JSON sidecar with time base and metadata
+
+    Uniform time bases are kept as start_time/sample_interval in the sidecar,
+    so time range reads compute sample indices directly instead of searching.
+    .npz archives (values/timestamps arrays) are also supported, but they
+    are loaded into memory instead of being memory-mapped.
+    """
+
+    SIDECAR_SUFFIX = ".meta"
+    TIMESTAMPS_SUFFIX = ".ts"
+    DEFAULT_CHUNK_SIZE = 65536
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the format handler.
+
+        Args:
+            chunk_size: Number of samples returned per read_chunk() call
+        """
+        self.chunk_size = chunk_size
+
+    @property
+    def name(self) -> str:
+        return "NUMPY"
+
+    @property
+    def extensions(self) -> List[str]:
+        return [".npy", ".npz"]
+
+    @property
+    def capabilities(self) -> List[FormatCapability]:
+        return [
+            FormatCapability.METADATA,
+            FormatCapability.STREAMING,
+            FormatCapability.RANDOM_ACCESS,
+            FormatCapability.MULTI_CHANNEL
+        ]
+
+    # --- Sidecar helpers ---
+
+    def _sidecar_path(self, path: Path) -> Path:
+        return path.with_name(path.name + self.SIDECAR_SUFFIX)
+
+    def _timestamps_path(self, path: Path) -> Path:
+        return path.with_name(path.name + self.TIMESTAMPS_SUFFIX)
+
+    def _read_sidecar(self, path: Path) -> Dict[str, Any]:
+        sidecar = self._sidecar_path(path)
+        if not sidecar.exists():
+            return {}
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_sidecar(self, path: Path, sidecar: Dict[str, Any]) -> None:
+        with open(self._sidecar_path(path), 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, indent=2, default=str)
+
+    @staticmethod
+    def _user_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Make metadata JSON friendly."""
+        return json.loads(json.dumps(metadata, default=str))
+
+    # --- Reading ---
+
+    def _open_arrays(self, path: Path) -> Tuple[np.ndarray, Optional[np.ndarray], Dict[str, Any]]:
+        """Open the values (memory-mapped) and the timestamps or time base of a recording."""
+        sidecar = self._read_sidecar(path)
+
+        if path.suffix.lower() == ".npz":
+            with np.load(path) as archive:
+                values = archive["values"]
+                timestamps = archive["timestamps"] if "timestamps" in archive.files else None
+            return values, timestamps, sidecar
+
+        values = _map_npy(path)
+
+        timestamps = None
+        if sidecar.get("timestamps") == "external":
+            timestamps = _map_npy(self._timestamps_path(path))
+            if len(timestamps) != len(values):
+                # An unclosed stream may have written one array further than the other
+                count = min(len(values), len(timestamps))
+                values, timestamps = values[:count], timestamps[:count]
+
+        return values, timestamps, sidecar
+
+    def _signal_metadata(self, sidecar: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = dict(sidecar.get("metadata", {}))
+        interval = sidecar.get("sample_interval")
+        if interval:
+            metadata.setdefault("sample_rate", 1.0 / interval)
+        if sidecar.get("start_time") is not None:
+            metadata.setdefault("start_time", sidecar["start_time"])
+        return metadata
+
+    def _generated_timestamps(self, sidecar: Dict[str, Any], start_idx: int, end_idx: int) -> Optional[np.ndarray]:
+        """Generate timestamps for a sample range from a uniform time base."""
+        if sidecar.get("timestamps") != "uniform":
+            return None
+        return sidecar["start_time"] + np.arange(start_idx, end_idx) * sidecar["sample_interval"]
+
+    def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
+        """
+        Read signal data from a NumPy source.
+
+        Values of .npy files are returned as a read-only memory map.
+
+        Args:
+            source: File path or file-like object
+            time_range: Optional time range to filter by
+
+        Returns:
+            SignalData object
+
+        Raises:
+            SignalFormatError: If reading fails
+        """
+        if time_range is not None and isinstance(source, (str, Path)):
+            return self.read_time_range(source, time_range)
+
+        try:
+            if not isinstance(source, (str, Path)):
+                # File-like objects cannot be mapped and carry no sidecar
+                pos = source.tell()
+                source.seek(0)
+                loaded = np.load(source)
+                source.seek(pos)
+                if isinstance(loaded, np.lib.npyio.NpzFile):
+                    values = loaded["values"]
+                    timestamps = loaded["timestamps"] if "timestamps" in loaded.files else None
+                else:
+                    values, timestamps = loaded, None
+                signal_data = SignalData(values=values, timestamps=timestamps, metadata={})
+                if time_range is not None and timestamps is not None:
+                    signal_data = signal_data.time_slice(time_range)
+                return signal_data
+
+            path = Path(source)
+            values, timestamps, sidecar = self._open_arrays(path)
+            if timestamps is None:
+                timestamps = self._generated_timestamps(sidecar, 0, len(values))
+
+            return SignalData(
+                values=values,
+                timestamps=timestamps,
+                metadata=self._signal_metadata(sidecar)
+            )
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read NumPy data: {str(e)}")
+            raise e
+
+    def read_time_range(self, source: Union[str, Path, BinaryIO], time_range: TimeRange) -> SignalData:
+        """
+        Read a specific time range from a NumPy source.
+
+        For uniform time bases the sample indices are computed directly from
+        start_time and the sample interval (O(1)); explicit timestamps are
+        binary searched. Only the selected rows of the memory map are touched.
+        """
+        if not isinstance(source, (str, Path)):
+            return self.read(source).time_slice(time_range)
+
+        try:
+            path = Path(source)
+            values, timestamps, sidecar = self._open_arrays(path)
+            n = len(values)
+
+            if timestamps is not None:
+                start_idx = 0 if time_range.start is None else int(np.searchsorted(timestamps, time_range.start, 'left'))
+                end_idx = n if time_range.end is None else int(np.searchsorted(timestamps, time_range.end, 'right'))
+                timestamps_slice = np.asarray(timestamps[start_idx:end_idx])
+            elif sidecar.get("timestamps") == "uniform":
+                start_idx, end_idx = uniform_time_indices(
+                    sidecar["start_time"], sidecar["sample_interval"], n, time_range)
+                timestamps_slice = self._generated_timestamps(sidecar, start_idx, end_idx)
+            else:
+                raise SignalFormatError("NumPy data has no time base for time range reading")
+
+            end_idx = max(end_idx, start_idx)
+            return SignalData(
+                values=values[start_idx:end_idx],
+                timestamps=timestamps_slice,
+                metadata=self._signal_metadata(sidecar)
+            )
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read NumPy time range: {str(e)}")
+            raise e
+
+    def open_lazy(self, source: Union[str, Path, BinaryIO], cache_size: Optional[int] = None) -> LazySignalData:
+        """
+        Open a recording lazily on top of its memory maps.
+
+        Uniform timestamps are generated per slice instead of being stored,
+        so nothing is read until values are accessed. .npz archives and
+        file-like objects cannot be mapped and are loaded into memory.
+        """
+        if not isinstance(source, (str, Path)):
+            return super().open_lazy(source, cache_size)
+
+        try:
+            values, timestamps, sidecar = self._open_arrays(Path(source))
+            time_base = None
+            if timestamps is None and sidecar.get("timestamps") == "uniform":
+                time_base = (sidecar["start_time"], sidecar["sample_interval"])
+            return LazySignalData(ArraySource(values, timestamps, time_base, self.chunk_size),
+                                  metadata=self._signal_metadata(sidecar))
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to open NumPy data: {str(e)}")
+            raise e
+
+    def get_metadata(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
+        """
+        Extract metadata from the sidecar without touching the data.
+
+        Falls back to the .npy header (shape and dtype) when there is no sidecar.
+        """
+        try:
+            if isinstance(source, (str, Path)):
+                path = Path(source)
+                sidecar = self._read_sidecar(path)
+                if sidecar:
+                    return self._signal_metadata(sidecar)
+                if path.suffix.lower() == ".npz":
+                    with np.load(path) as archive:
+                        if "values" not in archive.files:
+                            raise SignalFormatError("Missing 'values' array in .npz")
+                    return {}
+                with open(path, 'rb') as f:
+                    dtype, shape, _ = _read_npy_header(f)
+            else:
+                pos = source.tell()
+                source.seek(0)
+                try:
+                    dtype, shape, _ = _read_npy_header(source)
+                finally:
+                    source.seek(pos)
+
+            return {"dtype": dtype.str, "shape": list(shape)}
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to extract metadata from NumPy data: {str(e)}")
+            raise e
+
+    # --- Writing ---
+
+    def write(self, destination: Union[str, Path, BinaryIO], data: SignalData, append: bool = False) -> None:
+        """
+        Write signal data to a NumPy destination.
+
+        Appending to an existing .npy recording only writes the new rows.
+
+        Args:
+            destination: File path or file-like object
+            data: SignalData to write
+            append: Whether to append to existing data
+
+        Raises:
+            SignalFormatError: If writing fails
+        """
+        try:
+            if not isinstance(destination, (str, Path)):
+                # File-like objects receive the bare array
+                np.save(destination, np.asarray(data.values))
+                destination.flush()
+                return
+
+            path = Path(destination)
+            os.makedirs(path.parent, exist_ok=True)
+
+            if path.suffix.lower() == ".npz":
+                self._write_npz(path, data, append)
+                return
+
+            mode = 'a' if append and path.exists() else 'w'
+            stream = self.open_stream(path, mode)
+            try:
+                if mode == 'w' and data.timestamps is not None:
+                    # Keep uniform time bases implicit
+                    time_base = uniform_time_base(np.asarray(data.timestamps))
+                    if time_base is not None:
+                        stream.start_time, stream.sample_interval = time_base
+                        data = SignalData(values=data.values, metadata=data.metadata)
+                self.write_chunk(stream, data)
+            finally:
+                self.close_stream(stream)
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write NumPy data: {str(e)}")
+            raise e
+
+    def _write_npz(self, path: Path, data: SignalData, append: bool) -> None:
+        """Write an .npz archive (rewritten on append, as the format requires)."""
+        if append and path.exists():
+            existing = self.read(path)
+            values = np.concatenate([existing.values, data.values])
+            timestamps = None
+            if existing.timestamps is not None and data.timestamps is not None:
+                timestamps = np.concatenate([existing.timestamps, data.timestamps])
+            metadata = {**existing.metadata, **data.metadata}
+        else:
+            values, timestamps, metadata = data.values, data.timestamps, data.metadata
+
+        arrays = {"values": np.asarray(values)}
+        if timestamps is not None:
+            arrays["timestamps"] = np.asarray(timestamps)
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+        self._write_sidecar(path, {
+            "format": "numpy",
+            "version": "1.0",
+            "created_at": datetime.now().isoformat(),
+            "dtype": arrays["values"].dtype.str,
+            "shape": list(arrays["values"].shape),
+            "timestamps": "embedded" if timestamps is not None else None,
+            "metadata": self._user_metadata(metadata)
+        })
+
+    # --- Streaming support ---
+
+    def open_stream(self, destination: Union[str, Path], mode: str = 'w') -> NumpyStream:
+        """
+        Open a .npy recording for chunked writing ('w'), appending ('a') or reading ('r').
+
+        Args:
+            destination: File path to open
+            mode: File mode
+
+        Returns:
+            NumpyStream handle for write_chunk()/read_chunk()
+
+        Raises:
+            SignalFormatError: If the stream cannot be opened
+        """
+        if not isinstance(destination, (str, Path)):
+            raise SignalFormatError("NumPy streams require a file path")
+
+        path = Path(destination)
+        if path.suffix.lower() == ".npz":
+            raise SignalFormatError("Streaming is not supported for .npz archives")
+
+        stream = NumpyStream(path, mode, self.chunk_size)
+        try:
+            if mode == 'r':
+                stream.values, stream.timestamps, sidecar = self._open_arrays(path)
+                stream.metadata = self._signal_metadata(sidecar)
+                stream.start_time = sidecar.get("start_time")
+                stream.sample_interval = sidecar.get("sample_interval")
+            elif mode == 'a' and path.exists():
+                sidecar = self._read_sidecar(path)
+                stream.file = open(path, 'r+b')
+                stream.dtype, shape, offset = _read_npy_header(stream.file)
+                if offset != _NPY_HEADER_SIZE:
+                    raise SignalFormatError("Only files written by NumpyFormat can be appended to")
+                stream.count = shape[0]
+                stream.channels = shape[1] if len(shape) > 1 else None
+                stream.file.seek(0, os.SEEK_END)
+                stream.metadata = dict(sidecar.get("metadata", {}))
+                stream.start_time = sidecar.get("start_time")
+                stream.sample_interval = sidecar.get("sample_interval")
+                if sidecar.get("timestamps") == "external":
+                    stream.timestamps_file = open(self._timestamps_path(path), 'r+b')
+                    stream.timestamps_file.seek(0, os.SEEK_END)
+            elif mode in ('w', 'a'):
+                stream.mode = 'w'
+                stream.file = open(path, 'wb')
+            else:
+                raise SignalFormatError(f"Unsupported stream mode: {mode}")
+        except Exception as e:
+            stream.close()
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to open stream: {str(e)}")
+            raise e
+
+        return stream
+
+    def write_chunk(self, stream: NumpyStream, data: SignalData) -> None:
+        """
+        Append a chunk of rows to a NumPy stream.
+
+        The chunk's bytes are written directly behind the previous rows; the
+        header and sidecar are finalized by close_stream(). The sidecar is
+        also written when the first chunk sets up the stream, so the time
+        base of a stream that is never closed is kept.
+
+        Raises:
+            SignalFormatError: If the chunk does not match the stream, e.g. has
+                timestamps that the stream's time base cannot represent or
+                samples of a kind (such as float) the stream's dtype would truncate
+        """
+        try:
+            values = np.ascontiguousarray(data.values)
+            channels = values.shape[1] if values.ndim > 1 else None
+
+            if stream.dtype is None:
+                stream.dtype = values.dtype
+                stream.channels = channels
+                stream.file.write(_npy_header(stream.dtype, (0,) if channels is None else (0, channels)))
+                stream.metadata = dict(data.metadata)
+                if data.timestamps is not None:
+                    stream.timestamps_file = open(self._timestamps_path(stream.path), 'wb')
+                    stream.timestamps_file.write(_npy_header(np.float64, (0,)))
+                elif stream.start_time is None:
+                    stream.start_time = float(data.metadata.get("start_time", 0.0))
+                    if data.metadata.get("sample_rate"):
+                        stream.sample_interval = 1.0 / float(data.metadata["sample_rate"])
+                self._write_stream_sidecar(stream, 0)
+            else:
+                if channels != stream.channels:
+                    raise SignalFormatError("Chunk channel count does not match the stream")
+                if not np.can_cast(values.dtype, stream.dtype, 'same_kind'):
+                    raise SignalFormatError(f"Cannot store {values.dtype} samples in a {stream.dtype} stream")
+                stream.metadata.update(data.metadata)
+                values = values.astype(stream.dtype, copy=False)
+
+            if stream.timestamps_file is None and data.timestamps is not None:
+                # Without a timestamps file the chunk must follow the implicit time base
+                interval = stream.sample_interval
+                if not interval:
+                    raise SignalFormatError("Chunk with timestamps in a stream without a time base")
+                expected = stream.start_time + np.arange(stream.count, stream.count + len(values)) * interval
+                if not np.allclose(data.timestamps, expected, rtol=0.0, atol=interval * 1e-6):
+                    raise SignalFormatError("Chunk timestamps do not follow the stream's uniform time base")
+
+            stream.file.write(memoryview(values).cast('B'))
+
+            if stream.timestamps_file is not None:
+                if data.timestamps is None:
+                    raise SignalFormatError("Chunk without timestamps in a stream with timestamps")
+                timestamps = np.ascontiguousarray(data.timestamps, dtype=np.float64)
+                stream.timestamps_file.write(memoryview(timestamps).cast('B'))
+
+            stream.count += len(values)
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write NumPy chunk: {str(e)}")
+            raise e
+
+    def read_chunk(self, stream: NumpyStream) -> Optional[SignalData]:
+        """
+        Read the next chunk of rows from a NumPy stream.
+
+        Returns views on the memory map, so no data is copied.
+        """
+        try:
+            if stream.values is None or stream.position >= len(stream.values):
+                return None
+
+            start = stream.position
+            end = min(start + stream.chunk_size, len(stream.values))
+            stream.position = end
+
+            if stream.timestamps is not None:
+                timestamps = stream.timestamps[start:end]
+            elif stream.start_time is not None and stream.sample_interval:
+                timestamps = stream.start_time + np.arange(start, end) * stream.sample_interval
+            else:
+                timestamps = None
+
+            return SignalData(
+                values=stream.values[start:end],
+                timestamps=timestamps,
+                metadata=stream.metadata
+            )
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read NumPy chunk: {str(e)}")
+            raise e
+
+    def close_stream(self, stream: NumpyStream) -> None:
+        """Finalize the array headers and sidecar of a NumPy stream and close it."""
+        try:
+            if stream.mode != 'r' and stream.file is not None:
+                if stream.dtype is None:
+                    # Nothing was written; leave a valid empty array
+                    stream.dtype = np.dtype(np.float64)
+                    stream.file.write(_npy_header(stream.dtype, (0,)))
+
+                stream.file.seek(0)
+                stream.file.write(_npy_header(stream.dtype, self._stream_shape(stream, stream.count)))
+
+                if stream.timestamps_file is not None:
+                    stream.timestamps_file.seek(0)
+                    stream.timestamps_file.write(_npy_header(np.float64, (stream.count,)))
+
+                self._write_stream_sidecar(stream, stream.count)
+
+            stream.close()
+
+        except Exception as e:
+            stream.close()
+            raise SignalFormatError(f"Failed to close NumPy stream: {str(e)}")
+
+    @staticmethod
+    def _stream_shape(stream: NumpyStream, count: int) -> Tuple[int, ...]:
+        return (count,) if stream.channels is None else (count, stream.channels)
+
+    def _write_stream_sidecar(self, stream: NumpyStream, count: int) -> None:
+        """Write the sidecar of a stream with the given number of rows."""
+        if stream.timestamps_file is not None:
+            timestamps_mode = "external"
+            interval = None
+        else:
+            interval = stream.sample_interval
+            timestamps_mode = "uniform" if interval else None
+
+        self._write_sidecar(stream.path, {
+            "format": "numpy",
+            "version": "1.0",
+            "created_at": stream.metadata.get("created_at", datetime.now().isoformat()),
+            "dtype": stream.dtype.str,
+            "shape": list(self._stream_shape(stream, count)),
+            "timestamps": timestamps_mode,
+            "start_time": stream.start_time,
+            "sample_interval": interval,
+            "metadata": self._user_metadata(stream.metadata)
+        })
+
+    def validate(self, source: Union[str, Path, BinaryIO]) -> bool:
+        """
+        Validate whether a source is a NumPy array file.
+
+        Args:
+            source: File path or file-like object to validate
+
+        Returns:
+            True if valid, False otherwise
+        """
+        try:
+            self.get_metadata(source)
+            return True
+        except Exception as e:
+            logger.debug(f"Validation failed: {str(e)}")
+            return False
@@ -0,0 +1,833 @@
+"""
+Binary Frame Format Implementation
+
+This module implements the compact binary streaming format for signal data.
+A file is a sequence of length-prefixed frames, each with a small typed
+header and a raw little-endian payload, followed by a frame index footer
+that is written when the stream is closed.
+
+File layout (little-endian):
+    file header:  b'PSDFRM' + version (uint8) + reserved (uint8)
+    frame:        length (uint32, bytes after this field)
+                  + header (channels uint16, dtype uint8, flags uint8, samples uint32,
+                            t0 float64, dt float64, scale float64, offset float64)
+                  + [timestamps float64 x samples, if FRAME_TIMESTAMPS]
+                  + values (samples x channels, C order), or the ADC codec
+                    encoding of the values if FRAME_ADC
+                  + [CRC32 of the frame body before it (uint32), if FRAME_CRC]
+    footer:       length 0 (end of frames marker)
+                  + index (offset, t_start, t_end, first sample) per frame
+                  + metadata JSON
+                  + trailer (index offset uint64, frames uint64, metadata length uint32, b'PSDFIDX1')
+
+Frames are self-delimiting, so a file can be read while it is being written
+and a file whose writer never closed it is still readable; the index is then
+rebuilt by walking the frame headers.
+"""
+
+import json
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, BinaryIO, Tuple
+
+import numpy as np
+
+from .base import (
+    SignalFormat,
+    SignalData,
+    TimeRange,
+    FormatCapability,
+    SignalFormatError,
+    ChecksumError,
+    BlockError,
+    uniform_time_base
+)
+from .lazy import ChunkSource, LazySignalData
+from . import adc_codec
+
+
+FILE_MAGIC = b'PSDFRM'
+FILE_VERSION = 1
+INDEX_MAGIC = b'PSDFIDX1'
+
+_FILE_HEADER = struct.Struct('<6sBB')
+_LENGTH = struct.Struct('<I')
+_FRAME_HEADER = struct.Struct('<HBBIdddd')
+_TRAILER = struct.Struct('<QQI8s')
+_CRC = struct.Struct('<I')
+
+_INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('t_start', '<f8'),
+    ('t_end', '<f8'),
+    ('sample', '<u8'),
+])
+
+# Frame flags
+FRAME_TIMESTAMPS = 0x01     # Explicit float64 timestamps precede the values
+FRAME_ADC = 0x02            # Values are encoded with the ADC codec (adc_codec.py)
+FRAME_CRC = 0x04            # The frame body ends with a CRC32 of the rest of the body
+
+# Payload compression options for integer codes
+COMPRESSION_ADC = "adc"
+
+# Payload dtype codes; the code is part of the file format, never renumber
+_DTYPE_CODES = {
+    1: np.dtype('<f8'),
+    2: np.dtype('<f4'),
+    3: np.dtype('<i1'),
+    4: np.dtype('<i2'),
+    5: np.dtype('<i4'),
+    6: np.dtype('<i8'),
+    7: np.dtype('<u1'),
+    8: np.dtype('<u2'),
+    9: np.dtype('<u4'),
+    10: np.dtype('<u8'),
+    11: np.dtype('<c8'),
+    12: np.dtype('<c16'),
+}
+_CODES_BY_DTYPE = {dtype: code for code, dtype in _DTYPE_CODES.items()}
+
+
+class FrameStream:
+    """Open frame file used for chunked reading or writing."""
+
+    def __init__(self, file: BinaryIO, mode: str, owns_file: bool):
+        self.file = file
+        self.mode = mode
+        self.owns_file = owns_file
+        self.metadata = {}
+
+        # Index entries of the frames written or found so far
+        self.index: List[Tuple[int, float, float, int]] = []
+        self.num_samples = 0
+        self.channels = None
+
+        # Next frame to read
+        self.position = 0
+
+    def close(self) -> None:
+        if self.file is not None and self.owns_file:
+            self.file.close()
+        self.file = None
+
+
+class FrameSource(ChunkSource):
+    """Chunk source over an indexed frame file; each frame is one chunk."""
+
+    def __init__(self, frame_format: 'BinaryFrameFormat', file: BinaryIO, owns_file: bool,
+                 index: np.ndarray, cache_size: int):
+        self.format = frame_format
+        self.file = file
+        self.owns_file = owns_file
+        self.offsets = index['offset']
+
+        channels, num_samples = 1, 0
+        if len(index):
+            # Channel count from the first frame, total length from the last
+            channels = self._frame_header(0)[0]
+            num_samples = int(index[-1]['sample']) + self._frame_header(len(index) - 1)[3]
+        boundaries = np.append(index['sample'].astype(np.int64), num_samples)
+
+        chunk_times = np.column_stack([index['t_start'], index['t_end']])
+        super().__init__(boundaries, channels, chunk_times=chunk_times, cache_size=cache_size)
+
+    @property
+    def has_timestamps(self) -> bool:
+        return not np.isnan(self.chunk_times).any()
+
+    def _frame_header(self, index: int) -> Tuple:
+        self.file.seek(int(self.offsets[index]) + _LENGTH.size)
+        return _FRAME_HEADER.unpack(self.file.read(_FRAME_HEADER.size))
+
+    def _load_chunk(self, index: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        self.file.seek(int(self.offsets[index]))
+        body = self.format._read_frame_body(self.file)
+        if body is None:
+            raise SignalFormatError(f"Binary frame {index} is truncated")
+        if self.format.verify_checksums:
+            self.format._verify_bodies([body], index)
+        frame = self.format._decode_frame(body, {})
+        return frame.values, frame.timestamps
+
+    def close(self) -> None:
+        super().close()
+        if self.file is not None and self.owns_file:
+            self.file.close()
+        self.file = None
+
+
+class BinaryFrameFormat(SignalFormat):
+    """
+    Binary frame format handler for signal data.
+
+    Every frame carries its own time base (t0, dt) or explicit timestamps and
+    a scale/offset pair that maps stored codes to physical values, so raw ADC
+    samples can be streamed without conversion. read_chunk() returns
+    np.frombuffer views on the frame payload; read_time_range() binary
+    searches the frame index and seeks straight to the first frame needed.
+    """
+
+    DEFAULT_CHUNK_SIZE = 65536
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, apply_scale: bool = True,
+                 compression: Optional[str] = None, checksums: bool = True, verify: bool = False,
+                 workers: Optional[int] = None):
+        """
+        Initialize the format handler.
+
+        Args:
+            chunk_size: Maximum samples per frame written by write()
+            apply_scale: Convert stored codes with the frame scale/offset on read;
+                         when False the raw codes are returned
+            compression: "adc" to store integer codes of up to 32 bits with the
+                         lossless ADC codec; other dtypes are always stored raw.
+                         Reading needs no configuration, each frame is flagged.
+            checksums: Append a CRC32 to every frame written
+            verify: Check frame checksums on read and raise ChecksumError on a
+                    mismatch; frames written without a checksum are not checked
+            workers: Threads used to check checksums (defaults to the CPU count)
+
+        Raises:
+            SignalFormatError: If the compression option is unknown
+        """
+        if compression not in (None, COMPRESSION_ADC):
+            raise SignalFormatError(f"Unknown binary frame compression: {compression}")
+        self.chunk_size = chunk_size
+        self.apply_scale = apply_scale
+        self.compression = compression
+        self.checksums = checksums
+        self.verify_checksums = verify
+        self.workers = workers or os.cpu_count() or 1
+
+    @property
+    def name(self) -> str:
+        return "BINARY"
+
+    @property
+    def extensions(self) -> List[str]:
+        return [".sigbin"]
+
+    @property
+    def capabilities(self) -> List[FormatCapability]:
+        return [
+            FormatCapability.METADATA,
+            FormatCapability.STREAMING,
+            FormatCapability.RANDOM_ACCESS,
+            FormatCapability.MULTI_CHANNEL
+        ]
+
+    # --- Frame encoding ---
+
+    def _encode_frame(self, stream: FrameStream, data: SignalData) -> Tuple[bytes, Tuple[float, float]]:
+        """Serialize one chunk into a frame and return it with its time span."""
+        values = np.asarray(data.values)
+        code = _CODES_BY_DTYPE.get(values.dtype.newbyteorder('<'))
+        if code is None:
+            raise SignalFormatError(f"Unsupported dtype for binary frames: {values.dtype}")
+
+        channels = values.shape[1] if values.ndim > 1 else 1
+        if stream.channels is not None and channels != stream.channels:
+            raise SignalFormatError("Chunk channel count does not match the stream")
+        stream.channels = channels
+
+        num_samples = len(values)
+        flags = 0
+        t0, dt = float('nan'), 0.0
+        timestamps = None
+
+        if data.timestamps is not None:
+            time_base = uniform_time_base(np.asarray(data.timestamps))
+            if time_base is not None:
+                t0, dt = time_base
+            else:
+                timestamps = np.ascontiguousarray(data.timestamps, dtype='<f8')
+                flags |= FRAME_TIMESTAMPS
+        elif stream.metadata.get("sample_rate"):
+            dt = 1.0 / float(stream.metadata["sample_rate"])
+            t0 = float(stream.metadata.get("start_time", 0.0)) + stream.num_samples * dt
+
+        scale = float(data.metadata.get("scale", 1.0))
+        offset = float(data.metadata.get("offset", 0.0))
+
+        if self.checksums:
+            flags |= FRAME_CRC
+        if self.compression == COMPRESSION_ADC and adc_codec.supports_dtype(values.dtype):
+            payload = adc_codec.encode(values)
+            flags |= FRAME_ADC
+        else:
+            payload = np.ascontiguousarray(values, dtype=_DTYPE_CODES[code]).tobytes()
+
+        header = _FRAME_HEADER.pack(channels, code, flags, num_samples, t0, dt, scale, offset)
+        parts = [header]
+        if timestamps is not None:
+            parts.append(timestamps.tobytes())
+        parts.append(payload)
+        if self.checksums:
+            crc = 0
+            for part in parts:
+                crc = zlib.crc32(part, crc)
+            parts.append(_CRC.pack(crc))
+        body = b''.join(parts)
+
+        if timestamps is not None:
+            span = (float(timestamps[0]), float(timestamps[-1])) if num_samples else (t0, t0)
+        else:
+            span = (t0, t0 + (num_samples - 1) * dt) if num_samples else (t0, t0)
+
+        return _LENGTH.pack(len(body)) + body, span
+
+    def _decode_frame(self, body: bytes, metadata: Dict[str, Any]) -> SignalData:
+        """Build SignalData from a frame body with views on its payload."""
+        channels, code, flags, num_samples, t0, dt, scale, offset = _FRAME_HEADER.unpack_from(body)
+        dtype = _DTYPE_CODES.get(code)
+        if dtype is None:
+            raise SignalFormatError(f"Unknown dtype code in frame: {code}")
+
+        if flags & FRAME_CRC:
+            body = memoryview(body)[:-_CRC.size]
+
+        position = _FRAME_HEADER.size
+        if flags & FRAME_TIMESTAMPS:
+            timestamps = np.frombuffer(body, dtype='<f8', count=num_samples, offset=position)
+            position += num_samples * 8
+        elif dt > 0 and not np.isnan(t0):
+            timestamps = t0 + np.arange(num_samples) * dt
+        else:
+            timestamps = None
+
+        if flags & FRAME_ADC:
+            values = adc_codec.decode(memoryview(body)[position:], dtype, multi_channel=channels > 1)
+            if len(values) != num_samples:
+                raise SignalFormatError("ADC frame length does not match its header")
+        else:
+            values = np.frombuffer(body, dtype=dtype, count=num_samples * channels, offset=position)
+            if channels > 1:
+                values = values.reshape(num_samples, channels)
+        if self.apply_scale and (scale != 1.0 or offset != 0.0):
+            values = values * scale + offset
+
+        return SignalData(values=values, timestamps=timestamps, metadata=metadata)
+
+    @staticmethod
+    def _checksum_error(body: bytes) -> Optional[str]:
+        """Check the CRC of a frame body; returns a description of the mismatch or None."""
+        if len(body) < _FRAME_HEADER.size:
+            return "Frame is shorter than its header"
+        flags = _FRAME_HEADER.unpack_from(body)[2]
+        if not flags & FRAME_CRC:
+            return None
+        view = memoryview(body)
+        (stored,) = _CRC.unpack_from(view, len(view) - _CRC.size)
+        actual = zlib.crc32(view[:-_CRC.size])
+        if actual != stored:
+            return f"CRC mismatch (stored {stored:08x}, computed {actual:08x})"
+        return None
+
+    def _verify_bodies(self, bodies: List[bytes], first: int) -> None:
+        """Check frame bodies in parallel; raises ChecksumError for the first bad frame."""
+        if len(bodies) > 1 and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="frame-crc") as executor:
+                errors = list(executor.map(self._checksum_error, bodies))
+        else:
+            errors = [self._checksum_error(body) for body in bodies]
+        for i, error in enumerate(errors):
+            if error is not None:
+                raise ChecksumError(f"Binary frame {first + i} is corrupt: {error}")
+
+    @staticmethod
+    def _read_frame_body(f: BinaryIO) -> Optional[bytes]:
+        """Read the next frame body, or None at the end of the frames."""
+        prefix = f.read(_LENGTH.size)
+        if len(prefix) < _LENGTH.size:
+            return None
+        (length,) = _LENGTH.unpack(prefix)
+        if length == 0:
+            return None
+        body = f.read(length)
+        if len(body) < length:
+            # Frame still being written, or writer interrupted
+            return None
+        return body
+
+    # --- Index and footer ---
+
+    @staticmethod
+    def _read_file_header(f: BinaryIO) -> None:
+        header = f.read(_FILE_HEADER.size)
+        if len(header) < _FILE_HEADER.size:
+            raise SignalFormatError("Not a binary frame file: file too short")
+        magic, version, _ = _FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC:
+            raise SignalFormatError("Not a binary frame file")
+        if version != FILE_VERSION:
+            raise SignalFormatError(f"Unsupported binary frame version: {version}")
+
+    def _read_footer(self, f: BinaryIO) -> Optional[Tuple[np.ndarray, Dict[str, Any], int]]:
+        """Read the index footer; returns (index, metadata, footer offset) or None if missing."""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < _FILE_HEADER.size + _LENGTH.size + _TRAILER.size:
+            return None
+
+        f.seek(size - _TRAILER.size)
+        index_offset, num_frames, metadata_length, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+        if magic != INDEX_MAGIC:
+            return None
+
+        f.seek(index_offset)
+        index = np.frombuffer(f.read(num_frames * _INDEX_DTYPE.itemsize), dtype=_INDEX_DTYPE)
+        metadata = json.loads(f.read(metadata_length).decode('utf-8')) if metadata_length else {}
+        return index, metadata, index_offset - _LENGTH.size
+
+    @staticmethod
+    def _scan_index(f: BinaryIO) -> Tuple[np.ndarray, int]:
+        """Rebuild the frame index by walking the frame headers; returns (index, end of last frame)."""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        end = _FILE_HEADER.size
+        entries = []
+        sample = 0
+
+        while end + _LENGTH.size + _FRAME_HEADER.size <= size:
+            f.seek(end)
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            if length < _FRAME_HEADER.size or end + _LENGTH.size + length > size:
+                # End of frames marker or a partially written frame
+                break
+            _, _, flags, num_samples, t0, dt, _, _ = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+
+            if flags & FRAME_TIMESTAMPS and num_samples:
+                first = np.frombuffer(f.read(8), dtype='<f8')[0]
+                f.seek(end + _LENGTH.size + _FRAME_HEADER.size + (num_samples - 1) * 8)
+                last = np.frombuffer(f.read(8), dtype='<f8')[0]
+                span = (float(first), float(last))
+            else:
+                span = (t0, t0 + max(num_samples - 1, 0) * dt)
+
+            entries.append((end, span[0], span[1], sample))
+            sample += num_samples
+            end += _LENGTH.size + length
+
+        return np.array(entries, dtype=_INDEX_DTYPE), end
+
+    def _load_index(self, f: BinaryIO, raw_metadata: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Load the frame index from the footer, or rebuild it for unclosed files.
+
+        Unless `raw_metadata` is set, the scale and offset are left out of the
+        metadata when they are applied on read, so data written back is not
+        scaled a second time.
+        """
+        self._read_file_header(f)
+        footer = self._read_footer(f)
+        if footer is not None:
+            index, metadata, _ = footer
+        else:
+            index, _ = self._scan_index(f)
+            metadata = {}
+        if self.apply_scale and not raw_metadata:
+            metadata = {key: value for key, value in metadata.items() if key not in ("scale", "offset")}
+        return index, metadata
+
+    @staticmethod
+    def _write_footer(stream: FrameStream) -> None:
+        f = stream.file
+        f.write(_LENGTH.pack(0))
+        index_offset = f.tell()
+        f.write(np.array(stream.index, dtype=_INDEX_DTYPE).tobytes())
+        metadata = json.dumps(stream.metadata, default=str).encode('utf-8')
+        f.write(metadata)
+        f.write(_TRAILER.pack(index_offset, len(stream.index), len(metadata), INDEX_MAGIC))
+
+    @staticmethod
+    def _open_file(source: Union[str, Path, BinaryIO], mode: str) -> Tuple[BinaryIO, bool]:
+        if isinstance(source, (str, Path)):
+            return open(source, mode), True
+        return source, False
+
+    # --- Reading ---
+
+    def _read_frames(self, f: BinaryIO, index: np.ndarray, first: int, last: int,
+                     metadata: Dict[str, Any]) -> List[SignalData]:
+        """Read frames [first, last) of an indexed file."""
+        if first >= last:
+            return []
+        f.seek(int(index[first]['offset']))
+        bodies = []
+        for _ in range(first, last):
+            body = self._read_frame_body(f)
+            if body is None:
+                break
+            bodies.append(body)
+        if self.verify_checksums:
+            self._verify_bodies(bodies, first)
+        return [self._decode_frame(body, metadata) for body in bodies]
+
+    @staticmethod
+    def _concatenate(frames: List[SignalData], metadata: Dict[str, Any]) -> SignalData:
+        if not frames:
+            return SignalData(values=np.array([]), timestamps=None, metadata=metadata)
+        if len(frames) == 1:
+            return SignalData(values=frames[0].values, timestamps=frames[0].timestamps, metadata=metadata)
+        values = np.concatenate([frame.values for frame in frames])
+        if all(frame.timestamps is not None for frame in frames):
+            timestamps = np.concatenate([frame.timestamps for frame in frames])
+        else:
+            timestamps = None
+        return SignalData(values=values, timestamps=timestamps, metadata=metadata)
+
+    def read(self, source: Union[str, Path, BinaryIO], time_range: Optional[TimeRange] = None) -> SignalData:
+        """
+        Read signal data from a binary frame source.
+
+        Args:
+            source: File path or file-like object
+            time_range: Optional time range to filter by
+
+        Returns:
+            SignalData object
+
+        Raises:
+            SignalFormatError: If reading fails
+        """
+        if time_range is not None:
+            return self.read_time_range(source, time_range)
+
+        try:
+            f, owns_file = self._open_file(source, 'rb')
+            try:
+                index, metadata = self._load_index(f)
+                frames = self._read_frames(f, index, 0, len(index), metadata)
+                return self._concatenate(frames, metadata)
+            finally:
+                if owns_file:
+                    f.close()
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read binary frames: {str(e)}")
+            raise e
+
+    def read_time_range(self, source: Union[str, Path, BinaryIO], time_range: TimeRange) -> SignalData:
+        """
+        Read a specific time range.
+
+        The frame index is binary searched for the first and last frame that
+        overlap the range, so only those frames are read from disk.
+        """
+        try:
+            f, owns_file = self._open_file(source, 'rb')
+            try:
+                index, metadata = self._load_index(f)
+                if len(index) and np.isnan(index['t_start']).any():
+                    raise SignalFormatError("Binary frame data has no time base for time range reading")
+
+                first = 0 if time_range.start is None else int(
+                    np.searchsorted(index['t_end'], time_range.start, side='left'))
+                last = len(index) if time_range.end is None else int(
+                    np.searchsorted(index['t_start'], time_range.end, side='right'))
+
+                data = self._concatenate(self._read_frames(f, index, first, last, metadata), metadata)
+            finally:
+                if owns_file:
+                    f.close()
+
+            if data.timestamps is None or len(data.timestamps) == 0:
+                return data
+
+            # Trim the partially overlapping first and last frames
+            start_idx = 0 if time_range.start is None else int(
+                np.searchsorted(data.timestamps, time_range.start, side='left'))
+            end_idx = len(data.timestamps) if time_range.end is None else int(
+                np.searchsorted(data.timestamps, time_range.end, side='right'))
+            return SignalData(values=data.values[start_idx:end_idx],
+                              timestamps=data.timestamps[start_idx:end_idx],
+                              metadata=metadata)
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read binary frame time range: {str(e)}")
+            raise e
+
+    def open_lazy(self, source: Union[str, Path, BinaryIO], cache_size: Optional[int] = None) -> LazySignalData:
+        """
+        Open a frame file lazily; frames are decoded on demand and cached.
+
+        Only the frame index is read up front. Path sources stay open until
+        the returned signal is closed.
+        """
+        try:
+            f, owns_file = self._open_file(source, 'rb')
+            try:
+                index, metadata = self._load_index(f)
+                frame_source = FrameSource(self, f, owns_file, index,
+                                           FrameSource.DEFAULT_CACHE_SIZE if cache_size is None else cache_size)
+                return LazySignalData(frame_source, metadata=metadata)
+            except Exception:
+                if owns_file:
+                    f.close()
+                raise
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to open binary frames: {str(e)}")
+            raise e
+
+    def get_metadata(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
+        """
+        Extract metadata from the footer without reading any frames.
+        """
+        try:
+            f, owns_file = self._open_file(source, 'rb')
+            try:
+                return self._load_index(f)[1]
+            finally:
+                if owns_file:
+                    f.close()
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to extract metadata from binary frames: {str(e)}")
+            raise e
+
+    # --- Writing ---
+
+    def write(self, destination: Union[str, Path, BinaryIO], data: SignalData, append: bool = False) -> None:
+        """
+        Write signal data as frames of at most chunk_size samples.
+
+        Args:
+            destination: File path or file-like object
+            data: SignalData to write
+            append: Whether to append to existing data
+
+        Raises:
+            SignalFormatError: If writing fails
+        """
+        exists = isinstance(destination, (str, Path)) and Path(destination).exists()
+        stream = self.open_stream(destination, 'a' if append and exists else 'w')
+        try:
+            num_samples = len(data.values)
+            for start in range(0, max(num_samples, 1), self.chunk_size):
+                end = min(start + self.chunk_size, num_samples)
+                timestamps = data.timestamps[start:end] if data.timestamps is not None else None
+                self.write_chunk(stream, SignalData(values=data.values[start:end], timestamps=timestamps,
+                                                    metadata=data.metadata))
+        finally:
+            self.close_stream(stream)
+
+    # --- Streaming support ---
+
+    def open_stream(self, destination: Union[str, Path, BinaryIO], mode: str = 'w') -> FrameStream:
+        """
+        Open a frame file for writing ('w'), appending ('a') or reading ('r').
+
+        Appending drops the existing footer and rewrites it on close.
+
+        Args:
+            destination: File path or file-like object
+            mode: File mode
+
+        Returns:
+            FrameStream handle for write_chunk()/read_chunk()
+        """
+        if mode not in ('r', 'w', 'a'):
+            raise SignalFormatError(f"Unsupported stream mode: {mode}")
+
+        try:
+            file_mode = {'r': 'rb', 'w': 'wb', 'a': 'r+b'}[mode]
+            f, owns_file = self._open_file(destination, file_mode)
+            stream = FrameStream(f, mode, owns_file)
+
+            if mode == 'w':
+                f.write(_FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 0))
+                stream.metadata = {"format": "binary", "version": "1.0",
+                                   "created_at": datetime.now().isoformat()}
+                return stream
+
+            index, metadata = self._load_index(f, raw_metadata=mode == 'a')
+            stream.metadata = metadata
+            stream.index = [tuple(entry) for entry in index.tolist()]
+
+            if mode == 'r':
+                f.seek(_FILE_HEADER.size)
+                return stream
+
+            # Append: continue after the last frame, overwriting the footer
+            footer = self._read_footer(f)
+            end = footer[2] if footer is not None else self._scan_index(f)[1]
+            if stream.index:
+                last_offset = stream.index[-1][0]
+                f.seek(last_offset + _LENGTH.size)
+                header = f.read(_FRAME_HEADER.size)
+                channels, _, _, num_samples, _, _, _, _ = _FRAME_HEADER.unpack(header)
+                stream.channels = channels
+                stream.num_samples = stream.index[-1][3] + num_samples
+            f.seek(end)
+            f.truncate()
+            return stream
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to open stream: {str(e)}")
+            raise e
+
+    def write_chunk(self, stream: FrameStream, data: SignalData) -> None:
+        """
+        Append one chunk to a stream as a single frame.
+        """
+        try:
+            if data.metadata:
+                stream.metadata.update(data.metadata)
+
+            offset = stream.file.tell()
+            frame, span = self._encode_frame(stream, data)
+            stream.file.write(frame)
+            if self.flush_chunks:
+                # Hand complete frames to the OS so concurrent readers can follow the stream
+                stream.file.flush()
+            stream.index.append((offset, span[0], span[1], stream.num_samples))
+            stream.num_samples += len(data.values)
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to write binary frame: {str(e)}")
+            raise e
+
+    def read_chunk(self, stream: FrameStream) -> Optional[SignalData]:
+        """
+        Read the next frame from a stream.
+
+        The returned values are read-only views on the frame payload. Frames
+        appended by a concurrent writer are picked up on later calls.
+        """
+        try:
+            position = stream.file.tell()
+            body = self._read_frame_body(stream.file)
+            if body is None:
+                stream.file.seek(position)
+                return None
+            if self.verify_checksums:
+                self._verify_bodies([body], stream.position)
+            stream.position += 1
+            return self._decode_frame(body, stream.metadata)
+
+        except Exception as e:
+            if not isinstance(e, SignalFormatError):
+                e = SignalFormatError(f"Failed to read binary frame: {str(e)}")
+            raise e
+
+    def close_stream(self, stream: FrameStream) -> None:
+        """Write the index footer (when writing) and close the stream."""
+        try:
+            if stream.file is not None and stream.mode in ('w', 'a'):
+                self._write_footer(stream)
+                stream.file.flush()
+            stream.close()
+        except Exception as e:
+            raise SignalFormatError(f"Failed to close binary frame stream: {str(e)}")
+
+    # --- Integrity ---
+
+    def frame_index(self, source: Union[str, Path, BinaryIO]) -> np.ndarray:
+        """
+        Read the frame index (offset, t_start, t_end, sample) of a frame file.
+
+        Raises:
+            SignalFormatError: If the file is not a binary frame file
+        """
+        f, owns_file = self._open_file(source, 'rb')
+        try:
+            return self._load_index(f)[0]
+        finally:
+            if owns_file:
+                f.close()
+
+    def verify(self, source: Union[str, Path, BinaryIO], workers: Optional[int] = None) -> List[BlockError]:
+        """
+        Check the CRC of every frame.
+
+        Frames are read sequentially while their checksums are computed in a
+        thread pool (zlib releases the GIL), so a file is checked at close to
+        disk speed. Frames written without checksums are skipped.
+
+        Args:
+            source: File path or file-like object
+            workers: Number of checksum threads (format default if None)
+
+        Returns:
+            One BlockError per corrupt or truncated frame, with its time span and offset
+        """
+        workers = workers or self.workers
+        errors = []
+        try:
+            f, owns_file = self._open_file(source, 'rb')
+        except Exception as e:
+            return [BlockError(index=0, message=f"Failed to open binary frames: {e}")]
+
+        try:
+            self._read_file_header(f)
+            footer = self._read_footer(f)
+            index = footer[0] if footer is not None else self._scan_index(f)[0]
+
+            def block_error(i: int, message: str) -> BlockError:
+                entry = index[i]
+                time_range = None
+                if not np.isnan(entry['t_start']):
+                    time_range = TimeRange(start=float(entry['t_start']), end=float(entry['t_end']))
+                return BlockError(index=i, message=message, time_range=time_range, offset=int(entry['offset']))
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="frame-crc") as executor:
+                pending = deque()
+                for i in range(len(index)):
+                    f.seek(int(index[i]['offset']))
+                    body = self._read_frame_body(f)
+                    if body is None:
+                        errors.append(block_error(i, "Frame is truncated"))
+                        continue
+                    pending.append((i, executor.submit(self._checksum_error, body)))
+
+                    # Bound the frames held in memory while checksums are computed
+                    while len(pending) > 2 * workers or (pending and pending[0][1].done()):
+                        j, future = pending.popleft()
+                        if future.result() is not None:
+                            errors.append(block_error(j, future.result()))
+                for j, future in pending:
+                    if future.result() is not None:
+                        errors.append(block_error(j, future.result()))
+
+        except Exception as e:
+            errors.append(BlockError(index=0, message=f"Failed to read binary frame index: {e}"))
+        finally:
+            if owns_file:
+                f.close()
+        return sorted(errors, key=lambda error: error.index)
+
+    def validate(self, source: Union[str, Path, BinaryIO]) -> bool:
+        """
+        Validate whether a source is a binary frame file.
+
+        Args:
+            source: File path or file-like object to validate
+
+        Returns:
+            True if valid, False otherwise
+        """
+        try:
+            f, owns_file = self._open_file(source, 'rb')
+            try:
+                position = f.tell()
+                self._read_file_header(f)
+                if not owns_file:
+                    f.seek(position)
+                return True
+            finally:
+                if owns_file:
+                    f.close()
+        except Exception:
+            return False
@@ -0,0 +1,391 @@
+"""
+Streaming Conversion Module
+
+This module converts recordings between signal formats chunk by chunk, so
+memory use is bounded by a fixed budget instead of the file size. Decoding,
+the optional resampling and dtype conversion, and encoding run on separate
+threads connected by byte-bounded buffers.
+
+Command line:
+    python -m signals_system.io.convert capture.csv capture.sigbin --memory 256 --dtype float32
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from copy import copy as shallow_copy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from ..formats.base import SignalData, SignalFormat, SignalFormatError, registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_MEMORY_BUDGET = 256 << 20
+
+# Buffer item marking the end of the chunks
+_END = object()
+
+
+@dataclass
+class ConversionProgress:
+    """Progress of a running conversion, passed to progress callbacks."""
+
+    # Samples written so far
+    samples: int
+
+    # Total samples, if the source format can tell without reading
+    total_samples: Optional[int]
+
+    # Chunks written so far
+    chunks: int
+
+    # Seconds since the conversion started
+    elapsed: float
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Completed fraction, if the total is known."""
+        if not self.total_samples:
+            return None
+        return min(self.samples / self.total_samples, 1.0)
+
+    @property
+    def samples_per_second(self) -> float:
+        return self.samples / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _BoundedBuffer:
+    """FIFO between pipeline stages that holds at most `capacity` bytes of chunks."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.used = 0
+        self.items = []
+        self.failed = False
+        self.condition = threading.Condition()
+
+    def put(self, item: Any, size: int) -> None:
+        with self.condition:
+            # A single chunk larger than the capacity is still let through alone
+            while self.items and self.used + size > self.capacity and not self.failed:
+                self.condition.wait()
+            if self.failed:
+                raise _Aborted()
+            self.items.append((item, size))
+            self.used += size
+            self.condition.notify_all()
+
+    def get(self) -> Any:
+        with self.condition:
+            while not self.items and not self.failed:
+                self.condition.wait()
+            if self.failed:
+                raise _Aborted()
+            item, size = self.items.pop(0)
+            self.used -= size
+            self.condition.notify_all()
+            return item
+
+    def abort(self) -> None:
+        """Wake up all waiting stages after a failure."""
+        with self.condition:
+            self.failed = True
+            self.condition.notify_all()
+
+
+class _Aborted(Exception):
+    """Raised in a stage when another stage failed."""
+
+
+def _chunk_bytes(data: SignalData) -> int:
+    size = np.asarray(data.values).nbytes
+    if data.timestamps is not None:
+        size += np.asarray(data.timestamps).nbytes
+    return size
+
+
+class Resampler:
+    """
+    Linear interpolation onto a uniform time base, applied chunk by chunk.
+
+    The last input sample of each chunk is carried over, so output samples
+    between chunks are interpolated exactly as for the whole signal.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Output sample rate in Hz
+        """
+        if rate <= 0:
+            raise ValueError("Resample rate must be positive")
+        self.interval = 1.0 / rate
+        self.start_time = None
+        self.next_index = 0
+        self.carry = None
+
+    def __call__(self, data: SignalData) -> SignalData:
+        if data.timestamps is None:
+            raise SignalFormatError("Resampling requires timestamps")
+
+        timestamps = np.asarray(data.timestamps, dtype=np.float64)
+        values = np.asarray(data.values)
+        if self.carry is not None:
+            timestamps = np.concatenate([self.carry[0], timestamps])
+            values = np.concatenate([self.carry[1], values])
+        if len(timestamps) == 0:
+            return SignalData(values=values, timestamps=timestamps, metadata=data.metadata)
+        if self.start_time is None:
+            self.start_time = float(timestamps[0])
+
+        # Output samples up to the last input timestamp of this chunk
+        last_index = int(np.floor((timestamps[-1] - self.start_time) / self.interval))
+        indices = np.arange(self.next_index, last_index + 1)
+        output_times = self.start_time + indices * self.interval
+        self.next_index = last_index + 1
+        self.carry = (timestamps[-1:], values[-1:])
+
+        if values.ndim > 1:
+            output = np.column_stack([np.interp(output_times, timestamps, values[:, i])
+                                      for i in range(values.shape[1])])
+        else:
+            output = np.interp(output_times, timestamps, values)
+
+        metadata = dict(data.metadata)
+        metadata["sample_rate"] = 1.0 / self.interval
+        return SignalData(values=output, timestamps=output_times, metadata=metadata)
+
+
+def _resolve_format(path: Union[str, Path], signal_format: Optional[Union[str, SignalFormat]],
+                    sniff: bool) -> SignalFormat:
+    if isinstance(signal_format, SignalFormat):
+        return signal_format
+    if signal_format is not None:
+        return registry.get_format(signal_format)
+    return registry.get_for_file(path, sniff=sniff)
+
+
+def iter_chunks(source: Union[str, Path], signal_format: SignalFormat,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[SignalData]:
+    """
+    Read a file chunk by chunk in bounded memory.
+
+    Formats with lazy storage (memory maps, chunked files) are read through
+    open_lazy(); other streaming formats through read_chunk().
+
+    Args:
+        source: File path
+        signal_format: Format of the file
+        chunk_size: Samples per chunk
+
+    Yields:
+        SignalData chunks
+    """
+    if type(signal_format).open_lazy is not SignalFormat.open_lazy:
+        with signal_format.open_lazy(source) as lazy:
+            yield from lazy.iter_chunks(chunk_size)
+        return
+
+    if not signal_format.supports_streaming():
+        raise SignalFormatError(f"{signal_format.name} format cannot be read in chunks")
+
+    if hasattr(signal_format, 'chunk_size'):
+        # Copied to leave the caller's format as it is
+        signal_format = shallow_copy(signal_format)
+        signal_format.chunk_size = chunk_size
+    stream = signal_format.open_stream(source, 'r')
+    try:
+        while True:
+            chunk = signal_format.read_chunk(stream)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        signal_format.close_stream(stream)
+
+
+def _total_samples(source: Union[str, Path], signal_format: SignalFormat) -> Optional[int]:
+    """Sample count of a source, if it is known without reading the data."""
+    if type(signal_format).open_lazy is SignalFormat.open_lazy:
+        return None
+    try:
+        with signal_format.open_lazy(source) as lazy:
+            return lazy.num_samples
+    except SignalFormatError:
+        return None
+
+
+def convert(source: Union[str, Path], destination: Union[str, Path],
+            source_format: Optional[Union[str, SignalFormat]] = None,
+            destination_format: Optional[Union[str, SignalFormat]] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE, resample_rate: Optional[float] = None,
+            dtype: Optional[Union[str, np.dtype]] = None, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+            progress: Optional[Callable[[ConversionProgress], None]] = None) -> ConversionProgress:
+    """
+    Convert a recording to another format in bounded memory.
+
+    Decoding runs on one thread, resampling and dtype conversion on a second,
+    and encoding on the calling thread. The stages are connected by buffers
+    that together hold at most memory_budget bytes of chunks.
+
+    Args:
+        source: Source file path
+        destination: Destination file path
+        source_format: Source format name or instance; detected if None
+        destination_format: Destination format name or instance; chosen by extension if None
+        chunk_size: Samples per chunk
+        resample_rate: Resample onto a uniform time base at this rate (Hz)
+        dtype: Convert values to this dtype
+        memory_budget: Maximum bytes of chunks held between the stages
+        progress: Called with a ConversionProgress after every written chunk
+
+    Returns:
+        Final ConversionProgress
+
+    Raises:
+        SignalFormatError: If a format cannot stream or any stage fails
+    """
+    source_format = _resolve_format(source, source_format, sniff=True)
+    destination_format = _resolve_format(destination, destination_format, sniff=False)
+    if not destination_format.supports_streaming():
+        raise SignalFormatError(f"{destination_format.name} format cannot be written in chunks")
+
+    source_metadata = source_format.get_metadata(source)
+    total = _total_samples(source, source_format)
+    resampler = Resampler(resample_rate) if resample_rate else None
+    target_dtype = np.dtype(dtype) if dtype is not None else None
+
+    decoded = _BoundedBuffer(memory_budget // 2)
+    transformed = _BoundedBuffer(memory_budget // 2)
+    errors: List[BaseException] = []
+
+    def fail(error: BaseException) -> None:
+        errors.append(error)
+        decoded.abort()
+        transformed.abort()
+
+    def decode() -> None:
+        try:
+            for chunk in iter_chunks(source, source_format, chunk_size):
+                decoded.put(chunk, _chunk_bytes(chunk))
+            decoded.put(_END, 0)
+        except _Aborted:
+            pass
+        except Exception as e:
+            fail(e)
+
+    def transform() -> None:
+        try:
+            first = True
+            while True:
+                chunk = decoded.get()
+                if chunk is _END:
+                    transformed.put(_END, 0)
+                    return
+                if first:
+                    # Carry the source metadata into the destination
+                    chunk = SignalData(values=chunk.values, timestamps=chunk.timestamps,
+                                       metadata={**source_metadata, **chunk.metadata})
+                    first = False
+                if resampler is not None:
+                    chunk = resampler(chunk)
+                if target_dtype is not None:
+                    chunk = SignalData(values=np.asarray(chunk.values).astype(target_dtype),
+                                       timestamps=chunk.timestamps, metadata=chunk.metadata)
+                if len(chunk.values):
+                    transformed.put(chunk, _chunk_bytes(chunk))
+        except _Aborted:
+            pass
+        except Exception as e:
+            fail(e)
+
+    threads = [threading.Thread(target=decode, name="convert-decode", daemon=True),
+               threading.Thread(target=transform, name="convert-transform", daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    started = time.monotonic()
+    state = ConversionProgress(samples=0, total_samples=total, chunks=0, elapsed=0.0)
+    stream = None
+    try:
+        stream = destination_format.open_stream(destination, 'w')
+        while True:
+            chunk = transformed.get()
+            if chunk is _END:
+                break
+            destination_format.write_chunk(stream, chunk)
+            state.samples += len(chunk.values)
+            state.chunks += 1
+            state.elapsed = time.monotonic() - started
+            if progress is not None:
+                progress(state)
+    except _Aborted:
+        pass
+    except Exception as e:
+        fail(e)
+    finally:
+        if stream is not None:
+            destination_format.close_stream(stream)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        error = errors[0]
+        if not isinstance(error, SignalFormatError):
+            error = SignalFormatError(f"Failed to convert {source}: {error}")
+        raise error
+    state.elapsed = time.monotonic() - started
+    return state
+
+
+def _print_progress(state: ConversionProgress) -> None:
+    if state.fraction is not None:
+        line = f"{state.fraction * 100:5.1f}% "
+    else:
+        line = ""
+    line += f"{state.samples:,} samples, {state.samples_per_second:,.0f} samples/s"
+    print(f"\r{line}", end="", file=sys.stderr, flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m signals_system.io.convert",
+        description="Convert a signal recording between formats in bounded memory.")
+    parser.add_argument("source", help="source file")
+    parser.add_argument("destination", help="destination file; the format follows the extension")
+    parser.add_argument("--from", dest="source_format", help="source format name (detected by default)")
+    parser.add_argument("--to", dest="destination_format", help="destination format name")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="samples per chunk")
+    parser.add_argument("--resample", type=float, help="resample to this rate in Hz")
+    parser.add_argument("--dtype", help="convert values to this NumPy dtype, e.g. float32")
+    parser.add_argument("--memory", type=float, default=DEFAULT_MEMORY_BUDGET / (1 << 20),
+                        help="memory budget for buffered chunks in MiB")
+    parser.add_argument("--quiet", action="store_true", help="do not show progress")
+    args = parser.parse_args(argv)
+
+    try:
+        state = convert(args.source, args.destination, args.source_format, args.destination_format,
+                        chunk_size=args.chunk_size, resample_rate=args.resample, dtype=args.dtype,
+                        memory_budget=int(args.memory * (1 << 20)),
+                        progress=None if args.quiet else _print_progress)
+    except (SignalFormatError, KeyError, ValueError, OSError) as e:
+        if not args.quiet:
+            print(file=sys.stderr)
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"\nConverted {state.samples:,} samples in {state.elapsed:.1f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
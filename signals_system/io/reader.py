@@ -0,0 +1,229 @@
+"""
+Batch Reader Module
+
+This module reads many signal files concurrently. Formats are resolved
+through the format registry, files are read in a bounded thread pool (file
+I/O and NumPy decoding release the GIL), and results are yielded as they
+complete while the next files are prefetched. A file that fails to read
+produces a result carrying the error instead of aborting the batch.
+"""
+
+import glob
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from ..formats.base import SignalData, TimeRange, SignalFormatError, registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReadResult:
+    """Outcome of reading one file of a batch."""
+
+    # Position of the file in the batch
+    index: int
+
+    # Path of the file
+    path: Path
+
+    # Signal data, or None if reading failed
+    data: Optional[SignalData] = None
+
+    # Name of the format used to read the file, if it was resolved
+    format_name: Optional[str] = None
+
+    # Exception raised while resolving the format or reading the file
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was read successfully."""
+        return self.error is None
+
+
+def resolve_paths(sources: Union[str, Path, Iterable[Union[str, Path]]],
+                  recursive: bool = False) -> List[Path]:
+    """
+    Expand a glob pattern, directory or list of paths into a list of files.
+
+    Args:
+        sources: Glob pattern (e.g. "captures/**/*.h5"), directory, single path
+                 or an iterable of paths and patterns
+        recursive: List the files in the subdirectories of directories too
+
+    Returns:
+        Paths in a stable order; glob matches and directory entries are sorted
+    """
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+
+    paths = []
+    for source in sources:
+        source = str(source)
+        if glob.has_magic(source):
+            paths.extend(Path(match) for match in sorted(glob.glob(source, recursive=True))
+                         if Path(match).is_file())
+        elif Path(source).is_dir():
+            entries = Path(source).rglob('*') if recursive else Path(source).iterdir()
+            paths.extend(sorted(path for path in entries if path.is_file()))
+        else:
+            paths.append(Path(source))
+    return paths
+
+
+class BatchReader:
+    """
+    Concurrent reader for a batch of signal files.
+
+    Iterating the reader yields a ReadResult per file as soon as it is read.
+    At most `prefetch` files are in flight, so while the caller processes
+    one result the pool is already reading the next files, and memory stays
+    bounded by the prefetch depth.
+
+    Example:
+        with BatchReader("session/*.sigbin", max_workers=4) as reader:
+            for result in reader:
+                if result.ok:
+                    process(result.data)
+                else:
+                    print(result.path, result.error)
+    """
+
+    def __init__(self, sources: Union[str, Path, Iterable[Union[str, Path]]], max_workers: int = 4,
+                 prefetch: Optional[int] = None, time_range: Optional[TimeRange] = None,
+                 format_name: Optional[str] = None, lazy: bool = False, ordered: bool = False):
+        """
+        Initialize the reader.
+
+        Args:
+            sources: Glob pattern, directory, path or iterable of them (see resolve_paths)
+            max_workers: Number of reader threads
+            prefetch: Maximum files read ahead of the caller (defaults to 2 * max_workers)
+            time_range: Only read this time range of every file
+            format_name: Format to use for all files; detected per file if None
+            lazy: Open files with open_lazy() instead of reading them; the
+                  caller is responsible for closing the returned signals
+            ordered: Yield results in input order instead of completion order
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.paths = resolve_paths(sources)
+        self.max_workers = max_workers
+        self.prefetch = max(prefetch or 2 * max_workers, 1)
+        self.time_range = time_range
+        self.format_name = format_name
+        self.lazy = lazy
+        self.ordered = ordered
+
+        # Results of the files that failed, in completion order
+        self.errors: List[ReadResult] = []
+
+        self._executor = None
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __enter__(self) -> 'BatchReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _read(self, index: int, path: Path) -> ReadResult:
+        """Resolve the format of a file and read it; runs on a worker thread."""
+        result = ReadResult(index=index, path=path)
+        try:
+            if self.format_name is not None:
+                signal_format = registry.get_format(self.format_name)
+            else:
+                signal_format = registry.get_for_file(path)
+            result.format_name = signal_format.name
+
+            if self.lazy:
+                data = signal_format.open_lazy(path)
+                if self.time_range is not None:
+                    data = data.time_slice(self.time_range)
+                result.data = data
+            else:
+                result.data = signal_format.read(path, self.time_range)
+        except KeyError as e:
+            result.error = SignalFormatError(f"No format found for {path}: {e}")
+        except Exception as e:
+            result.error = e
+        return result
+
+    def __iter__(self) -> Iterator[ReadResult]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch-reader")
+
+        pending: Dict[Future, int] = {}
+        completed: Dict[int, ReadResult] = {}
+        next_submit = 0
+        next_yield = 0
+
+        try:
+            while next_yield < len(self.paths):
+                # Keep the read-ahead window full
+                while next_submit < len(self.paths) and len(pending) + len(completed) < self.prefetch:
+                    future = self._executor.submit(self._read, next_submit, self.paths[next_submit])
+                    pending[future] = next_submit
+                    next_submit += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    result = future.result()
+                    if not result.ok:
+                        logger.warning(f"Failed to read {result.path}: {result.error}")
+                        self.errors.append(result)
+                    completed[result.index] = result
+
+                if self.ordered:
+                    while next_yield in completed:
+                        yield completed.pop(next_yield)
+                        next_yield += 1
+                else:
+                    for index in sorted(completed):
+                        next_yield += 1
+                        yield completed.pop(index)
+        finally:
+            # The caller stopped early; drop reads that have not started
+            for future in pending:
+                future.cancel()
+
+    def read_all(self) -> List[ReadResult]:
+        """
+        Read every file and return the results in input order.
+
+        Returns:
+            One ReadResult per path; failed files carry their error
+        """
+        return sorted(self, key=lambda result: result.index)
+
+    def close(self) -> None:
+        """Cancel reads that have not started and stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def read_batch(sources: Union[str, Path, Iterable[Union[str, Path]]], max_workers: int = 4,
+               **kwargs) -> Iterator[ReadResult]:
+    """
+    Read a batch of files concurrently, yielding results as they complete.
+
+    Args:
+        sources: Glob pattern, directory, path or iterable of them
+        max_workers: Number of reader threads
+        **kwargs: Further BatchReader options (prefetch, time_range, format_name, lazy, ordered)
+
+    Yields:
+        ReadResult per file
+    """
+    with BatchReader(sources, max_workers=max_workers, **kwargs) as reader:
+        yield from reader
@@ -0,0 +1,289 @@
+"""
+Archive Scrub Module
+
+This module verifies the checksums of every file in an archive. Files are
+verified concurrently, and each format checks its own blocks (binary
+frames, compressed blocks, HDF5 chunks) with checksums computed in a thread
+pool, so an archive is scrubbed at close to disk speed. Corrupt blocks are
+reported with the time range they cover. A Scrubber runs a scrub on a
+background thread.
+
+Command line:
+    python -m signals_system.io.scrub /data/archive --workers 4
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Union
+
+from ..formats.base import BlockError, registry
+from .reader import resolve_paths
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FileReport:
+    """Verification result of one file."""
+
+    # Path of the file
+    path: Path
+
+    # Name of the format the file was verified with
+    format_name: Optional[str] = None
+
+    # Blocks that failed verification
+    errors: List[BlockError] = field(default_factory=list)
+
+    # Size of the file in bytes
+    size: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every block of the file verified."""
+        return not self.errors
+
+
+@dataclass
+class ScrubReport:
+    """Result of scrubbing an archive."""
+
+    # One report per verified file, in path order
+    files: List[FileReport] = field(default_factory=list)
+
+    # Files skipped because no format handles them
+    skipped: List[Path] = field(default_factory=list)
+
+    # Seconds spent scrubbing
+    elapsed: float = 0.0
+
+    # Whether the scrub was stopped before every file was verified
+    stopped: bool = False
+
+    @property
+    def bad_files(self) -> List[FileReport]:
+        """Reports of the files with corrupt blocks."""
+        return [report for report in self.files if not report.ok]
+
+    @property
+    def bytes_verified(self) -> int:
+        return sum(report.size for report in self.files)
+
+    @property
+    def throughput(self) -> float:
+        """Verified bytes per second."""
+        return self.bytes_verified / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def verify_file(path: Union[str, Path], workers: Optional[int] = None) -> FileReport:
+    """
+    Verify one file with the format detected for it.
+
+    Args:
+        path: File to verify
+        workers: Checksum threads used by the format
+
+    Returns:
+        FileReport of the file
+
+    Raises:
+        KeyError: If no format handles the file
+    """
+    path = Path(path)
+    signal_format = registry.get_for_file(path)
+    report = FileReport(path=path, format_name=signal_format.name, size=path.stat().st_size)
+    report.errors = signal_format.verify(path, workers)
+    for error in report.errors:
+        logger.warning(f"{path}: {format_block_error(error)}")
+    return report
+
+
+def format_block_error(error: BlockError) -> str:
+    """One-line description of a bad block, with its time range when known."""
+    parts = [f"block {error.index}"]
+    if error.time_range is not None:
+        parts.append(f"t={error.time_range.start:.6g}..{error.time_range.end:.6g} s")
+    if error.offset is not None:
+        parts.append(f"offset {error.offset}")
+    return f"{', '.join(parts)}: {error.message}"
+
+
+def scrub(sources: Union[str, Path, Iterable[Union[str, Path]]], max_workers: int = 2,
+          checksum_workers: Optional[int] = None, progress: Optional[Callable[[FileReport], None]] = None,
+          stop_event: Optional[threading.Event] = None) -> ScrubReport:
+    """
+    Verify every file of an archive.
+
+    Args:
+        sources: Archive directory (walked recursively), glob pattern
+                 (e.g. "archive/**/*.sigbin") or paths
+        max_workers: Files verified concurrently
+        checksum_workers: Checksum threads per file (format default if None)
+        progress: Called with each FileReport as files complete
+        stop_event: Stop after the files in progress when this event is set
+
+    Returns:
+        ScrubReport listing every verified file and its bad blocks
+    """
+    report = ScrubReport()
+    started = time.perf_counter()
+
+    paths = []
+    for path in resolve_paths(sources, recursive=True):
+        try:
+            registry.get_for_file(path, sniff=False)
+            paths.append(path)
+        except KeyError:
+            report.skipped.append(path)
+    if not paths:
+        logger.warning(f"No recordings to verify in {sources}")
+
+    reports = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrub") as executor:
+        futures = {}
+        for path in paths:
+            futures[executor.submit(verify_file, path, checksum_workers)] = path
+
+        for future, path in futures.items():
+            if stop_event is not None and stop_event.is_set():
+                report.stopped = True
+                future.cancel()
+                continue
+            try:
+                file_report = future.result()
+            except Exception as e:
+                file_report = FileReport(path=path, errors=[BlockError(index=0, message=str(e))])
+            reports[path] = file_report
+            if progress is not None:
+                progress(file_report)
+
+    report.files = [reports[path] for path in paths if path in reports]
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+class Scrubber:
+    """
+    Runs a scrub on a background thread.
+
+    Example:
+        scrubber = Scrubber("/data/archive")
+        scrubber.start()
+        ...
+        report = scrubber.join()
+        for file_report in report.bad_files:
+            print(file_report.path, file_report.errors)
+    """
+
+    def __init__(self, sources: Union[str, Path, Iterable[Union[str, Path]]], max_workers: int = 2,
+                 checksum_workers: Optional[int] = None,
+                 progress: Optional[Callable[[FileReport], None]] = None):
+        """
+        Initialize the scrubber.
+
+        Args:
+            sources: Archive directory (walked recursively), glob pattern or paths
+            max_workers: Files verified concurrently
+            checksum_workers: Checksum threads per file
+            progress: Called with each FileReport as files complete
+        """
+        self.sources = sources
+        self.max_workers = max_workers
+        self.checksum_workers = checksum_workers
+        self.progress = progress
+
+        # Report of the finished scrub
+        self.report: Optional[ScrubReport] = None
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._error = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start scrubbing on a daemon thread."""
+        if self.running:
+            raise RuntimeError("Scrub is already running")
+        self._stop.clear()
+        self.report = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="scrubber", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.report = scrub(self.sources, self.max_workers, self.checksum_workers,
+                                self.progress, self._stop)
+        except Exception as e:
+            logger.error(f"Scrub failed: {e}")
+            self._error = e
+
+    def stop(self) -> None:
+        """Ask the scrub to stop after the files in progress."""
+        self._stop.set()
+
+    def join(self, timeout: Optional[float] = None) -> Optional[ScrubReport]:
+        """
+        Wait for the scrub to finish.
+
+        Returns:
+            The report, or None if the scrub is still running after the timeout
+
+        Raises:
+            Exception: The error that ended the scrub
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return None
+        if self._error is not None:
+            raise self._error
+        return self.report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point; returns 0 if the archive is intact, 2 if blocks
+    are corrupt and 1 on errors, including an archive with nothing to verify.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m signals_system.io.scrub",
+        description="Verify the checksums of every recording in an archive.")
+    parser.add_argument("sources", nargs="+", help="archive directories, glob patterns or files")
+    parser.add_argument("--workers", type=int, default=2, help="files verified concurrently")
+    parser.add_argument("--checksum-workers", type=int, help="checksum threads per file")
+    parser.add_argument("--quiet", action="store_true", help="only print bad blocks")
+    args = parser.parse_args(argv)
+
+    def show(file_report: FileReport) -> None:
+        for error in file_report.errors:
+            print(f"{file_report.path}: {format_block_error(error)}")
+        if not args.quiet and file_report.ok:
+            print(f"{file_report.path}: ok", file=sys.stderr)
+
+    try:
+        report = scrub(args.sources, args.workers, args.checksum_workers, progress=show)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if not report.files and not report.stopped:
+        print(f"error: no recordings found in {' '.join(args.sources)}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(f"Verified {len(report.files)} files ({report.bytes_verified / (1 << 20):.1f} MiB) "
+              f"in {report.elapsed:.1f} s, {len(report.bad_files)} with corrupt blocks", file=sys.stderr)
+    return 2 if report.bad_files else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Background Writer Module
+
+This module implements write-behind streaming for signal formats. Chunks
+are accepted into a bounded queue and encoded and written by a dedicated
+thread, so producers such as acquisition loops only block on disk when the
+queue is full. Small chunks are coalesced into large writes, and durability
+is configurable: flush after a number of bytes and fsync at an interval.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from copy import copy as shallow_copy
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import numpy as np
+
+from ..formats.base import SignalData, SignalFormat, SignalFormatError, registry
+
+logger = logging.getLogger(__name__)
+
+# Queue item that tells the writer thread to finish
+_CLOSE = object()
+
+
+def _stream_file(stream: Any) -> Any:
+    """Find the file object behind a format stream, for flush and fsync."""
+    if hasattr(stream, 'fileno'):
+        return stream
+    return getattr(stream, 'file', None)
+
+
+def _mergeable(first: SignalData, second: SignalData) -> bool:
+    """Whether two chunks can be written as one without changing what is stored."""
+    first_values, second_values = np.asarray(first.values), np.asarray(second.values)
+    if (first_values.dtype != second_values.dtype
+            or first_values.shape[1:] != second_values.shape[1:]
+            or (first.timestamps is None) != (second.timestamps is None)):
+        return False
+    try:
+        return bool(first.metadata == second.metadata)
+    except ValueError:
+        # Array-valued metadata has no single truth value
+        return False
+
+
+def _merge(chunks: List[SignalData]) -> SignalData:
+    """Concatenate compatible chunks into a single chunk."""
+    if len(chunks) == 1:
+        return chunks[0]
+    values = np.concatenate([np.asarray(chunk.values) for chunk in chunks])
+    timestamps = None
+    if chunks[0].timestamps is not None:
+        timestamps = np.concatenate([np.asarray(chunk.timestamps) for chunk in chunks])
+    return SignalData(values=values, timestamps=timestamps, metadata=chunks[0].metadata)
+
+
+class BackgroundWriter:
+    """
+    Asynchronous chunk writer for any streaming signal format.
+
+    write() only enqueues the chunk; a dedicated thread coalesces queued
+    chunks with identical metadata into batches of up to batch_bytes and
+    passes them to the format's write_chunk(). An error on the writer thread
+    is raised from the next write() or from close().
+
+    Chunks are written after write() returns, so their arrays must not be
+    modified afterwards unless copy=True.
+
+    Example:
+        with BackgroundWriter("capture.sigbin", queue_size=256, fsync_interval=1.0) as writer:
+            while acquiring:
+                writer.write(scope.read_chunk())
+    """
+
+    def __init__(self, destination: Union[str, Path], signal_format: Optional[Union[str, SignalFormat]] = None,
+                 mode: str = 'w', queue_size: int = 64, batch_bytes: int = 4 << 20,
+                 flush_bytes: Optional[int] = None, fsync_interval: Optional[float] = None,
+                 copy: bool = False):
+        """
+        Open the destination stream and start the writer thread.
+
+        Args:
+            destination: File path to write
+            signal_format: Format name or instance; chosen by extension if None
+            mode: Stream mode, 'w' to create or 'a' to append
+            queue_size: Maximum number of chunks waiting to be written
+            batch_bytes: Maximum size of the values of a coalesced batch
+            flush_bytes: Flush the file after at least this many bytes of values
+                         (after every batch if None)
+            fsync_interval: Seconds between fsync calls, kept while the producer
+                            is idle; None to fsync only on close
+            copy: Copy chunk arrays in write(), so the caller may reuse its buffers
+
+        Raises:
+            SignalFormatError: If the format does not support streaming or the
+                               destination cannot be opened
+        """
+        if isinstance(signal_format, str):
+            signal_format = registry.get_format(signal_format)
+        elif signal_format is None:
+            signal_format = registry.get_for_file(destination, sniff=False)
+        if not signal_format.supports_streaming():
+            raise SignalFormatError(f"{signal_format.name} format does not support streaming")
+
+        # Flushing follows flush_bytes instead of every chunk; copied to leave the caller's format as it is
+        signal_format = shallow_copy(signal_format)
+        signal_format.flush_chunks = False
+
+        self.destination = Path(destination)
+        self.format = signal_format
+        self.batch_bytes = batch_bytes
+        self.flush_bytes = flush_bytes
+        self.fsync_interval = fsync_interval
+        self.copy = copy
+
+        # Statistics
+        self.chunks_written = 0
+        self.batches_written = 0
+        self.bytes_written = 0
+        self.max_queue_depth = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error = None
+        self._closed = False
+        self._unflushed = 0
+        self._unsynced = False  # Batches written since the last fsync
+        self._last_fsync = time.monotonic()
+        self._held = None  # Chunk taken from the queue that starts the next batch
+
+        self._stream = self.format.open_stream(self.destination, mode)
+        self._thread = threading.Thread(target=self._run, name=f"writer-{self.destination.name}", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'BackgroundWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of chunks waiting to be written."""
+        return self._queue.qsize()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise SignalFormatError(f"Background writer for {self.destination} failed: {self._error}") from self._error
+
+    def write(self, data: SignalData, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Queue a chunk for writing.
+
+        Args:
+            data: Chunk to write
+            block: Wait for room in the queue; if False, raise queue.Full when it is full
+            timeout: Maximum seconds to wait for room in the queue
+
+        Raises:
+            SignalFormatError: If the writer is closed or the writer thread failed
+            queue.Full: If the queue stayed full (non-blocking or timed out)
+        """
+        if self._closed:
+            raise SignalFormatError("Background writer is closed")
+        self._raise_error()
+
+        if self.copy:
+            timestamps = None if data.timestamps is None else np.array(data.timestamps)
+            data = SignalData(values=np.array(data.values), timestamps=timestamps, metadata=dict(data.metadata))
+
+        self._queue.put(data, block, timeout)
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    def _idle_timeout(self) -> Optional[float]:
+        """Seconds the writer thread may wait for a chunk before the next fsync is due."""
+        if self.fsync_interval is None or not self._unsynced or self._error is not None:
+            return None
+        return max(self._last_fsync + self.fsync_interval - time.monotonic(), 0.0)
+
+    def _next_batch(self) -> Optional[List[SignalData]]:
+        """Take the next chunk plus the compatible chunks queued behind it; None when closing."""
+        item = self._held
+        self._held = None
+        while item is None:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout())
+            except queue.Empty:
+                # The producer is idle; keep the fsync interval for what was written so far
+                self._sync_idle()
+        if item is _CLOSE:
+            return None
+        if item is _CLOSE:
+            return None
+
+        batch = [item]
+        size = np.asarray(item.values).nbytes
+        while size < self.batch_bytes:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLOSE or not _mergeable(batch[0], item):
+                # Starts the next batch
+                self._held = item
+                break
+            batch.append(item)
+            size += np.asarray(item.values).nbytes
+        return batch
+
+    def _run(self) -> None:
+        """Writer thread: write batches until the close marker arrives."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            if self._error is not None:
+                # Keep draining so producers never block on a dead writer
+                continue
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Background writer for {self.destination} failed: {e}")
+                self._error = e
+
+    def _write_batch(self, batch: List[SignalData]) -> None:
+        data = _merge(batch)
+        self.format.write_chunk(self._stream, data)
+
+        self.chunks_written += len(batch)
+        self.batches_written += 1
+        size = np.asarray(data.values).nbytes
+        self.bytes_written += size
+        self._unflushed += size
+        self._unsynced = True
+
+        file = _stream_file(self._stream)
+        if file is None:
+            return
+        if self.flush_bytes is None or self._unflushed >= self.flush_bytes:
+            file.flush()
+            self._unflushed = 0
+        if self.fsync_interval is not None and time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self._fsync(file)
+
+    def _sync_idle(self) -> None:
+        file = _stream_file(self._stream)
+        try:
+            if file is not None:
+                self._fsync(file)
+                self._unflushed = 0
+        except Exception as e:
+            logger.error(f"Background writer for {self.destination} failed: {e}")
+            self._error = e
+        self._unsynced = False
+
+    def _fsync(self, file: Any) -> None:
+        file.flush()
+        if hasattr(file, 'fileno'):
+            os.fsync(file.fileno())
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write all queued chunks and close the stream.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+
+        Raises:
+            SignalFormatError: If the writer thread failed or did not finish in time
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.put(_CLOSE)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise SignalFormatError(f"Background writer for {self.destination} did not drain in time")
+
+        try:
+            if self._error is None and self.fsync_interval is not None:
+                file = _stream_file(self._stream)
+                if file is not None:
+                    self._fsync(file)
+        finally:
+            self.format.close_stream(self._stream)
+        self._raise_error()
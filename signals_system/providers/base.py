@@ -0,0 +1,78 @@
+"""
+Signal Provider Base Module
+
+This module defines the base interface for signal providers. A provider
+delivers signal data to processing code, from a recording or from a live
+source, and owns the threads and buffers needed to do so.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderError(Exception):
+    """Base exception for all signal provider related errors."""
+    pass
+
+
+class SignalProvider(ABC):
+    """
+    Base class for all signal providers.
+
+    Providers are started before use and stopped to release their threads,
+    files and connections; using a provider as a context manager does both.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Get the name of the provider."""
+        pass
+
+    @property
+    @abstractmethod
+    def is_running(self) -> bool:
+        """Whether the provider has been started and not stopped."""
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        """
+        Start delivering data.
+
+        Raises:
+            ProviderError: If the source cannot be opened
+        """
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop delivering data and release threads and resources."""
+        pass
+
+    @property
+    def sample_rate(self) -> Optional[float]:
+        """Sample rate of the delivered data, if known."""
+        rate = self.metadata.get("sample_rate")
+        return float(rate) if rate else None
+
+    @property
+    def num_channels(self) -> Optional[int]:
+        """Number of channels of the delivered data, if known."""
+        return None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata describing the source."""
+        return {}
+
+    def __enter__(self) -> 'SignalProvider':
+        if not self.is_running:
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
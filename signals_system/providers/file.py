@@ -0,0 +1,370 @@
+"""
+File Signal Provider Module
+
+This module implements the file-based signal provider. A recording is
+delivered as a sequence of fixed-size, optionally overlapping windows,
+read in chunks between a start and end time by a background thread that
+prefetches the next windows while the current one is processed. Windows
+are preallocated buffers that are reused, so iterating a recording much
+larger than memory allocates no arrays per window.
+"""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from ..formats.base import SignalData, SignalFormat, TimeRange, registry
+from .base import SignalProvider, ProviderError
+
+logger = logging.getLogger(__name__)
+
+UNIT_SAMPLES = "samples"
+UNIT_SECONDS = "seconds"
+
+# Ready queue item marking the end of the windows
+_END = object()
+
+
+class _WindowBuffer:
+    """Preallocated storage for one window, handed back and forth between the threads."""
+
+    def __init__(self, window: int, channels: int, dtype: np.dtype, timestamps: bool,
+                 metadata: Dict[str, Any]):
+        shape = (window, channels) if channels > 1 else (window,)
+        self.values = np.empty(shape, dtype=dtype)
+        self.timestamps = np.empty(window, dtype=np.float64) if timestamps else None
+        self.data = SignalData(values=self.values, timestamps=self.timestamps, metadata=metadata)
+        self.start = 0
+
+
+def read_chunks(signal_format: SignalFormat, source: Union[str, Path], chunk_size: int,
+                time_range: Optional[TimeRange] = None, lazy: bool = True) -> Iterator[SignalData]:
+    """
+    Read a recording chunk by chunk, optionally restricted to a time range.
+
+    Formats with lazy storage are read through open_lazy() (unless `lazy` is
+    False), streaming formats through read_chunk() with chunks the size the
+    format reads, and other formats through read() in slices of chunk_size.
+
+    Args:
+        signal_format: Format of the recording
+        source: File path of the recording
+        chunk_size: Samples per chunk for lazy and in-memory reads
+        time_range: Only yield samples in this range
+        lazy: Use open_lazy() when the format supports it
+
+    Yields:
+        SignalData chunks in time order
+
+    Raises:
+        ProviderError: If a time range is requested from data without timestamps
+    """
+    if lazy and type(signal_format).open_lazy is not SignalFormat.open_lazy:
+        with signal_format.open_lazy(source) as data:
+            if time_range is not None:
+                data = data.time_slice(time_range)
+            yield from data.iter_chunks(chunk_size)
+        return
+
+    if signal_format.supports_streaming():
+        stream = signal_format.open_stream(source, 'r')
+        try:
+            while True:
+                chunk = signal_format.read_chunk(stream)
+                if chunk is None:
+                    return
+                if time_range is None:
+                    yield chunk
+                    continue
+                if chunk.timestamps is None:
+                    raise ProviderError(f"{signal_format.name} data has no timestamps to select a time range")
+                if time_range.end is not None and len(chunk.timestamps) and chunk.timestamps[0] > time_range.end:
+                    return
+                chunk = chunk.time_slice(time_range)
+                if chunk.num_samples:
+                    yield chunk
+        finally:
+            signal_format.close_stream(stream)
+        return
+
+    data = signal_format.read(source, time_range)
+    for start in range(0, data.num_samples, chunk_size):
+        yield data.slice(start, start + chunk_size)
+
+
+class FileSignalProvider(SignalProvider):
+    """
+    Window iterator over a recording in any signal format.
+
+    Windows are `window` long and start every `step`, both in samples or
+    seconds; a step shorter than the window gives overlapping windows, a
+    longer one skips samples. Formats with lazy storage are read through
+    open_lazy() (the start time is found by binary search), streaming
+    formats through read_chunk(), and other formats through read() with
+    the time range.
+
+    Each window is a view on a reused buffer that stays valid until the
+    next window is requested; copy it to keep it.
+
+    Example:
+        with FileSignalProvider("capture.sigbin", window=0.5, step=0.25, unit="seconds") as provider:
+            for window in provider:
+                spectrum = np.abs(np.fft.rfft(window.values))
+    """
+
+    DEFAULT_CHUNK_SIZE = 65536
+
+    def __init__(self, source: Union[str, Path], signal_format: Optional[Union[str, SignalFormat]] = None,
+                 window: Union[int, float] = 4096, step: Optional[Union[int, float]] = None,
+                 unit: str = UNIT_SAMPLES, start_time: Optional[float] = None,
+                 end_time: Optional[float] = None, prefetch: int = 2, partial: bool = True,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the provider.
+
+        Args:
+            source: File path of the recording
+            signal_format: Format name or instance; detected from the file if None
+            window: Window length in `unit`
+            step: Distance between window starts in `unit` (defaults to the window length)
+            unit: "samples" or "seconds"
+            start_time: Only deliver samples at or after this time
+            end_time: Only deliver samples at or before this time
+            prefetch: Number of windows read ahead of the consumer
+            partial: Deliver the last window even if it is shorter than `window`
+                     (when it holds samples not in the previous window)
+            chunk_size: Samples read from the file at a time
+
+        Raises:
+            ValueError: If the window, step or unit is invalid
+        """
+        if unit not in (UNIT_SAMPLES, UNIT_SECONDS):
+            raise ValueError(f"Unknown window unit: {unit}")
+        if window <= 0 or (step is not None and step <= 0):
+            raise ValueError("window and step must be positive")
+
+        self.source = Path(source)
+        if isinstance(signal_format, str):
+            signal_format = registry.get_format(signal_format)
+        self.format = signal_format
+        self.window = window
+        self.step = step if step is not None else window
+        self.unit = unit
+        self.start_time = start_time
+        self.end_time = end_time
+        self.prefetch = max(prefetch, 1)
+        self.partial = partial
+        self.chunk_size = chunk_size
+
+        # Statistics
+        self.windows_delivered = 0
+        self.stalls = 0  # Windows the consumer had to wait for
+
+        # Sample index (from the start time) of the last delivered window
+        self.position = 0
+
+        self._metadata: Dict[str, Any] = {}
+        self._sample_rate = None
+        self._channels = None
+        self._thread = None
+        self._stopping = threading.Event()
+        self._free = None
+        self._ready = None
+
+    # --- Provider interface ---
+
+    @property
+    def name(self) -> str:
+        return "file"
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def sample_rate(self) -> Optional[float]:
+        return self._sample_rate or super().sample_rate
+
+    @property
+    def num_channels(self) -> Optional[int]:
+        return self._channels
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._metadata
+
+    def start(self) -> None:
+        """
+        Open the recording and start prefetching windows.
+
+        Raises:
+            ProviderError: If no format can read the file
+        """
+        if self.is_running:
+            return
+        try:
+            if self.format is None:
+                self.format = registry.get_for_file(self.source)
+            self._metadata = dict(self.format.get_metadata(self.source))
+        except Exception as e:
+            raise ProviderError(f"Cannot open {self.source}: {e}") from e
+
+        self.windows_delivered = 0
+        self.stalls = 0
+        self._stopping.clear()
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        self._thread = threading.Thread(target=self._produce, name=f"provider-{self.source.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the prefetch thread and close the recording."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        # Wake the producer if it waits for a free buffer
+        self._free.put(None)
+        self._thread.join()
+        self._thread = None
+
+    # --- Reading ---
+
+    def _time_range(self) -> Optional[TimeRange]:
+        if self.start_time is None and self.end_time is None:
+            return None
+        return TimeRange(start=self.start_time, end=self.end_time)
+
+    def _chunks(self) -> Iterator[SignalData]:
+        """Chunks of the recording between the start and end time."""
+        return read_chunks(self.format, self.source, self.chunk_size, self._time_range())
+
+    def _window_samples(self, chunk: SignalData) -> List[int]:
+        """Window and step lengths in samples."""
+        if self.unit == UNIT_SAMPLES:
+            return [int(self.window), int(self.step)]
+        rate = self.sample_rate or chunk.sample_rate
+        if not rate:
+            raise ProviderError("Windows in seconds need a sample rate")
+        self._sample_rate = float(rate)
+        return [max(int(round(self.window * rate)), 1), max(int(round(self.step * rate)), 1)]
+
+    def _acquire(self) -> Optional[_WindowBuffer]:
+        buffer = self._free.get()
+        if buffer is None or self._stopping.is_set():
+            return None
+        return buffer
+
+    def _produce(self) -> None:
+        """Prefetch thread: copy chunks into window buffers and queue full windows."""
+        chunks = self._chunks()
+        try:
+            buffer = None
+            fill = 0           # Samples in the current buffer
+            carried = 0        # Of those, samples already delivered with the previous window
+            window_start = 0   # Sample index of the current window
+            sample = 0         # Sample index of the next chunk
+
+            for chunk in chunks:
+                if self._stopping.is_set():
+                    return
+                values = np.asarray(chunk.values)
+                timestamps = chunk.timestamps
+
+                if buffer is None:
+                    window, step = self._window_samples(chunk)
+                    self._channels = values.shape[1] if values.ndim > 1 else 1
+                    self._sample_rate = self._sample_rate or chunk.sample_rate
+                    for _ in range(self.prefetch + 2):
+                        self._free.put(_WindowBuffer(window, self._channels, values.dtype,
+                                                     timestamps is not None, self._metadata))
+                    buffer = self._acquire()
+                    if buffer is None:
+                        return
+
+                position = max(window_start + fill - sample, 0)
+                while position < len(values):
+                    # Samples between windows when the step is longer than the window
+                    if sample + position < window_start:
+                        position = window_start - sample
+                        continue
+
+                    take = min(window - fill, len(values) - position)
+                    buffer.values[fill:fill + take] = values[position:position + take]
+                    if buffer.timestamps is not None:
+                        buffer.timestamps[fill:fill + take] = timestamps[position:position + take]
+                    fill += take
+                    position += take
+
+                    if fill == window:
+                        buffer.start = window_start
+                        following = self._acquire()
+                        if following is None:
+                            return
+                        # Overlapping windows start with the tail of the previous one
+                        overlap = max(window - step, 0)
+                        following.values[:overlap] = buffer.values[step:]
+                        if following.timestamps is not None:
+                            following.timestamps[:overlap] = buffer.timestamps[step:]
+                        self._ready.put((buffer, window))
+                        buffer, fill, carried = following, overlap, overlap
+                        window_start += step
+
+                sample += len(values)
+
+            # A partial window only made of the previous window's tail holds nothing new
+            if buffer is not None and fill > carried and self.partial:
+                buffer.start = window_start
+                self._ready.put((buffer, fill))
+
+        except Exception as e:
+            logger.error(f"Failed to read {self.source}: {e}")
+            self._ready.put(e)
+        finally:
+            chunks.close()
+            self._ready.put(_END)
+
+    def __iter__(self) -> Iterator[SignalData]:
+        """
+        Iterate over the windows; starts the provider if needed.
+
+        Raises:
+            ProviderError: If reading the recording fails
+        """
+        if not self.is_running:
+            self.start()
+
+        previous = None
+        try:
+            while True:
+                if previous is not None:
+                    # The consumer is done with the last window
+                    self._free.put(previous)
+                    previous = None
+
+                if self._ready.empty():
+                    self.stalls += 1
+                item = self._ready.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    if isinstance(item, ProviderError):
+                        raise item
+                    raise ProviderError(f"Failed to read {self.source}: {item}") from item
+
+                buffer, length = item
+                previous = buffer
+                self.windows_delivered += 1
+                self.position = buffer.start
+                if length == len(buffer.values):
+                    yield buffer.data
+                else:
+                    timestamps = buffer.timestamps[:length] if buffer.timestamps is not None else None
+                    yield SignalData(values=buffer.values[:length], timestamps=timestamps, metadata=self._metadata)
+        finally:
+            if previous is not None:
+                self._free.put(previous)
+            self.stop()
@@ -0,0 +1,694 @@
+"""
+Live Signal Provider Module
+
+This module implements the live signal provider. Acquisition code writes
+samples into a preallocated ring buffer and any number of readers, each
+with its own cursor, take frames out of it as zero-copy views. A single
+writer publishes its position after copying, and readers detect being
+lapped by comparing their cursor with it, so with the "overwrite" policy
+the data path takes no locks. The "block" and "drop" policies take the
+ring's lock once per write to find the slowest reader, and a condition
+variable wakes readers (and a blocked writer) that are waiting.
+
+The ring stores every sample twice, at i and i + capacity, so that any
+span of up to `capacity` samples is contiguous and can be returned as a
+view without copying around the wrap point.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from ..formats.base import SignalData
+from .base import SignalProvider, ProviderError
+
+logger = logging.getLogger(__name__)
+
+# What the writer does when a reader still needs the samples it would overwrite
+OVERFLOW_OVERWRITE = "overwrite"  # Write anyway; lapped readers count an overrun
+OVERFLOW_BLOCK = "block"          # Wait for the slowest reader to release its last view
+OVERFLOW_DROP = "drop"            # Discard the new samples
+OVERFLOW_POLICIES = (OVERFLOW_OVERWRITE, OVERFLOW_BLOCK, OVERFLOW_DROP)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RingBuffer:
+    """
+    Preallocated single-writer, multi-reader sample ring.
+
+    Positions are absolute sample counts since the ring was created; the
+    sample at position i is stored at i % capacity (and mirrored at
+    i % capacity + capacity).
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype: Union[str, np.dtype] = np.float64,
+                 timestamps: bool = True, sample_rate: Optional[float] = None,
+                 overflow: str = OVERFLOW_OVERWRITE, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the ring.
+
+        Args:
+            capacity: Samples kept in the ring
+            channels: Channels per sample
+            dtype: Value dtype
+            timestamps: Store a timestamp per sample
+            sample_rate: Used to generate timestamps for writes without them
+            overflow: "overwrite", "block" or "drop"
+
+        Raises:
+            ValueError: If the capacity or overflow policy is invalid
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.capacity = int(capacity)
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.sample_rate = sample_rate
+        self.overflow = overflow
+        self.metadata = metadata if metadata is not None else {}
+
+        shape = (2 * self.capacity, channels) if channels > 1 else (2 * self.capacity,)
+        self.values = np.zeros(shape, dtype=self.dtype)
+        self.timestamps = np.zeros(2 * self.capacity, dtype=np.float64) if timestamps else None
+
+        # Published write position; samples before it are readable
+        self.head = 0
+
+        # End of the write in progress; samples before reserved - capacity are being overwritten
+        self._reserved = 0
+
+        # Statistics
+        self.samples_dropped = 0
+        self.overruns = 0
+
+        self.closed = False
+        self.error: Optional[BaseException] = None
+
+        self._readers = weakref.WeakSet()
+        self._cond = threading.Condition()
+        self._waiting = 0
+        self._writer_waiting = False
+        self._async_waiters: List = []
+        self._ramp = None
+        self._scratch = None
+        self._dropping = False
+
+    # --- Writing ---
+
+    def write(self, values: np.ndarray, timestamps: Optional[np.ndarray] = None,
+              timeout: Optional[float] = None) -> int:
+        """
+        Copy samples into the ring.
+
+        Args:
+            values: Samples, shaped (n,) or (n, channels)
+            timestamps: Timestamp per sample; generated from the sample rate if None
+            timeout: Longest wait for space with the "block" policy
+
+        Returns:
+            Number of samples stored (less than n if samples were dropped)
+
+        Raises:
+            ValueError: If timestamps are needed and cannot be generated
+        """
+        values = np.asarray(values)
+        stored = 0
+        for start in range(0, len(values), self.capacity):
+            end = start + self.capacity
+            chunk_timestamps = timestamps[start:end] if timestamps is not None else None
+            stored += self._write(values[start:end], chunk_timestamps, timeout)
+        return stored
+
+    def _write(self, values: np.ndarray, timestamps: Optional[np.ndarray], timeout: Optional[float]) -> int:
+        n = len(values)
+        if not self._make_room(n, timeout):
+            self.samples_dropped += n
+            return 0
+
+        index = self.head
+        self._reserved = index + n
+        self._store(self.values, values, index, n)
+        self._store_timestamps(timestamps, index, n)
+        self._publish(n)
+        return n
+
+    def reserve(self, n: int, timeout: Optional[float] = None) -> np.ndarray:
+        """
+        Get a writable view at the write position, e.g. for socket.recv_into().
+
+        Thanks to the mirrored storage the view is contiguous even across the
+        wrap point. Fill it, then call commit() with the number of samples
+        written.
+
+        Args:
+            n: Samples wanted (at most the capacity)
+            timeout: Longest wait for space with the "block" policy
+
+        Returns:
+            Writable array of min(n, capacity) samples
+        """
+        n = min(n, self.capacity)
+        if not self._make_room(n, timeout):
+            # The samples still have to be received; they go to scratch space and are dropped
+            if self._scratch is None:
+                self._scratch = np.empty_like(self.values[:self.capacity])
+            self._dropping = True
+            return self._scratch[:n]
+
+        offset = self.head % self.capacity
+        self._reserved = self.head + n
+        return self.values[offset:offset + n]
+
+    def commit(self, n: int, timestamps: Optional[np.ndarray] = None,
+               start_time: Optional[float] = None) -> int:
+        """
+        Publish the first n samples written into the view returned by reserve().
+
+        Args:
+            n: Samples written
+            timestamps: Timestamp per sample
+            start_time: Time of the first sample, the others follow at the sample
+                        rate (the default is the sample position over the rate)
+
+        Returns:
+            Number of samples published (0 if they were dropped)
+        """
+        if self._dropping:
+            self._dropping = False
+            self.samples_dropped += n
+            return 0
+        if n == 0:
+            return 0
+
+        index = self.head
+        offset = index % self.capacity
+        # Mirror the written span into the other half of the storage
+        first = min(n, self.capacity - offset)
+        self.values[offset + self.capacity:offset + self.capacity + first] = self.values[offset:offset + first]
+        if first < n:
+            self.values[:n - first] = self.values[self.capacity:self.capacity + n - first]
+        self._store_timestamps(timestamps, index, n, start_time)
+        self._publish(n)
+        return n
+
+    def _spans(self, index: int, n: int):
+        """(ring offset, source offset, length) of the at most two pieces of a write."""
+        offset = index % self.capacity
+        first = min(n, self.capacity - offset)
+        yield offset, 0, first
+        if first < n:
+            yield 0, first, n - first
+
+    def _store(self, target: np.ndarray, source: np.ndarray, index: int, n: int) -> None:
+        for offset, start, length in self._spans(index, n):
+            piece = source[start:start + length]
+            target[offset:offset + length] = piece
+            target[offset + self.capacity:offset + self.capacity + length] = piece
+
+    def _store_timestamps(self, timestamps: Optional[np.ndarray], index: int, n: int,
+                          start_time: Optional[float] = None) -> None:
+        if self.timestamps is None:
+            return
+        if timestamps is not None:
+            self._store(self.timestamps, timestamps, index, n)
+            return
+        if not self.sample_rate:
+            raise ValueError("Timestamps are required when the ring has no sample rate")
+
+        if self._ramp is None:
+            self._ramp = np.arange(self.capacity, dtype=np.float64) / self.sample_rate
+        base = index / self.sample_rate if start_time is None else start_time
+        for offset, start, length in self._spans(index, n):
+            target = self.timestamps[offset:offset + length]
+            np.add(self._ramp[start:start + length], base, out=target)
+            self.timestamps[offset + self.capacity:offset + self.capacity + length] = target
+
+    def _free_space(self) -> int:
+        with self._cond:
+            positions = [reader.held for reader in self._readers]
+        if not positions:
+            return self.capacity
+        return self.capacity - (self.head - max(min(positions), self.head - self.capacity))
+
+    def _make_room(self, n: int, timeout: Optional[float]) -> bool:
+        if self.overflow == OVERFLOW_OVERWRITE:
+            return True
+        if self._free_space() >= n:
+            return True
+        if self.overflow == OVERFLOW_DROP:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._writer_waiting = True
+            try:
+                while not self.closed:
+                    if self._free_space() >= n:
+                        return True
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._writer_waiting = False
+        return False
+
+    def _publish(self, n: int) -> None:
+        self.head += n
+        if self._waiting:
+            with self._cond:
+                self._cond.notify_all()
+        if self._async_waiters:
+            self._wake_async()
+
+    def _wake_async(self) -> None:
+        with self._cond:
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                # The loop was closed while waiting
+                pass
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """End the stream; readers return the remaining samples, then None."""
+        self.error = error
+        self.closed = True
+        with self._cond:
+            self._cond.notify_all()
+        self._wake_async()
+
+    # --- Reading ---
+
+    def view(self, start: int, n: int) -> SignalData:
+        """Zero-copy view of n samples starting at absolute position start."""
+        offset = start % self.capacity
+        timestamps = self.timestamps[offset:offset + n] if self.timestamps is not None else None
+        return SignalData(values=self.values[offset:offset + n], timestamps=timestamps, metadata=self.metadata)
+
+    def latest(self, n: int) -> SignalData:
+        """Zero-copy view of the newest n samples (fewer if not yet written)."""
+        head = self.head
+        n = min(n, head, self.capacity)
+        return self.view(head - n, n)
+
+    def oldest(self) -> int:
+        """Position of the oldest sample that is not being overwritten."""
+        return max(self._reserved - self.capacity, 0)
+
+    def valid(self, start: int) -> bool:
+        """Whether a view starting at position start has not been overwritten since."""
+        return start >= self._reserved - self.capacity
+
+    def reader(self, frame_size: Optional[int] = None, hop: Optional[int] = None,
+               from_oldest: bool = False) -> 'RingReader':
+        """Create a reader starting at the newest (or oldest) sample."""
+        return RingReader(self, frame_size, hop, self.oldest() if from_oldest else None)
+
+    def _wait(self, position: int, timeout: Optional[float]) -> bool:
+        with self._cond:
+            self._waiting += 1
+            try:
+                return self._cond.wait_for(lambda: self.head >= position or self.closed, timeout)
+            finally:
+                self._waiting -= 1
+
+
+class RingReader:
+    """
+    Cursor of one consumer of a RingBuffer.
+
+    Views returned by read() and next_frame() share memory with the ring;
+    they stay valid until the writer laps them, which intact() checks. With
+    the "block" overflow policy the writer never does: the last view is
+    held until the reader asks for the next one.
+    A reader that falls more than a ring behind counts an overrun and
+    resumes at the newest frame.
+    """
+
+    def __init__(self, ring: RingBuffer, frame_size: Optional[int] = None, hop: Optional[int] = None,
+                 position: Optional[int] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            ring: Ring to read from
+            frame_size: Samples per frame returned by next_frame()
+            hop: Samples between frame starts (defaults to frame_size; less overlaps frames)
+            position: Absolute start position (defaults to the newest sample)
+
+        Raises:
+            ValueError: If the frame does not fit in the ring
+        """
+        frame_size = frame_size or 1
+        if frame_size > ring.capacity:
+            raise ValueError("frame_size is larger than the ring")
+
+        self.ring = ring
+        self.frame_size = frame_size
+        self.hop = hop or frame_size
+        self.position = ring.head if position is None else position
+
+        # Statistics
+        self.frames_read = 0
+        self.overruns = 0
+        self.samples_lost = 0
+
+        self._last_start = None
+        with ring._cond:
+            ring._readers.add(self)
+
+    @property
+    def available(self) -> int:
+        """Unread samples in the ring."""
+        return self.ring.head - self.position
+
+    @property
+    def held(self) -> int:
+        """Oldest position still in use: the start of the last view until the next read."""
+        return self._last_start if self._last_start is not None else self.position
+
+    def _check_overrun(self) -> None:
+        oldest = self.ring._reserved - self.ring.capacity
+        if self.position >= oldest:
+            return
+        target = max(self.ring.head - self.frame_size, oldest)
+        self.samples_lost += target - self.position
+        self.overruns += 1
+        self.ring.overruns += 1
+        self.position = target
+
+    def _advance(self, n: int) -> None:
+        self.position += n
+        if self.ring._writer_waiting:
+            with self.ring._cond:
+                self.ring._cond.notify_all()
+
+    def _release(self) -> None:
+        """The consumer is done with the last view."""
+        if self._last_start is not None:
+            self._last_start = None
+            self._advance(0)
+
+    def _finished(self) -> None:
+        if self.ring.error is not None:
+            raise ProviderError(f"Live source failed: {self.ring.error}") from self.ring.error
+
+    def read(self, max_samples: Optional[int] = None) -> Optional[SignalData]:
+        """
+        Take every unread sample without waiting.
+
+        Returns:
+            View of the unread samples (at most max_samples), or None if there are none
+        """
+        self._release()
+        self._check_overrun()
+        n = min(self.available, self.ring.capacity)
+        if max_samples is not None:
+            n = min(n, max_samples)
+        if n <= 0:
+            return None
+        start = self.position
+        self._last_start = start
+        self._advance(n)
+        return self.ring.view(start, n)
+
+    def next_frame(self, timeout: Optional[float] = None) -> Optional[SignalData]:
+        """
+        Wait for the next frame.
+
+        Args:
+            timeout: Longest wait in seconds (forever if None)
+
+        Returns:
+            View of frame_size samples, or None on timeout or when the stream ended
+
+        Raises:
+            ProviderError: If the acquisition failed
+        """
+        self._release()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._check_overrun()
+            if self.available >= self.frame_size:
+                return self._take_frame()
+            if self.ring.closed:
+                self._finished()
+                return None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self.ring._wait(self.position + self.frame_size, remaining)
+
+    async def next_frame_async(self, timeout: Optional[float] = None) -> Optional[SignalData]:
+        """
+        Await the next frame without blocking the event loop.
+
+        Args:
+            timeout: Longest wait in seconds (forever if None)
+
+        Returns:
+            View of frame_size samples, or None on timeout or when the stream ended
+
+        Raises:
+            ProviderError: If the acquisition failed
+        """
+        self._release()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            self._check_overrun()
+            if self.available >= self.frame_size:
+                return self._take_frame()
+            if self.ring.closed:
+                self._finished()
+                return None
+
+            future = loop.create_future()
+            with self.ring._cond:
+                self.ring._async_waiters.append((loop, future))
+            # Samples published before the waiter was registered do not wake it
+            if self.available >= self.frame_size or self.ring.closed:
+                continue
+
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def _take_frame(self) -> SignalData:
+        start = self.position
+        self._last_start = start
+        self.frames_read += 1
+        self._advance(self.hop)
+        return self.ring.view(start, self.frame_size)
+
+    def intact(self) -> bool:
+        """Whether the last view returned is still there (False after a read returned None)."""
+        return self._last_start is not None and self.ring.valid(self._last_start)
+
+    def close(self) -> None:
+        """Detach from the ring so it no longer holds the writer back."""
+        with self.ring._cond:
+            self.ring._readers.discard(self)
+
+
+class LiveSignalProvider(SignalProvider):
+    """
+    Provider of live data through a ring buffer.
+
+    Samples come from write() calls of acquisition code, or from `source`,
+    a callable polled on an acquisition thread that returns a SignalData or
+    array per call and None when the stream ends. Subclasses that talk to
+    hardware or the network override _acquire(). Consumers read frames of
+    `frame_size` samples, `frame_rate` frames per second at the sample rate.
+
+    Example:
+        provider = LiveSignalProvider(buffer_size=1 << 20, sample_rate=1e6, frame_rate=50)
+        with provider:
+            reader = provider.reader()
+            while (frame := reader.next_frame(timeout=1.0)) is not None:
+                display(frame.values)
+    """
+
+    DEFAULT_BUFFER_SIZE = 1 << 20
+    DEFAULT_FRAME_SIZE = 1024
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE, channels: int = 1,
+                 dtype: Union[str, np.dtype] = np.float64, sample_rate: Optional[float] = None,
+                 frame_size: Optional[int] = None, frame_rate: Optional[float] = None,
+                 overflow: str = OVERFLOW_OVERWRITE, timestamps: bool = True,
+                 source: Optional[Callable[[], Any]] = None, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the provider.
+
+        Args:
+            buffer_size: Samples kept in the ring (twice this is allocated)
+            channels: Channels per sample
+            dtype: Value dtype
+            sample_rate: Sample rate in Hz
+            frame_size: Samples per frame; derived from frame_rate if None
+            frame_rate: Frames per second, used with the sample rate for the frame size
+            overflow: What to do when the ring is full: "overwrite", "block" or "drop"
+            timestamps: Store a timestamp per sample
+            source: Callable polled for data on the acquisition thread
+            metadata: Metadata of the delivered data
+
+        Raises:
+            ValueError: If the settings are inconsistent
+        """
+        if frame_size is None:
+            if frame_rate and sample_rate:
+                frame_size = max(int(round(sample_rate / frame_rate)), 1)
+            else:
+                frame_size = min(self.DEFAULT_FRAME_SIZE, buffer_size)
+        if frame_size > buffer_size:
+            raise ValueError(f"frame_size {frame_size} does not fit in buffer_size {buffer_size}")
+
+        self.buffer_size = buffer_size
+        self.frame_size = frame_size
+        self.frame_rate = frame_rate if frame_rate else (sample_rate / frame_size if sample_rate else None)
+        self.source = source
+        self._metadata = dict(metadata or {})
+        if sample_rate:
+            self._metadata["sample_rate"] = sample_rate
+        self._ring_settings = dict(capacity=buffer_size, channels=channels, dtype=dtype, timestamps=timestamps,
+                                   sample_rate=sample_rate, overflow=overflow)
+
+        self.ring = RingBuffer(metadata=self._metadata, **self._ring_settings)
+        self._reader: Optional[RingReader] = None
+        self._running = False
+        self._stopping = threading.Event()
+        self._thread = None
+
+    # --- Provider interface ---
+
+    @property
+    def name(self) -> str:
+        return "live"
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def num_channels(self) -> Optional[int]:
+        return self.ring.channels
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._metadata
+
+    def start(self) -> None:
+        """
+        Start the acquisition thread, if there is a source.
+
+        Raises:
+            ProviderError: If the source cannot be opened
+        """
+        if self._running:
+            return
+        if self.ring.closed:
+            # Restarting begins a new stream
+            self.ring = RingBuffer(metadata=self._metadata, **self._ring_settings)
+            self._reader = None
+        self._stopping.clear()
+        self._running = True
+
+        if self.source is not None or type(self)._acquire is not LiveSignalProvider._acquire:
+            self._thread = threading.Thread(target=self._run, name=f"provider-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop acquisition and end the stream for the readers."""
+        if not self._running:
+            return
+        self._stopping.set()
+        self.ring.close(self.ring.error)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._running = False
+
+    def _run(self) -> None:
+        try:
+            self._acquire()
+            self.ring.close()
+        except Exception as e:
+            logger.error(f"Acquisition of {self.name} failed: {e}")
+            self.ring.close(e)
+
+    def _acquire(self) -> None:
+        """Acquisition loop; runs on the acquisition thread until stopping is set."""
+        while not self._stopping.is_set():
+            chunk = self.source()
+            if chunk is None:
+                return
+            if isinstance(chunk, SignalData):
+                self.ring.write(chunk.values, chunk.timestamps)
+            else:
+                self.ring.write(chunk)
+
+    # --- Data access ---
+
+    @property
+    def samples_written(self) -> int:
+        return self.ring.head
+
+    @property
+    def samples_dropped(self) -> int:
+        return self.ring.samples_dropped
+
+    @property
+    def overruns(self) -> int:
+        return self.ring.overruns
+
+    def write(self, values: np.ndarray, timestamps: Optional[np.ndarray] = None,
+              timeout: Optional[float] = None) -> int:
+        """Write samples from acquisition code; see RingBuffer.write()."""
+        return self.ring.write(values, timestamps, timeout)
+
+    def reader(self, frame_size: Optional[int] = None, hop: Optional[int] = None,
+               from_oldest: bool = False) -> RingReader:
+        """
+        Create an independent reader.
+
+        Args:
+            frame_size: Samples per frame (the provider's frame size if None)
+            hop: Samples between frame starts
+            from_oldest: Start at the oldest sample in the ring instead of the newest
+        """
+        return self.ring.reader(frame_size or self.frame_size, hop, from_oldest)
+
+    def latest(self, n: int) -> SignalData:
+        """Zero-copy view of the newest n samples."""
+        return self.ring.latest(n)
+
+    def _default_reader(self) -> RingReader:
+        if self._reader is None or self._reader.ring is not self.ring:
+            self._reader = self.reader()
+        return self._reader
+
+    def next_frame(self, timeout: Optional[float] = None) -> Optional[SignalData]:
+        """Wait for the next frame of the provider's own reader; see RingReader.next_frame()."""
+        return self._default_reader().next_frame(timeout)
+
+    async def next_frame_async(self, timeout: Optional[float] = None) -> Optional[SignalData]:
+        """Await the next frame of the provider's own reader."""
+        return await self._default_reader().next_frame_async(timeout)
@@ -0,0 +1,529 @@
+"""
+Network Signal Provider Module
+
+This module implements a live provider fed over TCP or UDP, and a loopback
+generator that serves test streams from a separate process.
+
+Wire protocol: every frame is a fixed header followed by the samples,
+little-endian and interleaved by channel:
+
+    magic       4s   b"SIGF"
+    version     B    1
+    dtype       B    dtype code, see DTYPE_CODES
+    channels    H    channels per sample
+    samples     I    samples in the frame
+    sequence    Q    frame counter, incremented by one per frame
+    start_time  d    time of the first sample in seconds
+    sample_rate d    samples per second
+
+Over TCP frames follow each other on the stream; over UDP every datagram
+carries one frame. Payloads are received with recv_into()/recvmsg_into()
+straight into the provider's ring buffer, so no memory is allocated per frame.
+A UDP header is peeked first, so the ring only reserves the frame's samples.
+
+Command line (generator):
+    python -m signals_system.providers.network --port 9000 --dtype int16 --channels 2 --rate 1e6
+"""
+
+import argparse
+import logging
+import multiprocessing
+import socket
+import struct
+import sys
+import time
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from .base import ProviderError
+from .live import LiveSignalProvider, OVERFLOW_OVERWRITE
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_TCP = "tcp"
+PROTOCOL_UDP = "udp"
+
+FRAME_MAGIC = b"SIGF"
+PROTOCOL_VERSION = 1
+FRAME_HEADER = struct.Struct('<4sBBHIQdd')
+HEADER_SIZE = FRAME_HEADER.size
+
+# Largest UDP payload over IPv4
+MAX_DATAGRAM = 65507
+
+DTYPE_CODES = {
+    1: np.dtype('<i1'), 2: np.dtype('<u1'), 3: np.dtype('<i2'), 4: np.dtype('<u2'),
+    5: np.dtype('<i4'), 6: np.dtype('<u4'), 7: np.dtype('<f4'), 8: np.dtype('<f8'),
+}
+_CODES_BY_DTYPE = {dtype: code for code, dtype in DTYPE_CODES.items()}
+
+# Kernel receive buffer requested for the socket
+RECEIVE_BUFFER = 8 << 20
+
+# Frames a UDP datagram may arrive behind its successors and still count as late;
+# a larger backwards jump in the sequence means the sender restarted
+REORDER_WINDOW = 64
+
+
+def dtype_code(dtype: Any) -> int:
+    """
+    Wire code of a dtype.
+
+    Raises:
+        ValueError: If the dtype cannot be sent
+    """
+    code = _CODES_BY_DTYPE.get(np.dtype(dtype).newbyteorder('<'))
+    if code is None:
+        raise ValueError(f"Unsupported wire dtype: {dtype}")
+    return code
+
+
+class _Stopped(Exception):
+    """Raised inside the receive loops when the provider is stopping."""
+
+
+class _EndOfStream(ConnectionResetError):
+    """Raised when the server closes the connection between frames."""
+
+
+class SocketSignalProvider(LiveSignalProvider):
+    """
+    Live provider receiving framed samples over TCP or UDP.
+
+    Over TCP the provider connects to a server and reconnects when the
+    connection drops; over UDP it binds to the address and receives
+    datagrams from any sender. Sequence numbers detect lost frames (and,
+    over UDP, late frames, which are discarded). A sequence that jumps back
+    further than a reordered frame can counts as a sender restart.
+
+    Example:
+        provider = SocketSignalProvider("sdr.local", 9000, dtype="int16", channels=2,
+                                        buffer_size=1 << 22, frame_rate=50, sample_rate=2e6)
+        with provider:
+            reader = provider.reader()
+            while (frame := reader.next_frame(timeout=1.0)) is not None:
+                display(frame.values)
+            print(provider.frames_lost, provider.reconnects)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, protocol: str = PROTOCOL_TCP,
+                 reconnect: bool = True, reconnect_delay: float = 0.5, timeout: float = 0.2,
+                 buffer_size: int = LiveSignalProvider.DEFAULT_BUFFER_SIZE, channels: int = 1,
+                 dtype: Any = np.int16, sample_rate: Optional[float] = None,
+                 frame_size: Optional[int] = None, frame_rate: Optional[float] = None,
+                 overflow: str = OVERFLOW_OVERWRITE, timestamps: bool = True, metadata=None,
+                 reorder_window: int = REORDER_WINDOW):
+        """
+        Initialize the provider.
+
+        Args:
+            host: Server to connect to (TCP) or address to bind (UDP)
+            port: Server port (TCP) or port to bind, 0 for any (UDP)
+            protocol: "tcp" or "udp"
+            reconnect: Reconnect when the TCP connection fails or drops
+            reconnect_delay: Seconds between connection attempts
+            timeout: Socket timeout, which bounds how long stop() waits
+            buffer_size: Samples kept in the ring
+            channels: Channels per sample; frames must match
+            dtype: Sample dtype; frames must match
+            sample_rate: Sample rate in Hz (taken from the frames if None)
+            frame_size: Samples per frame delivered to readers
+            frame_rate: Frames per second delivered to readers
+            overflow: Ring overflow policy
+            timestamps: Store a timestamp per sample
+            metadata: Metadata of the delivered data
+            reorder_window: Frames a UDP datagram may be behind and still be
+                            dropped as late rather than taken as a restart
+
+        Raises:
+            ValueError: If the protocol or dtype is not supported
+        """
+        if protocol not in (PROTOCOL_TCP, PROTOCOL_UDP):
+            raise ValueError(f"Unknown protocol: {protocol}")
+        dtype = np.dtype(dtype).newbyteorder('<')
+        self._dtype_code = dtype_code(dtype)
+
+        super().__init__(buffer_size=buffer_size, channels=channels, dtype=dtype, sample_rate=sample_rate,
+                         frame_size=frame_size, frame_rate=frame_rate, overflow=overflow,
+                         timestamps=timestamps, metadata=metadata)
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.timeout = timeout
+        self.reorder_window = reorder_window
+        self._sample_bytes = dtype.itemsize * channels
+
+        # Statistics
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.sequence_gaps = 0
+        self.frames_lost = 0
+        self.frames_late = 0
+        self.restarts = 0
+        self.reconnects = 0
+
+        self._socket: Optional[socket.socket] = None
+        self._expected: Optional[int] = None
+        self._header = bytearray(HEADER_SIZE)
+        self._header_view = memoryview(self._header)
+        self._datagram = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.protocol}://{self.host}:{self.port}"
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        """Local address of the socket (the bound port for UDP with port 0)."""
+        return self._socket.getsockname() if self._socket is not None else None
+
+    # --- Connection handling ---
+
+    def start(self) -> None:
+        """
+        Bind (UDP) or connect (TCP) and start receiving.
+
+        Raises:
+            ProviderError: If the socket cannot be opened and reconnecting is off
+        """
+        if self.is_running:
+            return
+        self._expected = None
+        try:
+            self._open()
+        except OSError as e:
+            if self.protocol == PROTOCOL_UDP or not self.reconnect:
+                raise ProviderError(f"Cannot open {self.name}: {e}") from e
+            logger.warning(f"Cannot connect to {self.name}, retrying: {e}")
+        super().start()
+
+    def stop(self) -> None:
+        """Stop receiving and close the socket."""
+        super().stop()
+        self._close()
+
+    def _open(self) -> None:
+        if self.protocol == PROTOCOL_TCP:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind((self.host, self.port))
+            self.port = sock.getsockname()[1]
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER)
+        except OSError:
+            pass
+        sock.settimeout(self.timeout)
+        self._socket = sock
+
+    def _close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _acquire(self) -> None:
+        """Receive loop; reconnects TCP connections that fail."""
+        while not self._stopping.is_set():
+            try:
+                if self._socket is None:
+                    self._open()
+                    self.reconnects += 1
+                    # A new connection starts a new sequence
+                    self._expected = None
+                if self.protocol == PROTOCOL_TCP:
+                    self._receive_stream()
+                else:
+                    self._receive_datagrams()
+            except _Stopped:
+                return
+            except _EndOfStream:
+                if not self.reconnect:
+                    return
+                logger.info(f"{self.name} closed the connection")
+                self._close()
+                self._stopping.wait(self.reconnect_delay)
+            except OSError as e:
+                if self.protocol == PROTOCOL_UDP or not self.reconnect:
+                    raise
+                logger.warning(f"Connection to {self.name} lost: {e}")
+                self._close()
+                self._stopping.wait(self.reconnect_delay)
+
+    # --- Receiving ---
+
+    def _receive_into(self, view: memoryview) -> None:
+        """Fill a buffer from the TCP stream."""
+        received = 0
+        size = len(view)
+        while received < size:
+            try:
+                count = self._socket.recv_into(view[received:])
+            except socket.timeout:
+                if self._stopping.is_set():
+                    raise _Stopped()
+                continue
+            if count == 0:
+                if received == 0 and view is self._header_view:
+                    raise _EndOfStream()
+                raise ConnectionResetError("Connection closed by the server in the middle of a frame")
+            received += count
+        self.bytes_received += size
+
+    def _parse_header(self) -> Tuple[int, int, float, float]:
+        magic, version, code, channels, samples, sequence, start_time, rate = FRAME_HEADER.unpack_from(self._header)
+        if magic != FRAME_MAGIC or version != PROTOCOL_VERSION:
+            raise ProviderError(f"Invalid frame header from {self.name}")
+        if code != self._dtype_code or channels != self.ring.channels:
+            raise ProviderError(f"Frames from {self.name} are {DTYPE_CODES.get(code)} x {channels}, "
+                                f"expected {self.ring.dtype} x {self.ring.channels}")
+        if rate and rate != self.ring.sample_rate:
+            self.ring.sample_rate = rate
+            self.ring._ramp = None
+            self._metadata["sample_rate"] = rate
+        return samples, sequence, start_time, rate
+
+    def _late(self, sequence: int) -> bool:
+        """Whether a frame is older than the expected one by at most the reorder window."""
+        return self._expected is not None and 0 < self._expected - sequence <= self.reorder_window
+
+    def _accept_sequence(self, sequence: int, ordered: bool) -> bool:
+        """Track the frame counter; returns False for late frames, which are dropped."""
+        if not ordered and self._late(sequence):
+            self.frames_late += 1
+            return False
+        expected = self._expected
+        if expected is not None and sequence != expected:
+            if sequence > expected:
+                self.sequence_gaps += 1
+                self.frames_lost += sequence - expected
+            else:
+                # Further back than reordering explains: the sender restarted its counter
+                self.restarts += 1
+        self._expected = sequence + 1
+        self.frames_received += 1
+        return True
+
+    def _receive_stream(self) -> None:
+        """Receive frames from the TCP stream straight into the ring."""
+        while not self._stopping.is_set():
+            self._receive_into(self._header_view)
+            samples, sequence, start_time, rate = self._parse_header()
+            self._accept_sequence(sequence, ordered=True)
+
+            done = 0
+            while done < samples:
+                target = self.ring.reserve(samples - done)
+                self._receive_into(memoryview(target).cast('B'))
+                part_start = start_time + done / rate if rate else None
+                self.ring.commit(len(target), start_time=part_start)
+                done += len(target)
+
+    def _discard_datagram(self) -> None:
+        """Consume the pending datagram without storing it."""
+        self.bytes_received += self._socket.recv_into(self._header_view)
+
+    def _receive_datagrams(self) -> None:
+        """Receive one frame per datagram straight into the ring."""
+        max_samples = min((MAX_DATAGRAM - HEADER_SIZE) // self._sample_bytes, self.ring.capacity)
+        scatter = hasattr(self._socket, "recvmsg_into")
+        if not scatter and self._datagram is None:
+            self._datagram = bytearray(MAX_DATAGRAM)
+
+        while not self._stopping.is_set():
+            try:
+                if scatter:
+                    # Peek at the header to reserve only the samples of this frame
+                    size = self._socket.recv_into(self._header_view, HEADER_SIZE, socket.MSG_PEEK)
+                else:
+                    size = self._socket.recv_into(self._datagram)
+                    self.bytes_received += size
+                    self._header[:] = self._datagram[:HEADER_SIZE]
+            except socket.timeout:
+                continue
+
+            if size < HEADER_SIZE:
+                logger.warning(f"Dropped malformed datagram from {self.name}")
+                if scatter:
+                    self._discard_datagram()
+                continue
+            samples, sequence, start_time, _ = self._parse_header()
+            if samples > max_samples or self._late(sequence):
+                if samples > max_samples:
+                    logger.warning(f"Dropped datagram with a bad length from {self.name}")
+                else:
+                    self.frames_late += 1
+                if scatter:
+                    self._discard_datagram()
+                continue
+
+            target = self.ring.reserve(samples)
+            if scatter:
+                # Header and payload land in separate buffers; the payload in the ring
+                size, _, flags, _ = self._socket.recvmsg_into([self._header_view, memoryview(target).cast('B')])
+                self.bytes_received += size
+                if flags & getattr(socket, "MSG_TRUNC", 0):
+                    size = -1
+            if samples * self._sample_bytes != size - HEADER_SIZE:
+                logger.warning(f"Dropped datagram with a bad length from {self.name}")
+                self.ring.commit(0)
+                continue
+            self._accept_sequence(sequence, ordered=False)
+            if not scatter:
+                target.reshape(-1).view(np.uint8)[:size - HEADER_SIZE] = \
+                    np.frombuffer(self._datagram, np.uint8, size - HEADER_SIZE, HEADER_SIZE)
+            self.ring.commit(samples, start_time=start_time)
+
+
+# --- Loopback generator ---
+
+def run_generator(host: str = "127.0.0.1", port: int = 0, protocol: str = PROTOCOL_TCP,
+                  dtype: Any = np.int16, channels: int = 1, frame_size: int = 4096,
+                  sample_rate: float = 1e6, frames: Optional[int] = None, realtime: bool = False,
+                  skip_every: Optional[int] = None, connections: Optional[int] = 1, ready=None) -> None:
+    """
+    Send a test stream: a counting ramp, where sample k of channel c is k * channels + c.
+
+    Over TCP the generator listens on (host, port) and streams to each client
+    that connects; over UDP it sends datagrams to (host, port).
+
+    Args:
+        host: Listen address (TCP) or destination (UDP)
+        port: Listen port, 0 for any (TCP) or destination port (UDP)
+        protocol: "tcp" or "udp"
+        dtype: Sample dtype (the ramp wraps around for integer types)
+        channels: Channels per sample
+        frame_size: Samples per frame
+        sample_rate: Sample rate written into the frames
+        frames: Frames per connection (endless if None)
+        realtime: Pace the frames at the sample rate instead of sending as fast as possible
+        skip_every: Leave out every n-th frame (its sequence number is still used)
+        connections: TCP connections served before returning (endless if None)
+        ready: Callable receiving the listen port once the generator is ready
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    if protocol == PROTOCOL_UDP and frame_size * channels * dtype.itemsize > MAX_DATAGRAM - HEADER_SIZE:
+        raise ValueError("Frames do not fit in a datagram")
+
+    ramp = np.arange(frame_size * channels, dtype=np.int64)
+    counter = np.empty_like(ramp)
+    payload = np.empty(frame_size * channels, dtype=dtype)
+    header = bytearray(HEADER_SIZE)
+    buffers = [header, memoryview(payload).cast('B')]
+    code = dtype_code(dtype)
+
+    def send_frames(sock: socket.socket, address: Optional[Tuple[str, int]]) -> None:
+        started = time.monotonic()
+        sequence = 0
+        while frames is None or sequence < frames:
+            first = sequence * frame_size
+            if realtime:
+                delay = started + first / sample_rate - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            if skip_every and (sequence + 1) % skip_every == 0:
+                sequence += 1
+                continue
+            np.add(ramp, first * channels, out=counter)
+            np.copyto(payload, counter, casting='unsafe')
+            FRAME_HEADER.pack_into(header, 0, FRAME_MAGIC, PROTOCOL_VERSION, code, channels, frame_size,
+                                   sequence, first / sample_rate, sample_rate)
+            if address is None:
+                sock.sendall(header)
+                sock.sendall(payload)
+            else:
+                sock.sendmsg(buffers, [], 0, address)
+            sequence += 1
+
+    if protocol == PROTOCOL_UDP:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            if ready is not None:
+                ready(port)
+            send_frames(sock, (host, port))
+        return
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host, port))
+        server.listen(1)
+        if ready is not None:
+            ready(server.getsockname()[1])
+
+        served = 0
+        while connections is None or served < connections:
+            client, _ = server.accept()
+            served += 1
+            with client:
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                try:
+                    send_frames(client, None)
+                except OSError as e:
+                    logger.info(f"Generator client disconnected: {e}")
+
+
+def _generator_process(connection, settings) -> None:
+    run_generator(ready=connection.send, **settings)
+
+
+def start_generator(protocol: str = PROTOCOL_TCP, port: int = 0, timeout: float = 10.0,
+                    **settings) -> Tuple[multiprocessing.Process, int]:
+    """
+    Start run_generator() in a separate process.
+
+    Args:
+        protocol: "tcp" or "udp"
+        port: Listen port, 0 for any (TCP) or destination port (UDP)
+        timeout: Seconds to wait for the generator to start
+        **settings: Other run_generator() arguments
+
+    Returns:
+        (process, port): the daemon process and its listen (TCP) or destination (UDP) port
+
+    Raises:
+        RuntimeError: If the generator does not start in time
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    settings = dict(settings, protocol=protocol, port=port)
+    process = multiprocessing.Process(target=_generator_process, args=(sender, settings),
+                                      name="signal-generator", daemon=True)
+    process.start()
+    sender.close()
+    if not receiver.poll(timeout):
+        process.terminate()
+        raise RuntimeError("Signal generator did not start")
+    return process, receiver.recv()
+
+
+def main(argv=None) -> int:
+    """Command line entry point of the loopback generator."""
+    parser = argparse.ArgumentParser(
+        prog="python -m signals_system.providers.network",
+        description="Serve a counting test stream in the live frame protocol.")
+    parser.add_argument("--host", default="127.0.0.1", help="listen address (tcp) or destination (udp)")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--protocol", choices=[PROTOCOL_TCP, PROTOCOL_UDP], default=PROTOCOL_TCP)
+    parser.add_argument("--dtype", default="int16")
+    parser.add_argument("--channels", type=int, default=1)
+    parser.add_argument("--frame-size", type=int, default=4096)
+    parser.add_argument("--rate", type=float, default=1e6, help="sample rate in Hz")
+    parser.add_argument("--frames", type=int, help="frames per connection (endless by default)")
+    parser.add_argument("--realtime", action="store_true", help="pace frames at the sample rate")
+    args = parser.parse_args(argv)
+
+    try:
+        run_generator(args.host, args.port, args.protocol, args.dtype, args.channels, args.frame_size,
+                      args.rate, args.frames, args.realtime, connections=None,
+                      ready=lambda port: print(f"Serving on {args.protocol}://{args.host}:{port}", file=sys.stderr))
+    except KeyboardInterrupt:
+        pass
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+"""
+Replay Signal Provider Module
+
+This module implements a live provider that plays back a recording, so the
+live display and processing path can be driven and soak-tested without an
+instrument. The recording is read with read_chunk() and written into the
+live ring buffer frame by frame, paced by the recording's timestamps at
+real time, at N times real time, or as fast as possible.
+
+Frames are scheduled against absolute deadlines on the monotonic clock,
+so sleep overshoot does not accumulate into drift: a late frame makes the
+following ones wait less. The last moments before a deadline are spent
+spinning instead of sleeping for sub-millisecond precision.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from ..formats.base import SignalFormat, TimeRange, registry
+from .base import ProviderError
+from .file import read_chunks
+from .live import LiveSignalProvider, OVERFLOW_OVERWRITE
+
+logger = logging.getLogger(__name__)
+
+# Deadlines closer than this are waited for by spinning
+SPIN_SECONDS = 0.002
+
+# Frames whose lateness is kept for percentiles
+LATENESS_WINDOW = 4096
+
+
+@dataclass
+class ReplayStats:
+    """Pacing statistics of a replay."""
+
+    # Frames and samples written to the ring
+    frames: int = 0
+    samples: int = 0
+
+    # Frames emitted later than the late threshold
+    late_frames: int = 0
+
+    # Lateness of the emitted frames in seconds
+    total_lateness: float = 0.0
+    max_lateness: float = 0.0
+
+    # Times the schedule was moved because the replay fell more than max_lag behind
+    rebases: int = 0
+
+    # Completed passes over the recording
+    loops: int = 0
+
+    # Recording seconds replayed and wall-clock seconds taken
+    recording_seconds: float = 0.0
+    elapsed: float = 0.0
+
+    # Lateness of the most recent frames (circular)
+    recent: np.ndarray = field(default_factory=lambda: np.zeros(LATENESS_WINDOW), repr=False)
+
+    @property
+    def mean_lateness(self) -> float:
+        return self.total_lateness / self.frames if self.frames else 0.0
+
+    @property
+    def speed(self) -> float:
+        """Achieved speed as a multiple of real time."""
+        return self.recording_seconds / self.elapsed if self.elapsed > 0 else 0.0
+
+    def lateness_percentile(self, q: float) -> float:
+        """Percentile (0-100) of the lateness over the most recent frames."""
+        count = min(self.frames, LATENESS_WINDOW)
+        return float(np.percentile(self.recent[:count], q)) if count else 0.0
+
+
+class ReplaySignalProvider(LiveSignalProvider):
+    """
+    Live provider that plays back a recording in any format.
+
+    Consumers use the same readers as for live data. With `speed` None the
+    recording is written as fast as readers allow; combine it with
+    overflow="block" to deliver every sample, or keep the default
+    "overwrite" to see how the pipeline copes with overruns.
+
+    Example:
+        provider = ReplaySignalProvider("capture.sigbin", speed=4.0, frame_rate=50)
+        with provider:
+            reader = provider.reader()
+            while (frame := reader.next_frame(timeout=1.0)) is not None:
+                process(frame)
+        print(provider.stats.mean_lateness, provider.stats.lateness_percentile(99))
+    """
+
+    def __init__(self, source: Union[str, Path], signal_format: Optional[Union[str, SignalFormat]] = None,
+                 speed: Optional[float] = 1.0, frame_size: Optional[int] = None,
+                 frame_rate: Optional[float] = None, loop: bool = False, max_lag: Optional[float] = 1.0,
+                 late_threshold: float = 0.001, start_time: Optional[float] = None,
+                 end_time: Optional[float] = None, chunk_size: int = 65536,
+                 buffer_size: int = LiveSignalProvider.DEFAULT_BUFFER_SIZE,
+                 overflow: str = OVERFLOW_OVERWRITE, timestamps: bool = True, precise: bool = True):
+        """
+        Initialize the provider.
+
+        Args:
+            source: File path of the recording
+            signal_format: Format name or instance; detected from the file if None
+            speed: Multiple of real time, None to replay as fast as possible
+            frame_size: Samples written to the ring at a time (and per reader frame)
+            frame_rate: Frames per second of recording time, used for the frame size
+            loop: Start over at the end of the recording; timestamps keep increasing
+            max_lag: Seconds behind schedule after which the schedule is moved
+                     instead of catching up with a burst (never if None)
+            late_threshold: Lateness in seconds above which a frame counts as late
+            start_time: Replay from this recording time
+            end_time: Replay up to this recording time
+            chunk_size: Samples per read for formats without streaming support
+            buffer_size: Samples kept in the ring
+            overflow: Ring overflow policy
+            timestamps: Store a timestamp per sample
+            precise: Spin for the last SPIN_SECONDS before each deadline
+
+        Raises:
+            ProviderError: If the recording cannot be read
+            ValueError: If the speed is not positive
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None for as fast as possible")
+
+        self.source = Path(source)
+        try:
+            if signal_format is None:
+                signal_format = registry.get_for_file(self.source)
+            elif isinstance(signal_format, str):
+                signal_format = registry.get_format(signal_format)
+            metadata = dict(signal_format.get_metadata(self.source))
+            # The first chunk tells the shape, dtype and rate the ring needs
+            chunks = self._read(signal_format, start_time, end_time, chunk_size)
+            try:
+                first = next(chunks, None)
+            finally:
+                chunks.close()
+        except ProviderError:
+            raise
+        except Exception as e:
+            raise ProviderError(f"Cannot open {self.source}: {e}") from e
+        if first is None:
+            raise ProviderError(f"{self.source} has no samples to replay")
+
+        values = np.asarray(first.values)
+        sample_rate = metadata.get("sample_rate") or first.sample_rate
+        super().__init__(buffer_size=buffer_size, channels=values.shape[1] if values.ndim > 1 else 1,
+                         dtype=values.dtype, sample_rate=float(sample_rate) if sample_rate else None,
+                         frame_size=frame_size, frame_rate=frame_rate, overflow=overflow,
+                         timestamps=timestamps, metadata=metadata)
+        # The recording takes the place of the polled source
+        self.source = Path(source)
+        self.format = signal_format
+        self.speed = speed
+        self.loop = loop
+        self.max_lag = max_lag
+        self.late_threshold = late_threshold
+        self.start_time = start_time
+        self.end_time = end_time
+        self.chunk_size = chunk_size
+        self.precise = precise
+        self.stats = ReplayStats()
+
+    @property
+    def name(self) -> str:
+        return f"replay:{self.source.name}"
+
+    def _read(self, signal_format: SignalFormat, start_time: Optional[float], end_time: Optional[float],
+              chunk_size: int):
+        time_range = None
+        if start_time is not None or end_time is not None:
+            time_range = TimeRange(start=start_time, end=end_time)
+        return read_chunks(signal_format, self.source, chunk_size, time_range, lazy=False)
+
+    # --- Scheduling ---
+
+    def _wait_until(self, deadline: float) -> bool:
+        """Wait for a deadline on the monotonic clock; returns False if stopping."""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if remaining > SPIN_SECONDS or not self.precise:
+                if self._stopping.wait(remaining - SPIN_SECONDS if self.precise else remaining):
+                    return False
+            elif self._stopping.is_set():
+                return False
+
+    def _record_lateness(self, lateness: float) -> None:
+        stats = self.stats
+        stats.recent[stats.frames % LATENESS_WINDOW] = lateness
+        stats.frames += 1
+        stats.total_lateness += lateness
+        if lateness > stats.max_lateness:
+            stats.max_lateness = lateness
+        if lateness > self.late_threshold:
+            stats.late_frames += 1
+
+    def _acquire(self) -> None:
+        """Replay loop: write frame after frame into the ring at its scheduled time."""
+        stats = self.stats = ReplayStats()
+        rate = self.ring.sample_rate
+        period = 1.0 / rate if rate else 0.0
+        frame_size = self.frame_size
+        started = time.monotonic()
+
+        origin = None        # (monotonic time, recording time) the schedule is anchored to
+        offset = 0.0         # Recording time added per completed loop
+        shifted = None       # Preallocated timestamps shifted by the loop offset
+        position = 0         # Samples read in this pass, for recordings without timestamps
+        first_time = last_time = None
+
+        while not self._stopping.is_set():
+            for chunk in self._read(self.format, self.start_time, self.end_time, self.chunk_size):
+                values = np.asarray(chunk.values)
+                timestamps = chunk.timestamps
+                for start in range(0, len(values), frame_size):
+                    end = min(start + frame_size, len(values))
+                    if timestamps is not None:
+                        frame_time = float(timestamps[start])
+                        last_time = float(timestamps[end - 1])
+                    elif rate:
+                        frame_time = (position + start) / rate
+                        last_time = (position + end - 1) / rate
+                    else:
+                        raise ProviderError(f"{self.source} has neither timestamps nor a sample rate")
+                    if first_time is None:
+                        first_time = frame_time
+
+                    if self.speed is not None:
+                        if origin is None:
+                            origin = (time.monotonic(), frame_time + offset)
+                        # Like an acquisition, a frame is complete one sample period after its last sample
+                        deadline = origin[0] + (last_time + period + offset - origin[1]) / self.speed
+                        if not self._wait_until(deadline):
+                            return
+                        lateness = time.monotonic() - deadline
+                        if self.max_lag is not None and lateness > self.max_lag:
+                            # Too far behind to catch up: continue the schedule from now
+                            origin = (origin[0] + lateness, origin[1])
+                            stats.rebases += 1
+                        self._record_lateness(lateness)
+                    else:
+                        self._record_lateness(0.0)
+
+                    frame_timestamps = None
+                    if timestamps is not None:
+                        frame_timestamps = timestamps[start:end]
+                        if offset:
+                            if shifted is None:
+                                shifted = np.empty(frame_size, dtype=np.float64)
+                            frame_timestamps = np.add(frame_timestamps, offset, out=shifted[:end - start])
+
+                    self.ring.write(values[start:end], frame_timestamps)
+                    stats.samples += end - start
+                    stats.recording_seconds = last_time + period - first_time + offset
+                    stats.elapsed = time.monotonic() - started
+                    if self._stopping.is_set():
+                        return
+                position += len(values)
+
+            stats.loops += 1
+            if not self.loop or first_time is None:
+                return
+            # The next pass continues one sample period after the last sample
+            offset += last_time + period - first_time
+            position = 0
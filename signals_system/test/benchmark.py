@@ -0,0 +1,244 @@
+"""
+Performance regression benchmarks for the signals_system.formats package
+
+Every registered format is timed over sizes, channel counts and dtypes for
+write, read, read_time_range, get_metadata and streaming chunk I/O, with the
+tracemalloc peak of each operation. The ADC codec is timed on its own and
+through ADC-compressed binary frames, with zlib as the reference. Results are written as JSON and compared
+with a baseline; a benchmark fails when its throughput drops below the
+baseline by more than the tolerance.
+
+The benchmarks are opt-in, run them explicitly:
+    python -m pytest -q signals_system/test/benchmark.py
+
+Environment variables:
+    SIGNALS_BENCH_SIZES      Sample counts, e.g. "1e3,1e5,1e6,1e7,1e8" (default "1e3,1e5")
+    SIGNALS_BENCH_CHANNELS   Channel counts (default "1,4")
+    SIGNALS_BENCH_DTYPES     Value dtypes (default "float64,float32,int16")
+    SIGNALS_BENCH_FORMATS    Format names (default: every registered format)
+    SIGNALS_BENCH_CODES      Integer dtypes for the ADC codec (default "int8,int16,int32")
+    SIGNALS_BENCH_TEXT_MAX   Largest size run for text formats (default 1e6)
+    SIGNALS_BENCH_BASELINE   Baseline file (default benchmark_baseline.json next to this file)
+    SIGNALS_BENCH_RESULTS    File the results of the run are written to
+    SIGNALS_BENCH_UPDATE     "1" to write the results of this run as the new baseline
+    SIGNALS_BENCH_TOLERANCE  Allowed throughput drop as a fraction (default 0.25)
+"""
+
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+
+import pytest
+import numpy as np
+
+# Add project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from signals_system.formats import base
+from signals_system.formats import adc_codec
+from signals_system.formats.base import SignalData, TimeRange, FormatCapability, SignalFormatError
+from signals_system.formats.protobuf_format import BinaryFrameFormat
+
+
+def _env_list(name, default, convert=str):
+    return [convert(item.strip()) for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
+SIZES = _env_list("SIGNALS_BENCH_SIZES", "1e3,1e5", lambda item: int(float(item)))
+CHANNELS = _env_list("SIGNALS_BENCH_CHANNELS", "1,4", int)
+DTYPES = _env_list("SIGNALS_BENCH_DTYPES", "float64,float32,int16")
+FORMATS = _env_list("SIGNALS_BENCH_FORMATS", ",".join(base.registry.names))
+CODES = _env_list("SIGNALS_BENCH_CODES", "int8,int16,int32")
+TEXT_FORMATS = {"JSON", "CSV"}
+TEXT_MAX = int(float(os.environ.get("SIGNALS_BENCH_TEXT_MAX", "1e6")))
+BASELINE = Path(os.environ.get("SIGNALS_BENCH_BASELINE", Path(__file__).with_name("benchmark_baseline.json")))
+RESULTS = os.environ.get("SIGNALS_BENCH_RESULTS")
+UPDATE = os.environ.get("SIGNALS_BENCH_UPDATE") == "1"
+TOLERANCE = float(os.environ.get("SIGNALS_BENCH_TOLERANCE", "0.25"))
+
+STREAM_CHUNK = 65536
+SAMPLE_RATE = 1024.0
+
+# Results of this run, keyed like the baseline
+_results = {}
+
+
+def _load_baseline():
+    if not BASELINE.exists():
+        return {}
+    with open(BASELINE) as f:
+        return json.load(f).get("results", {})
+
+
+_baseline = _load_baseline()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _report():
+    """Write the results when the module finishes."""
+    yield
+    if not _results:
+        return
+    document = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": _results,
+    }
+    targets = [Path(RESULTS)] if RESULTS else []
+    if UPDATE:
+        merged = dict(_baseline)
+        merged.update(_results)
+        targets.append(BASELINE)
+        document = dict(document, results=merged)
+    for target in targets:
+        with open(target, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+
+def _make_data(n, channels, dtype):
+    """Scope-like test signal: a noisy sine as codes of the requested dtype."""
+    rng = np.random.default_rng(n)
+    t = np.arange(n) / SAMPLE_RATE
+    wave = np.sin(2 * np.pi * 5.0 * t)[:, None] * 1000.0 + rng.normal(0, 3.0, (n, channels))
+    values = wave.astype(dtype) if channels > 1 else wave[:, 0].astype(dtype)
+    return SignalData(values=values, timestamps=t, metadata={"units": "V", "sample_rate": SAMPLE_RATE})
+
+
+def _measure(operation, repeat):
+    """Best wall time of `repeat` runs, then the tracemalloc peak of one more run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def _record(key, nbytes, seconds, peak):
+    """Store a result and fail if its throughput regressed against the baseline."""
+    result = {
+        "seconds": seconds,
+        "mb_s": nbytes / seconds / 1e6 if seconds > 0 else float("inf"),
+        "peak_mb": peak / 1e6,
+    }
+    _results[key] = result
+
+    expected = _baseline.get(key)
+    if expected is None or UPDATE:
+        return
+    floor = expected["mb_s"] * (1.0 - TOLERANCE)
+    assert result["mb_s"] >= floor, (
+        f"{key}: {result['mb_s']:.1f} MB/s is below the baseline {expected['mb_s']:.1f} MB/s "
+        f"(tolerance {TOLERANCE:.0%})")
+
+
+def _stream_write(signal_format, path, data):
+    stream = signal_format.open_stream(path, 'w')
+    try:
+        for start in range(0, len(data.values), STREAM_CHUNK):
+            end = start + STREAM_CHUNK
+            signal_format.write_chunk(stream, SignalData(values=data.values[start:end],
+                                                         timestamps=data.timestamps[start:end]))
+    finally:
+        signal_format.close_stream(stream)
+
+
+def _stream_read(signal_format, path):
+    stream = signal_format.open_stream(path, 'r')
+    try:
+        while signal_format.read_chunk(stream) is not None:
+            pass
+    finally:
+        signal_format.close_stream(stream)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("channels", CHANNELS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_format_throughput(tmp_path, format_name, size, channels, dtype):
+    """Time every operation of a format on one data shape"""
+    if format_name == "hdf5":
+        pytest.importorskip("h5py")
+    signal_format = base.registry.get_format(format_name)
+    if signal_format.name in TEXT_FORMATS and size > TEXT_MAX:
+        pytest.skip(f"text formats are limited to {TEXT_MAX} samples")
+    if channels > 1 and not signal_format.has_capability(FormatCapability.MULTI_CHANNEL):
+        pytest.skip(f"{signal_format.name} is single channel")
+
+    data = _make_data(size, channels, dtype)
+    nbytes = data.values.nbytes
+    path = tmp_path / f"bench{signal_format.extensions[0]}"
+    key = f"{signal_format.name}/{size}/{channels}/{dtype}"
+    repeat = 3 if size <= 100000 else 1
+
+    try:
+        signal_format.write(path, data)
+    except SignalFormatError as e:
+        pytest.skip(f"{signal_format.name} cannot store this data: {e}")
+
+    _record(f"{key}/write", nbytes, *_measure(lambda: signal_format.write(path, data), repeat))
+    _record(f"{key}/read", nbytes, *_measure(lambda: signal_format.read(path), repeat))
+    _record(f"{key}/get_metadata", nbytes, *_measure(lambda: signal_format.get_metadata(path), repeat))
+
+    if signal_format.supports_random_access(path):
+        # A tenth of the recording from its middle
+        duration = size / SAMPLE_RATE
+        time_range = TimeRange(start=duration * 0.45, end=duration * 0.55)
+        _record(f"{key}/read_time_range", nbytes // 10,
+                *_measure(lambda: signal_format.read_time_range(path, time_range), repeat))
+
+    if signal_format.supports_streaming():
+        stream_path = tmp_path / f"stream{signal_format.extensions[0]}"
+        _record(f"{key}/stream_write", nbytes,
+                *_measure(lambda: _stream_write(signal_format, stream_path, data), repeat))
+        _record(f"{key}/stream_read", nbytes,
+                *_measure(lambda: _stream_read(signal_format, stream_path), repeat))
+
+
+@pytest.mark.parametrize("dtype", CODES)
+@pytest.mark.parametrize("channels", CHANNELS)
+@pytest.mark.parametrize("size", SIZES)
+def test_adc_codec_throughput(tmp_path, size, channels, dtype):
+    """Time the ADC codec, ADC-compressed frames and zlib on scope-like codes"""
+    data = _make_data(size, channels, dtype)
+    values = data.values
+    nbytes = values.nbytes
+    key = f"ADC/{size}/{channels}/{dtype}"
+    repeat = 3 if size <= 100000 else 1
+
+    encoded = adc_codec.encode(values)
+    assert np.array_equal(adc_codec.decode(encoded, values.dtype, multi_channel=channels > 1), values)
+    _record(f"{key}/encode", nbytes, *_measure(lambda: adc_codec.encode(values), repeat))
+    _record(f"{key}/decode", nbytes,
+            *_measure(lambda: adc_codec.decode(encoded, values.dtype, multi_channel=channels > 1), repeat))
+
+    compressed = zlib.compress(values.tobytes(), 1)
+    _record(f"{key}/zlib_compress", nbytes, *_measure(lambda: zlib.compress(values.tobytes(), 1), repeat))
+    _record(f"{key}/zlib_decompress", nbytes, *_measure(lambda: zlib.decompress(compressed), repeat))
+
+    # Frames written without timestamps, so only the codes are timed
+    frames = BinaryFrameFormat(compression="adc")
+    path = tmp_path / "bench.sigbin"
+    codes = SignalData(values=values, metadata={"sample_rate": SAMPLE_RATE})
+    _record(f"{key}/frame_write", nbytes, *_measure(lambda: frames.write(path, codes), repeat))
+    _record(f"{key}/frame_read", nbytes, *_measure(lambda: frames.read(path), repeat))
@@ -0,0 +1,311 @@
+"""
+Tests for the signals_system.io package
+
+This module contains tests for batch reading and other file I/O utilities.
+"""
+
+import os
+import sys
+import queue
+import threading
+import time
+import pytest
+import numpy as np
+
+# Add project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from signals_system.formats.base import SignalData, TimeRange, SignalFormatError
+from signals_system.formats.protobuf_format import BinaryFrameFormat
+from signals_system.formats.json_format import JsonFormat
+from signals_system.formats.csv_format import CsvFormat
+from signals_system.formats.numpy_format import NumpyFormat
+from signals_system.io.reader import BatchReader, read_batch, resolve_paths
+from signals_system.io.writer import BackgroundWriter
+from signals_system.io.convert import convert, main as convert_main
+from signals_system.io.scrub import Scrubber, scrub, main as scrub_main
+
+
+def _signal(n=100, offset=0.0):
+    return SignalData(values=np.arange(n, dtype=float) + offset, timestamps=np.arange(n) * 0.01,
+                      metadata={"capture": int(offset)})
+
+
+@pytest.fixture
+def session(tmp_path):
+    """A directory of captures in two formats plus one corrupt file."""
+    for i in range(6):
+        BinaryFrameFormat().write(tmp_path / f"capture_{i}.sigbin", _signal(offset=i))
+    JsonFormat().write(tmp_path / "capture_6.json", _signal(offset=6))
+    (tmp_path / "capture_7.sigbin").write_bytes(b"PSDFRM\x07\x00garbage")
+    return tmp_path
+
+
+class TestBatchReader:
+    """Tests for the BatchReader class"""
+
+    def test_resolve_paths(self, session):
+        """Test glob, directory and list resolution"""
+        assert len(resolve_paths(str(session / "*.sigbin"))) == 7
+        assert len(resolve_paths(session)) == 8
+        paths = [session / "capture_1.sigbin", str(session / "*.json")]
+        assert [p.name for p in resolve_paths(paths)] == ["capture_1.sigbin", "capture_6.json"]
+
+    def test_read_all(self, session):
+        """Test reading a session with a per-file error channel"""
+        with BatchReader(session, max_workers=3, prefetch=2) as reader:
+            results = reader.read_all()
+
+        assert len(results) == 8
+        assert [r.index for r in results] == list(range(8))
+        for i, result in enumerate(results[:7]):
+            assert result.ok
+            assert result.data.metadata["capture"] == i
+            assert result.data.values[0] == i
+        assert results[6].format_name == "JSON"
+
+        assert not results[7].ok
+        assert isinstance(results[7].error, SignalFormatError)
+        assert reader.errors == [results[7]]
+
+    def test_ordered_and_time_range(self, session):
+        """Test in-order delivery and time range reads"""
+        results = list(read_batch(str(session / "capture_[0-5].sigbin"), max_workers=4, ordered=True,
+                                  time_range=TimeRange(start=0.2, end=0.29)))
+        assert [r.path.name for r in results] == [f"capture_{i}.sigbin" for i in range(6)]
+        assert all(r.data.num_samples == 10 for r in results)
+
+    def test_lazy(self, session):
+        """Test opening files lazily"""
+        results = list(read_batch(str(session / "capture_[0-2].sigbin"), lazy=True))
+        for result in results:
+            assert result.data.num_samples == 100
+            result.data.close()
+
+    def test_prefetch_bound(self, session, monkeypatch):
+        """Test that no more than `prefetch` files are read ahead of the caller"""
+        in_flight = []
+        lock = threading.Lock()
+        original = BatchReader._read
+
+        def tracking_read(self, index, path):
+            with lock:
+                in_flight.append(index)
+            return original(self, index, path)
+
+        monkeypatch.setattr(BatchReader, "_read", tracking_read)
+        reader = BatchReader(session, max_workers=2, prefetch=2)
+        iterator = iter(reader)
+        next(iterator)
+        assert len(in_flight) <= 3
+        iterator.close()
+        reader.close()
+
+
+class TestBackgroundWriter:
+    """Tests for the BackgroundWriter class"""
+
+    def test_coalesced_writes(self, tmp_path):
+        """Test that small chunks are batched and read back unchanged"""
+        path = tmp_path / "capture.sigbin"
+        chunks = [_signal(n=50, offset=i * 50) for i in range(40)]
+        for i, chunk in enumerate(chunks):
+            chunk.timestamps = chunk.timestamps + i * 0.5
+            chunk.metadata = {"units": "V"}
+
+        with BackgroundWriter(path, queue_size=100, batch_bytes=1 << 20) as writer:
+            gate = threading.Event()
+            original = writer.format.write_chunk
+
+            def slow_write_chunk(stream, data):
+                gate.wait(5)
+                original(stream, data)
+
+            writer.format.write_chunk = slow_write_chunk
+            for chunk in chunks:
+                writer.write(chunk)
+            gate.set()
+
+        assert writer.chunks_written == 40
+        assert writer.batches_written < 40
+        data = BinaryFrameFormat().read(path)
+        assert np.array_equal(data.values, np.arange(2000, dtype=float))
+
+    def test_backpressure(self, tmp_path):
+        """Test that a full queue blocks or raises instead of growing"""
+        gate = threading.Event()
+        writer = BackgroundWriter(tmp_path / "capture.sigbin", queue_size=2)
+        original = writer.format.write_chunk
+
+        def blocked_write_chunk(stream, data):
+            gate.wait(5)
+            original(stream, data)
+
+        writer.format.write_chunk = blocked_write_chunk
+        with pytest.raises(queue.Full):
+            for i in range(10):
+                writer.write(_signal(n=10), block=False)
+        gate.set()
+        writer.close()
+        assert writer.chunks_written >= 2
+
+    def test_error_channel(self, tmp_path):
+        """Test that writer thread errors surface in the caller"""
+        writer = BackgroundWriter(tmp_path / "capture.sigbin", fsync_interval=0.0, copy=True)
+        writer.write(_signal(n=10))
+        writer.write(SignalData(values=np.zeros((10, 2))))
+        with pytest.raises(SignalFormatError):
+            writer.close()
+        with pytest.raises(SignalFormatError):
+            writer.write(_signal(n=10))
+
+    def test_flush_bytes(self, tmp_path):
+        """Test that chunks are only flushed once flush_bytes have been written"""
+        path = tmp_path / "capture.sigbin"
+        signal_format = BinaryFrameFormat()
+        writer = BackgroundWriter(path, signal_format, flush_bytes=1 << 20)
+        size = os.path.getsize(path)
+        for i in range(5):
+            writer.write(_signal(n=10, offset=i * 10))
+        while writer.chunks_written < 5:
+            threading.Event().wait(0.001)
+
+        assert os.path.getsize(path) == size
+        assert signal_format.flush_chunks and not writer.format.flush_chunks
+        writer.close()
+        assert BinaryFrameFormat().read(path).num_samples == 50
+
+    def test_idle_fsync(self, tmp_path):
+        """Test that the fsync interval holds while the producer is idle"""
+        path = tmp_path / "capture.sigbin"
+        writer = BackgroundWriter(path, "binary", flush_bytes=1 << 20, fsync_interval=0.1)
+        size = os.path.getsize(path)
+        for i in range(3):
+            writer.write(_signal(n=10, offset=i * 10))
+
+        deadline = time.monotonic() + 5.0
+        while os.path.getsize(path) == size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert writer.chunks_written == 3 and os.path.getsize(path) > size
+        writer.close()
+
+    def test_csv_destination(self, tmp_path):
+        """Test writing through a text format chosen by extension"""
+        path = tmp_path / "capture.csv"
+        with BackgroundWriter(path, flush_bytes=1 << 16) as writer:
+            for i in range(5):
+                writer.write(_signal(n=20, offset=i * 20))
+        assert CsvFormat().read(path).num_samples == 100
+
+
+class TestConvert:
+    """Tests for streaming conversion between formats"""
+
+    @staticmethod
+    def _csv_capture(path, n=5000):
+        data = SignalData(values=np.column_stack([np.sin(np.arange(n) / 10.0), np.arange(n, dtype=float)]),
+                          timestamps=np.arange(n) * 0.001, metadata={"units": "V"})
+        CsvFormat().write(path, data)
+        return data
+
+    def test_csv_to_binary(self, tmp_path):
+        """Test converting in chunks with a small memory budget"""
+        data = self._csv_capture(tmp_path / "capture.csv")
+        source_format = CsvFormat()
+        chunk_size = source_format.chunk_size
+        updates = []
+        state = convert(tmp_path / "capture.csv", tmp_path / "capture.sigbin", source_format, chunk_size=700,
+                        memory_budget=64 << 10, progress=lambda p: updates.append(p.samples))
+        assert source_format.chunk_size == chunk_size
+
+        assert state.samples == 5000
+        assert state.chunks == 8
+        assert updates == sorted(updates) and updates[-1] == 5000
+        converted = BinaryFrameFormat().read(tmp_path / "capture.sigbin")
+        assert np.allclose(converted.values, data.values)
+        assert np.allclose(converted.timestamps, data.timestamps)
+        assert converted.metadata["units"] == "V"
+
+    def test_resample_and_dtype(self, tmp_path):
+        """Test resampling across chunk boundaries and dtype conversion"""
+        data = self._csv_capture(tmp_path / "capture.csv")
+        state = convert(tmp_path / "capture.csv", tmp_path / "capture.npy", chunk_size=333,
+                        resample_rate=250.0, dtype="float32")
+
+        converted = NumpyFormat().read(tmp_path / "capture.npy")
+        assert converted.values.dtype == np.float32
+        assert state.samples == 1250
+        expected = np.interp(np.arange(1250) * 0.004, data.timestamps, data.values[:, 1])
+        assert np.allclose(converted.values[:, 1], expected, atol=1e-3)
+        assert state.total_samples is None
+
+    def test_total_from_lazy_source(self, tmp_path):
+        """Test that sources with lazy storage report the total for progress"""
+        BinaryFrameFormat(chunk_size=100).write(tmp_path / "capture.sigbin", _signal(n=1000))
+        fractions = []
+        convert(tmp_path / "capture.sigbin", tmp_path / "capture.csv", chunk_size=250,
+                progress=lambda p: fractions.append(p.fraction))
+        assert fractions == [0.25, 0.5, 0.75, 1.0]
+        assert np.array_equal(CsvFormat().read(tmp_path / "capture.csv").values, np.arange(1000, dtype=float))
+
+    def test_command_line(self, tmp_path, capsys):
+        """Test the command line entry point"""
+        self._csv_capture(tmp_path / "capture.csv", n=100)
+        assert convert_main([str(tmp_path / "capture.csv"), str(tmp_path / "capture.sigbin"), "--quiet"]) == 0
+        assert BinaryFrameFormat().read(tmp_path / "capture.sigbin").num_samples == 100
+
+        assert convert_main([str(tmp_path / "missing.csv"), str(tmp_path / "out.sigbin"), "--quiet"]) == 1
+        assert "error" in capsys.readouterr().err
+
+
+class TestScrub:
+    """Tests for archive scrubbing"""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        """An archive with intact files, one corrupt frame in a subdirectory and a file of unknown type."""
+        frame_format = BinaryFrameFormat(chunk_size=100)
+        (tmp_path / "day1").mkdir()
+        for i in range(4):
+            folder = tmp_path / "day1" if i >= 2 else tmp_path
+            frame_format.write(folder / f"capture_{i}.sigbin", _signal(n=1000, offset=i))
+        JsonFormat().write(tmp_path / "notes.json", _signal(n=10))
+        (tmp_path / "README.txt").write_text("archive")
+
+        path = tmp_path / "day1" / "capture_2.sigbin"
+        offset = int(frame_format.frame_index(path)[7]['offset']) + 200
+        raw = bytearray(path.read_bytes())
+        raw[offset] ^= 0xFF
+        path.write_bytes(bytes(raw))
+        return tmp_path
+
+    def test_scrub(self, archive):
+        """Test that bad blocks are reported with their file and time range"""
+        seen = []
+        report = scrub(archive, max_workers=3, progress=seen.append)
+
+        assert len(report.files) == 5 and len(seen) == 5
+        assert [p.name for p in report.skipped] == ["README.txt"]
+        assert report.bytes_verified > 0
+        [bad] = report.bad_files
+        assert bad.path.name == "capture_2.sigbin"
+        assert [error.index for error in bad.errors] == [7]
+        assert bad.errors[0].time_range.start == pytest.approx(7.0)
+
+    def test_background_and_command_line(self, archive, capsys):
+        """Test the background scrubber and the command line exit status"""
+        scrubber = Scrubber(str(archive / "**" / "*.sigbin"))
+        scrubber.start()
+        report = scrubber.join(timeout=10)
+        assert len(report.files) == 4 and len(report.bad_files) == 1
+
+        assert scrub_main([str(archive), "--quiet"]) == 2
+        assert "capture_2.sigbin: block 7" in capsys.readouterr().out
+        assert scrub_main([str(archive / "capture_0.sigbin"), "--quiet"]) == 0
+
+        # Nothing to verify is an error, not an intact archive
+        (archive / "empty").mkdir()
+        assert scrub_main([str(archive / "empty"), "--quiet"]) == 1
+        assert "no recordings" in capsys.readouterr().err
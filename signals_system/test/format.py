@@ -23,6 +23,9 @@ from signals_system.formats import base
 from signals_system.formats.base import SignalData, TimeRange, FormatCapability, SignalFormatError
 from signals_system.formats.json_format import JsonFormat
 from signals_system.formats.csv_format import CsvFormat
+from signals_system.formats.numpy_format import NumpyFormat
+from signals_system.formats.hdf5_format import Hdf5Format
+from signals_system.formats.protobuf_format import BinaryFrameFormat
 
 
 class TestSignalData:
@@ -77,6 +80,44 @@ class TestSignalData:
         assert np.array_equal(time_sliced.values, np.array([3.0, 4.0]))
         assert np.array_equal(time_sliced.timestamps, np.array([0.2, 0.3]))
     
+    def test_slice_views(self):
+        """Test that slices of sorted data share memory and copy metadata"""
+        values = np.arange(10, dtype=float)
+        timestamps = np.arange(10) * 0.1
+        data = SignalData(values=values, timestamps=timestamps, metadata={"units": "V"})
+        assert data.timestamps_sorted
+        
+        time_sliced = data.time_slice(TimeRange(start=0.25, end=0.65))
+        assert np.array_equal(time_sliced.values, [3.0, 4.0, 5.0, 6.0])
+        assert np.shares_memory(time_sliced.values, values)
+        assert np.shares_memory(time_sliced.timestamps, timestamps)
+        
+        # Zooming into a view keeps sharing memory, and empty ranges are empty
+        zoomed = time_sliced.time_slice(TimeRange(start=0.4))
+        assert np.array_equal(zoomed.values, [4.0, 5.0, 6.0])
+        assert np.shares_memory(zoomed.values, values)
+        assert data.time_slice(TimeRange(start=0.55, end=0.52)).num_samples == 0
+        
+        # Each slice has its own metadata dict
+        zoomed.metadata["units"] = "mV"
+        data.metadata["channel"] = 1
+        assert data.metadata == {"units": "V", "channel": 1}
+        assert time_sliced.metadata == {"units": "V"}
+        assert zoomed.metadata == {"units": "mV"}
+        
+        # Including a dict taken from the signal before slicing
+        metadata = data.metadata
+        view = data.slice(0, 5)
+        metadata["channel"] = 2
+        assert view.metadata["channel"] == 1
+        
+        # Unsorted timestamps use the masked path, which copies
+        unsorted = SignalData(values=np.arange(4, dtype=float), timestamps=np.array([0.3, 0.1, 0.2, 0.0]))
+        assert not unsorted.timestamps_sorted
+        masked = unsorted.time_slice(TimeRange(start=0.1, end=0.2))
+        assert np.array_equal(masked.values, [1.0, 2.0])
+        assert not np.shares_memory(masked.values, unsorted.values)
+    
     def test_properties(self):
         """Test property calculations"""
         # Test sample rate calculation from metadata
@@ -174,10 +215,9 @@ class TestFormatRegistry:
         assert isinstance(streaming_formats[0], (JsonFormat, CsvFormat))
         assert isinstance(streaming_formats[1], (JsonFormat, CsvFormat))
         
-        # Find formats with random access capability
+        # CSV only has random access for indexed files, so no format advertises it statically
         random_access_formats = registry.find_with_capability(FormatCapability.RANDOM_ACCESS)
-        assert len(random_access_formats) == 1
-        assert isinstance(random_access_formats[0], CsvFormat)
+        assert len(random_access_formats) == 0
     
     def test_global_registry(self):
         """Test the global registry instance"""
@@ -185,6 +225,83 @@ class TestFormatRegistry:
         format_classes = [f.__class__.__name__.lower() for f in base.registry.find_with_capability(FormatCapability.METADATA)]
         assert "jsonformat" in format_classes
         assert "csvformat" in format_classes
+    
+    def test_lazy_registration(self):
+        """Test that lazily registered formats are imported on first use"""
+        registry = base.FormatRegistry()
+        registry.register_lazy("json", ".json_format", "JsonFormat", [".json"])
+        assert "json" in registry.names
+        assert "json" not in registry._formats
+        
+        json_format = registry.get_for_extension(".json")
+        assert isinstance(json_format, JsonFormat)
+        assert registry._formats["json"] is JsonFormat
+        
+        with pytest.raises(ValueError):
+            registry.register(JsonFormat)
+        with pytest.raises(KeyError):
+            registry.get_format("missing")
+    
+    def test_content_detection(self, tmp_path):
+        """Test detection by magic bytes and content, with extension fallback"""
+        data = SignalData(np.arange(5, dtype=float), metadata={"units": "V"})
+        
+        # NumPy content under a misleading extension
+        numpy_path = tmp_path / "capture.dat"
+        with open(numpy_path, 'wb') as f:
+            np.save(f, data.values)
+        assert base.registry.detect(numpy_path) == "numpy"
+        assert base.registry.get_for_file(numpy_path).name == "NUMPY"
+        
+        # JSON and CSV content without a registered extension
+        json_path = tmp_path / "capture.txt"
+        JsonFormat().write(json_path, data)
+        assert base.registry.get_for_file(json_path).name == "JSON"
+        
+        csv_path = tmp_path / "capture.log"
+        CsvFormat().write(csv_path, data)
+        assert base.registry.detect(csv_path) == "csv"
+        
+        # Content wins over the extension, which is only used as a fallback
+        mislabeled = tmp_path / "capture.csv"
+        JsonFormat().write(mislabeled, data)
+        assert base.registry.get_for_file(mislabeled).name == "JSON"
+        assert base.registry.get_for_file(mislabeled, sniff=False).name == "CSV"
+        assert base.registry.get_for_file(tmp_path / "new.csv").name == "CSV"
+        
+        unknown = tmp_path / "notes.csv"
+        unknown.write_text("not, a\nsignal, file\n")
+        assert base.registry.detect(unknown) is None
+        assert base.registry.get_for_file(unknown).name == "CSV"
+    
+    def test_validation_cache(self, tmp_path, monkeypatch):
+        """Test that validate() results are cached per path and mtime"""
+        registry = base.FormatRegistry()
+        registry.register(JsonFormat)
+        path = tmp_path / "capture.json"
+        JsonFormat().write(path, SignalData(np.arange(3, dtype=float)))
+        
+        calls = []
+        original = JsonFormat.validate
+        def counting_validate(self, source):
+            calls.append(source)
+            return original(self, source)
+        monkeypatch.setattr(JsonFormat, "validate", counting_validate)
+        
+        assert registry.is_valid(path)
+        assert registry.is_valid(path)
+        assert len(calls) == 1
+        
+        # Rewriting the file invalidates the cached result
+        path.write_text("{broken")
+        os.utime(path, ns=(0, 0))
+        assert not registry.is_valid(path)
+        assert len(calls) == 2
+        
+        registry.clear_validation_cache()
+        assert not registry.is_valid(path)
+        assert len(calls) == 3
+        assert not registry.is_valid(tmp_path / "missing.json")
 
 
 class TestJsonFormat:
@@ -244,6 +361,77 @@ class TestJsonFormat:
             # Clean up
             os.unlink(tmp_path)
     
+    def test_binary_encoding(self, tmp_path):
+        """Test base64 typed buffers, compression and mixed-encoding reads"""
+        values = np.random.randn(500, 2).astype(np.float32)
+        timestamps = np.arange(500) * 0.001
+        data = SignalData(values=values, timestamps=timestamps, metadata={"unit": "V"})
+        
+        list_path = tmp_path / "list.json"
+        binary_path = tmp_path / "binary.json"
+        JsonFormat().write(list_path, data)
+        JsonFormat(array_encoding="base64", compression="zlib").write(binary_path, data)
+        assert binary_path.stat().st_size < list_path.stat().st_size / 2
+        
+        with open(binary_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["data"]["dtype"] == "<f4"
+        
+        # Any handler reads either encoding
+        read_data = JsonFormat().read(binary_path)
+        assert read_data.values.dtype == np.float32
+        assert np.array_equal(read_data.values, values)
+        assert np.array_equal(read_data.timestamps, timestamps)
+        assert read_data.values.flags.writeable and read_data.timestamps.flags.writeable
+        assert JsonFormat().validate(binary_path)
+        
+        # Appends may mix encodings
+        JsonFormat(array_encoding="base64").write(list_path, SignalData(values=np.ones((1, 2))), append=True)
+        assert JsonFormat().read(list_path).values.shape == (501, 2)
+        
+        with pytest.raises(ValueError):
+            JsonFormat(array_encoding="msgpack")
+    
+    def test_append_layout(self, tmp_path):
+        """Test that appends only add lines after a one-time conversion"""
+        path = tmp_path / "signal.json"
+        json_format = JsonFormat()
+        json_format.write(path, SignalData(values=np.array([1.0, 2.0]), timestamps=np.array([0.0, 0.1]),
+                                           metadata={"unit": "V"}))
+        
+        # The first append converts to the lines layout
+        json_format.write(path, SignalData(values=np.array([3.0]), timestamps=np.array([0.2])), append=True)
+        before = path.read_bytes()
+        json_format.write(path, SignalData(values=np.array([4.0]), timestamps=np.array([0.3]),
+                                           metadata={"unit": "mV"}), append=True)
+        assert path.read_bytes().startswith(before)
+        
+        read_data = json_format.read(path)
+        assert np.array_equal(read_data.values, [1.0, 2.0, 3.0, 4.0])
+        assert np.array_equal(read_data.timestamps, [0.0, 0.1, 0.2, 0.3])
+        assert read_data.metadata["unit"] == "mV"
+        assert json_format.get_metadata(path)["unit"] == "mV"
+        assert json_format.validate(path)
+    
+    def test_stream_appended(self, tmp_path):
+        """Test streaming and converting a file in the lines layout"""
+        from signals_system.io.convert import convert
+        path = tmp_path / "signal.json"
+        json_format = JsonFormat()
+        json_format.write(path, SignalData(values=np.array([1.0, 2.0]), metadata={"unit": "V"}))
+        json_format.write(path, SignalData(values=np.array([3.0]), metadata={"unit": "mV"}), append=True)
+        
+        stream = json_format.open_stream(path, 'r')
+        chunks = []
+        while (chunk := json_format.read_chunk(stream)) is not None:
+            chunks.append(chunk)
+        json_format.close_stream(stream)
+        assert [chunk.values.tolist() for chunk in chunks] == [[1.0, 2.0], [3.0]]
+        assert chunks[0].metadata["unit"] == "V" and chunks[1].metadata["unit"] == "mV"
+        
+        destination = tmp_path / "signal.npy"
+        convert(path, destination)
+        assert np.array_equal(NumpyFormat().read(destination).values, [1.0, 2.0, 3.0])
+    
     def test_get_metadata(self):
         """Test extracting metadata from JSON files"""
         # Create test data
@@ -340,7 +528,7 @@ class TestCsvFormat:
         assert ".csv" in csv_format.extensions
         assert FormatCapability.METADATA in csv_format.capabilities
         assert FormatCapability.STREAMING in csv_format.capabilities
-        assert FormatCapability.RANDOM_ACCESS in csv_format.capabilities
+        assert FormatCapability.RANDOM_ACCESS not in csv_format.capabilities
         assert FormatCapability.MULTI_CHANNEL in csv_format.capabilities
     
     def test_metadata_handling(self):
@@ -370,6 +558,155 @@ class TestCsvFormat:
         assert any("channel_count: 2" in comment for comment in comments)
         assert any("created_at:" in comment for comment in comments)
     
+    def test_append(self, tmp_path):
+        """Test that appends write only new rows and a metadata trailer"""
+        path = tmp_path / "signal.csv"
+        csv_format = CsvFormat(index_interval=2)
+        values = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        csv_format.write(path, SignalData(values=values, timestamps=np.array([0.0, 0.1, 0.2]),
+                                          metadata={"unit": "V"}))
+        csv_format.build_index(path)
+        
+        before = path.read_bytes()
+        csv_format.write(path, SignalData(values=np.array([[7.0, 8.0]]), timestamps=np.array([0.3]),
+                                          metadata={"unit": "mV"}), append=True)
+        assert path.read_bytes().startswith(before)
+        
+        read_data = csv_format.read(path)
+        assert np.array_equal(read_data.values[-1], [7.0, 8.0])
+        assert read_data.metadata["unit"] == "mV"
+        assert csv_format.get_metadata(path)["unit"] == "mV"
+        
+        # The index was extended rather than invalidated
+        assert np.allclose(csv_format.load_index(path)["timestamp"], [0.0, 0.2])
+        
+        with pytest.raises(SignalFormatError):
+            csv_format.write(path, SignalData(values=np.array([1.0]), timestamps=np.array([0.4])), append=True)
+    
+    def test_append_without_timestamps(self, tmp_path):
+        """Test that appended rows continue the time base and trailers reach every reader"""
+        path = tmp_path / "signal.csv"
+        csv_format = CsvFormat(index_interval=2)
+        csv_format.write(path, SignalData(values=np.arange(5.0), metadata={"sample_rate": 10.0, "unit": "V"}))
+        csv_format.write(path, SignalData(values=np.arange(5.0, 8.0), metadata={"unit": "mV"}), append=True)
+        
+        read_data = csv_format.read(path)
+        assert np.allclose(read_data.timestamps, np.arange(8) / 10.0)
+        
+        # The first metadata read indexes the file, including its trailer comments
+        assert csv_format.get_metadata(path) == read_data.metadata
+        assert csv_format.load_index(path) is not None
+        csv_format.write(path, SignalData(values=np.arange(8.0, 10.0), metadata={"gain": "2"}), append=True)
+        
+        read_data = csv_format.read(path)
+        assert np.allclose(read_data.timestamps, np.arange(10) / 10.0)
+        assert np.allclose(csv_format.load_index(path)["timestamp"], [0.0, 0.2, 0.4, 0.6, 0.8])
+        assert csv_format.get_metadata(path) == read_data.metadata
+        
+        partial = csv_format.read_time_range(path, TimeRange(start=0.1, end=0.3))
+        assert np.array_equal(partial.values, [1.0, 2.0, 3.0])
+        assert partial.metadata == read_data.metadata
+        assert partial.metadata["unit"] == "mV" and partial.metadata["gain"] == "2"
+    
+    def test_row_offset_index(self, tmp_path):
+        """Test index building, indexed range reads and invalidation"""
+        path = tmp_path / "signal.csv"
+        values = np.random.randn(1000, 2)
+        timestamps = np.arange(1000) * 0.01
+        csv_format = CsvFormat(index_interval=64)
+        csv_format.write(path, SignalData(values=values, timestamps=timestamps))
+        
+        assert csv_format.load_index(path) is None
+        assert not csv_format.supports_random_access(path)
+        
+        result = csv_format.read_time_range(path, TimeRange(start=5.0, end=5.5))
+        assert np.allclose(result.timestamps, timestamps[500:551])
+        assert np.allclose(result.values, values[500:551])
+        
+        # The first range read built the sidecar index
+        index = csv_format.load_index(path)
+        assert len(index) == 16
+        assert np.allclose(index["timestamp"], timestamps[::64])
+        assert FormatCapability.RANDOM_ACCESS in csv_format.get_capabilities(path)
+        
+        # Rewriting the file invalidates the index
+        csv_format.write(path, SignalData(values=values[:10], timestamps=timestamps[:10]))
+        assert csv_format.load_index(path) is None
+    
+    def test_stream_index(self, tmp_path):
+        """Test that write_chunk maintains the index across appending streams"""
+        path = tmp_path / "stream.csv"
+        csv_format = CsvFormat(index_interval=4, auto_index=False)
+        
+        stream = csv_format.open_stream(path, 'w')
+        csv_format.write_chunk(stream, SignalData(values=np.arange(6.0), timestamps=np.arange(6) * 0.1))
+        csv_format.close_stream(stream)
+        stream = csv_format.open_stream(path, 'a')
+        csv_format.write_chunk(stream, SignalData(values=np.arange(6.0, 10.0), timestamps=np.arange(6, 10) * 0.1))
+        csv_format.close_stream(stream)
+        
+        index = csv_format.load_index(path)
+        assert np.allclose(index["timestamp"], [0.0, 0.4, 0.8])
+        with open(path, 'rb') as f:
+            for timestamp, offset in index.tolist():
+                f.seek(offset)
+                assert float(f.readline().split(b",")[0]) == timestamp
+        
+        result = csv_format.read_time_range(path, TimeRange(start=0.45, end=0.85))
+        assert np.array_equal(result.values, [5.0, 6.0, 7.0, 8.0])
+    
+    def test_chunk_reader(self, tmp_path):
+        """Test chunked reading across block boundaries and raw file objects"""
+        path = tmp_path / "signal.csv"
+        values = np.random.randn(1000, 2)
+        timestamps = np.arange(1000) * 0.001
+        CsvFormat().write(path, SignalData(values=values, timestamps=timestamps))
+        
+        # Tiny blocks force partial lines to be carried between blocks
+        csv_format = CsvFormat(chunk_size=64, block_size=100)
+        stream = csv_format.open_stream(path, 'r')
+        chunks = []
+        while True:
+            chunk = csv_format.read_chunk(stream)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+        csv_format.close_stream(stream)
+        
+        assert [chunk.num_samples for chunk in chunks] == [64] * 15 + [40]
+        assert np.array_equal(np.concatenate([chunk.values for chunk in chunks]), values)
+        assert np.array_equal(np.concatenate([chunk.timestamps for chunk in chunks]), timestamps)
+        
+        # Raw file objects work too and keep their reader until closed
+        with open(path, 'rb') as f:
+            assert csv_format.read_chunk(f).num_samples == 64
+            assert np.array_equal(csv_format.read_chunk(f).values, values[64:128])
+    
+    def test_block_parsing(self):
+        """Test the block parser with small blocks, comments between rows and invalid rows"""
+        content = (
+            "# sample_rate: 10.0\n"
+            "timestamp,channel_0,channel_1\n"
+            "0.0,1.0,2.0\n"
+            "0.1,bad,2.1\n"
+            "# note: gap\n"
+            "\n"
+            "0.2,1.2,2.2\r\n"
+            "0.3,\"1.3\",2.3\n"
+            "0.4,1.4\n"
+            "0.5,1.5,2.5"
+        ).encode('utf-8')
+        
+        csv_format = CsvFormat()
+        csv_format.BLOCK_SIZE = 16
+        read_data = csv_format.read(io.BytesIO(content))
+        
+        assert np.array_equal(read_data.timestamps, [0.0, 0.2, 0.3, 0.5])
+        assert np.array_equal(read_data.values[:, 0], [1.0, 1.2, 1.3, 1.5])
+        assert read_data.values.flags.c_contiguous
+        assert read_data.metadata["sample_rate"] == "10.0"
+        assert read_data.metadata["note"] == "gap"
+    
     def test_read_write(self):
         """Test reading and writing CSV files"""
         # Create test data
@@ -527,7 +864,7 @@ class TestCsvFormat:
             tmp_path = tmp.name
         
         # Open stream for writing
-        csv_format = CsvFormat()
+        csv_format = CsvFormat(chunk_size=3)
         stream = None
         
         try:
@@ -586,6 +923,639 @@ class TestCsvFormat:
                 logging.warning(f"Could not delete temporary file {tmp_path}")
 
 
+class TestNumpyFormat:
+    """Tests for the NumpyFormat class"""
+    
+    def test_basic_properties(self):
+        """Test basic properties of NumpyFormat"""
+        numpy_format = NumpyFormat()
+        
+        assert numpy_format.name == "NUMPY"
+        assert ".npy" in numpy_format.extensions
+        assert ".npz" in numpy_format.extensions
+        assert FormatCapability.RANDOM_ACCESS in numpy_format.capabilities
+        assert FormatCapability.STREAMING in numpy_format.capabilities
+    
+    def test_read_write(self, tmp_path):
+        """Test reading and writing memory-mapped NumPy files"""
+        values = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        timestamps = np.array([0.0, 0.1, 0.2])
+        metadata = {"test_key": "test_value"}
+        data = SignalData(values=values, timestamps=timestamps, metadata=metadata)
+        
+        path = tmp_path / "signal.npy"
+        numpy_format = NumpyFormat()
+        numpy_format.write(path, data)
+        
+        # Uniform timestamps are stored as a time base, not as an array
+        assert not (tmp_path / "signal.npy.ts").exists()
+        
+        read_data = numpy_format.read(path)
+        assert isinstance(read_data.values, np.memmap)
+        assert np.array_equal(read_data.values, values)
+        assert np.array_equal(read_data.timestamps, timestamps)
+        assert read_data.metadata["test_key"] == "test_value"
+        assert read_data.metadata["sample_rate"] == pytest.approx(10.0)
+        
+        # Appending only adds rows
+        new_data = SignalData(values=np.array([[7.0, 8.0]]), metadata={"new_key": "new_value"})
+        numpy_format.write(path, new_data, append=True)
+        
+        combined = numpy_format.read(path)
+        assert combined.num_samples == 4
+        assert np.allclose(combined.timestamps, np.array([0.0, 0.1, 0.2, 0.3]))
+        assert combined.metadata["new_key"] == "new_value"
+        assert combined.metadata["test_key"] == "test_value"
+    
+    def test_read_time_range(self, tmp_path):
+        """Test time range reads with uniform and explicit timestamps"""
+        numpy_format = NumpyFormat()
+        
+        # Uniform time base: indices are computed, not searched
+        uniform = SignalData(values=np.arange(1000.0), metadata={"sample_rate": 100.0, "start_time": 1.0})
+        numpy_format.write(tmp_path / "uniform.npy", uniform)
+        
+        data = numpy_format.read_time_range(tmp_path / "uniform.npy", TimeRange(start=2.0, end=2.5))
+        assert data.values[0] == 100.0
+        assert data.values[-1] == 150.0
+        assert np.allclose(data.timestamps, 1.0 + np.arange(100, 151) / 100.0)
+        
+        # Irregular timestamps are kept in a separate array
+        timestamps = np.array([0.0, 0.1, 0.25, 0.3, 0.45])
+        irregular = SignalData(values=np.arange(5.0), timestamps=timestamps)
+        numpy_format.write(tmp_path / "irregular.npy", irregular)
+        assert (tmp_path / "irregular.npy.ts").exists()
+        
+        data = numpy_format.read(tmp_path / "irregular.npy", time_range=TimeRange(start=0.15, end=0.35))
+        assert np.array_equal(data.values, np.array([2.0, 3.0]))
+        assert np.array_equal(data.timestamps, np.array([0.25, 0.3]))
+    
+    def test_npz(self, tmp_path):
+        """Test .npz archives"""
+        values = np.array([1.0, 2.0, 3.0])
+        timestamps = np.array([0.0, 0.5, 0.7])
+        numpy_format = NumpyFormat()
+        numpy_format.write(tmp_path / "signal.npz", SignalData(values=values, timestamps=timestamps,
+                                                               metadata={"unit": "V"}))
+        
+        read_data = numpy_format.read(tmp_path / "signal.npz")
+        assert np.array_equal(read_data.values, values)
+        assert np.array_equal(read_data.timestamps, timestamps)
+        assert numpy_format.get_metadata(tmp_path / "signal.npz")["unit"] == "V"
+    
+    def test_streaming(self, tmp_path):
+        """Test streaming operations with NumPy format"""
+        path = tmp_path / "stream.npy"
+        numpy_format = NumpyFormat(chunk_size=3)
+        
+        stream = numpy_format.open_stream(path, 'w')
+        numpy_format.write_chunk(stream, SignalData(values=np.array([1.0, 2.0, 3.0]),
+                                                    timestamps=np.array([0.0, 0.1, 0.2])))
+        numpy_format.write_chunk(stream, SignalData(values=np.array([4.0, 5.0]),
+                                                    timestamps=np.array([0.3, 0.4])))
+        numpy_format.close_stream(stream)
+        
+        stream = numpy_format.open_stream(path, 'r')
+        chunk1 = numpy_format.read_chunk(stream)
+        chunk2 = numpy_format.read_chunk(stream)
+        assert np.array_equal(chunk1.values, np.array([1.0, 2.0, 3.0]))
+        assert np.array_equal(chunk2.timestamps, np.array([0.3, 0.4]))
+        assert numpy_format.read_chunk(stream) is None
+        numpy_format.close_stream(stream)
+        
+        # The finished file is a standard .npy array
+        assert np.array_equal(np.load(path), np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+    
+    def test_append_timestamps(self, tmp_path):
+        """Test appended timestamps being checked against the implicit time base"""
+        numpy_format = NumpyFormat()
+        path = tmp_path / "uniform.npy"
+        numpy_format.write(path, SignalData(values=np.arange(5.0), timestamps=np.arange(5) / 10.0))
+        numpy_format.write(path, SignalData(values=np.arange(3.0), timestamps=np.arange(5, 8) / 10.0), append=True)
+        assert np.allclose(numpy_format.read(path).timestamps, np.arange(8) / 10.0)
+        
+        with pytest.raises(SignalFormatError):
+            numpy_format.write(path, SignalData(values=np.arange(2.0), timestamps=np.array([5.0, 6.0])), append=True)
+        
+        # Without a sample rate there is no time base to put timestamps on
+        path = tmp_path / "untimed.npy"
+        numpy_format.write(path, SignalData(values=np.arange(5.0)))
+        with pytest.raises(SignalFormatError):
+            numpy_format.write(path, SignalData(values=np.arange(2.0), timestamps=np.array([0.5, 0.6])), append=True)
+    
+    def test_append_dtype(self, tmp_path):
+        """Test appending samples that the file's dtype would truncate"""
+        numpy_format = NumpyFormat()
+        path = tmp_path / "codes.npy"
+        numpy_format.write(path, SignalData(values=np.arange(4, dtype=np.int16)))
+        numpy_format.write(path, SignalData(values=np.array([5, 6], dtype=np.int8)), append=True)
+        with pytest.raises(SignalFormatError):
+            numpy_format.write(path, SignalData(values=np.array([1.7, 2.2])), append=True)
+        assert np.array_equal(numpy_format.read(path).values, [0, 1, 2, 3, 5, 6])
+    
+    def test_unclosed_stream(self, tmp_path):
+        """Test reading the rows of a stream that was never closed"""
+        numpy_format = NumpyFormat()
+        for name, timestamps in (("uniform.npy", None), ("explicit.npy", np.array([0.0, 0.1, 0.3]))):
+            path = tmp_path / name
+            stream = numpy_format.open_stream(path, 'w')
+            for _ in range(2):
+                numpy_format.write_chunk(stream, SignalData(values=np.ones((3, 2)), timestamps=timestamps,
+                                                            metadata={"sample_rate": 10.0}))
+                if timestamps is not None:
+                    timestamps = timestamps + 1.0
+            stream.file.flush()
+            if stream.timestamps_file is not None:
+                stream.timestamps_file.flush()
+            
+            data = numpy_format.read(path)
+            assert data.values.shape == (6, 2)
+            assert len(data.timestamps) == 6 and data.timestamps[3] == pytest.approx(0.3 if name == "uniform.npy" else 1.0)
+            stream.close()
+
+
+class TestHdf5Format:
+    """Tests for the Hdf5Format class"""
+    
+    @pytest.fixture(autouse=True)
+    def _require_h5py(self):
+        pytest.importorskip("h5py")
+    
+    def test_basic_properties(self):
+        """Test basic properties of Hdf5Format"""
+        hdf5_format = Hdf5Format()
+        
+        assert hdf5_format.name == "HDF5"
+        assert ".h5" in hdf5_format.extensions
+        assert ".hdf5" in hdf5_format.extensions
+        assert FormatCapability.COMPRESSION in hdf5_format.capabilities
+        assert FormatCapability.RANDOM_ACCESS in hdf5_format.capabilities
+        assert base.registry.get_for_file("capture.h5").name == "HDF5"
+    
+    def test_read_write(self, tmp_path):
+        """Test reading and writing chunked, compressed HDF5 files"""
+        import h5py
+        
+        values = np.random.randn(1000, 2)
+        timestamps = np.arange(1000) * 0.001
+        data = SignalData(values=values, timestamps=timestamps, metadata={"test_key": "test_value"})
+        
+        path = tmp_path / "signal.h5"
+        Hdf5Format(chunk_size=128).write(path, data)
+        
+        with h5py.File(path, "r") as f:
+            dataset = f["signal/channel_1"]
+            assert dataset.chunks == (128,)
+            assert dataset.compression == "gzip"
+            assert dataset.attrs["sample_interval"] == pytest.approx(0.001)
+            assert "timestamps" not in f["signal"]
+        
+        read_data = Hdf5Format().read(path)
+        assert np.array_equal(read_data.values, values)
+        assert np.allclose(read_data.timestamps, timestamps)
+        assert read_data.metadata["test_key"] == "test_value"
+    
+    def test_read_time_range(self, tmp_path):
+        """Test time range reads for uniform and explicit time bases"""
+        hdf5_format = Hdf5Format(chunk_size=16)
+        values = np.arange(100, dtype=np.float64)
+        
+        uniform_path = tmp_path / "uniform.h5"
+        hdf5_format.write(uniform_path, SignalData(values=values, timestamps=values * 0.1))
+        result = hdf5_format.read_time_range(uniform_path, TimeRange(start=2.0, end=3.0))
+        assert np.array_equal(result.values, np.arange(20, 31))
+        
+        irregular = np.cumsum(np.linspace(0.01, 0.2, 100))
+        explicit_path = tmp_path / "explicit.h5"
+        hdf5_format.write(explicit_path, SignalData(values=values, timestamps=irregular))
+        result = hdf5_format.read(explicit_path, TimeRange(start=irregular[40], end=irregular[59]))
+        assert np.array_equal(result.values, np.arange(40, 60))
+        assert np.array_equal(result.timestamps, irregular[40:60])
+    
+    def test_streaming(self, tmp_path):
+        """Test streaming operations with HDF5 format"""
+        path = tmp_path / "stream.h5"
+        hdf5_format = Hdf5Format(chunk_size=3)
+        
+        stream = hdf5_format.open_stream(path, 'w')
+        hdf5_format.write_chunk(stream, SignalData(values=np.array([1.0, 2.0, 3.0]),
+                                                   timestamps=np.array([0.0, 0.1, 0.2])))
+        hdf5_format.write_chunk(stream, SignalData(values=np.array([4.0, 5.0]),
+                                                   timestamps=np.array([0.3, 0.4])))
+        hdf5_format.close_stream(stream)
+        
+        stream = hdf5_format.open_stream(path, 'r')
+        chunk1 = hdf5_format.read_chunk(stream)
+        chunk2 = hdf5_format.read_chunk(stream)
+        assert np.array_equal(chunk1.values, np.array([1.0, 2.0, 3.0]))
+        assert np.allclose(chunk2.timestamps, np.array([0.3, 0.4]))
+        assert hdf5_format.read_chunk(stream) is None
+        hdf5_format.close_stream(stream)
+        
+        # A chunk with a gap switches the file to explicit timestamps
+        hdf5_format.write(path, SignalData(values=np.array([6.0]), timestamps=np.array([1.0])), append=True)
+        read_data = hdf5_format.read(path)
+        assert np.allclose(read_data.timestamps, [0.0, 0.1, 0.2, 0.3, 0.4, 1.0])
+        assert hdf5_format.validate(path)
+        import h5py
+        with h5py.File(path, "r") as f:
+            for node in (f["signal"], f["signal/channel_0"]):
+                assert "start_time" not in node.attrs and "sample_interval" not in node.attrs
+        
+        # Timestamps cannot be added to a file without a time base
+        untimed = tmp_path / "untimed.h5"
+        hdf5_format.write(untimed, SignalData(values=np.arange(3.0)))
+        with pytest.raises(SignalFormatError):
+            hdf5_format.write(untimed, SignalData(values=np.arange(2.0), timestamps=np.array([0.5, 0.6])), append=True)
+
+
+class TestBinaryFrameFormat:
+    """Tests for the BinaryFrameFormat class"""
+    
+    def test_basic_properties(self):
+        """Test basic properties of BinaryFrameFormat"""
+        frame_format = BinaryFrameFormat()
+        
+        assert frame_format.name == "BINARY"
+        assert ".sigbin" in frame_format.extensions
+        assert FormatCapability.STREAMING in frame_format.capabilities
+        assert FormatCapability.RANDOM_ACCESS in frame_format.capabilities
+    
+    def test_read_write(self, tmp_path):
+        """Test round trips of multi-channel data, scaled codes and metadata"""
+        path = tmp_path / "signal.sigbin"
+        values = np.random.randn(250, 2)
+        timestamps = np.arange(250) * 0.01
+        frame_format = BinaryFrameFormat(chunk_size=64)
+        frame_format.write(path, SignalData(values=values, timestamps=timestamps, metadata={"unit": "V"}))
+        
+        read_data = frame_format.read(path)
+        assert np.array_equal(read_data.values, values)
+        assert np.allclose(read_data.timestamps, timestamps)
+        assert frame_format.get_metadata(path)["unit"] == "V"
+        assert frame_format.validate(path)
+        
+        # Raw ADC codes with a scale and offset
+        codes = np.array([0, 128, 255], dtype=np.uint8)
+        frame_format.write(path, SignalData(values=codes, metadata={"scale": 0.5, "offset": -1.0}))
+        assert np.array_equal(frame_format.read(path).values, [-1.0, 63.0, 126.5])
+        assert np.array_equal(BinaryFrameFormat(apply_scale=False).read(path).values, codes)
+        assert BinaryFrameFormat(apply_scale=False).get_metadata(path)["scale"] == 0.5
+    
+    def test_scaled_round_trip(self, tmp_path):
+        """Test that scaled values written back are not scaled a second time"""
+        path = tmp_path / "codes.sigbin"
+        codes = np.arange(100, 141, 5, dtype=np.int16)
+        frame_format = BinaryFrameFormat()
+        frame_format.write(path, SignalData(values=codes, metadata={"scale": 0.5, "offset": -1.0}))
+        scaled = frame_format.read(path)
+        assert "scale" not in scaled.metadata and "offset" not in frame_format.get_metadata(path)
+        
+        copy_path = tmp_path / "copy.sigbin"
+        frame_format.write(copy_path, scaled)
+        assert np.array_equal(frame_format.read(copy_path).values, codes * 0.5 - 1.0)
+        
+        stream = frame_format.open_stream(copy_path, 'r')
+        assert "scale" not in frame_format.read_chunk(stream).metadata
+        frame_format.close_stream(stream)
+    
+    def test_read_time_range(self, tmp_path):
+        """Test that time range reads seek to the overlapping frames"""
+        path = tmp_path / "signal.sigbin"
+        values = np.arange(100, dtype=np.float64)
+        BinaryFrameFormat(chunk_size=16).write(path, SignalData(values=values, timestamps=values * 0.1))
+        
+        result = BinaryFrameFormat().read_time_range(path, TimeRange(start=2.0, end=3.0))
+        assert np.array_equal(result.values, np.arange(20, 31))
+        
+        irregular = np.cumsum(np.linspace(0.01, 0.2, 100))
+        BinaryFrameFormat(chunk_size=16).write(path, SignalData(values=values, timestamps=irregular))
+        result = BinaryFrameFormat().read(path, TimeRange(start=irregular[40], end=irregular[59]))
+        assert np.array_equal(result.values, np.arange(40, 60))
+    
+    def test_streaming(self, tmp_path):
+        """Test streaming, zero-copy chunks, appending and unclosed files"""
+        path = tmp_path / "stream.sigbin"
+        frame_format = BinaryFrameFormat()
+        
+        stream = frame_format.open_stream(path, 'w')
+        frame_format.write_chunk(stream, SignalData(values=np.array([1.0, 2.0, 3.0]),
+                                                    timestamps=np.array([0.0, 0.1, 0.2])))
+        frame_format.write_chunk(stream, SignalData(values=np.array([4.0, 5.0]),
+                                                    timestamps=np.array([0.3, 0.4])))
+        
+        # Frames are readable before the footer exists
+        assert np.array_equal(frame_format.read(path).values, [1.0, 2.0, 3.0, 4.0, 5.0])
+        frame_format.close_stream(stream)
+        
+        frame_format.write(path, SignalData(values=np.array([6.0]), timestamps=np.array([0.5])), append=True)
+        
+        stream = frame_format.open_stream(path, 'r')
+        chunk1 = frame_format.read_chunk(stream)
+        assert not chunk1.values.flags.owndata
+        assert np.array_equal(chunk1.values, [1.0, 2.0, 3.0])
+        assert np.allclose(frame_format.read_chunk(stream).timestamps, [0.3, 0.4])
+        assert np.array_equal(frame_format.read_chunk(stream).values, [6.0])
+        assert frame_format.read_chunk(stream) is None
+        frame_format.close_stream(stream)
+    
+    def test_adc_codec(self):
+        """Test lossless round trips of the ADC codec across dtypes and lengths"""
+        from signals_system.formats import adc_codec
+        
+        rng = np.random.default_rng(0)
+        for dtype in (np.int8, np.uint8, np.int16, np.int32, np.uint32):
+            info = np.iinfo(dtype)
+            for n in (0, 1, 2, 255, 257, 3000):
+                codes = rng.integers(info.min, info.max, n, endpoint=True).astype(dtype)
+                assert np.array_equal(adc_codec.decode(adc_codec.encode(codes), dtype), codes)
+        
+        # Smooth scope traces pack into a few bits per sample
+        trace = np.round(100 * np.sin(np.arange(20000) / 50.0)).astype(np.int8)
+        two_channels = np.column_stack([trace, -trace])
+        encoded = adc_codec.encode(two_channels)
+        assert len(encoded) * 3 < two_channels.nbytes
+        assert np.array_equal(adc_codec.decode(encoded, np.int8), two_channels)
+        
+        # Full-scale steps need the widest residuals of every dtype
+        for dtype in (np.int8, np.uint16, np.uint32):
+            info = np.iinfo(dtype)
+            codes = np.tile(np.array([info.min, info.max], dtype=dtype), 300)
+            assert np.array_equal(adc_codec.decode(adc_codec.encode(codes), dtype), codes)
+        
+        empty = np.empty((0, 3), dtype=np.int16)
+        assert adc_codec.decode(adc_codec.encode(empty), np.int16, multi_channel=True).shape == (0, 3)
+        
+        with pytest.raises(SignalFormatError):
+            adc_codec.encode(np.zeros(10))
+    
+    def test_adc_frames(self, tmp_path):
+        """Test ADC compressed frames with scaling, time ranges and raw fallback"""
+        path = tmp_path / "scope.sigbin"
+        codes = np.round(100 * np.sin(np.arange(10000) / 40.0)).astype(np.int8)
+        frame_format = BinaryFrameFormat(chunk_size=1000, compression="adc")
+        timestamps = np.arange(10000) / 1024.0
+        frame_format.write(path, SignalData(values=codes, timestamps=timestamps, metadata={"scale": 0.01}))
+        BinaryFrameFormat().write(tmp_path / "raw.sigbin", SignalData(values=codes))
+        assert path.stat().st_size * 2 < (tmp_path / "raw.sigbin").stat().st_size
+        
+        assert np.array_equal(BinaryFrameFormat(apply_scale=False).read(path).values, codes)
+        assert np.allclose(BinaryFrameFormat().read(path).values, codes * 0.01)
+        result = BinaryFrameFormat(apply_scale=False).read(path, TimeRange(start=2.5, end=2.6))
+        assert np.array_equal(result.values, codes[(timestamps >= 2.5) & (timestamps <= 2.6)])
+        
+        # Float values are stored raw even with compression enabled
+        frame_format.write(path, SignalData(values=np.linspace(0, 1, 50)))
+        assert np.array_equal(BinaryFrameFormat().read(path).values, np.linspace(0, 1, 50))
+        
+        with pytest.raises(SignalFormatError):
+            BinaryFrameFormat(compression="zip")
+
+
+class TestLazySignalData:
+    """Tests for lazily opened signals"""
+    
+    @staticmethod
+    def _recording(n=1000, channels=1, uniform=True):
+        values = np.arange(n * channels, dtype=float).reshape(n, channels) if channels > 1 else np.arange(n, dtype=float)
+        timestamps = np.arange(n) * 0.01 if uniform else np.cumsum(np.full(n, 0.01) + (np.arange(n) % 3) * 0.001)
+        return SignalData(values=values, timestamps=timestamps, metadata={"sample_rate": 100.0})
+    
+    def test_array_source(self):
+        """Test views and chunk iteration over in-memory arrays"""
+        from signals_system.formats.lazy import ArraySource, LazySignalData
+        data = self._recording(uniform=False)
+        lazy = LazySignalData(ArraySource(data.values, data.timestamps, chunk_size=64), metadata=data.metadata)
+        
+        assert lazy.num_samples == 1000
+        assert lazy.duration == pytest.approx(data.duration)
+        view = lazy.time_slice(TimeRange(start=2.0, end=4.0)).slice(10, 20)
+        expected = data.time_slice(TimeRange(start=2.0, end=4.0)).slice(10, 20)
+        assert isinstance(view, LazySignalData)
+        assert np.array_equal(view.values, expected.values)
+        assert np.array_equal(view.timestamps, expected.timestamps)
+        
+        chunks = list(lazy.slice(100, 300).iter_chunks())
+        assert [len(c.values) for c in chunks] == [28, 64, 64, 44]
+        assert np.array_equal(np.concatenate([c.values for c in chunks]), data.values[100:300])
+        assert sum(len(c.values) for c in lazy.iter_chunks(chunk_size=300)) == 1000
+    
+    def test_numpy_memory_map(self, tmp_path):
+        """Test that NumPy recordings are opened without loading them"""
+        path = tmp_path / "capture.npy"
+        data = self._recording(channels=2)
+        NumpyFormat().write(path, data)
+        
+        with NumpyFormat().open_lazy(path) as lazy:
+            assert isinstance(lazy.source.values, np.memmap)
+            assert lazy._loaded is None
+            assert lazy.num_channels == 2
+            assert lazy.duration == pytest.approx(9.99)
+            view = lazy.time_slice(TimeRange(start=1.0, end=1.5))
+            assert lazy._loaded is None and view._loaded is None
+            assert np.array_equal(view.values, data.values[100:151])
+            assert np.allclose(view.timestamps, data.timestamps[100:151])
+            assert lazy.metadata["sample_rate"] == 100.0
+    
+    @pytest.mark.parametrize("format_class", [BinaryFrameFormat, Hdf5Format])
+    def test_chunked_formats(self, tmp_path, format_class):
+        """Test chunked formats decode only the chunks they need"""
+        if format_class is Hdf5Format:
+            pytest.importorskip("h5py")
+        signal_format = format_class(chunk_size=100)
+        path = tmp_path / f"capture{signal_format.extensions[0]}"
+        data = self._recording(uniform=False)
+        signal_format.write(path, data)
+        
+        with signal_format.open_lazy(path, cache_size=2) as lazy:
+            source = lazy.source
+            assert lazy.num_samples == 1000
+            assert source.num_chunks == 10
+            assert len(source._cache) == 0
+            
+            view = lazy.time_slice(TimeRange(start=3.0, end=3.5))
+            expected = data.time_slice(TimeRange(start=3.0, end=3.5))
+            assert view.num_samples == expected.num_samples
+            assert np.array_equal(view.values, expected.values)
+            assert np.array_equal(view.timestamps, expected.timestamps)
+            assert len(source._cache) <= 2
+            
+            chunks = list(lazy.iter_chunks())
+            assert len(chunks) == 10
+            assert np.array_equal(np.concatenate([c.values for c in chunks]), data.values)
+    
+    def test_default_fallback(self, tmp_path):
+        """Test formats without lazy storage still return a LazySignalData"""
+        from signals_system.formats.lazy import LazySignalData
+        path = tmp_path / "capture.json"
+        data = self._recording(n=50)
+        JsonFormat().write(path, data)
+        
+        lazy = JsonFormat().open_lazy(path)
+        assert isinstance(lazy, LazySignalData)
+        assert np.array_equal(lazy.slice(5, 10).values, data.values[5:10])
+
+
+class TestCompressedFormat:
+    """Tests for the block compression layer"""
+    
+    @staticmethod
+    def _data(n=20000):
+        values = np.round(np.sin(np.arange(n) / 50.0) * 100)
+        return SignalData(values=values, timestamps=np.arange(n) * 0.001, metadata={"units": "V"})
+    
+    def test_block_streams(self, tmp_path):
+        """Test seekable reads of block compressed streams"""
+        from signals_system.formats.compression import open_compressed
+        payload = os.urandom(5000) + bytes(20000)
+        path = tmp_path / "payload.blz"
+        
+        writer = open_compressed(path, 'wb', codec="bz2", block_size=4096, workers=2)
+        for start in range(0, len(payload), 1000):
+            writer.write(payload[start:start + 1000])
+            writer.flush()
+        writer.close()
+        
+        with open_compressed(path) as reader:
+            assert len(reader.raw.table) == 7
+            assert reader.read() == payload
+            reader.raw._cache.clear()
+            reader.seek(9000)
+            assert reader.read(100) == payload[9000:9100]
+            # Only the blocks covering the buffered read were decompressed
+            assert set(reader.raw._cache) <= {2, 3} and 2 in reader.raw._cache
+        
+        # Files whose writer never wrote the footer are still readable
+        with open(path, 'rb') as f:
+            truncated = f.read()[:-(7 * 16 + 32)]
+        path.write_bytes(truncated)
+        with open_compressed(path) as reader:
+            assert reader.read() == payload
+    
+    @pytest.mark.parametrize("inner,suffix", [("binary", ".sigbin"), ("csv", ".csv"), ("json", ".json")])
+    def test_round_trip(self, tmp_path, inner, suffix):
+        """Test that any format can be stored compressed and read back"""
+        from signals_system.formats.compression import CompressedFormat
+        data = self._data()
+        path = tmp_path / f"capture{suffix}.blz"
+        CompressedFormat(codec="zlib", block_size=16384).write(path, data)
+        
+        signal_format = base.registry.get_for_file(path)
+        assert signal_format.name == "COMPRESSED"
+        assert signal_format.validate(path)
+        plain_path = tmp_path / f"capture{suffix}"
+        base.registry.get_format(inner).write(plain_path, data)
+        assert path.stat().st_size < plain_path.stat().st_size / 2
+        
+        read_data = signal_format.read(path)
+        assert np.allclose(read_data.values, data.values)
+        assert signal_format.get_metadata(path)["units"] == "V"
+        
+        time_range = TimeRange(start=5.0, end=5.5)
+        partial = signal_format.read_time_range(path, time_range)
+        assert np.allclose(partial.values, data.time_slice(time_range).values)
+        assert FormatCapability.COMPRESSION in signal_format.get_capabilities(path)
+    
+    def test_codecs(self, tmp_path):
+        """Test codec selection and the codec benchmark"""
+        from signals_system.formats.compression import CompressedFormat, benchmark_codecs, get_codec
+        assert get_codec("gzip").name == "zlib"
+        with pytest.raises(SignalFormatError):
+            CompressedFormat(codec="snappy")
+        
+        results = benchmark_codecs(self._data().values, block_size=32768, workers=2)
+        assert [r["codec"] for r in results] == ["zlib", "lzma", "bz2"]
+        assert all(r["ratio"] > 1 and r["compress_mb_s"] > 0 and r["decompress_mb_s"] > 0 for r in results)
+        
+        path = tmp_path / "capture.sigbin.blz"
+        CompressedFormat("binary", codec="lzma").write(path, self._data(100))
+        with pytest.raises(SignalFormatError):
+            CompressedFormat().write(path, self._data(100), append=True)
+
+
+class TestChecksums:
+    """Tests for per-block checksums and verification"""
+    
+    @staticmethod
+    def _corrupt(path, offset):
+        with open(path, 'r+b') as f:
+            f.seek(offset)
+            byte = f.read(1)
+            f.seek(offset)
+            f.write(bytes([byte[0] ^ 0xFF]))
+    
+    @staticmethod
+    def _data(n=10000):
+        return SignalData(values=np.arange(n, dtype=float), timestamps=np.arange(n) / 1024.0)
+    
+    def test_binary_frames(self, tmp_path):
+        """Test that a corrupt frame is reported by time range and fails verified reads"""
+        from signals_system.formats.base import ChecksumError
+        path = tmp_path / "capture.sigbin"
+        frame_format = BinaryFrameFormat(chunk_size=1000)
+        frame_format.write(path, self._data())
+        assert frame_format.verify(path) == []
+        
+        index = frame_format.frame_index(path)
+        self._corrupt(path, int(index[3]['offset']) + 500)
+        errors = frame_format.verify(path, workers=2)
+        assert [error.index for error in errors] == [3]
+        assert errors[0].time_range.start == 3000 / 1024.0
+        assert errors[0].offset == int(index[3]['offset'])
+        
+        # Unverified reads do not notice, verified reads and chunk reads do
+        frame_format.read(path)
+        with pytest.raises(ChecksumError):
+            BinaryFrameFormat(verify=True).read(path)
+        assert BinaryFrameFormat(verify=True).read(path, TimeRange(start=0.0, end=2.0)).num_samples == 2049
+        with BinaryFrameFormat(verify=True).open_lazy(path) as lazy:
+            with pytest.raises(ChecksumError):
+                lazy.values
+        
+        # Files written without checksums still read and verify
+        BinaryFrameFormat(checksums=False).write(path, self._data(100))
+        assert BinaryFrameFormat(verify=True).read(path).num_samples == 100
+        assert BinaryFrameFormat().verify(path) == []
+    
+    def test_compressed_blocks(self, tmp_path):
+        """Test that corrupt compressed blocks are found without decompressing"""
+        from signals_system.formats.base import ChecksumError
+        from signals_system.formats.compression import CompressedFormat, open_compressed
+        path = tmp_path / "capture.sigbin.blz"
+        CompressedFormat(codec="none", block_size=8192).write(path, self._data(20000))
+        assert CompressedFormat().verify(path) == []
+        
+        with open_compressed(path) as reader:
+            table = reader.raw.table.copy()
+        self._corrupt(path, int(table[5]['offset']) + 100)
+        
+        errors = CompressedFormat().verify(path, workers=2)
+        assert [error.index for error in errors] == [5]
+        assert errors[0].time_range is not None
+        data = self._data(20000)
+        assert data.time_slice(errors[0].time_range).num_samples > 0
+        with pytest.raises(ChecksumError):
+            CompressedFormat(verify=True).read(path)
+    
+    def test_hdf5_chunks(self, tmp_path):
+        """Test HDF5 chunk checksums"""
+        pytest.importorskip("h5py")
+        path = tmp_path / "capture.h5"
+        Hdf5Format(chunk_size=1000, compression=None).write(path, self._data())
+        assert Hdf5Format().verify(path) == []
+        
+        # Corrupt the middle of the file, which holds chunk data
+        raw = bytearray(path.read_bytes())
+        position = raw.find(np.arange(5000, 5004, dtype=float).tobytes())
+        assert position > 0
+        self._corrupt(path, position)
+        errors = Hdf5Format().verify(path)
+        assert [error.index for error in errors] == [5]
+        assert errors[0].time_range.start == 5000 / 1024.0
+        with pytest.raises(SignalFormatError):
+            Hdf5Format().read(path)
+
+
 def test_validation():
     """Test format validation"""
     # Create a valid JSON file
@@ -0,0 +1,387 @@
+"""
+Tests for the signals_system.providers package
+
+This module contains tests for the file, live, socket and replay signal providers.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+import pytest
+import numpy as np
+
+# Add project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from signals_system.formats.base import SignalData
+from signals_system.formats.protobuf_format import BinaryFrameFormat
+from signals_system.formats.csv_format import CsvFormat
+from signals_system.providers.base import ProviderError
+from signals_system.providers.file import FileSignalProvider
+from signals_system.providers.live import LiveSignalProvider
+from signals_system.providers.network import SocketSignalProvider, start_generator
+from signals_system.providers.replay import ReplaySignalProvider
+
+
+def _recording(n=1000, channels=1, rate=100.0):
+    values = np.arange(n * channels, dtype=float).reshape(n, channels)
+    if channels == 1:
+        values = values[:, 0]
+    return SignalData(values=values, timestamps=np.arange(n) / rate, metadata={"sample_rate": rate})
+
+
+class TestFileSignalProvider:
+    """Tests for the FileSignalProvider class"""
+
+    @pytest.fixture
+    def recording(self, tmp_path):
+        path = tmp_path / "capture.sigbin"
+        BinaryFrameFormat(chunk_size=128).write(path, _recording())
+        return path
+
+    def test_fixed_windows(self, recording):
+        """Test back-to-back windows with a partial last window"""
+        with FileSignalProvider(recording, window=300, chunk_size=128) as provider:
+            windows = [(w.values.copy(), w.timestamps.copy()) for w in provider]
+
+        assert [len(values) for values, _ in windows] == [300, 300, 300, 100]
+        assert np.array_equal(np.concatenate([values for values, _ in windows]), np.arange(1000.0))
+        assert np.allclose(windows[1][1], np.arange(300, 600) / 100.0)
+        assert provider.windows_delivered == 4
+        assert not provider.is_running
+
+        provider = FileSignalProvider(recording, window=300, partial=False)
+        assert len(list(provider)) == 3
+
+        # Overlapping windows end with a partial window only if it has new samples
+        windows = [w.values.tolist() for w in FileSignalProvider(recording, window=400, step=200, chunk_size=128)]
+        assert [len(values) for values in windows] == [400, 400, 400, 400]
+        windows = [w.values.tolist() for w in FileSignalProvider(recording, window=300, step=200, chunk_size=128)]
+        assert [len(values) for values in windows] == [300, 300, 300, 300, 200]
+        assert windows[-1][0] == 800.0
+
+    def test_overlapping_windows_in_seconds(self, recording):
+        """Test overlapping windows and a time range given in seconds"""
+        provider = FileSignalProvider(recording, window=1.0, step=0.25, unit="seconds",
+                                      start_time=2.0, end_time=5.995, partial=False)
+        starts = []
+        for window in provider:
+            assert len(window.values) == 100
+            assert np.array_equal(window.values, np.arange(100.0) + window.values[0])
+            starts.append(window.values[0])
+
+        assert starts == [200.0 + 25 * i for i in range(13)]
+        assert provider.sample_rate == 100.0
+
+    def test_gapped_windows(self, recording):
+        """Test a step longer than the window skipping samples"""
+        windows = [w.values[0] for w in FileSignalProvider(recording, window=10, step=250, chunk_size=64)]
+        assert windows == [0.0, 250.0, 500.0, 750.0]
+
+    def test_buffer_reuse(self, recording):
+        """Test windows being written into a fixed pool of buffers"""
+        provider = FileSignalProvider(recording, window=50, prefetch=2)
+        buffers = {id(window.values) for window in provider}
+        assert len(buffers) <= provider.prefetch + 2
+
+    def test_streaming_format(self, tmp_path):
+        """Test windows from a format read with read_chunk"""
+        path = tmp_path / "capture.csv"
+        CsvFormat().write(path, _recording(n=500, channels=2))
+
+        with FileSignalProvider(path, window=200, step=100, start_time=1.0, chunk_size=64) as provider:
+            windows = [w.values.copy() for w in provider]
+
+        assert provider.num_channels == 2
+        # The last 100 samples were all in the third window, so no partial window follows
+        assert [len(values) for values in windows] == [200, 200, 200]
+        assert np.array_equal(windows[1][:, 0], np.arange(200, 400) * 2.0)
+
+    def test_errors(self, tmp_path):
+        """Test invalid settings and unreadable files"""
+        with pytest.raises(ValueError):
+            FileSignalProvider(tmp_path / "x.sigbin", window=0)
+        with pytest.raises(ValueError):
+            FileSignalProvider(tmp_path / "x.sigbin", unit="frames")
+
+        path = tmp_path / "missing.sigbin"
+        with pytest.raises(ProviderError):
+            list(FileSignalProvider(path, signal_format="binary"))
+
+
+class TestLiveSignalProvider:
+    """Tests for the LiveSignalProvider class and its ring buffer"""
+
+    def test_frames_and_latest(self):
+        """Test frames across the wrap point being views of the ring"""
+        provider = LiveSignalProvider(buffer_size=100, frame_size=30, sample_rate=10.0)
+        with provider:
+            reader = provider.reader()
+            for start in range(0, 150, 25):
+                provider.write(np.arange(start, start + 25, dtype=float))
+                frame = reader.next_frame(timeout=0)
+                while frame is not None:
+                    assert np.array_equal(frame.values, frame.timestamps * 10.0)
+                    assert np.shares_memory(frame.values, provider.ring.values)
+                    assert reader.intact()
+                    frame = reader.next_frame(timeout=0)
+
+            assert reader.frames_read == 5
+            latest = provider.latest(60)
+            assert np.array_equal(latest.values, np.arange(90.0, 150.0))
+            assert np.shares_memory(latest.values, provider.ring.values)
+
+    def test_overrun(self):
+        """Test a lapped reader counting the lost samples and resuming at the newest frame"""
+        provider = LiveSignalProvider(buffer_size=64, frame_size=16, sample_rate=1.0)
+        reader = provider.reader(hop=8)
+        provider.write(np.arange(200.0))
+
+        frame = reader.next_frame(timeout=0)
+        assert reader.overruns == 1 and provider.overruns == 1
+        assert reader.samples_lost == 184
+        assert np.array_equal(frame.values, np.arange(184.0, 200.0))
+
+        provider.write(np.arange(200.0, 240.0))
+        assert reader.next_frame(timeout=0).values[0] == 192.0
+        assert reader.intact()
+        provider.write(np.arange(240.0, 320.0))
+        assert not reader.intact()
+
+    def test_overflow_policies(self):
+        """Test the drop and block policies holding back for the slowest reader"""
+        provider = LiveSignalProvider(buffer_size=32, frame_size=8, sample_rate=1.0, overflow="drop")
+        reader = provider.reader()
+        assert provider.write(np.arange(40.0)) == 32
+        assert provider.samples_dropped == 8
+        assert reader.read().values[-1] == 31.0
+
+        provider = LiveSignalProvider(buffer_size=32, frame_size=8, sample_rate=1.0, overflow="block")
+        reader = provider.reader()
+        provider.write(np.arange(32.0))
+        assert provider.write(np.arange(8.0), timeout=0.01) == 0
+
+        writer = threading.Thread(target=provider.write, args=(np.arange(32.0, 48.0),))
+        writer.start()
+        frames = [reader.next_frame(timeout=1.0).values[0] for _ in range(6)]
+        writer.join()
+        assert frames == [0.0, 8.0, 16.0, 24.0, 32.0, 40.0]
+        assert reader.overruns == 0
+
+    def test_block_holds_last_view(self):
+        """Test the block policy keeping a view intact until the next read"""
+        provider = LiveSignalProvider(buffer_size=32, frame_size=16, sample_rate=1.0, overflow="block")
+        reader = provider.reader()
+        provider.write(np.arange(32.0))
+        frame = reader.next_frame(timeout=0)
+
+        # The frame's samples are still in use, so the writer cannot reuse them
+        assert provider.write(np.arange(32.0, 48.0), timeout=0.05) == 0
+        assert np.array_equal(frame.values, np.arange(16.0)) and reader.intact()
+
+        assert reader.next_frame(timeout=0).values[0] == 16.0
+        assert provider.write(np.arange(32.0, 48.0), timeout=0.05) == 16
+
+    def test_source_thread_and_async(self):
+        """Test a polled source on the acquisition thread with async readers"""
+        chunks = iter([np.full(50, i, dtype=np.int16) for i in range(8)])
+        provider = LiveSignalProvider(buffer_size=1000, dtype=np.int16, channels=1, frame_size=100,
+                                      sample_rate=1000.0, source=lambda: next(chunks, None))
+        readers = [provider.reader(from_oldest=True), provider.reader(from_oldest=True)]
+
+        async def consume(reader):
+            sums = []
+            while (frame := await reader.next_frame_async(timeout=1.0)) is not None:
+                sums.append(int(frame.values.sum()))
+            return sums
+
+        async def run():
+            return await asyncio.gather(*(consume(reader) for reader in readers))
+
+        provider.start()
+        first, second = asyncio.run(run())
+        provider.stop()
+        assert first == second == [50 * (2 * i + 2 * i + 1) for i in range(4)]
+
+    def test_source_error(self):
+        """Test an acquisition error reaching the readers"""
+        def source():
+            raise OSError("device unplugged")
+
+        provider = LiveSignalProvider(buffer_size=16, frame_size=4, source=source)
+        reader = provider.reader()
+        provider.start()
+        with pytest.raises(ProviderError):
+            reader.next_frame(timeout=1.0)
+        provider.stop()
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSocketSignalProvider:
+    """Tests for the SocketSignalProvider class against the loopback generator"""
+
+    def test_tcp_stream_with_gaps(self):
+        """Test frames received into the ring with lost frames detected"""
+        process, port = start_generator(dtype="int32", channels=2, frame_size=1000, frames=50,
+                                        sample_rate=1000.0, skip_every=10)
+        provider = SocketSignalProvider("127.0.0.1", port, dtype="int32", channels=2, buffer_size=100000,
+                                        frame_size=1000, reconnect=False)
+        reader = provider.reader()
+        with provider:
+            assert _wait_for(lambda: provider.frames_received == 45)
+            frames = [reader.next_frame(timeout=1.0) for _ in range(45)]
+            # The server closing the connection ends the stream
+            assert reader.next_frame(timeout=1.0) is None
+        process.join(5)
+
+        assert provider.sequence_gaps == 4 and provider.frames_lost == 4
+        assert provider.sample_rate == 1000.0
+        starts = [int(frame.values[0, 0]) // 2 for frame in frames]
+        assert starts == [i * 1000 for i in range(50) if (i + 1) % 10]
+        third = frames[2]
+        assert np.array_equal(third.values.reshape(-1), np.arange(4000, 6000))
+        assert np.allclose(third.timestamps, np.arange(2000, 3000) / 1000.0)
+
+    def test_tcp_reconnect(self):
+        """Test reconnecting when the server closes the connection"""
+        process, port = start_generator(dtype="float32", frame_size=256, frames=20, connections=2)
+        provider = SocketSignalProvider("127.0.0.1", port, dtype="float32", buffer_size=65536,
+                                        reconnect_delay=0.05)
+        with provider:
+            assert _wait_for(lambda: provider.frames_received == 40)
+            assert provider.reconnects >= 1
+        process.join(5)
+        assert provider.sequence_gaps == 0
+        assert provider.samples_written == 40 * 256
+
+    def test_udp_datagrams(self):
+        """Test one frame per datagram with sequence gaps"""
+        provider = SocketSignalProvider("127.0.0.1", 0, protocol="udp", dtype="float64",
+                                        buffer_size=200000, frame_size=500)
+        reader = provider.reader()
+        with provider:
+            process, _ = start_generator(protocol="udp", port=provider.address[1], dtype="float64",
+                                         frame_size=500, frames=100, skip_every=7, sample_rate=500.0,
+                                         realtime=False)
+            process.join(5)
+            assert _wait_for(lambda: provider.frames_received + provider.frames_lost == 100)
+            frame = reader.next_frame(timeout=1.0)
+
+        assert provider.frames_lost >= 14
+        assert np.array_equal(frame.values, np.arange(500.0))
+        assert np.allclose(frame.timestamps, np.arange(500) / 500.0)
+
+    def test_udp_sender_restart(self):
+        """Test a UDP sender restarting its sequence without losing frames or overrunning readers"""
+        provider = SocketSignalProvider("127.0.0.1", 0, protocol="udp", dtype="float64",
+                                        buffer_size=65536, frame_size=1000, reorder_window=4)
+        reader = provider.reader()
+        with provider:
+            for run in range(2):
+                process, _ = start_generator(protocol="udp", port=provider.address[1], dtype="float64",
+                                             frame_size=1000, frames=20, realtime=False)
+                process.join(5)
+                assert _wait_for(lambda: provider.frames_received + provider.frames_lost == 20 * (run + 1))
+            # 40000 unread samples fit in the ring; only the received frames take space
+            frames = [reader.next_frame(timeout=1.0) for _ in range(provider.frames_received)]
+
+        assert provider.restarts == 1 and provider.frames_late == 0
+        assert reader.overruns == 0 and reader.samples_lost == 0
+        assert np.array_equal(frames[20].values, np.arange(1000.0))
+
+    def test_protocol_errors(self):
+        """Test frames that do not match the provider settings"""
+        process, port = start_generator(dtype="int16", frame_size=64, frames=5)
+        provider = SocketSignalProvider("127.0.0.1", port, dtype="float32", reconnect=False)
+        reader = provider.reader()
+        with provider:
+            with pytest.raises(ProviderError):
+                reader.next_frame(timeout=5.0)
+        process.join(5)
+
+        with pytest.raises(ValueError):
+            SocketSignalProvider(protocol="sctp")
+
+
+class TestReplaySignalProvider:
+    """Tests for the ReplaySignalProvider class"""
+
+    def test_lossless_fast_replay(self, tmp_path):
+        """Test replaying every sample as fast as the reader allows"""
+        path = tmp_path / "capture.csv"
+        CsvFormat().write(path, _recording(n=5000, channels=2))
+        provider = ReplaySignalProvider(path, speed=None, frame_size=256, buffer_size=1024, overflow="block")
+        reader = provider.reader()
+        with provider:
+            frames = []
+            while True:
+                # Everything is written once the stream is closed
+                closed = provider.ring.closed
+                frame = reader.read()
+                if frame is not None:
+                    frames.append(frame.values.copy())
+                elif closed:
+                    break
+
+        assert np.array_equal(np.concatenate(frames), _recording(n=5000, channels=2).values)
+        assert provider.stats.samples == 5000 and provider.stats.loops == 1
+        assert reader.overruns == 0
+
+    def test_paced_replay(self, tmp_path):
+        """Test N x real-time pacing against the monotonic clock"""
+        path = tmp_path / "capture.sigbin"
+        BinaryFrameFormat().write(path, _recording(n=1000, rate=1000.0))
+        provider = ReplaySignalProvider(path, speed=5.0, frame_rate=50)
+        reader = provider.reader()
+
+        started = time.monotonic()
+        with provider:
+            frames = 0
+            while reader.next_frame(timeout=1.0) is not None:
+                frames += 1
+        elapsed = time.monotonic() - started
+
+        assert provider.frame_size == 20 and frames == 50
+        assert 0.18 <= elapsed < 1.0
+        stats = provider.stats
+        assert stats.frames == 50
+        assert abs(stats.speed - 5.0) < 1.0
+        assert stats.lateness_percentile(50) < 0.01
+
+    def test_loop_and_time_range(self, tmp_path):
+        """Test looping a time range with increasing timestamps"""
+        path = tmp_path / "capture.sigbin"
+        BinaryFrameFormat().write(path, _recording(n=1000))
+        provider = ReplaySignalProvider(path, speed=None, loop=True, start_time=2.0, end_time=2.99,
+                                        frame_size=50, buffer_size=1000, overflow="block")
+        reader = provider.reader(frame_size=100)
+        with provider:
+            values, times = [], []
+            for _ in range(5):
+                # Views are only held until the next read
+                frame = reader.next_frame(timeout=1.0)
+                values.append(frame.values[0])
+                times.append(frame.timestamps[0])
+
+        assert values == [200.0, 200.0, 200.0, 200.0, 200.0]
+        assert np.allclose(times, [2.0, 3.0, 4.0, 5.0, 6.0])
+        assert provider.stats.loops >= 4
+
+    def test_errors(self, tmp_path):
+        """Test invalid settings and unreadable recordings"""
+        with pytest.raises(ProviderError):
+            ReplaySignalProvider(tmp_path / "missing.sigbin")
+        path = tmp_path / "capture.sigbin"
+        BinaryFrameFormat().write(path, _recording(n=10))
+        with pytest.raises(ValueError):
+            ReplaySignalProvider(path, speed=0)
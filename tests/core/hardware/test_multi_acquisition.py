@@ -0,0 +1,85 @@
+"""
+Tests for core.hardware.multi_acquisition
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from core.hardware.multi_acquisition import MultiInstrumentCapture, TriggerMode
+from core.hardware.waveform import WaveformPreamble, parse_block
+from tests.test_helpers.mock_oscilloscope import MockOscilloscope, MockDeviceManager
+
+
+class TestWaveform:
+    """Tests for the preamble and block helpers"""
+
+    def test_preamble_and_block(self):
+        """Test parsing a preamble and a binary block"""
+        scope = MockOscilloscope(points=100, sample_rate=1e6)
+        preamble = WaveformPreamble.from_string(scope.preamble())
+
+        assert preamble.points == 100
+        assert preamble.sample_rate == pytest.approx(1e6)
+
+        codes = parse_block(scope.block(1))
+        assert np.array_equal(codes, scope.codes(1))
+        assert preamble.time_axis(len(codes))[0] == pytest.approx(scope.x_origin)
+
+        with pytest.raises(ValueError):
+            parse_block(b"not a block")
+
+
+class TestMultiInstrumentCapture:
+    """Tests for the MultiInstrumentCapture class"""
+
+    def test_shared_trigger_arming(self):
+        """Test that followers trigger on EXT and the master on its own source"""
+        scopes = {"A": MockOscilloscope(), "B": MockOscilloscope()}
+        with MultiInstrumentCapture(MockDeviceManager(scopes), ["A", "B"],
+                                    trigger_mode=TriggerMode.SHARED) as capture:
+            capture.arm()
+
+        assert ":TRIG:EDGE:SOUR CHAN1" in scopes["A"].commands
+        assert ":TRIG:EDGE:SOUR EXT" in scopes["B"].commands
+        assert scopes["A"].closed and scopes["B"].closed
+
+    def test_alignment(self):
+        """Test merging devices with different trigger offsets and sample rates"""
+        scopes = {
+            "A": MockOscilloscope(points=1000, sample_rate=1e6, x_origin=-500e-6),
+            "B": MockOscilloscope(points=1000, sample_rate=1e6, x_origin=-400e-6),
+            "C": MockOscilloscope(points=500, sample_rate=0.5e6, x_origin=-450e-6),
+        }
+        with MultiInstrumentCapture(MockDeviceManager(scopes), ["A", "B", "C"],
+                                    channels={"A": [1, 2], "B": [1], "C": [1]}) as capture:
+            result = capture.capture(timeout=1.0)
+
+        # Overlap is [-400us, 499us] on the finest (1 us) grid
+        assert result.timestamps[0] == pytest.approx(-400e-6)
+        assert result.timestamps[-1] == pytest.approx(499e-6)
+        assert list(result.channels) == ["A:CH1", "A:CH2", "B:CH1", "C:CH1"]
+        assert result.trigger_offsets["B"] == pytest.approx(-400e-6)
+
+        # Same waveform on every device, so aligned channels must agree
+        a = result.channels["A:CH1"]
+        assert len(a) == len(result.timestamps)
+        assert np.allclose(a, result.channels["B:CH1"])
+        assert np.allclose(a, result.channels["C:CH1"], atol=0.5)
+
+        signal = result.to_signal_data()
+        assert signal.num_channels == 4
+        assert signal.metadata["sample_rate"] == pytest.approx(1e6)
+
+    def test_concurrent_readout(self):
+        """Test that read-out time does not grow with the device count"""
+        delay = 0.2
+        scopes = {name: MockOscilloscope(read_delay=delay) for name in "ABC"}
+        with MultiInstrumentCapture(MockDeviceManager(scopes), list(scopes)) as capture:
+            start = time.perf_counter()
+            captures = capture.read_out()
+            elapsed = time.perf_counter() - start
+
+        assert all(c.num_bytes == 1200 for c in captures.values())
+        assert elapsed < 2 * delay
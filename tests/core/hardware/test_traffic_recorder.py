@@ -0,0 +1,113 @@
+"""
+Tests for core.hardware.traffic_recorder
+"""
+
+import io
+import time
+
+import numpy as np
+import pytest
+
+from core.hardware.traffic_recorder import (
+    TrafficRecorder, RecordingResource, ReplayResource, ReplayMismatchError,
+    RecordKind, read_traffic_log, recorded_sessions
+)
+from core.hardware.waveform import parse_block
+from tests.test_helpers.mock_oscilloscope import MockOscilloscope
+
+
+def _acquire(device):
+    """Run a short acquisition conversation and return the results."""
+    idn = device.query("*IDN?")
+    device.write(":WAV:SOUR CHAN1")
+    preamble = device.query(":WAV:PRE?")
+    device.write(":WAV:DATA?")
+    codes = parse_block(device.read_raw()).copy()
+    return idn, preamble, codes
+
+
+class TestTrafficRecorder:
+    """Tests for recording and replaying SCPI traffic"""
+
+    def test_record_and_replay(self, tmp_path):
+        """Test that a replay reproduces the recorded conversation"""
+        log_path = tmp_path / "capture.scpi"
+        scope = MockOscilloscope(points=5000)
+
+        recorder = TrafficRecorder(log_path)
+        recorded = _acquire(RecordingResource(scope, recorder))
+        recorder.close()
+
+        kinds = [record.kind for record in read_traffic_log(log_path)]
+        assert kinds.count(RecordKind.WRITE) == 4
+        assert kinds[-1] == RecordKind.READ_RAW
+
+        replay = ReplayResource(log_path)
+        replayed = _acquire(replay)
+        assert replayed[0] == recorded[0]
+        assert replayed[1] == recorded[1]
+        assert np.array_equal(replayed[2], recorded[2])
+        assert replay.remaining == 0
+
+    def test_sessions_replay_per_address(self):
+        """Test that interleaved traffic of several devices replays per address"""
+        buffer = io.BytesIO()
+        recorder = TrafficRecorder(buffer)
+        first = RecordingResource(MockOscilloscope(points=100), recorder, "TCPIP::A::INSTR")
+        second = RecordingResource(MockOscilloscope(points=300), recorder, "TCPIP::B::INSTR")
+        first.query("*IDN?")
+        recorded_second = _acquire(second)
+        recorded_first = _acquire(first)
+        buffer.seek(0)
+
+        assert recorded_sessions(buffer) == ["TCPIP::A::INSTR", "TCPIP::B::INSTR"]
+        buffer.seek(0)
+        replay_second = ReplayResource(buffer, address="TCPIP::B::INSTR")
+        assert np.array_equal(_acquire(replay_second)[2], recorded_second[2])
+        assert replay_second.remaining == 0
+
+        buffer.seek(0)
+        replay_first = ReplayResource(buffer, address="TCPIP::A::INSTR")
+        replay_first.query("*IDN?")
+        assert np.array_equal(_acquire(replay_first)[2], recorded_first[2])
+
+    def test_attribute_delegation(self):
+        """Test that resource attributes pass through the recording wrapper"""
+        scope = MockOscilloscope()
+        wrapper = RecordingResource(scope, TrafficRecorder(io.BytesIO()))
+        wrapper.timeout = 1234
+        assert scope.timeout == 1234
+        assert wrapper.read_termination == scope.read_termination
+
+    def test_mismatch(self):
+        """Test that diverging commands are detected in strict mode"""
+        buffer = io.BytesIO()
+        recorder = TrafficRecorder(buffer)
+        _acquire(RecordingResource(MockOscilloscope(), recorder))
+        buffer.seek(0)
+
+        replay = ReplayResource(buffer)
+        with pytest.raises(ReplayMismatchError):
+            replay.query(":ACQ:SRAT?")
+
+    def test_realtime_pacing(self):
+        """Test that realtime replay reproduces recorded delays"""
+        buffer = io.BytesIO()
+        recorder = TrafficRecorder(buffer)
+        device = RecordingResource(MockOscilloscope(), recorder)
+        device.query("*IDN?")
+        time.sleep(0.2)
+        device.query("*IDN?")
+        buffer.seek(0)
+
+        fast = ReplayResource(io.BytesIO(buffer.getvalue()))
+        start = time.perf_counter()
+        fast.query("*IDN?")
+        fast.query("*IDN?")
+        assert time.perf_counter() - start < 0.1
+
+        paced = ReplayResource(io.BytesIO(buffer.getvalue()), realtime=True)
+        start = time.perf_counter()
+        paced.query("*IDN?")
+        paced.query("*IDN?")
+        assert time.perf_counter() - start >= 0.15
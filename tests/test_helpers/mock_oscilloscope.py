@@ -1 +1,130 @@
-# Oscilloscope simulation
\ No newline at end of file
+# Oscilloscope simulation
+"""
+Mock oscilloscope for hardware tests.
+
+Implements the subset of the PyVISA resource interface (write, query, read,
+read_raw, close) and of the Rigol SCPI command set used by the acquisition code.
+"""
+
+import time
+
+import numpy as np
+
+
+class MockOscilloscope:
+    """Simulated oscilloscope answering SCPI commands with synthetic waveforms."""
+
+    def __init__(self, points=1200, sample_rate=1e6, x_origin=None, read_delay=0.0,
+                 idn="RIGOL TECHNOLOGIES,DS1104Z,MOCK0001,00.04.05"):
+        """
+        Initialize the mock oscilloscope.
+
+        Args:
+            points (int): Number of samples per waveform
+            sample_rate (float): Sample rate in Hz
+            x_origin (float): Time of the first sample relative to the trigger
+            read_delay (float): Simulated transfer time for each waveform read in seconds
+            idn (str): Identification string
+        """
+        self.points = points
+        self.sample_rate = sample_rate
+        self.x_origin = -points / (2 * sample_rate) if x_origin is None else x_origin
+        self.read_delay = read_delay
+        self.idn = idn
+
+        self.timeout = 2000
+        self.read_termination = '\n'
+        self.write_termination = '\n'
+
+        self.commands = []
+        self.closed = False
+
+        self._source = 1
+        self._trigger_status = "STOP"
+        self._pending = []
+
+    # MARK: - Waveform generation
+
+    def codes(self, channel):
+        """Return the raw byte codes of a channel (a phase-shifted sine per channel)."""
+        t = np.arange(self.points) / self.sample_rate + self.x_origin
+        phase = (channel - 1) * np.pi / 4
+        return (128 + 100 * np.sin(2 * np.pi * 1e3 * t + phase)).astype(np.uint8)
+
+    def preamble(self):
+        """Return the :WAV:PRE? response string."""
+        return (f"0,0,{self.points},1,{1.0 / self.sample_rate:e},{self.x_origin:e},0,"
+                f"0.04,0,128")
+
+    def block(self, channel):
+        """Return the IEEE 488.2 block for a channel."""
+        payload = self.codes(channel).tobytes()
+        size = str(len(payload)).encode()
+        return b"#" + str(len(size)).encode() + size + payload + b"\n"
+
+    # MARK: - Resource interface
+
+    def write(self, command):
+        self.commands.append(command)
+        command = command.strip()
+        upper = command.upper()
+
+        if upper.startswith(":WAV:SOUR"):
+            self._source = int(upper.rsplit("CHAN", 1)[1])
+        elif upper in (":SING", ":RUN"):
+            self._trigger_status = "WAIT"
+        elif upper in (":TFOR", ":STOP"):
+            self._trigger_status = "STOP"
+        elif upper == ":WAV:DATA?":
+            self._pending.append(self.block(self._source))
+        elif upper.endswith("?"):
+            self._pending.append((self._answer(upper) + self.read_termination).encode())
+
+    def _answer(self, query):
+        if query == "*IDN?":
+            return self.idn
+        if query == ":WAV:PRE?":
+            return self.preamble()
+        if query == ":TRIG:STAT?":
+            # A single-shot acquisition completes on the first poll
+            status, self._trigger_status = self._trigger_status, "STOP"
+            return "TD" if status == "WAIT" else status
+        if query == ":ACQ:SRAT?":
+            return f"{self.sample_rate:e}"
+        if query == ":ACQ:MDEP?":
+            return str(self.points)
+        return "0"
+
+    def read_raw(self, size=None):
+        if self._pending and self._pending[0].startswith(b"#") and self.read_delay:
+            time.sleep(self.read_delay)
+        return self._pending.pop(0)
+
+    def read(self):
+        return self.read_raw().decode().rstrip(self.read_termination)
+
+    def query(self, command):
+        self.write(command)
+        return self.read()
+
+    def close(self):
+        self.closed = True
+
+
+class MockDeviceManager:
+    """Minimal stand-in for DeviceManager's multi-instrument session API."""
+
+    def __init__(self, devices):
+        """
+        Args:
+            devices (dict): Mapping of addresses to MockOscilloscope instances
+        """
+        self._devices = devices
+        self.closed = []
+
+    def open_session(self, address):
+        return self._devices[address]
+
+    def close_session(self, address):
+        self.closed.append(address)
+        self._devices[address].close()